@@ -1,5 +1,7 @@
 import random
-from typing import Optional, List
+from typing import Dict, Optional, List
+
+import numpy as np
 
 from ray.data.block import Block, BlockAccessor
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
@@ -349,3 +351,183 @@ class ShufflingBatcher(BatcherInterface):
         self._batch_head += batch_size
         # Yield the shuffled batch.
         return BlockAccessor.for_block(self._shuffle_buffer).take(batch_indices)
+
+
+class IndexShufflingBatcher(BatcherInterface):
+    """Chunks blocks into shuffled batches, gathering rows from a ring of blocks.
+
+    Unlike ShufflingBatcher, this batcher never concatenates the added blocks into a
+    shuffle buffer. Instead, it keeps the blocks as they are along with a shuffled
+    index of the rows that haven't been yielded yet. Each batch takes the next rows
+    of this index and gathers them directly from their blocks, one block at a time.
+    The rows gathered from a block keep their shuffled order, and the blocks are
+    gathered in the order in which their first rows appear in the index. The
+    gathered rows are then concatenated, which doesn't copy Arrow blocks, so every
+    row of an Arrow block is copied only once, into its output batch. A block is
+    released once all of its rows have been yielded.
+
+    Like ShufflingBatcher, the index is only reshuffled on the next batch retrieval
+    after blocks are added, but this only shuffles row indices rather than data.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int],
+        shuffle_buffer_min_size: int,
+        shuffle_seed: Optional[int] = None,
+    ):
+        """Constructs a random-shuffling block batcher.
+
+        Args:
+            batch_size: Record batch size.
+            shuffle_buffer_min_size: Minimum number of rows that must be in the
+                buffered blocks in order to yield a batch. When there are no more rows
+                to be added, the number of buffered rows *will* decrease below this
+                value while yielding the remaining batches, and the final batch may
+                have less than ``batch_size`` rows.
+            shuffle_seed: The seed to use for the local random shuffle.
+        """
+        if batch_size is None:
+            raise ValueError("Must specify a batch_size if using a local shuffle.")
+        self._batch_size = batch_size
+        if shuffle_buffer_min_size < batch_size:
+            shuffle_buffer_min_size = batch_size
+        self._buffer_capacity = max(
+            2 * shuffle_buffer_min_size,
+            shuffle_buffer_min_size + batch_size,
+        )
+        self._buffer_min_size = shuffle_buffer_min_size
+        # The accessors of the buffered blocks, and their numbers of rows not yielded
+        # yet, keyed by block id.
+        self._blocks: Dict[int, BlockAccessor] = {}
+        self._num_rows_remaining: Dict[int, int] = {}
+        self._next_block_id = 0
+        # The shuffled block ids and row indices of the buffered rows. The rows
+        # before the batch head have already been yielded.
+        self._block_ids = np.empty(0, dtype=np.int64)
+        self._row_ids = np.empty(0, dtype=np.int64)
+        self._batch_head = 0
+        # The indices of the blocks added since the last batch, which are added to
+        # the above arrays on the next batch.
+        self._pending_block_ids: List[np.ndarray] = []
+        self._pending_row_ids: List[np.ndarray] = []
+        self._num_pending_rows = 0
+        self._done_adding = False
+        self._rng = np.random.default_rng(shuffle_seed)
+
+    def add(self, block: Block):
+        """Add a block to the buffered blocks.
+
+        Note empty block is not added to buffer.
+
+        Args:
+            block: Block to add to the buffered blocks.
+        """
+        accessor = BlockAccessor.for_block(block)
+        num_rows = accessor.num_rows()
+        if num_rows == 0:
+            return
+        assert self.can_add(block)
+        if (
+            isinstance(accessor, ArrowBlockAccessor)
+            and block.num_columns > 0
+            and block.column(0).num_chunks >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
+        ):
+            accessor = BlockAccessor.for_block(transform_pyarrow.combine_chunks(block))
+        block_id = self._next_block_id
+        self._next_block_id += 1
+        self._blocks[block_id] = accessor
+        self._num_rows_remaining[block_id] = num_rows
+        self._pending_block_ids.append(np.full(num_rows, block_id, dtype=np.int64))
+        self._pending_row_ids.append(np.arange(num_rows, dtype=np.int64))
+        self._num_pending_rows += num_rows
+
+    def can_add(self, block: Block) -> bool:
+        """Whether the block can be added to the buffered blocks.
+
+        Like ShufflingBatcher, this doesn't take the size of the block into account.
+        """
+        return self._buffer_size() <= self._buffer_capacity and not self._done_adding
+
+    def done_adding(self) -> bool:
+        """Indicate to the batcher that no more blocks will be added to the batcher.
+
+        No more blocks should be added to the batcher after calling this.
+        """
+        self._done_adding = True
+
+    def has_any(self) -> bool:
+        """Whether this batcher has any data."""
+        return self._buffer_size() > 0
+
+    def has_batch(self) -> bool:
+        """Whether this batcher has any batches."""
+        buffer_size = self._buffer_size()
+        if not self._done_adding:
+            # If still adding blocks, ensure that removing a batch wouldn't cause the
+            # buffered rows to dip beneath the configured minimum size.
+            return buffer_size - self._batch_size >= self._buffer_min_size
+        else:
+            return buffer_size >= self._batch_size
+
+    def _buffer_size(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._block_ids) - self._batch_head + self._num_pending_rows
+
+    def next_batch(self) -> Block:
+        """Get the next shuffled batch from the buffered blocks.
+
+        Returns:
+            A batch represented as a Block.
+        """
+        assert self.has_batch() or (self._done_adding and self.has_any())
+        if self._num_pending_rows > 0:
+            # Add the indices of the new rows to the unyielded ones, and reshuffle.
+            block_ids = np.concatenate(
+                [self._block_ids[self._batch_head :]] + self._pending_block_ids
+            )
+            row_ids = np.concatenate(
+                [self._row_ids[self._batch_head :]] + self._pending_row_ids
+            )
+            permutation = self._rng.permutation(len(block_ids))
+            self._block_ids = block_ids[permutation]
+            self._row_ids = row_ids[permutation]
+            self._batch_head = 0
+            self._pending_block_ids = []
+            self._pending_row_ids = []
+            self._num_pending_rows = 0
+
+        # Get the rows of this batch.
+        batch_end = self._batch_head + self._batch_size
+        block_ids = self._block_ids[self._batch_head : batch_end]
+        row_ids = self._row_ids[self._batch_head : batch_end]
+        self._batch_head += len(block_ids)
+
+        # Gather the rows block by block.
+        order = np.argsort(block_ids, kind="stable")
+        unique_block_ids, starts, counts = np.unique(
+            block_ids[order], return_index=True, return_counts=True
+        )
+        for block_id, count in zip(unique_block_ids, counts):
+            self._num_rows_remaining[block_id] -= count
+        if len(unique_block_ids) == 1:
+            batch = self._blocks[unique_block_ids[0]].take(row_ids)
+        else:
+            row_ids = row_ids[order]
+            builder = DelegatingBlockBuilder()
+            # Gather the blocks in the order of their first rows in the batch, which
+            # is random, rather than in the order they were added.
+            for i in np.argsort(order[starts]):
+                start, count = starts[i], counts[i]
+                builder.add_block(
+                    self._blocks[unique_block_ids[i]].take(
+                        row_ids[start : start + count]
+                    )
+                )
+            batch = builder.build()
+        # Release the blocks whose rows have all been yielded.
+        for block_id in unique_block_ids:
+            if self._num_rows_remaining[block_id] == 0:
+                del self._blocks[block_id]
+                del self._num_rows_remaining[block_id]
+        return batch
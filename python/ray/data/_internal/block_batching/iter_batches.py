@@ -1,4 +1,5 @@
 import collections
+import math
 from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 import ray
@@ -119,6 +120,19 @@ def iter_batches(
 
     eager_free = clear_block_after_read and DataContext.get_current().eager_free
 
+    num_batches_to_prefetch = prefetch_batches
+    if (
+        prefetch_batches > 0
+        and shuffle_buffer_min_size is not None
+        and batch_size is not None
+        and context.use_index_based_local_shuffle
+    ):
+        # Prefetch enough blocks to fill the shuffle buffer, so that they are fetched
+        # from their owners in parallel.
+        num_batches_to_prefetch = max(
+            prefetch_batches, math.ceil(shuffle_buffer_min_size / batch_size)
+        )
+
     def _async_iter_batches(
         block_refs: Iterator[Tuple[ObjectRef[Block], BlockMetadata]],
     ) -> Iterator[DataBatch]:
@@ -127,7 +141,7 @@ def iter_batches(
         block_refs = prefetch_batches_locally(
             block_ref_iter=block_refs,
             prefetcher=prefetcher,
-            num_batches_to_prefetch=prefetch_batches,
+            num_batches_to_prefetch=num_batches_to_prefetch,
             batch_size=batch_size,
             eager_free=eager_free,
         )
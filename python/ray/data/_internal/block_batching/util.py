@@ -8,13 +8,18 @@ import ray
 from ray.types import ObjectRef
 from ray.actor import ActorHandle
 from ray.data.block import Block, BlockAccessor, DataBatch
-from ray.data._internal.batcher import Batcher, ShufflingBatcher
+from ray.data._internal.batcher import (
+    Batcher,
+    IndexShufflingBatcher,
+    ShufflingBatcher,
+)
 from ray.data._internal.block_batching.interfaces import (
     Batch,
     CollatedBatch,
     BlockPrefetcher,
 )
 from ray.data._internal.stats import DatasetPipelineStats, DatastreamStats
+from ray.data.context import DataContext
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 T = TypeVar("T")
@@ -100,7 +105,16 @@ def blocks_to_batches(
     Returns:
         An iterator over blocks of the given size that are potentially shuffled.
     """
-    if shuffle_buffer_min_size is not None:
+    if (
+        shuffle_buffer_min_size is not None
+        and DataContext.get_current().use_index_based_local_shuffle
+    ):
+        batcher = IndexShufflingBatcher(
+            batch_size=batch_size,
+            shuffle_buffer_min_size=shuffle_buffer_min_size,
+            shuffle_seed=shuffle_seed,
+        )
+    elif shuffle_buffer_min_size is not None:
         batcher = ShufflingBatcher(
             batch_size=batch_size,
             shuffle_buffer_min_size=shuffle_buffer_min_size,
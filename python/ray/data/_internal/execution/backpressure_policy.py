@@ -0,0 +1,162 @@
+"""Pluggable backpressure policies for the streaming executor.
+
+In addition to the global resource limits, the streaming executor consults the
+backpressure policies set in `ExecutionOptions.backpressure_policies` before adding
+an input to an operator. An operator is only selected to run if all of the policies
+allow it.
+"""
+
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.util.annotations import DeveloperAPI
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.streaming_executor_state import OpState
+
+
+@DeveloperAPI
+class BackpressurePolicy(ABC):
+    """Interface for policies that decide whether an operator may take more inputs.
+
+    Policy instances may be shared between executions, so any per-operator state
+    should be keyed by the operator.
+    """
+
+    @abstractmethod
+    def can_add_input(self, op: PhysicalOperator, state: "OpState") -> bool:
+        """Return whether the operator is allowed to take another input.
+
+        Args:
+            op: The operator to check.
+            state: The streaming execution state of the operator.
+        """
+        raise NotImplementedError
+
+
+@DeveloperAPI
+class ObjectStoreBudgetBackpressurePolicy(BackpressurePolicy):
+    """Limits the object store memory used by each operator.
+
+    The memory of an operator is the memory of its active tasks and internal buffers
+    plus that of its output queue. An operator over its budget isn't given more
+    inputs until its downstream operators consume its outputs.
+    """
+
+    def __init__(
+        self,
+        default_budget: Optional[int] = None,
+        budgets: Optional[Dict[str, int]] = None,
+    ):
+        """Create an ObjectStoreBudgetBackpressurePolicy.
+
+        Args:
+            default_budget: The object store memory budget in bytes of the operators
+                not in `budgets`. If None, these operators are not limited.
+            budgets: The object store memory budgets in bytes, keyed by operator
+                name.
+        """
+        self._default_budget = default_budget
+        self._budgets = budgets or {}
+
+    def can_add_input(self, op: PhysicalOperator, state: "OpState") -> bool:
+        budget = self._budgets.get(op.name, self._default_budget)
+        if budget is None:
+            return True
+        usage = (
+            op.current_resource_usage().object_store_memory or 0
+        ) + state.outqueue_memory_usage()
+        return usage < budget
+
+
+@DeveloperAPI
+class MaxQueuedOutputsBackpressurePolicy(BackpressurePolicy):
+    """Limits the number of output bundles queued for the downstream operators."""
+
+    def __init__(self, max_queued_outputs: int):
+        """Create a MaxQueuedOutputsBackpressurePolicy.
+
+        Args:
+            max_queued_outputs: The max number of output bundles of an operator that
+                haven't been taken by its downstream operators.
+        """
+        assert max_queued_outputs > 0, max_queued_outputs
+        self._max_queued_outputs = max_queued_outputs
+
+    def can_add_input(self, op: PhysicalOperator, state: "OpState") -> bool:
+        return len(state.outqueue) < self._max_queued_outputs
+
+
+@dataclass
+class _ConcurrencyCapState:
+    # The current max number of active tasks of the operator.
+    cap: int
+    # The number of completed outputs of the operator when the cap was last updated.
+    num_completed_at_update: int
+
+
+@DeveloperAPI
+class ConcurrencyCapBackpressurePolicy(BackpressurePolicy):
+    """Caps the number of active tasks of each operator, following its throughput.
+
+    Each operator starts with a cap of `init_cap` active tasks. Every time the
+    operator has completed as many outputs as its cap since the last update, the cap
+    is adjusted based on whether its downstream operators keep up with it:
+
+    - If fewer outputs than the cap are queued downstream, the cap is multiplied by
+      `cap_multiplier`, up to `max_cap`.
+    - Otherwise, the outputs are produced faster than they are consumed, and the cap
+      is divided by `cap_multiplier`, down to 1.
+    """
+
+    def __init__(
+        self,
+        init_cap: int = 4,
+        cap_multiplier: float = 2.0,
+        max_cap: Optional[int] = None,
+    ):
+        """Create a ConcurrencyCapBackpressurePolicy.
+
+        Args:
+            init_cap: The initial max number of active tasks of each operator.
+            cap_multiplier: The factor the cap is increased or decreased by.
+            max_cap: The max value of the cap. If None, the cap is unbounded.
+        """
+        assert init_cap > 0, init_cap
+        assert cap_multiplier > 1, cap_multiplier
+        self._init_cap = init_cap
+        self._cap_multiplier = cap_multiplier
+        self._max_cap = max_cap
+        self._states: Dict[
+            PhysicalOperator, _ConcurrencyCapState
+        ] = weakref.WeakKeyDictionary()
+
+    def __reduce__(self):
+        # The per-operator state is only used by the executor that created it, and
+        # isn't serializable.
+        return (
+            self.__class__,
+            (self._init_cap, self._cap_multiplier, self._max_cap),
+        )
+
+    def can_add_input(self, op: PhysicalOperator, state: "OpState") -> bool:
+        cap_state = self._states.get(op)
+        if cap_state is None:
+            cap_state = _ConcurrencyCapState(
+                cap=self._init_cap, num_completed_at_update=state.num_completed_tasks
+            )
+            self._states[op] = cap_state
+        if state.num_completed_tasks - cap_state.num_completed_at_update >= (
+            cap_state.cap
+        ):
+            if len(state.outqueue) < cap_state.cap:
+                cap_state.cap = int(cap_state.cap * self._cap_multiplier)
+                if self._max_cap is not None:
+                    cap_state.cap = min(cap_state.cap, self._max_cap)
+            else:
+                cap_state.cap = max(1, int(cap_state.cap / self._cap_multiplier))
+            cap_state.num_completed_at_update = state.num_completed_tasks
+        return op.num_active_work_refs() < cap_state.cap
@@ -1,6 +1,17 @@
+import collections
 from dataclasses import dataclass, field
 import os
-from typing import Dict, List, Optional, Iterable, Iterator, Tuple, Callable, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+    Iterable,
+    Iterator,
+    Tuple,
+    Callable,
+    Union,
+)
 
 import ray
 from ray.util.annotations import DeveloperAPI
@@ -13,6 +24,9 @@ from ray.data.block import Block, BlockMetadata
 from ray.data.context import DataContext
 from ray.types import ObjectRef
 
+if TYPE_CHECKING:
+    from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
+
 # Node id string returned by `ray.get_runtime_context().get_node_id()`.
 NodeIdStr = str
 
@@ -87,18 +101,22 @@ class RefBundle:
     def get_cached_location(self) -> Optional[NodeIdStr]:
         """Return a location for this bundle's data, if possible.
 
-        Caches the resolved location so multiple calls to this are efficient.
+        This is the node holding the most bytes of the bundle's blocks. Caches the
+        resolved location so multiple calls to this are efficient.
         """
         if self._cached_location is None:
-            # Only consider the first block in the bundle for now. TODO(ekl) consider
-            # taking into account other blocks.
-            ref = self.blocks[0][0]
+            refs = [ref for ref, _ in self.blocks]
             # This call is pretty fast for owned objects (~5k/s), so we don't need to
-            # batch it for now.
-            locs = ray.experimental.get_object_locations([ref])
-            nodes = locs[ref]["node_ids"]
-            if nodes:
-                self._cached_location = nodes[0]
+            # batch it across bundles for now.
+            locs = ray.experimental.get_object_locations(refs)
+            bytes_per_node: Dict[NodeIdStr, int] = collections.defaultdict(int)
+            for ref, meta in self.blocks:
+                size = locs[ref].get("object_size") or meta.size_bytes or 0
+                for node in locs[ref]["node_ids"]:
+                    bytes_per_node[node] += size
+            if bytes_per_node:
+                # Ties are broken in favor of the nodes of the first blocks.
+                self._cached_location = max(bytes_per_node, key=bytes_per_node.get)
             else:
                 self._cached_location = ""
         if self._cached_location:
@@ -207,6 +225,11 @@ class ExecutionOptions:
         verbose_progress: Whether to report progress individually per operator. By
             default, only AllToAll operators and global progress is reported. This
             option is useful for performance debugging. Off by default.
+        backpressure_policies: Backpressure policies applied by the streaming
+            executor in addition to the resource limits. An operator is only given
+            more inputs if all of the policies allow it. See
+            `ray.data._internal.execution.backpressure_policy` for the built-in
+            policies. Empty by default.
     """
 
     resource_limits: ExecutionResources = field(default_factory=ExecutionResources)
@@ -219,6 +242,8 @@ class ExecutionOptions:
 
     verbose_progress: bool = bool(int(os.environ.get("RAY_DATA_VERBOSE_PROGRESS", "0")))
 
+    backpressure_policies: List["BackpressurePolicy"] = field(default_factory=list)
+
 
 @dataclass
 class TaskContext:
@@ -237,6 +262,10 @@ class TaskContext:
     # an AllToAllOperator with an upstream MapOperator.
     upstream_map_transform_fn: Optional["MapTransformFn"] = None
 
+    # If set, the output blocks of a MapOperator task that are larger than this
+    # number of bytes are split into smaller blocks.
+    target_max_block_size: Optional[int] = None
+
 
 # Block transform function applied by task and actor pools in MapOperator.
 MapTransformFn = Callable[[Iterable[Block], TaskContext], Iterable[Block]]
@@ -287,6 +316,11 @@ class PhysicalOperator(Operator):
         self._inputs_complete = not input_dependencies
         self._dependents_complete = False
         self._started = False
+        # Called with the work ref of each task submitted by this operator, and of
+        # each task it cancels before it completes, if set by the executor, e.g. to
+        # record the timeline of the operator.
+        self._on_task_submitted: Optional[Callable[[ray.ObjectRef], None]] = None
+        self._on_task_cancelled: Optional[Callable[[ray.ObjectRef], None]] = None
 
     def __reduce__(self):
         raise ValueError("Operator is not serializable.")
@@ -308,6 +342,18 @@ class PhysicalOperator(Operator):
         """Return recorded execution stats for use with DatastreamStats."""
         raise NotImplementedError
 
+    def _notify_task_submitted(self, ref: ray.ObjectRef) -> None:
+        """Called by subclasses right after submitting a task with the given work
+        ref."""
+        if self._on_task_submitted is not None:
+            self._on_task_submitted(ref)
+
+    def _notify_task_cancelled(self, ref: ray.ObjectRef) -> None:
+        """Called by subclasses when they cancel the task with the given work ref,
+        which the executor then no longer waits on."""
+        if self._on_task_cancelled is not None:
+            self._on_task_cancelled(ref)
+
     def get_metrics(self) -> Dict[str, int]:
         """Returns dict of metrics reported from this operator.
 
@@ -516,6 +562,17 @@ class OutputIterator(Iterator[RefBundle]):
             raise NotImplementedError()
         return next(self._it)
 
+    def num_ready(self, output_split_idx: Optional[int] = None) -> int:
+        """Return the number of outputs that `get_next()` can return without blocking.
+
+        This is used by `Datastream.streaming_split()` to hand out the outputs of a
+        split in bulk. Iterators that can't tell without blocking return 0.
+
+        Args:
+            output_split_idx: The output split index to count the outputs of.
+        """
+        return 0
+
     def __next__(self) -> RefBundle:
         return self.get_next()
 
@@ -213,22 +213,19 @@ def _blocks_to_input_buffer(blocks: BlockList, owns_blocks: bool) -> PhysicalOpe
                 block_meta.size_bytes = task_size
             return block_meta
 
-        inputs = InputDataBuffer(
-            [
-                RefBundle(
-                    [
-                        (
-                            # This isn't a proper block, but it's what we are doing
-                            # in the legacy code.
-                            ray.put(read_task),
-                            cleaned_metadata(read_task),
-                        )
-                    ],
-                    owns_blocks=True,
-                )
-                for read_task in read_tasks
-            ]
-        )
+        input_data = []
+        # The remote args of the read tasks that have their own, by task ref.
+        read_task_remote_args = {}
+        for read_task in read_tasks:
+            # This isn't a proper block, but it's what we are doing in the legacy
+            # code.
+            ref = ray.put(read_task)
+            if read_task._ray_remote_args:
+                read_task_remote_args[ref] = read_task._ray_remote_args
+            input_data.append(
+                RefBundle([(ref, cleaned_metadata(read_task))], owns_blocks=True)
+            )
+        inputs = InputDataBuffer(input_data)
 
         for i in inputs._input_data:
             for b in i.blocks:
@@ -243,9 +240,14 @@ def _blocks_to_input_buffer(blocks: BlockList, owns_blocks: bool) -> PhysicalOpe
         task_name = "DoRead"
         if isinstance(blocks, LazyBlockList):
             task_name = getattr(blocks, "_read_stage_name", task_name)
-        return MapOperator.create(
+        op = MapOperator.create(
             do_read, inputs, name=task_name, ray_remote_args=remote_args
         )
+        if read_task_remote_args:
+            op._ray_remote_args_fn = lambda bundle: read_task_remote_args.get(
+                bundle.blocks[0][0], {}
+            )
+        return op
     else:
         output = _block_list_to_bundles(blocks, owns_blocks=owns_blocks)
         for i in output:
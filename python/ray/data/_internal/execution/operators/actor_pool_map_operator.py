@@ -1,4 +1,5 @@
 import collections
+import itertools
 from dataclasses import dataclass
 from typing import Dict, Any, Iterator, Callable, List, Tuple, Union, Optional
 
@@ -30,6 +31,10 @@ logger = DatastreamLogger(__name__)
 # fairly high since streaming backpressure prevents us from overloading actors.
 DEFAULT_MAX_TASKS_IN_FLIGHT = 4
 
+# The max number of queued bundles considered when looking for a bundle that can be
+# dispatched to an actor on the node holding most of its data.
+LOCALITY_LOOKAHEAD = 16
+
 
 class ActorPoolMapOperator(MapOperator):
     """A MapOperator implementation that executes tasks on an actor pool.
@@ -99,6 +104,7 @@ class ActorPoolMapOperator(MapOperator):
 
     def start(self, options: ExecutionOptions):
         self._actor_locality_enabled = options.actor_locality_enabled
+        self._preserve_order = options.preserve_order
         super().start(options)
 
         # Create the actor workers and add them to the pool.
@@ -152,24 +158,31 @@ class ActorPoolMapOperator(MapOperator):
             * a new worker has been created.
         """
         while self._bundle_queue:
-            # Pick an actor from the pool.
+            # Pick a bundle from the queue and an actor from the pool.
             if self._actor_locality_enabled:
-                actor = self._actor_pool.pick_actor(self._bundle_queue[0])
+                bundle_index = self._next_bundle_index()
+                actor = self._actor_pool.pick_actor(self._bundle_queue[bundle_index])
             else:
+                bundle_index = 0
                 actor = self._actor_pool.pick_actor()
             if actor is None:
                 # No actors available for executing the next task.
                 break
             # Submit the map task.
-            bundle = self._bundle_queue.popleft()
+            bundle = self._bundle_queue[bundle_index]
+            del self._bundle_queue[bundle_index]
             input_blocks = [block for block, _ in bundle.blocks]
-            ctx = TaskContext(task_idx=self._next_task_idx)
+            ctx = TaskContext(
+                task_idx=self._next_task_idx,
+                target_max_block_size=self._target_max_block_size,
+            )
             ref = actor.submit.options(num_returns="dynamic", name=self.name).remote(
                 self._transform_fn_ref, ctx, *input_blocks
             )
             self._next_task_idx += 1
             task = _TaskState(bundle)
             self._tasks[ref] = (task, actor)
+            self._notify_task_submitted(ref)
             self._handle_task_submitted(task)
 
         # Needed in the bulk execution path for triggering autoscaling. This is a
@@ -181,6 +194,24 @@ class ActorPoolMapOperator(MapOperator):
             # Only try to scale down if the work queue has been fully consumed.
             self._scale_down_if_needed()
 
+    def _next_bundle_index(self) -> int:
+        """Return the index in the bundle queue of the next bundle to dispatch.
+
+        This is the first of the next `LOCALITY_LOOKAHEAD` bundles that can be
+        dispatched to an actor on the node holding most of its data, so that bundles
+        are only dispatched to remote actors when the local actors of all of them are
+        saturated. The queue order is kept if the output order must be preserved,
+        since it depends on the dispatch order.
+        """
+        if self._preserve_order:
+            return 0
+        for i, bundle in enumerate(
+            itertools.islice(self._bundle_queue, LOCALITY_LOOKAHEAD)
+        ):
+            if self._actor_pool.has_free_local_actor(bundle):
+                return i
+        return 0
+
     def _scale_up_if_needed(self):
         """Try to scale up the pool if the autoscaling policy allows it."""
         while self._autoscaling_policy.should_scale_up(
@@ -239,6 +270,13 @@ class ActorPoolMapOperator(MapOperator):
         # Try to scale pool down.
         self._scale_down_if_needed()
 
+    def all_dependents_complete(self):
+        super().all_dependents_complete()
+        # Downstream operators don't need any more outputs (e.g., a limit has been
+        # reached), so drop the bundles that haven't been dispatched yet. Running
+        # tasks are stopped when the actors are killed on shutdown.
+        self._bundle_queue.clear()
+
     def _kill_inactive_workers_if_done(self):
         if self._inputs_done and not self._bundle_queue:
             # No more tasks will be submitted, so we kill all current and future
@@ -621,6 +659,22 @@ class _ActorPool:
         self._num_tasks_in_flight[actor] += 1
         return actor
 
+    def has_free_local_actor(self, locality_hint: RefBundle) -> bool:
+        """Return whether a running actor on the node holding most of the bundle's
+        data has capacity for another task.
+
+        Args:
+            locality_hint: The bundle to find a local actor for.
+        """
+        preferred_loc = self._get_location(locality_hint)
+        if preferred_loc is None:
+            return False
+        return any(
+            self._actor_locations[actor] == preferred_loc
+            and num_tasks_in_flight < self._max_tasks_in_flight
+            for actor, num_tasks_in_flight in self._num_tasks_in_flight.items()
+        )
+
     def return_actor(self, actor: ray.actor.ActorHandle):
         """Returns the provided actor to the pool."""
         assert actor in self._num_tasks_in_flight
@@ -0,0 +1,70 @@
+from typing import Callable, List, Optional, Tuple
+
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.execution.interfaces import (
+    RefBundle,
+    PhysicalOperator,
+)
+
+
+class JoinOperator(PhysicalOperator):
+    """An operator that joins its inputs on key columns.
+
+    NOTE: the implementation is bulk for now, which materializes all its inputs in
+    object store, before starting execution.
+    """
+
+    def __init__(
+        self,
+        join_fn: Callable[
+            [List[RefBundle], List[RefBundle]], Tuple[List[RefBundle], StatsDict]
+        ],
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            join_fn: The function that joins the RefBundles of the left and right
+                inputs.
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+        """
+        self._join_fn = join_fn
+        self._left_buffer: List[RefBundle] = []
+        self._right_buffer: List[RefBundle] = []
+        self._output_buffer: List[RefBundle] = []
+        self._stats: StatsDict = {}
+        super().__init__("Join", [left_input_op, right_input_op])
+
+    def num_outputs_total(self) -> Optional[int]:
+        # The number of outputs depends on whether the join is broadcast.
+        return None
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._left_buffer.append(refs)
+        else:
+            self._right_buffer.append(refs)
+
+    def inputs_done(self) -> None:
+        self._output_buffer, self._stats = self._join_fn(
+            self._left_buffer, self._right_buffer
+        )
+        self._left_buffer.clear()
+        self._right_buffer.clear()
+        super().inputs_done()
+
+    def has_next(self) -> bool:
+        return len(self._output_buffer) > 0
+
+    def get_next(self) -> RefBundle:
+        return self._output_buffer.pop(0)
+
+    def get_stats(self) -> StatsDict:
+        return self._stats
+
+    def get_transformation_fn(self) -> Callable:
+        return self._join_fn
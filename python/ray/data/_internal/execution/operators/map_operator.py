@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 import copy
 from dataclasses import dataclass
 import itertools
+import math
 from typing import Callable, List, Iterator, Any, Dict, Optional, Union
 
 import ray
@@ -26,6 +27,7 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.memory_tracing import trace_allocation
 from ray.data._internal.stats import StatsDict
+from ray.data.context import DataContext
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from ray.types import ObjectRef
 from ray._raylet import ObjectRefGenerator
@@ -53,11 +55,19 @@ class MapOperator(PhysicalOperator, ABC):
         self._transform_fn = transform_fn
         self._ray_remote_args = _canonicalize_ray_remote_args(ray_remote_args or {})
         self._ray_remote_args_factory = None
+        # Overrides of the remote args for the task of an input bundle, e.g. to run
+        # read tasks on the nodes that hold their data.
+        self._ray_remote_args_fn: Optional[Callable[[RefBundle], Dict[str, Any]]] = None
 
         # Bundles block references up to the min_rows_per_bundle target.
         self._block_ref_bundler = _BlockRefBundler(min_rows_per_bundle)
         # Object store allocation stats.
         self._metrics = _ObjectStoreMetrics(alloc=0, freed=0, cur=0, peak=0)
+        # Input and output size stats of completed tasks.
+        self._block_size_metrics = _BlockSizeMetrics(input_bytes=0, output_bytes=0)
+        # The max size of task output blocks, set by start() if adaptive block
+        # sizing is enabled.
+        self._target_max_block_size: Optional[int] = None
 
         # Queue for task outputs, either ordered or unordered (this is set by start()).
         self._output_queue: _OutputQueue = None
@@ -144,6 +154,11 @@ class MapOperator(PhysicalOperator, ABC):
 
     def start(self, options: "ExecutionOptions"):
         super().start(options)
+        ctx = DataContext.get_current()
+        self._adaptive_block_sizing = ctx.adaptive_block_sizing
+        if self._adaptive_block_sizing:
+            self._target_min_block_size = ctx.target_min_block_size
+            self._target_max_block_size = ctx.target_max_block_size
         # Create output queue with desired ordering semantics.
         if options.preserve_order:
             self._output_queue = _OrderedOutputQueue()
@@ -192,10 +207,19 @@ class MapOperator(PhysicalOperator, ABC):
             bundle = self._block_ref_bundler.get_next_bundle()
             self._add_bundled_input(bundle)
 
-    def _get_runtime_ray_remote_args(self) -> Dict[str, Any]:
+    def _get_runtime_ray_remote_args(
+        self, input_bundle: Optional[RefBundle] = None
+    ) -> Dict[str, Any]:
         if self._ray_remote_args_factory:
-            return self._ray_remote_args_factory(self._ray_remote_args)
-        return self._ray_remote_args
+            ray_remote_args = self._ray_remote_args_factory(self._ray_remote_args)
+        else:
+            ray_remote_args = self._ray_remote_args
+        if self._ray_remote_args_fn and input_bundle is not None:
+            ray_remote_args = {
+                **ray_remote_args,
+                **self._ray_remote_args_fn(input_bundle),
+            }
+        return ray_remote_args
 
     @abstractmethod
     def _add_bundled_input(self, refs: RefBundle):
@@ -259,6 +283,38 @@ class MapOperator(PhysicalOperator, ABC):
         self._metrics.cur -= freed
         if self._metrics.cur > self._metrics.peak:
             self._metrics.peak = self._metrics.cur
+        # Update block size stats.
+        self._block_size_metrics.input_bytes += freed
+        self._block_size_metrics.output_bytes += allocated
+        if self._adaptive_block_sizing:
+            self._update_min_bytes_per_bundle()
+
+    def _handle_task_cancelled(self, task: "_TaskState"):
+        """Handle a task cancelled before it completed, freeing its inputs and
+        updating object store metrics.
+
+        This should be called by subclasses right after a task is cancelled.
+
+        Args:
+            task: The task state for the cancelled task.
+        """
+        task.inputs.destroy_if_owned()
+        freed = task.inputs.size_bytes()
+        self._metrics.freed += freed
+        self._metrics.cur -= freed
+
+    def _update_min_bytes_per_bundle(self):
+        """Bundle enough input blocks per task for its outputs to reach the target
+        min block size, based on the observed output/input size ratio."""
+        input_bytes = self._block_size_metrics.input_bytes
+        output_bytes = self._block_size_metrics.output_bytes
+        if input_bytes == 0 or output_bytes == 0:
+            return
+        ratio = output_bytes / input_bytes
+        min_bytes_per_bundle = min(
+            self._target_min_block_size / ratio, self._target_max_block_size
+        )
+        self._block_ref_bundler.set_min_bytes_per_bundle(int(min_bytes_per_bundle))
 
     def inputs_done(self):
         self._block_ref_bundler.done_adding_bundles()
@@ -268,6 +324,11 @@ class MapOperator(PhysicalOperator, ABC):
             self._add_bundled_input(bundle)
         super().inputs_done()
 
+    def need_more_inputs(self) -> bool:
+        # Once all downstream operators are done (e.g., because a limit has been
+        # reached), launching more tasks would be wasted work.
+        return not self._dependents_complete
+
     def has_next(self) -> bool:
         assert self._started
         return self._output_queue.has_next()
@@ -368,6 +429,14 @@ class _ObjectStoreMetrics:
         }
 
 
+@dataclass
+class _BlockSizeMetrics:
+    """Metrics for the input and output sizes of completed tasks."""
+
+    input_bytes: int
+    output_bytes: int
+
+
 def _map_task(
     fn: MapTransformFn,
     ctx: TaskContext,
@@ -387,15 +456,33 @@ def _map_task(
     output_metadata = []
     stats = BlockExecStats.builder()
     for b_out in fn(iter(blocks), ctx):
-        # TODO(Clark): Add input file propagation from input blocks.
-        m_out = BlockAccessor.for_block(b_out).get_metadata([], None)
-        m_out.exec_stats = stats.build()
-        output_metadata.append(m_out)
-        yield b_out
-        stats = BlockExecStats.builder()
+        for b_out in _split_block(b_out, ctx.target_max_block_size):
+            # TODO(Clark): Add input file propagation from input blocks.
+            m_out = BlockAccessor.for_block(b_out).get_metadata([], None)
+            m_out.exec_stats = stats.build()
+            output_metadata.append(m_out)
+            yield b_out
+            stats = BlockExecStats.builder()
     yield output_metadata
 
 
+def _split_block(block: Block, target_max_block_size: Optional[int]) -> List[Block]:
+    """Split the block into blocks of at most `target_max_block_size` bytes, if
+    it's set."""
+    if target_max_block_size is None:
+        return [block]
+    accessor = BlockAccessor.for_block(block)
+    num_rows = accessor.num_rows()
+    num_splits = min(num_rows, math.ceil(accessor.size_bytes() / target_max_block_size))
+    if num_splits <= 1:
+        return [block]
+    rows_per_split = math.ceil(num_rows / num_splits)
+    return [
+        accessor.slice(start, min(start + rows_per_split, num_rows), copy=True)
+        for start in range(0, num_rows, rows_per_split)
+    ]
+
+
 class _BlockRefBundler:
     """Rebundles RefBundles to get them close to a particular number of rows."""
 
@@ -408,50 +495,77 @@ class _BlockRefBundler:
                 result in an empty bundle.
         """
         self._min_rows_per_bundle = min_rows_per_bundle
+        self._min_bytes_per_bundle: Optional[int] = None
         self._bundle_buffer: List[RefBundle] = []
         self._bundle_buffer_size = 0
+        self._bundle_buffer_size_bytes = 0
         self._finalized = False
 
+    def set_min_bytes_per_bundle(self, min_bytes_per_bundle: Optional[int]):
+        """Set the target number of bytes per bundle.
+
+        Bundles are then also bundled until they reach this size, in addition to
+        `min_rows_per_bundle`.
+        """
+        self._min_bytes_per_bundle = min_bytes_per_bundle
+
     def add_bundle(self, bundle: RefBundle):
         """Add a bundle to the bundler."""
         self._bundle_buffer.append(bundle)
         self._bundle_buffer_size += self._get_bundle_size(bundle)
+        self._bundle_buffer_size_bytes += bundle.size_bytes()
 
     def has_bundle(self) -> bool:
         """Returns whether the bundler has a bundle."""
         return self._bundle_buffer and (
-            self._min_rows_per_bundle is None
-            or self._bundle_buffer_size >= self._min_rows_per_bundle
+            (
+                (
+                    self._min_rows_per_bundle is None
+                    or self._bundle_buffer_size >= self._min_rows_per_bundle
+                )
+                and (
+                    self._min_bytes_per_bundle is None
+                    or self._bundle_buffer_size_bytes >= self._min_bytes_per_bundle
+                )
+            )
             or (self._finalized and self._bundle_buffer_size > 0)
         )
 
     def get_next_bundle(self) -> RefBundle:
         """Gets the next bundle."""
         assert self.has_bundle()
-        if self._min_rows_per_bundle is None:
+        if self._min_rows_per_bundle is None and self._min_bytes_per_bundle is None:
             # Short-circuit if no bundle row target was defined.
             assert len(self._bundle_buffer) == 1
             bundle = self._bundle_buffer[0]
             self._bundle_buffer = []
             self._bundle_buffer_size = 0
+            self._bundle_buffer_size_bytes = 0
             return bundle
         leftover = []
         output_buffer = []
         output_buffer_size = 0
+        output_buffer_size_bytes = 0
         buffer_filled = False
         for bundle in self._bundle_buffer:
             bundle_size = self._get_bundle_size(bundle)
+            if self._min_bytes_per_bundle is None:
+                fits = output_buffer_size + bundle_size <= self._min_rows_per_bundle
+            else:
+                # With a bytes target, bundle until both targets are reached.
+                fits = output_buffer_size_bytes < self._min_bytes_per_bundle or (
+                    self._min_rows_per_bundle is not None
+                    and output_buffer_size < self._min_rows_per_bundle
+                )
             if buffer_filled:
                 # Buffer has been filled, save it in the leftovers.
                 leftover.append(bundle)
-            elif (
-                output_buffer_size + bundle_size <= self._min_rows_per_bundle
-                or output_buffer_size == 0
-            ):
+            elif fits or output_buffer_size == 0:
                 # Bundle fits in buffer, or bundle doesn't fit but the buffer still
                 # needs a non-empty bundle.
                 output_buffer.append(bundle)
                 output_buffer_size += bundle_size
+                output_buffer_size_bytes += bundle.size_bytes()
             else:
                 # Bundle doesn't fit in a buffer that already has at least one non-empty
                 # bundle, so we add it to the leftovers.
@@ -462,6 +576,7 @@ class _BlockRefBundler:
         self._bundle_buffer_size = sum(
             self._get_bundle_size(bundle) for bundle in leftover
         )
+        self._bundle_buffer_size_bytes = sum(bundle.size_bytes() for bundle in leftover)
         return _merge_ref_bundles(*output_buffer)
 
     def done_adding_bundles(self):
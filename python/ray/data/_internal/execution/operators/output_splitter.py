@@ -1,5 +1,5 @@
 import math
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from ray.data.block import Block, BlockMetadata, BlockAccessor
 from ray.data._internal.remote_fn import cached_remote_fn
@@ -27,6 +27,10 @@ class OutputSplitter(PhysicalOperator):
     has a minimum size calculated to enable a good locality hit rate, as well as ensure
     we can satisfy the `equal` requirement.
 
+    If locality hints are given, a bundle is only dispatched to a split on another
+    node when none of the buffered bundles is local to a split that is within one
+    bundle of the least rows output so far, and the buffer is full.
+
     OutputSplitter does not provide any ordering guarantees.
     """
 
@@ -61,6 +65,9 @@ class OutputSplitter(PhysicalOperator):
             self._min_buffer_size = 2 * n
         else:
             self._min_buffer_size = 0
+        # The max number of rows of the bundles added so far, which bounds how far
+        # ahead of the other splits a split may get to receive a local bundle.
+        self._max_bundle_rows = 0
         self._locality_hits = 0
         self._locality_misses = 0
 
@@ -98,6 +105,7 @@ class OutputSplitter(PhysicalOperator):
     def add_input(self, bundle, input_index) -> None:
         if bundle.num_rows() is None:
             raise ValueError("OutputSplitter requires bundles with known row count")
+        self._max_bundle_rows = max(self._max_bundle_rows, bundle.num_rows())
         self._buffer.append(bundle)
         self._dispatch_bundles()
 
@@ -152,8 +160,22 @@ class OutputSplitter(PhysicalOperator):
         while self._buffer and (
             dispatch_all or len(self._buffer) >= self._min_buffer_size
         ):
-            target_index = self._select_output_index()
-            target_bundle = self._pop_bundle_to_dispatch(target_index)
+            target = None
+            if self._locality_hints:
+                target = self._select_local_dispatch()
+                if (
+                    target is None
+                    and not dispatch_all
+                    and len(self._buffer) < 2 * self._min_buffer_size
+                ):
+                    # Wait for a bundle local to one of the splits.
+                    break
+            if target is not None:
+                target_index, target_bundle = target
+                self._buffer.remove(target_bundle)
+            else:
+                target_index = self._select_output_index()
+                target_bundle = self._buffer.pop(0)
             if self._can_safely_dispatch(target_index, target_bundle.num_rows()):
                 target_bundle.output_split_idx = target_index
                 self._num_output[target_index] += target_bundle.num_rows()
@@ -174,14 +196,18 @@ class OutputSplitter(PhysicalOperator):
         i, _ = min(enumerate(self._num_output), key=lambda t: t[1])
         return i
 
-    def _pop_bundle_to_dispatch(self, target_index: int) -> RefBundle:
-        if self._locality_hints:
-            preferred_loc = self._locality_hints[target_index]
-            for bundle in self._buffer:
-                if self._get_location(bundle) == preferred_loc:
-                    self._buffer.remove(bundle)
-                    return bundle
-        return self._buffer.pop(0)
+    def _select_local_dispatch(self) -> Optional[Tuple[int, RefBundle]]:
+        # Dispatch a bundle to the consumer with the least data so far that has a
+        # local bundle in the buffer, unless it's too far ahead of the others.
+        min_output = min(self._num_output)
+        locations = [self._get_location(bundle) for bundle in self._buffer]
+        for i in sorted(range(len(self._num_output)), key=self._num_output.__getitem__):
+            if self._num_output[i] - min_output > self._max_bundle_rows:
+                break
+            for bundle, location in zip(self._buffer, locations):
+                if location == self._locality_hints[i]:
+                    return i, bundle
+        return None
 
     def _can_safely_dispatch(self, target_index: int, nrow: int) -> bool:
         if not self._equal:
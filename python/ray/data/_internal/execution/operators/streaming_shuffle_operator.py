@@ -0,0 +1,276 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import ray
+from ray.data._internal.datastream_logger import DatastreamLogger
+from ray.data._internal.execution.interfaces import (
+    ExecutionOptions,
+    ExecutionResources,
+    PhysicalOperator,
+    RefBundle,
+)
+from ray.data._internal.execution.operators.map_operator import (
+    _canonicalize_ray_remote_args,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import Block, BlockMetadata
+from ray.data.context import DataContext
+from ray.types import ObjectRef
+
+logger = DatastreamLogger(__name__)
+
+
+class StreamingShuffleOperator(PhysicalOperator):
+    """A shuffle operator that starts shuffling its inputs as they arrive.
+
+    Unlike AllToAllOperator, this operator doesn't wait for all of its inputs to be
+    complete. A map task is submitted for each input block as soon as it's added, so
+    the shuffle overlaps with upstream operators. Every `merge_factor` completed map
+    tasks, a merge task partially reduces their outputs for each output partition,
+    similar to the merge stage of push-based shuffle. The merges are hierarchical:
+    every `merge_factor` completed merge tasks of a level are merged again by a merge
+    task of the next level. Once all inputs are done and all merges are complete, a
+    reduce task per output partition reduces the unmerged blocks of all levels into
+    an output block, so each reduce task gets at most
+    `(merge_factor - 1) * log_{merge_factor}(num map tasks)` blocks.
+
+    Map tasks are only submitted when the executor adds inputs, so the number of
+    concurrent map tasks is subject to the execution resource limits.
+    """
+
+    def __init__(
+        self,
+        exchange_spec: ExchangeTaskSpec,
+        input_op: PhysicalOperator,
+        num_outputs: Optional[int] = None,
+        merge_factor: Optional[int] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+        name: str = "StreamingShuffle",
+    ):
+        """Create a StreamingShuffleOperator.
+
+        Args:
+            exchange_spec: The map and reduce functions of the shuffle.
+            input_op: Operator generating input data for this op.
+            num_outputs: The number of output blocks of the shuffle. Defaults to the
+                number of output bundles of the input operator, which must be known
+                when this operator is started.
+            merge_factor: The number of map or merge task outputs merged by a merge
+                task. Defaults to `DataContext.streaming_shuffle_merge_factor`.
+            ray_remote_args: Customize the map, merge and reduce Ray tasks.
+            name: The name of this operator.
+        """
+        if merge_factor is None:
+            merge_factor = DataContext.get_current().streaming_shuffle_merge_factor
+        assert num_outputs is None or num_outputs > 0, num_outputs
+        assert merge_factor > 1, merge_factor
+        self._exchange_spec = exchange_spec
+        self._num_outputs = num_outputs
+        self._merge_factor = merge_factor
+        self._ray_remote_args = _canonicalize_ray_remote_args(ray_remote_args or {})
+        self._reduce_ray_remote_args = self._ray_remote_args.copy()
+        if "scheduling_strategy" not in self._reduce_ray_remote_args:
+            self._reduce_ray_remote_args["scheduling_strategy"] = "SPREAD"
+
+        self._num_maps = 0
+        self._input_owned = True
+        # Active tasks, keyed by the ref of the metadata they return. Merge tasks are
+        # keyed to the merge level of their output and their output blocks.
+        self._map_tasks: Dict[ObjectRef[BlockMetadata], List[ObjectRef[Block]]] = {}
+        self._merge_tasks: Dict[
+            ObjectRef[List[BlockMetadata]], Tuple[int, List[ObjectRef[Block]]]
+        ] = {}
+        self._reduce_tasks: Dict[ObjectRef[BlockMetadata], Tuple[int, ObjectRef]] = {}
+        # Outputs of completed tasks that aren't merged yet, by merge level. Level 0
+        # holds the outputs of map tasks, and level i + 1 the outputs of the merge
+        # tasks of level i outputs. Each output is a block per output partition.
+        self._unmerged_outputs: List[List[List[ObjectRef[Block]]]] = []
+        self._reduce_submitted = False
+        # Output bundles of completed reduce tasks, keyed by output partition, which
+        # are returned in order.
+        self._reduce_outputs: Dict[int, RefBundle] = {}
+        self._next_output_index = 0
+        # Estimated size of the shuffled data held by this operator.
+        self._buffered_bytes = 0
+        self._stats: StatsDict = {"map": [], "merge": [], "reduce": []}
+        super().__init__(name, [input_op])
+
+    def num_outputs_total(self) -> Optional[int]:
+        return self._num_outputs
+
+    def start(self, options: ExecutionOptions) -> None:
+        if self._num_outputs is None:
+            # The input operators are started before this one, so the number of
+            # input bundles is known now if it can be known before execution.
+            self._num_outputs = self.input_dependencies[0].num_outputs_total()
+            if not self._num_outputs:
+                logger.get_logger().warning(
+                    f"The number of inputs of {self.name} is unknown, so it's "
+                    "shuffled into a single output block."
+                )
+                self._num_outputs = 1
+        self._shuffle_map = cached_remote_fn(self._exchange_spec.map)
+        self._shuffle_merge = cached_remote_fn(_shuffle_merge)
+        self._shuffle_reduce = cached_remote_fn(self._exchange_spec.reduce)
+        super().start(options)
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0, input_index
+        self._input_owned = self._input_owned and refs.owns_blocks
+        for block, _ in refs.blocks:
+            map_out = self._shuffle_map.options(
+                **self._ray_remote_args,
+                num_returns=1 + self._num_outputs,
+            ).remote(
+                self._num_maps,
+                block,
+                self._num_outputs,
+                *self._exchange_spec._map_args,
+            )
+            self._num_maps += 1
+            # The last item returned is the BlockMetadata.
+            self._map_tasks[map_out[-1]] = map_out[:-1]
+            self._notify_task_submitted(map_out[-1])
+
+    def inputs_done(self) -> None:
+        super().inputs_done()
+        self._maybe_submit_reduce_tasks()
+
+    def notify_work_completed(self, work_ref: ray.ObjectRef) -> None:
+        if work_ref in self._map_tasks:
+            map_output = self._map_tasks.pop(work_ref)
+            metadata = ray.get(work_ref)
+            self._stats["map"].append(metadata)
+            self._buffered_bytes += metadata.size_bytes or 0
+            self._add_unmerged_output(0, map_output)
+        elif work_ref in self._merge_tasks:
+            level, merged = self._merge_tasks.pop(work_ref)
+            self._stats["merge"].extend(ray.get(work_ref))
+            self._add_unmerged_output(level, merged)
+        else:
+            index, block = self._reduce_tasks.pop(work_ref)
+            metadata = ray.get(work_ref)
+            self._stats["reduce"].append(metadata)
+            self._reduce_outputs[index] = RefBundle(
+                [(block, metadata)], owns_blocks=self._input_owned
+            )
+        self._maybe_submit_reduce_tasks()
+
+    def _add_unmerged_output(self, level: int, output: List[ObjectRef[Block]]):
+        """Add the output of a completed task of the given merge level, merging the
+        outputs of the level once there are `merge_factor` of them."""
+        if level == len(self._unmerged_outputs):
+            self._unmerged_outputs.append([])
+        outputs = self._unmerged_outputs[level]
+        outputs.append(output)
+        if len(outputs) >= self._merge_factor:
+            self._unmerged_outputs[level] = []
+            self._submit_merge_task(level + 1, outputs)
+
+    def _submit_merge_task(self, level: int, outputs: List[List[ObjectRef[Block]]]):
+        merge_out = self._shuffle_merge.options(
+            **self._ray_remote_args,
+            num_returns=1 + self._num_outputs,
+        ).remote(
+            self._exchange_spec.reduce,
+            self._exchange_spec._reduce_args,
+            self._num_outputs,
+            *[block for blocks in outputs for block in blocks],
+        )
+        self._merge_tasks[merge_out[-1]] = (level, merge_out[:-1])
+        self._notify_task_submitted(merge_out[-1])
+
+    def _maybe_submit_reduce_tasks(self):
+        if (
+            self._reduce_submitted
+            or not self._inputs_complete
+            or self._map_tasks
+            or self._merge_tasks
+            or self._num_maps == 0
+        ):
+            return
+        self._reduce_submitted = True
+        for i in range(self._num_outputs):
+            blocks = [
+                output[i] for outputs in self._unmerged_outputs for output in outputs
+            ]
+            block, metadata = self._shuffle_reduce.options(
+                **self._reduce_ray_remote_args, num_returns=2
+            ).remote(*self._exchange_spec._reduce_args, *blocks)
+            self._reduce_tasks[metadata] = (i, block)
+            self._notify_task_submitted(metadata)
+        self._unmerged_outputs = []
+
+    def has_next(self) -> bool:
+        return self._next_output_index in self._reduce_outputs
+
+    def get_next(self) -> RefBundle:
+        bundle = self._reduce_outputs.pop(self._next_output_index)
+        self._next_output_index += 1
+        self._buffered_bytes = max(0, self._buffered_bytes - bundle.size_bytes())
+        return bundle
+
+    def get_work_refs(self) -> List[ray.ObjectRef]:
+        return (
+            list(self._map_tasks) + list(self._merge_tasks) + list(self._reduce_tasks)
+        )
+
+    def num_active_work_refs(self) -> int:
+        return len(self._map_tasks) + len(self._merge_tasks) + len(self._reduce_tasks)
+
+    def get_stats(self) -> StatsDict:
+        return {k: v for k, v in self._stats.items() if v}
+
+    def progress_str(self) -> str:
+        return (
+            f"{len(self._map_tasks)} map, {len(self._merge_tasks)} merge, "
+            f"{len(self._reduce_tasks)} reduce active"
+        )
+
+    def shutdown(self) -> None:
+        for ref in self.get_work_refs():
+            ray.cancel(ref)
+        self._map_tasks.clear()
+        self._merge_tasks.clear()
+        self._reduce_tasks.clear()
+        super().shutdown()
+
+    def current_resource_usage(self) -> ExecutionResources:
+        return ExecutionResources(
+            cpu=self._ray_remote_args.get("num_cpus", 0) * self.num_active_work_refs(),
+            gpu=self._ray_remote_args.get("num_gpus", 0) * self.num_active_work_refs(),
+            object_store_memory=self._buffered_bytes,
+        )
+
+    def incremental_resource_usage(self) -> ExecutionResources:
+        return ExecutionResources(
+            cpu=self._ray_remote_args.get("num_cpus", 0),
+            gpu=self._ray_remote_args.get("num_gpus", 0),
+        )
+
+    def get_transformation_fn(self) -> Callable:
+        return self._exchange_spec.map
+
+
+def _shuffle_merge(
+    reduce_fn: Callable[..., Tuple[Block, BlockMetadata]],
+    reduce_args: List[Any],
+    num_outputs: int,
+    *map_outputs: Block,
+) -> List[Any]:
+    """Partially reduce the outputs of map or merge tasks for each output partition.
+
+    `map_outputs` are the outputs of the tasks, ordered by task and then by output
+    partition. Returns a merged block for each output partition, followed by
+    the list of their metadata.
+    """
+    blocks, metadata = [], []
+    for i in range(num_outputs):
+        block, meta = reduce_fn(
+            *reduce_args, *map_outputs[i::num_outputs], partial_reduce=True
+        )
+        blocks.append(block)
+        metadata.append(meta)
+    return blocks + [metadata]
@@ -51,20 +51,34 @@ class TaskPoolMapOperator(MapOperator):
         # Submit the task as a normal Ray task.
         map_task = cached_remote_fn(_map_task, num_returns="dynamic")
         input_blocks = [block for block, _ in bundle.blocks]
-        ctx = TaskContext(task_idx=self._next_task_idx)
+        ctx = TaskContext(
+            task_idx=self._next_task_idx,
+            target_max_block_size=self._target_max_block_size,
+        )
         ref = map_task.options(
-            **self._get_runtime_ray_remote_args(), name=self.name
+            **self._get_runtime_ray_remote_args(bundle), name=self.name
         ).remote(self._transform_fn_ref, ctx, *input_blocks)
         self._next_task_idx += 1
         task = _TaskState(bundle)
         self._tasks[ref] = task
         self._handle_task_submitted(task)
+        self._notify_task_submitted(ref)
 
     def notify_work_completed(self, ref: ObjectRef[ObjectRefGenerator]):
         task: _TaskState = self._tasks.pop(ref)
         task.output = self._map_ref_to_ref_bundle(ref)
         self._handle_task_done(task)
 
+    def all_dependents_complete(self):
+        super().all_dependents_complete()
+        # Downstream operators don't need any more outputs (e.g., a limit has been
+        # reached), so cancel the in-flight tasks instead of waiting for them.
+        for ref, task in self._tasks.items():
+            ray.cancel(ref)
+            self._handle_task_cancelled(task)
+            self._notify_task_cancelled(ref)
+        self._tasks.clear()
+
     def shutdown(self):
         task_refs = self.get_work_refs()
         # Cancel all active tasks.
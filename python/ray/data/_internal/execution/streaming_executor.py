@@ -22,6 +22,7 @@ from ray.data._internal.execution.streaming_executor_state import (
     TopologyResourceUsage,
     OpState,
     build_streaming_topology,
+    get_backpressured_ops,
     process_completed_tasks,
     select_operator_to_run,
     DEFAULT_OBJECT_STORE_MEMORY_LIMIT_FRACTION,
@@ -30,7 +31,7 @@ from ray.data._internal.execution.autoscaling_requester import (
     get_or_create_autoscaling_requester_actor,
 )
 from ray.data._internal.progress_bar import ProgressBar
-from ray.data._internal.stats import DatastreamStats
+from ray.data._internal.stats import DatastreamStats, ExecutionTimeline
 
 logger = DatastreamLogger(__name__)
 
@@ -61,6 +62,9 @@ class StreamingExecutor(Executor, threading.Thread):
 
         self._execution_id = uuid.uuid4().hex
         self._autoscaling_state = AutoscalingState()
+        self._timeline: Optional[ExecutionTimeline] = None
+        if DataContext.get_current().enable_operator_timeline:
+            self._timeline = ExecutionTimeline()
 
         # The executor can be shutdown while still running.
         self._shutdown_lock = threading.RLock()
@@ -99,7 +103,7 @@ class StreamingExecutor(Executor, threading.Thread):
 
         # Setup the streaming DAG topology and start the runner thread.
         _validate_dag(dag, self._get_or_refresh_resource_limits())
-        self._topology, _ = build_streaming_topology(dag, self._options)
+        self._topology, _ = build_streaming_topology(dag, self._options, self._timeline)
 
         if not isinstance(dag, InputDataBuffer):
             # Note: DAG must be initialized in order to query num_outputs_total.
@@ -137,6 +141,9 @@ class StreamingExecutor(Executor, threading.Thread):
                     self._outer.shutdown()
                     raise
 
+            def num_ready(self, output_split_idx: Optional[int] = None) -> int:
+                return self._outer._output_node.num_outputs_ready(output_split_idx)
+
         return StreamIterator(self)
 
     def shutdown(self):
@@ -183,8 +190,14 @@ class StreamingExecutor(Executor, threading.Thread):
             # Propagate it to the result iterator.
             self._output_node.outqueue.append(e)
         finally:
-            # Signal end of results.
-            self._output_node.outqueue.append(None)
+            try:
+                # Finish the timeline from this thread, since the scheduling loop
+                # may still be running after shutdown() times out joining it.
+                if self._timeline:
+                    self._timeline.on_execution_finished()
+            finally:
+                # Signal end of results.
+                self._output_node.outqueue.append(None)
 
     def get_stats(self):
         """Return the stats object for the streaming execution.
@@ -205,6 +218,8 @@ class StreamingExecutor(Executor, threading.Thread):
             builder = stats.child_builder(op.name, override_start_time=self._start_time)
             stats = builder.build_multistage(op.get_stats())
             stats.extra_metrics = op.get_metrics()
+            if self._timeline:
+                stats.timeline = self._timeline.operators.get(op)
         return stats
 
     def _scheduling_loop_step(self, topology: Topology) -> bool:
@@ -225,7 +240,7 @@ class StreamingExecutor(Executor, threading.Thread):
         # Note: calling process_completed_tasks() is expensive since it incurs
         # ray.wait() overhead, so make sure to allow multiple dispatch per call for
         # greater parallelism.
-        process_completed_tasks(topology)
+        process_completed_tasks(topology, self._timeline)
 
         # Dispatch as many operators as we can for completed tasks.
         limits = self._get_or_refresh_resource_limits()
@@ -238,6 +253,7 @@ class StreamingExecutor(Executor, threading.Thread):
             ensure_at_least_one_running=self._consumer_idling(),
             execution_id=self._execution_id,
             autoscaling_state=self._autoscaling_state,
+            backpressure_policies=self._options.backpressure_policies,
         )
         i = 0
         while op is not None:
@@ -255,6 +271,19 @@ class StreamingExecutor(Executor, threading.Thread):
                 ensure_at_least_one_running=self._consumer_idling(),
                 execution_id=self._execution_id,
                 autoscaling_state=self._autoscaling_state,
+                backpressure_policies=self._options.backpressure_policies,
+            )
+
+        if self._timeline:
+            self._timeline.on_scheduling_step(
+                get_backpressured_ops(
+                    topology,
+                    cur_usage,
+                    limits,
+                    self._options.backpressure_policies,
+                ),
+                list(topology),
+                {op: state.num_queued() for op, state in topology.items()},
             )
 
         # Update the progress bar to reflect scheduling decisions.
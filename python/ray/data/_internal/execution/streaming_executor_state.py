@@ -3,11 +3,12 @@
 This is split out from streaming_executor.py to facilitate better unit testing.
 """
 
+import functools
 import math
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Deque, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Deque, Set, Tuple, Union
 
 import ray
 from ray.data._internal.execution.interfaces import (
@@ -24,6 +25,10 @@ from ray.data._internal.execution.autoscaling_requester import (
 from ray.data._internal.execution.util import memory_string
 from ray.data._internal.progress_bar import ProgressBar
 
+if TYPE_CHECKING:
+    from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
+    from ray.data._internal.stats import ExecutionTimeline
+
 
 # Holds the full execution state of the streaming topology. It's a dict mapping each
 # operator to tracked streaming exec state.
@@ -106,7 +111,12 @@ class OpState:
     operator queues to be shared across threads.
     """
 
-    def __init__(self, op: PhysicalOperator, inqueues: List[Deque[MaybeRefBundle]]):
+    def __init__(
+        self,
+        op: PhysicalOperator,
+        inqueues: List[Deque[MaybeRefBundle]],
+        timeline: Optional["ExecutionTimeline"] = None,
+    ):
         # Each inqueue is connected to another operator's outqueue.
         assert len(inqueues) == len(op.input_dependencies), (op, inqueues)
         self.inqueues: List[Deque[MaybeRefBundle]] = inqueues
@@ -122,6 +132,7 @@ class OpState:
         self.num_completed_tasks = 0
         self.inputs_done_called = False
         self.dependents_completed_called = False
+        self.timeline = timeline
 
     def initialize_progress_bars(self, index: int, verbose_progress: bool) -> int:
         """Create progress bars at the given index (line offset in console).
@@ -163,6 +174,8 @@ class OpState:
 
     def add_output(self, ref: RefBundle) -> None:
         """Move a bundle produced by the operator to its outqueue."""
+        if self.timeline:
+            self.timeline.on_output_queued(self.op, ref)
         self.outqueue.append(ref)
         self.num_completed_tasks += 1
         if self.progress_bar:
@@ -191,7 +204,10 @@ class OpState:
         """Move a bundle from the operator inqueue to the operator itself."""
         for i, inqueue in enumerate(self.inqueues):
             if inqueue:
-                self.op.add_input(inqueue.popleft(), input_index=i)
+                bundle = inqueue.popleft()
+                self.op.add_input(bundle, input_index=i)
+                if self.timeline:
+                    self.timeline.on_input_dispatched(self.op, bundle)
                 return
         assert False, "Nothing to dispatch"
 
@@ -225,6 +241,19 @@ class OpState:
                 pass
             time.sleep(0.01)
 
+    def num_outputs_ready(self, output_split_idx: Optional[int]) -> int:
+        """Return the number of bundles in this node's output queue that
+        `get_output_blocking()` can return without blocking."""
+        # Copy the queue, since the executor thread may append to it concurrently.
+        return sum(
+            1
+            for bundle in list(self.outqueue)
+            if isinstance(bundle, RefBundle)
+            and (
+                output_split_idx is None or bundle.output_split_idx == output_split_idx
+            )
+        )
+
     def inqueue_memory_usage(self) -> int:
         """Return the object store memory of this operator's inqueue."""
         total = 0
@@ -257,7 +286,9 @@ class OpState:
 
 
 def build_streaming_topology(
-    dag: PhysicalOperator, options: ExecutionOptions
+    dag: PhysicalOperator,
+    options: ExecutionOptions,
+    timeline: Optional["ExecutionTimeline"] = None,
 ) -> Tuple[Topology, int]:
     """Instantiate the streaming operator state topology for the given DAG.
 
@@ -268,6 +299,7 @@ def build_streaming_topology(
     Args:
         dag: The operator DAG to instantiate.
         options: The execution options to use to start operators.
+        timeline: The timeline to record the execution of the operators to, if any.
 
     Returns:
         The topology dict holding the streaming execution state.
@@ -288,7 +320,10 @@ def build_streaming_topology(
             inqueues.append(parent_state.outqueue)
 
         # Create state.
-        op_state = OpState(op, inqueues)
+        op_state = OpState(op, inqueues, timeline)
+        if timeline:
+            op._on_task_submitted = functools.partial(timeline.on_task_submitted, op)
+            op._on_task_cancelled = functools.partial(timeline.on_task_cancelled, op)
         topology[op] = op_state
         op.start(options)
         return op_state
@@ -306,7 +341,9 @@ def build_streaming_topology(
     return (topology, i)
 
 
-def process_completed_tasks(topology: Topology) -> None:
+def process_completed_tasks(
+    topology: Topology, timeline: Optional["ExecutionTimeline"] = None
+) -> None:
     """Process any newly completed tasks and update operator state."""
 
     # Update active tasks.
@@ -327,6 +364,8 @@ def process_completed_tasks(topology: Topology) -> None:
         for ref in completed:
             op = active_tasks.pop(ref)
             op.notify_work_completed(ref)
+            if timeline:
+                timeline.on_task_finished(op, ref)
 
     # Pull any operator outputs into the streaming op state.
     for op, op_state in topology.items():
@@ -368,6 +407,7 @@ def select_operator_to_run(
     ensure_at_least_one_running: bool,
     execution_id: str,
     autoscaling_state: AutoscalingState,
+    backpressure_policies: Optional[List["BackpressurePolicy"]] = None,
 ) -> Optional[PhysicalOperator]:
     """Select an operator to run, if possible.
 
@@ -376,7 +416,9 @@ def select_operator_to_run(
 
     This is currently implemented by applying backpressure on operators that are
     producing outputs faster than they are consuming them `len(outqueue)`, as well as
-    operators with a large number of running tasks `num_processing()`.
+    operators with a large number of running tasks `num_processing()`. Operators are
+    also only selected if all of the given backpressure policies allow them to take
+    more inputs.
 
     Note that memory limits also apply to the outqueue of the output operator. This
     provides backpressure if the consumer is slow. However, once a bundle is returned
@@ -391,8 +433,7 @@ def select_operator_to_run(
         if (
             op.need_more_inputs()
             and state.num_queued() > 0
-            and op.should_add_input()
-            and under_resource_limits
+            and _can_add_input(op, state, under_resource_limits, backpressure_policies)
         ):
             ops.append(op)
         # Update the op in all cases to enable internal autoscaling, etc.
@@ -438,6 +479,45 @@ def select_operator_to_run(
     )
 
 
+def get_backpressured_ops(
+    topology: Topology,
+    cur_usage: TopologyResourceUsage,
+    limits: ExecutionResources,
+    backpressure_policies: Optional[List["BackpressurePolicy"]] = None,
+) -> Set[PhysicalOperator]:
+    """Return the operators that have queued inputs, but can't take them because of
+    resource limits or backpressure."""
+    return {
+        op
+        for op, state in topology.items()
+        if op.need_more_inputs()
+        and state.num_queued() > 0
+        and not _can_add_input(
+            op,
+            state,
+            _execution_allowed(op, cur_usage, limits),
+            backpressure_policies,
+        )
+    }
+
+
+def _can_add_input(
+    op: PhysicalOperator,
+    state: OpState,
+    under_resource_limits: bool,
+    backpressure_policies: Optional[List["BackpressurePolicy"]],
+) -> bool:
+    """Return whether the operator can take more inputs under the resource limits
+    and backpressure."""
+    return (
+        op.should_add_input()
+        and under_resource_limits
+        and all(
+            policy.can_add_input(op, state) for policy in backpressure_policies or []
+        )
+    )
+
+
 def _try_to_scale_up_cluster(topology: Topology, execution_id: str):
     """Try to scale up the cluster to accomodate the provided in-progress workload.
 
@@ -88,19 +88,20 @@ class StreamSplitDataIterator(DataIterator):
                 self._coord_actor.start_epoch.remote(self._output_split_idx)
             )
             future: ObjectRef[
-                Optional[ObjectRef[Block]]
+                List[Tuple[ObjectRef[Block], BlockMetadata]]
             ] = self._coord_actor.get.remote(cur_epoch, self._output_split_idx)
             while True:
-                block_ref: Optional[Tuple[ObjectRef[Block], BlockMetadata]] = ray.get(
+                block_refs: List[Tuple[ObjectRef[Block], BlockMetadata]] = ray.get(
                     future
                 )
-                if not block_ref:
+                if not block_refs:
                     break
                 else:
+                    # Request the next blocks while these ones are consumed.
                     future = self._coord_actor.get.remote(
                         cur_epoch, self._output_split_idx
                     )
-                    yield block_ref
+                    yield from block_refs
 
         return gen_blocks(), None, False
 
@@ -139,6 +140,7 @@ class SplitCoordinator:
         self._n = n
         self._equal = equal
         self._locality_hints = locality_hints
+        self._max_blocks_per_fetch = max(1, ctx.streaming_split_max_blocks_per_fetch)
         self._lock = threading.RLock()
 
         # Guarded by self._lock.
@@ -178,9 +180,14 @@ class SplitCoordinator:
 
     def get(
         self, epoch_id: int, output_split_idx: int
-    ) -> Optional[Tuple[ObjectRef[Block], BlockMetadata]]:
+    ) -> List[Tuple[ObjectRef[Block], BlockMetadata]]:
         """Blocking get operation.
 
+        This blocks until a block is routed to the given output split, and then
+        returns all the blocks routed to it so far, up to the max blocks per fetch, so
+        that clients don't need an actor call per block. An empty list means the end
+        of the epoch.
+
         This is intended to be called concurrently from multiple clients.
         """
 
@@ -189,30 +196,30 @@ class SplitCoordinator:
                 "Invalid iterator: the datastream has moved on to another epoch."
             )
 
+        with self._lock:
+            next_bundle = self._next_bundle.pop(output_split_idx, None)
+
+        blocks = []
         try:
-            # Ensure there is at least one bundle.
-            with self._lock:
-                if output_split_idx in self._next_bundle:
-                    next_bundle = self._next_bundle[output_split_idx]
-                else:
+            while len(blocks) < self._max_blocks_per_fetch:
+                if next_bundle is None:
+                    if blocks and not self._output_iterator.num_ready(output_split_idx):
+                        break
+                    # This is a BLOCKING call if no blocks have been fetched yet, so
+                    # do it outside the lock.
+                    next_bundle = self._output_iterator.get_next(output_split_idx)
+                while next_bundle.blocks and len(blocks) < self._max_blocks_per_fetch:
+                    blocks.append(next_bundle.blocks.pop(0))
+                if not next_bundle.blocks:
                     next_bundle = None
+        except StopIteration:
+            pass
 
-            # Fetch next bundle if needed.
-            if next_bundle is None:
-                # This is a BLOCKING call, so do it outside the lock.
-                next_bundle = self._output_iterator.get_next(output_split_idx)
-
-            bundle = next_bundle.blocks.pop()
-
-            # Accumulate any remaining blocks in next_bundle map as needed.
+        # Accumulate any remaining blocks in next_bundle map as needed.
+        if next_bundle is not None:
             with self._lock:
                 self._next_bundle[output_split_idx] = next_bundle
-                if not next_bundle.blocks:
-                    del self._next_bundle[output_split_idx]
-
-            return bundle
-        except StopIteration:
-            return None
+        return blocks
 
     def _barrier(self, split_idx: int) -> int:
         """Arrive and block until the start of the given epoch."""
@@ -597,10 +597,11 @@ class LazyBlockList(BlockList):
             self._execution_started = True
         task = self._tasks[task_idx]
         context = DataContext.get_current()
+        remote_args = {**self._remote_args, **task._ray_remote_args}
         if context.block_splitting_enabled:
             return (
                 cached_remote_fn(_execute_read_task_split)
-                .options(num_returns="dynamic", **self._remote_args)
+                .options(num_returns="dynamic", **remote_args)
                 .remote(
                     i=task_idx,
                     task=task,
@@ -613,7 +614,7 @@ class LazyBlockList(BlockList):
         else:
             return (
                 cached_remote_fn(_execute_read_task_nosplit)
-                .options(num_returns=2, **self._remote_args)
+                .options(num_returns=2, **remote_args)
                 .remote(
                     i=task_idx,
                     task=task,
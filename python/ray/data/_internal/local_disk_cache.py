@@ -0,0 +1,340 @@
+import os
+import shutil
+import uuid
+import weakref
+from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+
+import ray
+from ray.experimental.internal_kv import (
+    _internal_kv_del,
+    _internal_kv_list,
+    _internal_kv_put,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import Block, BlockMetadata
+from ray.data.datasource.datasource import Datasource, Reader, ReadTask
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# The file extension of cached blocks.
+CACHED_BLOCK_EXTENSION = ".arrow"
+
+# The internal KV namespace holding the IDs of the caches in use.
+_KV_NAMESPACE = "local_disk_cache"
+
+# The caches created by this process, by cache ID.
+_caches: "weakref.WeakValueDictionary[str, LocalDiskCache]" = (
+    weakref.WeakValueDictionary()
+)
+
+# The root directories whose stale cache directories were removed by this process.
+_cleaned_roots: Set[str] = set()
+
+# The total size of the cached blocks in each root directory, as counted by this
+# process.
+_cached_bytes: Dict[str, int] = {}
+
+
+class LocalDiskCache:
+    """The node-local cache directories of a datastream cached with
+    ``Datastream.cache()``.
+
+    The blocks are cached under ``<root>/<session name>/<job ID>/<cache ID>`` on
+    each node. When the cache created with ``create()`` is garbage collected, i.e.
+    when no datastream reads its blocks anymore, the cache directories are removed.
+    Deserializing the cache in the process that created it returns the same object,
+    so that the read tasks of the cached datastream keep it alive. While it's alive,
+    its ID is registered in the internal KV, so that its blocks aren't evicted.
+    """
+
+    def __init__(self, root: str, cache_id: str):
+        self.root = root
+        self.cache_id = cache_id
+        # The IDs of the nodes that hold cached blocks.
+        self.node_ids: Set[str] = set()
+
+    @classmethod
+    def create(cls, root: str) -> "LocalDiskCache":
+        """Create a cache whose directories are removed when it's garbage
+        collected."""
+        cache = cls(root, uuid.uuid4().hex)
+        _caches[cache.cache_id] = cache
+        _internal_kv_put(cache.cache_id, b"", namespace=_KV_NAMESPACE)
+        weakref.finalize(
+            cache, _remove_cache_dirs, root, cache.cache_id, cache.node_ids
+        )
+        return cache
+
+    def get_cache_dir(self) -> str:
+        """Return the cache directory on the current node."""
+        return os.path.join(
+            self.root,
+            _get_session_name(),
+            ray.get_runtime_context().get_job_id(),
+            self.cache_id,
+        )
+
+    def __reduce__(self):
+        return _deserialize_cache, (self.root, self.cache_id)
+
+
+def _deserialize_cache(root: str, cache_id: str) -> LocalDiskCache:
+    cache = _caches.get(cache_id)
+    if cache is None:
+        cache = LocalDiskCache(root, cache_id)
+    return cache
+
+
+def write_cached_blocks(
+    batch: "pyarrow.Table", cache: LocalDiskCache, max_bytes: Optional[int]
+) -> "pyarrow.Table":
+    """Write a block to a node-local Arrow IPC file in the cache directory.
+
+    This is applied to each block of the cached datastream with
+    ``map_batches(batch_size=None)``, so that the blocks are written on the node that
+    computed them, without going through the object store.
+
+    Args:
+        batch: The block to write.
+        cache: The cache of the datastream.
+        max_bytes: The max total size of the cached blocks on this node. If writing
+            the block exceeds it, the least recently used blocks of the caches that
+            aren't in use anymore are evicted. If that isn't enough, the block is
+            removed and a ``RuntimeError`` is raised.
+
+    Returns:
+        A table with a single row, holding the location and metadata of the block.
+    """
+    import pyarrow as pa
+
+    cache_dir = cache.get_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, uuid.uuid4().hex + CACHED_BLOCK_EXTENSION)
+    with pa.OSFile(path, "wb") as f:
+        with pa.ipc.new_file(f, batch.schema) as writer:
+            writer.write_table(batch)
+    _remove_stale_cache_dirs(cache.root)
+    if max_bytes is not None:
+        _add_cached_bytes(cache.root, path, max_bytes)
+    return pa.table(
+        {
+            "node_id": [ray.get_runtime_context().get_node_id()],
+            "path": [path],
+            "num_rows": [batch.num_rows],
+            "size_bytes": [batch.nbytes],
+            "schema": [batch.schema.serialize().to_pybytes()],
+        }
+    )
+
+
+def _remove_stale_cache_dirs(root: str) -> None:
+    """Remove the cache directories of the dead jobs of this session in the root
+    directory.
+
+    No datastream can read these blocks anymore. They're left behind when a driver
+    exits before its cached datastreams are garbage collected. This is done once per
+    process, since the workers of a job don't outlive it.
+    """
+    if root in _cleaned_roots:
+        return
+    _cleaned_roots.add(root)
+    session_dir = os.path.join(root, _get_session_name())
+    alive_job_ids = {
+        job["JobID"] for job in ray._private.state.jobs() if not job["IsDead"]
+    }
+    for job_id in _listdir(session_dir):
+        if job_id not in alive_job_ids:
+            shutil.rmtree(os.path.join(session_dir, job_id), ignore_errors=True)
+
+
+def _add_cached_bytes(root: str, path: str, max_bytes: int) -> None:
+    """Count the block file just written to the root directory towards max_bytes,
+    evicting the blocks of the caches that aren't in use if it's exceeded."""
+    num_bytes = os.path.getsize(path)
+    if root in _cached_bytes:
+        _cached_bytes[root] += num_bytes
+    else:
+        _cached_bytes[root] = _get_cached_bytes(root)
+    if _cached_bytes[root] <= max_bytes:
+        return
+    # The other workers on this node write and remove blocks too, so count the
+    # blocks again before evicting any.
+    _cached_bytes[root] = _get_cached_bytes(root)
+    if _cached_bytes[root] > max_bytes:
+        _cached_bytes[root] -= _evict_unused_blocks(
+            root, _cached_bytes[root] - max_bytes
+        )
+    if _cached_bytes[root] > max_bytes:
+        os.remove(path)
+        _cached_bytes[root] -= num_bytes
+        raise RuntimeError(
+            f"Caching the block would make the cached blocks on this node take "
+            f"{_cached_bytes[root] + num_bytes} bytes, which is more than "
+            f"max_bytes={max_bytes}. The blocks of cached datastreams that are "
+            "still in use aren't evicted, so delete the cached datastreams you no "
+            "longer need, or increase max_bytes."
+        )
+
+
+def _evict_unused_blocks(root: str, num_bytes: int) -> int:
+    """Remove the least recently used blocks of the caches in the root directory
+    that aren't in use, until at least num_bytes are freed.
+
+    Returns:
+        The number of bytes freed.
+    """
+    live_cache_ids = {
+        key.decode() for key in _internal_kv_list("", namespace=_KV_NAMESPACE)
+    }
+    unused_blocks = []
+    for dirpath, _, filenames in os.walk(root):
+        if os.path.basename(dirpath) in live_cache_ids:
+            continue
+        for filename in filenames:
+            if not filename.endswith(CACHED_BLOCK_EXTENSION):
+                continue
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            unused_blocks.append((stat.st_mtime, stat.st_size, path))
+    freed_bytes = 0
+    for _, size, path in sorted(unused_blocks):
+        if freed_bytes >= num_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Removed concurrently by another task.
+            continue
+        freed_bytes += size
+    return freed_bytes
+
+
+def _get_cached_bytes(root: str) -> int:
+    total_bytes = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.endswith(CACHED_BLOCK_EXTENSION):
+                continue
+            try:
+                total_bytes += os.path.getsize(os.path.join(dirpath, filename))
+            except FileNotFoundError:
+                # Removed concurrently by another task.
+                pass
+    return total_bytes
+
+
+def _remove_cache_dirs(root: str, cache_id: str, node_ids: Set[str]) -> None:
+    if not ray.is_initialized():
+        # The directories are removed by the next job that caches a datastream.
+        return
+    _internal_kv_del(cache_id, namespace=_KV_NAMESPACE)
+    remove_cache_dir = cached_remote_fn(_remove_cache_dir, num_cpus=0)
+    for node_id in node_ids:
+        remove_cache_dir.options(
+            scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=True)
+        ).remote(root, cache_id)
+
+
+def _remove_cache_dir(root: str, cache_id: str) -> None:
+    shutil.rmtree(LocalDiskCache(root, cache_id).get_cache_dir(), ignore_errors=True)
+
+
+def _get_session_name() -> str:
+    return ray._private.worker.global_worker.node.session_name
+
+
+def _listdir(path: str) -> List[str]:
+    try:
+        return os.listdir(path)
+    except FileNotFoundError:
+        return []
+
+
+class LocalDiskCacheDatasource(Datasource):
+    """A datasource that reads the blocks written by ``write_cached_blocks()``.
+
+    Each block is memory mapped from its file by a read task scheduled on the node
+    that cached it.
+    """
+
+    def create_reader(
+        self, cache: LocalDiskCache, entries: List[Dict[str, Any]]
+    ) -> Reader:
+        return _LocalDiskCacheReader(cache, entries)
+
+
+class _LocalDiskCacheReader(Reader):
+    def __init__(self, cache: LocalDiskCache, entries: List[Dict[str, Any]]):
+        self._cache = cache
+        self._entries = entries
+
+    def estimate_inmemory_data_size(self) -> Optional[int]:
+        return sum(entry["size_bytes"] for entry in self._entries)
+
+    def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+        import pyarrow as pa
+
+        read_tasks = []
+        for entry in self._entries:
+            metadata = BlockMetadata(
+                num_rows=entry["num_rows"],
+                size_bytes=entry["size_bytes"],
+                schema=pa.ipc.read_schema(pa.py_buffer(entry["schema"])),
+                input_files=None,
+                exec_stats=None,
+            )
+            node_id = entry["node_id"]
+            path = entry["path"]
+            read_tasks.append(
+                ReadTask(
+                    # The read tasks reference the cache, so that it isn't removed
+                    # while the cached datastream is in use.
+                    lambda cache=self._cache, node_id=node_id, path=path: [
+                        _read_cached_block(node_id, path)
+                    ],
+                    metadata,
+                    ray_remote_args={
+                        "scheduling_strategy": NodeAffinitySchedulingStrategy(
+                            node_id, soft=True
+                        )
+                    },
+                )
+            )
+        return read_tasks
+
+
+def _read_cached_block(node_id: str, path: str) -> Block:
+    if ray.get_runtime_context().get_node_id() == node_id:
+        return _mmap_cached_block(path)
+    if not any(node["NodeID"] == node_id and node["Alive"] for node in ray.nodes()):
+        raise RuntimeError(
+            f"The cached block {path} was lost, since the node {node_id} that cached "
+            "it is dead. Call Datastream.cache() on the original datastream to cache "
+            "it again."
+        )
+    # The read task was fused with tasks that read blocks cached on other nodes, so
+    # map the block on its node and fetch it from the object store.
+    mmap_cached_block = cached_remote_fn(_mmap_cached_block).options(
+        scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=False)
+    )
+    return ray.get(mmap_cached_block.remote(path))
+
+
+def _mmap_cached_block(path: str) -> Block:
+    import pyarrow as pa
+
+    try:
+        source = pa.memory_map(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"The cached block {path} was deleted. Call Datastream.cache() on the "
+            "original datastream to cache it again."
+        ) from None
+    # Mark the block as recently used, for the eviction of unused blocks.
+    os.utime(path)
+    return pa.ipc.open_file(source).read_all()
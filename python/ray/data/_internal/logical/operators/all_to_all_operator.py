@@ -74,6 +74,7 @@ class Repartition(AbstractAllToAll):
         input_op: LogicalOperator,
         num_outputs: int,
         shuffle: bool,
+        keys: Optional[List[str]] = None,
     ):
         super().__init__(
             "Repartition",
@@ -81,6 +82,7 @@ class Repartition(AbstractAllToAll):
             num_outputs=num_outputs,
         )
         self._shuffle = shuffle
+        self._keys = keys
 
 
 class Sort(AbstractAllToAll):
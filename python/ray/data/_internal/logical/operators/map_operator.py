@@ -1,10 +1,13 @@
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data.block import UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 class AbstractMap(LogicalOperator):
     """Abstract class for logical operators that should be converted to physical
@@ -130,22 +133,51 @@ class MapRows(AbstractUDFMap):
 
 
 class Filter(AbstractUDFMap):
-    """Logical operator for filter."""
+    """Logical operator for filter.
+
+    The predicate is either a row-level UDF ``fn``, or a ``filter_expr`` given as a
+    ``pyarrow.compute.Expression``. Only the latter can be pushed down into reads.
+    """
 
     def __init__(
         self,
         input_op: LogicalOperator,
-        fn: UserDefinedFunction,
+        fn: Optional[UserDefinedFunction] = None,
         compute: Optional[Union[str, ComputeStrategy]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
+        filter_expr: Optional["pyarrow.compute.Expression"] = None,
     ):
+        assert (fn is None) != (filter_expr is None), (fn, filter_expr)
         super().__init__(
             "Filter",
             input_op,
             fn,
+            fn_args=(filter_expr,) if filter_expr is not None else None,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._filter_expr = filter_expr
+
+
+class Project(AbstractUDFMap):
+    """Logical operator for select_columns."""
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        cols: List[str],
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            "Project",
+            input_op,
+            None,
+            fn_args=(cols,),
             compute=compute,
             ray_remote_args=ray_remote_args,
         )
+        self._cols = cols
 
 
 class FlatMap(AbstractUDFMap):
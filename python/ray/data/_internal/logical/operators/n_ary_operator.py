@@ -1,3 +1,5 @@
+from typing import List
+
 from ray.data._internal.logical.interfaces import LogicalOperator
 
 
@@ -15,3 +17,29 @@ class Zip(LogicalOperator):
             right_input_op: The input operator at right hand side.
         """
         super().__init__("Zip", [left_input_op, right_input_op])
+
+
+class Join(LogicalOperator):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        on: List[str],
+        how: str,
+        right_suffix: str,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            on: The key columns to join on.
+            how: The type of join, one of "inner", "left", "right" or "outer".
+            right_suffix: The suffix of the right hand side columns whose names
+                collide with left hand side columns.
+        """
+        super().__init__("Join", [left_input_op, right_input_op])
+        self._on = on
+        self._how = how
+        self._right_suffix = right_suffix
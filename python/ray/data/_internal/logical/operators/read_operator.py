@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ray.data._internal.logical.operators.map_operator import AbstractMap
 from ray.data.datasource.datasource import Datasource
@@ -13,8 +13,20 @@ class Read(AbstractMap):
         parallelism: int = -1,
         ray_remote_args: Dict[str, Any] = None,
         read_args: Dict[str, Any] = None,
+        limit: Optional[int] = None,
     ):
+        """
+        Args:
+            datasource: The datasource to read from.
+            parallelism: The requested parallelism of the read.
+            ray_remote_args: Args to provide to ray.remote.
+            read_args: Additional kwargs to pass to the datasource reader.
+            limit: If set, only the read tasks needed to produce this many rows are
+                launched. This is set by the optimizer when a downstream Limit
+                operator is pushed down, and does not truncate the read output.
+        """
         super().__init__("Read", None, ray_remote_args)
         self._datasource = datasource
         self._parallelism = parallelism
-        self._read_args = read_args
+        self._read_args = read_args or {}
+        self._limit = limit
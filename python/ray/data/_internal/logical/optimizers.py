@@ -7,7 +7,10 @@ from ray.data._internal.logical.interfaces import (
     PhysicalPlan,
 )
 from ray.data._internal.logical.rules import (
+    LimitPushdownRule,
     OperatorFusionRule,
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
     ReorderRandomizeBlocksRule,
 )
 from ray.data._internal.planner.planner import Planner
@@ -18,7 +21,12 @@ class LogicalOptimizer(Optimizer):
 
     @property
     def rules(self) -> List[Rule]:
-        return [ReorderRandomizeBlocksRule()]
+        return [
+            ReorderRandomizeBlocksRule(),
+            PredicatePushdownRule(),
+            ProjectionPushdownRule(),
+            LimitPushdownRule(),
+        ]
 
 
 class PhysicalOptimizer(Optimizer):
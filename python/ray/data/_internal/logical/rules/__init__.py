@@ -1,4 +1,15 @@
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
+from ray.data._internal.logical.rules.pushdown import (
+    LimitPushdownRule,
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
+)
 
-__all__ = ["ReorderRandomizeBlocksRule", "OperatorFusionRule"]
+__all__ = [
+    "ReorderRandomizeBlocksRule",
+    "OperatorFusionRule",
+    "LimitPushdownRule",
+    "PredicatePushdownRule",
+    "ProjectionPushdownRule",
+]
@@ -230,6 +230,9 @@ class OperatorFusionRule(Rule):
             min_rows_per_bundle=target_block_size,
             ray_remote_args=ray_remote_args,
         )
+        # Keep running the fused tasks with the remote args of their input bundles,
+        # e.g. on the nodes that hold the data of the read tasks.
+        op._ray_remote_args_fn = up_op._ray_remote_args_fn
 
         # Build a map logical operator to be used as a reference for further fusion.
         # TODO(Scott): This is hacky, remove this once we push fusion to be purely based
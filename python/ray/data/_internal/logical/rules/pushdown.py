@@ -0,0 +1,182 @@
+import copy
+from typing import TYPE_CHECKING, Any, List
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.limit_operator import Limit
+from ray.data._internal.logical.operators.map_operator import (
+    Filter,
+    MapRows,
+    Project,
+)
+from ray.data._internal.logical.operators.read_operator import Read
+
+if TYPE_CHECKING:
+    import pyarrow.compute as pc
+
+
+class PredicatePushdownRule(Rule):
+    """Rule for pushing expression-based Filter operators into Read operators.
+
+    A Filter whose predicate is a ``pyarrow.compute.Expression`` is moved below any
+    Project operators preceding it, and is then merged into the ``filter`` read arg
+    of a Read operator whose datasource supports read pushdown. A Filter is only
+    moved below a Project that keeps all the columns its predicate references, since
+    filtering on a column that was projected away raises an error. Filters with
+    opaque UDF predicates are left untouched.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag: LogicalOperator = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        # Post-order traversal, so that upstream pushdowns happen first. Rewired
+        # inputs are always equivalent to the original ones.
+        op._input_dependencies = [self._apply(x) for x in op.input_dependencies]
+
+        if not isinstance(op, Filter) or op._filter_expr is None:
+            return op
+
+        projects = []
+        upstream_op = op.input_dependencies[0]
+        while isinstance(upstream_op, Project):
+            if not _references_only(op._filter_expr, upstream_op._cols):
+                # Keep the Filter to preserve the original error behavior.
+                return op
+            projects.append(upstream_op)
+            upstream_op = upstream_op.input_dependencies[0]
+        if not _can_push_into_read(upstream_op):
+            return op
+
+        filter_expr = upstream_op._read_args.get("filter")
+        if filter_expr is None:
+            filter_expr = op._filter_expr
+        else:
+            filter_expr = filter_expr & op._filter_expr
+        new_op = _copy_read_with_args(upstream_op, filter=filter_expr)
+
+        # Re-apply the projections on top of the filtered read. The Project
+        # operators are copied since they may be shared with other datastreams
+        # which don't include this filter.
+        for project_op in reversed(projects):
+            new_project_op = copy.copy(project_op)
+            new_project_op._input_dependencies = [new_op]
+            new_project_op._output_dependencies = []
+            new_op = new_project_op
+        return new_op
+
+
+class ProjectionPushdownRule(Rule):
+    """Rule for pushing Project operators into Read operators.
+
+    A Project that directly follows a Read operator whose datasource supports
+    read pushdown is merged into the ``columns`` read arg of the Read, so that
+    unneeded columns are never read. This rule should run after
+    ``PredicatePushdownRule``, which moves expression-based filters out of the way.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag: LogicalOperator = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        op._input_dependencies = [self._apply(x) for x in op.input_dependencies]
+
+        if not isinstance(op, Project):
+            return op
+
+        upstream_op = op.input_dependencies[0]
+        if not _can_push_into_read(upstream_op):
+            return op
+
+        columns = upstream_op._read_args.get("columns")
+        if columns is not None and not set(op._cols).issubset(columns):
+            # Selecting a column that isn't read raises an error, so keep the
+            # Project operator to preserve the original error behavior.
+            return op
+        return _copy_read_with_args(upstream_op, columns=list(op._cols))
+
+
+class LimitPushdownRule(Rule):
+    """Rule for propagating Limit operators upstream into Read operators.
+
+    The row limit is pushed through operators that map rows 1:1 (MapRows, Project
+    and other Limits) into the ``limit`` of the Read operator, so that only the read
+    tasks needed to produce that many rows are launched. The Limit operator itself
+    is kept, since reads can only be truncated at read task granularity.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag: LogicalOperator = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        op._input_dependencies = [self._apply(x) for x in op.input_dependencies]
+
+        if not isinstance(op, Limit):
+            return op
+
+        row_preserving_ops = []
+        upstream_op = op.input_dependencies[0]
+        while isinstance(upstream_op, (MapRows, Project, Limit)):
+            row_preserving_ops.append(upstream_op)
+            upstream_op = upstream_op.input_dependencies[0]
+        if (
+            not isinstance(upstream_op, Read)
+            # A block UDF may change the number of rows in the read blocks.
+            or upstream_op._read_args.get("_block_udf") is not None
+            or (upstream_op._limit is not None and upstream_op._limit <= op._limit)
+        ):
+            return op
+
+        new_op = _copy_read_with_args(upstream_op)
+        new_op._limit = op._limit
+        # The operators in between are copied since they may be shared with other
+        # datastreams which don't include this limit.
+        for row_preserving_op in reversed(row_preserving_ops):
+            new_row_preserving_op = copy.copy(row_preserving_op)
+            new_row_preserving_op._input_dependencies = [new_op]
+            new_row_preserving_op._output_dependencies = []
+            new_op = new_row_preserving_op
+        op._input_dependencies = [new_op]
+        return op
+
+
+def _can_push_into_read(op: LogicalOperator) -> bool:
+    return (
+        isinstance(op, Read)
+        and op._datasource.supports_read_pushdown()
+        # A block UDF is applied to the read blocks, so it may need columns or rows
+        # that would be pushed down.
+        and op._read_args.get("_block_udf") is None
+    )
+
+
+def _references_only(expr: "pc.Expression", cols: List[str]) -> bool:
+    """Return whether the expression only references the given columns.
+
+    Arrow doesn't expose the field references of an expression, so the expression
+    is evaluated on an empty table with only these columns, which fails if it
+    references any other column. The columns are typed as null, so the evaluation
+    can also fail for other reasons, e.g. for ``is_in`` with a string value set. In
+    that case, the referenced columns are unknown, and False is returned.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as pds
+
+    table = pa.table({col: pa.array([], type=pa.null()) for col in cols})
+    try:
+        pds.dataset(table).to_table(filter=expr)
+    except Exception:
+        return False
+    return True
+
+
+def _copy_read_with_args(op: Read, **read_args: Any) -> Read:
+    return Read(
+        op._datasource,
+        parallelism=op._parallelism,
+        ray_remote_args=op._ray_remote_args,
+        read_args={**op._read_args, **read_args},
+        limit=op._limit,
+    )
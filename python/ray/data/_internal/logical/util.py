@@ -48,6 +48,7 @@ _op_name_white_list = [
     "MapRows",
     "Filter",
     "FlatMap",
+    "Project",
     # All-to-all
     "RandomizeBlocks",
     "RandomShuffle",
@@ -56,6 +57,9 @@ _op_name_white_list = [
     "Aggregate",
     # N-ary
     "Zip",
+    "Join",
+    # Limit
+    "Limit",
 ]
 
 
@@ -1132,8 +1132,16 @@ def _rewrite_read_stages(
     stages: List[Stage],
     datastream_uuid: str,
 ) -> Tuple[BlockList, DatastreamStats, List[Stage]]:
-    """Rewrites read stages into one-to-one stages, if needed."""
-    if _is_lazy(blocks) and stages:
+    """Rewrites read stages into one-to-one stages, if needed.
+
+    Read tasks with remote args of their own aren't rewritten, since the rewritten
+    stage runs all of them with the same remote args.
+    """
+    if (
+        _is_lazy(blocks)
+        and stages
+        and not any(task._ray_remote_args for task in blocks._tasks)
+    ):
         blocks, stats, stages = _rewrite_read_stage(blocks, stages)
         stats.datastream_uuid = datastream_uuid
     return blocks, stats, stages
@@ -6,6 +6,7 @@ from ray.data._internal.execution.interfaces import (
     TaskContext,
 )
 from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
     SortAggregateTaskSpec,
 )
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
@@ -48,10 +49,17 @@ def generate_aggregate_fn(
             agg_fn._validate(unified_schema)
 
         num_mappers = len(blocks)
+        # Hash-based aggregation doesn't need to sample the key boundaries.
+        use_hash_aggregate = (
+            isinstance(key, str) and DataContext.get_current().use_hash_aggregate
+        )
 
         if key is None:
             num_outputs = 1
             boundaries = []
+        elif use_hash_aggregate:
+            # Use same number of output partitions.
+            num_outputs = num_mappers
         else:
             # Use same number of output partitions.
             num_outputs = num_mappers
@@ -62,11 +70,23 @@ def generate_aggregate_fn(
                 num_outputs,
             )
 
-        agg_spec = SortAggregateTaskSpec(
-            boundaries=boundaries,
-            key=key,
-            aggs=aggs,
-        )
+        if use_hash_aggregate:
+            agg_spec = HashAggregateTaskSpec(
+                key=key,
+                aggs=aggs,
+                vectorized=HashAggregateTaskSpec.can_vectorize(
+                    key, aggs, unified_schema
+                ),
+                float_columns=HashAggregateTaskSpec.float_columns(
+                    aggs, [m.schema for m in metadata]
+                ),
+            )
+        else:
+            agg_spec = SortAggregateTaskSpec(
+                boundaries=boundaries,
+                key=key,
+                aggs=aggs,
+            )
         if DataContext.get_current().use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(agg_spec)
         else:
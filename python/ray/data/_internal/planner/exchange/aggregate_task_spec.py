@@ -1,8 +1,19 @@
-from typing import List, Optional, Tuple, Union
+import collections
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+
+import numpy as np
 
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.table_block import TableBlockAccessor
-from ray.data.aggregate import _AggregateOnKeyBase, AggregateFn, Count
+from ray.data.aggregate import (
+    _AggregateOnKeyBase,
+    AggregateFn,
+    Count,
+    Max,
+    Mean,
+    Min,
+    Sum,
+)
 from ray.data.block import (
     Block,
     BlockAccessor,
@@ -11,6 +22,11 @@ from ray.data.block import (
     KeyType,
 )
 
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data._internal.pandas_block import PandasBlockSchema
+
 
 class SortAggregateTaskSpec(ExchangeTaskSpec):
     """
@@ -108,3 +124,392 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    Aggregate is done in 2 steps, like the sort-based aggregate, but rows are
+    assigned to final aggregate tasks by the hash of their key instead of by sampled
+    key ranges, so no sampling or sorting across blocks is needed.
+
+    Partial aggregate (`map`): each block is partially aggregated and partitioned by
+    the hash of the key. If the aggregations are vectorized (see
+    `can_vectorize()`), the block is aggregated with `pyarrow.Table.group_by()`
+    before partitioning. Otherwise, each partition is sorted and combined per group.
+
+    Final aggregate (`reduce`): each task receives the partitions with the same key
+    hashes from every worker, and merges them. The output blocks are sorted by key,
+    but keys aren't ordered across output blocks.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        aggs: List[AggregateFn],
+        vectorized: bool,
+        float_columns: Optional[List[str]] = None,
+    ):
+        super().__init__(
+            map_args=[key, aggs, vectorized, float_columns or []],
+            reduce_args=[key, aggs, vectorized],
+        )
+
+    @staticmethod
+    def float_columns(
+        aggs: List[AggregateFn],
+        schemas: List[Union[type, "pyarrow.lib.Schema", "PandasBlockSchema"]],
+    ) -> List[str]:
+        """Return the aggregated columns that are floating point in any of the
+        schemas.
+
+        The vectorized aggregations of these columns are computed as float64 in all
+        blocks, and those of the other columns as int64, so that the output blocks
+        have the same types even if e.g. only some pandas blocks of an integer column
+        contain NaNs.
+        """
+        import pyarrow as pa
+
+        from ray.data._internal.pandas_block import PandasBlockSchema
+
+        columns = {
+            agg._key_fn
+            for agg in aggs
+            if isinstance(getattr(agg, "_key_fn", None), str)
+        }
+        float_columns = set()
+        for schema in schemas:
+            if isinstance(schema, pa.Schema):
+                for name, t in zip(schema.names, schema.types):
+                    if name in columns and pa.types.is_floating(t):
+                        float_columns.add(name)
+            elif isinstance(schema, PandasBlockSchema):
+                for name, t in zip(schema.names, schema.types):
+                    if name in columns and np.issubdtype(t, np.floating):
+                        float_columns.add(name)
+        return sorted(float_columns)
+
+    @staticmethod
+    def can_vectorize(
+        key: Optional[str],
+        aggs: List[AggregateFn],
+        schema: Optional[Union[type, "pyarrow.lib.Schema", "PandasBlockSchema"]],
+    ) -> bool:
+        """Whether the aggregations can be computed with
+        `pyarrow.Table.group_by()`.
+
+        This is the case for Count, Sum, Min, Max and Mean aggregations of numeric
+        columns.
+        """
+        import pyarrow as pa
+
+        from ray.data._internal.pandas_block import PandasBlockSchema
+
+        if isinstance(schema, pa.Schema):
+            types = dict(zip(schema.names, schema.types))
+
+            def is_numeric(t):
+                return pa.types.is_integer(t) or pa.types.is_floating(t)
+
+        elif isinstance(schema, PandasBlockSchema):
+            types = dict(zip(schema.names, schema.types))
+
+            def is_numeric(t):
+                return np.issubdtype(t, np.integer) or np.issubdtype(t, np.floating)
+
+        else:
+            return False
+        if not isinstance(key, str):
+            return False
+        for agg in aggs:
+            if type(agg) is Count:
+                continue
+            if type(agg) not in (Sum, Min, Max, Mean) or not isinstance(
+                agg._key_fn, str
+            ):
+                return False
+            if agg._key_fn not in types or not is_numeric(types[agg._key_fn]):
+                return False
+        return True
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: List[AggregateFn],
+        vectorized: bool,
+        float_columns: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        block_accessor = BlockAccessor.for_block(block)
+
+        if vectorized:
+            if block_accessor.num_rows() > 0:
+                table = _cast_aggregated_columns(
+                    block_accessor.to_arrow(), aggs, float_columns
+                )
+                block = _partial_aggregate(table, key, aggs)
+            parts = _hash_partition(block, key, output_num_blocks)
+        else:
+            parts = []
+            for partition in _hash_partition(block, key, output_num_blocks):
+                [partition] = BlockAccessor.for_block(partition).sort_and_partition(
+                    [], [(key, "ascending")], descending=False
+                )
+                parts.append(BlockAccessor.for_block(partition).combine(key, aggs))
+        meta = block_accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: str,
+        aggs: List[AggregateFn],
+        vectorized: bool,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        if not vectorized:
+            return BlockAccessor.for_block(mapper_outputs[0]).aggregate_combined_blocks(
+                list(mapper_outputs), key, aggs, finalize=not partial_reduce
+            )
+
+        stats = BlockExecStats.builder()
+        block = _merge_partial_aggregates(
+            list(mapper_outputs), key, aggs, finalize=not partial_reduce
+        )
+        return block, BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+
+
+def _hash_partition(
+    block: Block, key: Union[str, List[str]], num_partitions: int
+) -> List[Block]:
+    """Partition the rows of the block by the hash of their key columns."""
+    block_accessor = BlockAccessor.for_block(block)
+    if num_partitions == 1 or block_accessor.num_rows() == 0:
+        return [block] * num_partitions
+
+    keys = [key] if isinstance(key, str) else key
+    table = BlockAccessor.for_block(block_accessor.select(keys)).to_arrow()
+    hashes = _hash_key_columns(table, keys)
+    partition_ids = (hashes % np.uint64(num_partitions)).astype(np.int64)
+
+    # Group the row indices by partition, preserving the order of the rows.
+    indices = np.argsort(partition_ids, kind="stable")
+    bounds = np.cumsum(np.bincount(partition_ids, minlength=num_partitions))
+    return [
+        block_accessor.take(indices[start:end])
+        for start, end in zip(np.concatenate([[0], bounds[:-1]]), bounds)
+    ]
+
+
+def _hash_key_columns(table: "pyarrow.Table", keys: List[str]) -> np.ndarray:
+    """Hash the key columns of each row of the table into a uint64."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    hashes = np.zeros(table.num_rows, dtype=np.uint64)
+    for key in keys:
+        column = table[key].combine_chunks()
+        is_null = column.is_null().to_numpy(zero_copy_only=False)
+        # Cast numeric keys to float64, so that equal keys hash to the same value in
+        # all blocks, even when they have different types, e.g. an integer column
+        # that became float64 in a pandas block because of a NaN. Large integers
+        # can collide, which only puts them in the same partition. Null keys are
+        # all hashed to 0.
+        if (
+            pa.types.is_integer(column.type)
+            or pa.types.is_floating(column.type)
+            or pa.types.is_boolean(column.type)
+            or pa.types.is_null(column.type)
+        ):
+            values = pc.fill_null(column.cast(pa.float64(), safe=False), 0)
+            values = values.to_numpy(zero_copy_only=False)
+            # Normalize -0.0 to 0.0 and all NaNs to the same bits.
+            values = np.where(np.isnan(values), np.nan, values + 0.0)
+        else:
+            values = column.to_numpy(zero_copy_only=False)
+        column_hashes = pd.util.hash_array(values)
+        column_hashes[is_null] = 0
+        # Combine the hashes of the key columns, wrapping around on overflow.
+        hashes = hashes * np.uint64(31) + column_hashes
+    return hashes
+
+
+def _partial_aggregations(agg: AggregateFn, key: str) -> List[Tuple[str, str, Any]]:
+    """Return the `pyarrow.Table.group_by()` aggregations to partially aggregate
+    the given aggregation."""
+    import pyarrow.compute as pc
+
+    if type(agg) is Count:
+        return [(key, "count", pc.CountOptions(mode="all"))]
+    options = pc.ScalarAggregateOptions(skip_nulls=agg._ignore_nulls, min_count=1)
+    if type(agg) is Sum:
+        return [(agg._key_fn, "sum", options)]
+    elif type(agg) is Min:
+        return [(agg._key_fn, "min", options)]
+    elif type(agg) is Max:
+        return [(agg._key_fn, "max", options)]
+    else:
+        assert type(agg) is Mean, agg
+        return [
+            (agg._key_fn, "sum", options),
+            (agg._key_fn, "count", pc.CountOptions(mode="only_valid")),
+        ]
+
+
+def _merge_aggregations(agg: AggregateFn) -> List[Tuple[str, Any]]:
+    """Return the functions and options to merge the partial aggregates of the
+    given aggregation."""
+    import pyarrow.compute as pc
+
+    if type(agg) is Count:
+        return [("sum", None)]
+    options = pc.ScalarAggregateOptions(skip_nulls=agg._ignore_nulls, min_count=1)
+    if type(agg) is Sum:
+        return [("sum", options)]
+    elif type(agg) is Min:
+        return [("min", options)]
+    elif type(agg) is Max:
+        return [("max", options)]
+    else:
+        assert type(agg) is Mean, agg
+        return [("sum", options), ("sum", None)]
+
+
+def _group_by(
+    table: "pyarrow.Table", key: str, aggregations: List[Tuple[str, str, Any]]
+) -> Tuple["pyarrow.ChunkedArray", List["pyarrow.ChunkedArray"]]:
+    """Group the table by key, and return the key column and aggregated columns."""
+    result = table.group_by(key).aggregate(aggregations)
+    # Depending on the pyarrow version, the key column either comes first or last.
+    if result.column_names[-1] == key:
+        return result.column(result.num_columns - 1), result.columns[:-1]
+    else:
+        return result.column(0), result.columns[1:]
+
+
+def _partial_table(
+    key: str,
+    key_column: "pyarrow.ChunkedArray",
+    partial_columns: List["pyarrow.ChunkedArray"],
+) -> "pyarrow.Table":
+    import pyarrow as pa
+
+    return pa.Table.from_arrays(
+        [key_column] + partial_columns,
+        names=[key] + [f"__partial_{i}" for i in range(len(partial_columns))],
+    )
+
+
+def _cast_aggregated_columns(
+    table: "pyarrow.Table", aggs: List[AggregateFn], float_columns: List[str]
+) -> "pyarrow.Table":
+    """Cast the aggregated numeric columns to float64 if they're in `float_columns`
+    or floating point in this table, and to int64 otherwise."""
+    import pyarrow as pa
+
+    for name in {agg._key_fn for agg in aggs if not isinstance(agg, Count)}:
+        column = table.column(name)
+        if name in float_columns or pa.types.is_floating(column.type):
+            target_type = pa.float64()
+        else:
+            target_type = pa.int64()
+        if column.type != target_type:
+            table = table.set_column(
+                table.schema.get_field_index(name), name, column.cast(target_type)
+            )
+    return table
+
+
+def _partial_aggregate(
+    table: "pyarrow.Table", key: str, aggs: List[AggregateFn]
+) -> "pyarrow.Table":
+    """Aggregate the rows of the table with the same key into partial aggregates."""
+    aggregations = []
+    for agg in aggs:
+        aggregations.extend(_partial_aggregations(agg, key))
+    key_column, partial_columns = _group_by(table, key, aggregations)
+    return _partial_table(key, key_column, partial_columns)
+
+
+def _merge_partial_aggregates(
+    tables: List["pyarrow.Table"],
+    key: str,
+    aggs: List[AggregateFn],
+    finalize: bool,
+) -> "pyarrow.Table":
+    """Merge the partial aggregates with the same key, and optionally finalize them
+    into a sorted block of [k, v_1, ..., v_n] columns."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from ray.data._internal.arrow_block import ArrowBlockAccessor
+    from ray.data._internal.arrow_ops import transform_pyarrow
+
+    tables = [t for t in tables if BlockAccessor.for_block(t).num_rows() > 0]
+    if len(tables) == 0:
+        return ArrowBlockAccessor._empty_table()
+    table = transform_pyarrow.concat(_unify_numeric_types(tables))
+
+    aggregations = []
+    for agg in aggs:
+        for fn, options in _merge_aggregations(agg):
+            column = table.column_names[len(aggregations) + 1]
+            aggregations.append((column, fn, options))
+    key_column, partial_columns = _group_by(table, key, aggregations)
+    if not finalize:
+        return _partial_table(key, key_column, partial_columns)
+
+    columns = {key: key_column}
+    count = collections.defaultdict(int)
+    partial_columns = iter(partial_columns)
+    for agg in aggs:
+        if type(agg) is Mean:
+            sum_, count_ = next(partial_columns), next(partial_columns)
+            value = pc.divide(pc.cast(sum_, pa.float64()), count_)
+        else:
+            value = next(partial_columns)
+        name = agg.name
+        # Check for conflicts with existing aggregation name.
+        if count[name] > 0:
+            name = ArrowBlockAccessor._munge_conflict(name, count[name])
+        count[name] += 1
+        columns[name] = value
+    return pa.table(columns).sort_by(key)
+
+
+def _unify_numeric_types(tables: List["pyarrow.Table"]) -> List["pyarrow.Table"]:
+    """Cast the numeric columns whose types differ between the tables to a common
+    type, e.g. when only some of the pandas blocks of a column contain NaNs."""
+    import pyarrow as pa
+
+    types = collections.defaultdict(set)
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                types[field.name].add(field.type)
+    for name, column_types in types.items():
+        if len(column_types) < 2 or not all(
+            pa.types.is_integer(t) or pa.types.is_floating(t) for t in column_types
+        ):
+            continue
+        if any(pa.types.is_floating(t) for t in column_types):
+            target_type = pa.float64()
+        else:
+            target_type = pa.int64()
+        tables = [
+            t.set_column(
+                t.schema.get_field_index(name),
+                name,
+                t.column(name).cast(target_type),
+            )
+            for t in tables
+        ]
+    return tables
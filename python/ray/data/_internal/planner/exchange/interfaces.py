@@ -18,14 +18,24 @@ class ExchangeTaskSpec:
     Any custom arguments for `map` and `reduce` methods should be specified by
     setting `map_args` and `reduce_args`.
 
+    If `split_reduce_outputs` is set, reduce tasks are run with dynamic returns, and
+    `reduce` may split its output into multiple blocks. It then returns a generator
+    of the output blocks, followed by the list of their metadata.
+
     The concept here is similar to the exchange operator described in
     "Volcano - An Extensible and Parallel Query Evaluation System"
     (https://dl.acm.org/doi/10.1109/69.273032).
     """
 
-    def __init__(self, map_args: List[Any] = None, reduce_args: List[Any] = None):
+    def __init__(
+        self,
+        map_args: List[Any] = None,
+        reduce_args: List[Any] = None,
+        split_reduce_outputs: bool = False,
+    ):
         self._map_args = map_args or []
         self._reduce_args = reduce_args or []
+        self._split_reduce_outputs = split_reduce_outputs
         assert isinstance(self._map_args, list)
         assert isinstance(self._reduce_args, list)
 
@@ -55,7 +65,9 @@ class ExchangeTaskSpec:
             partial_reduce: Whether should partially or fully reduce.
 
         Returns:
-            The reduced block and its metadata.
+            The reduced block and its metadata. If `split_reduce_outputs` is set
+            and `partial_reduce` isn't, a generator of the reduced blocks
+            followed by the list of their metadata.
         """
         raise NotImplementedError
 
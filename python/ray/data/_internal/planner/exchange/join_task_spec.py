@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# The pyarrow join types of the supported join types.
+_JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+# Names of the row index columns used to gather the joined rows.
+_LEFT_INDEX_COLUMN = "__left_index"
+_RIGHT_INDEX_COLUMN = "__right_index"
+
+
+def _join_blocks(
+    on: List[str],
+    how: str,
+    right_suffix: str,
+    left: Block,
+    right: Block,
+) -> Tuple[Block, BlockMetadata]:
+    """Join two blocks on the given key columns."""
+    stats = BlockExecStats.builder()
+    result = _join_tables(
+        BlockAccessor.for_block(left).to_arrow(),
+        BlockAccessor.for_block(right).to_arrow(),
+        on,
+        how,
+        right_suffix,
+    )
+    return result, BlockAccessor.for_block(result).get_metadata(
+        input_files=None, exec_stats=stats.build()
+    )
+
+
+def _join_tables(
+    left: "pyarrow.Table",
+    right: "pyarrow.Table",
+    on: List[str],
+    how: str,
+    right_suffix: str,
+) -> "pyarrow.Table":
+    """Join two tables on the given key columns.
+
+    Only the key columns are joined with `pyarrow.Table.join()`, together with the
+    row indices of both sides, which are then used to gather the other columns. This
+    supports columns of any type, including tensor and nested types that can't be
+    joined by pyarrow.
+    """
+    import pyarrow as pa
+
+    # Empty blocks without a schema don't have the key columns.
+    if left.num_rows == 0 and not set(on).issubset(left.column_names):
+        if right.num_rows == 0 and not set(on).issubset(right.column_names):
+            return pa.table({})
+        left = right.select(on).schema.empty_table()
+    elif right.num_rows == 0 and not set(on).issubset(right.column_names):
+        right = left.select(on).schema.empty_table()
+
+    left_keys = left.select(on).append_column(
+        _LEFT_INDEX_COLUMN, pa.array(np.arange(left.num_rows, dtype=np.int64))
+    )
+    right_keys = right.select(on).append_column(
+        _RIGHT_INDEX_COLUMN, pa.array(np.arange(right.num_rows, dtype=np.int64))
+    )
+    joined = left_keys.join(right_keys, on, join_type=_JOIN_TYPES[how])
+
+    left_columns = [name for name in left.column_names if name not in on]
+    right_columns = [name for name in right.column_names if name not in on]
+    left_values = transform_pyarrow.take_table(
+        left.select(left_columns), joined[_LEFT_INDEX_COLUMN]
+    )
+    right_values = transform_pyarrow.take_table(
+        right.select(right_columns), joined[_RIGHT_INDEX_COLUMN]
+    )
+
+    # The key columns keep their position in the left side, and the other columns
+    # of the right side are appended, with a suffix if their name is taken.
+    names, columns = [], []
+    for name in left.column_names:
+        names.append(name)
+        columns.append(joined[name] if name in on else left_values[name])
+    for name in right_columns:
+        names.append(name + right_suffix if name in left.column_names else name)
+        columns.append(right_values[name])
+    return pa.Table.from_arrays(columns, names=names)
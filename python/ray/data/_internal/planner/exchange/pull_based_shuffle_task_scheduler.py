@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional, Tuple
 
+import ray
 from ray.data._internal.execution.interfaces import RefBundle
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskScheduler
 from ray.data._internal.progress_bar import ProgressBar
@@ -67,31 +68,46 @@ class PullBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         map_bar.close()
 
         reduce_bar = ProgressBar("Shuffle Reduce", total=output_num_blocks)
+        split_reduce_outputs = self._exchange_spec._split_reduce_outputs
         shuffle_reduce_out = [
-            shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2,).remote(
+            shuffle_reduce.options(
+                **reduce_ray_remote_args,
+                num_returns="dynamic" if split_reduce_outputs else 2,
+            ).remote(
                 *self._exchange_spec._reduce_args,
                 *[shuffle_map_out[i][j] for i in range(input_num_blocks)],
             )
             for j in range(output_num_blocks)
         ]
 
-        new_blocks, new_metadata = zip(*shuffle_reduce_out)
-        new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
-        reduce_bar.close()
-
         output = []
-        for block, meta in zip(new_blocks, new_metadata):
-            output.append(
-                RefBundle(
-                    [
-                        (
-                            block,
-                            meta,
-                        )
-                    ],
-                    owns_blocks=input_owned,
+        if split_reduce_outputs:
+            new_metadata = []
+            for ref_generator in reduce_bar.fetch_until_complete(shuffle_reduce_out):
+                refs = list(ref_generator)
+                metadata = ray.get(refs.pop(-1))
+                output.append(
+                    RefBundle(list(zip(refs, metadata)), owns_blocks=input_owned)
+                )
+                new_metadata += metadata
+            reduce_bar.close()
+        else:
+            new_blocks, new_metadata = zip(*shuffle_reduce_out)
+            new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
+            reduce_bar.close()
+
+            for block, meta in zip(new_blocks, new_metadata):
+                output.append(
+                    RefBundle(
+                        [
+                            (
+                                block,
+                                meta,
+                            )
+                        ],
+                        owns_blocks=input_owned,
+                    )
                 )
-            )
         stats = {
             "map": shuffle_map_metadata,
             "reduce": new_metadata,
@@ -276,12 +276,14 @@ class _ReduceStageIterator:
         all_merge_results: List[List[List[ObjectRef]]],
         ray_remote_args,
         reduce_args: List[Any],
+        split_outputs: bool = False,
     ):
         self._shuffle_reduce = shuffle_reduce
         self._stage = stage
         self._reduce_arg_blocks: List[Tuple[int, List[ObjectRef]]] = []
         self._ray_remote_args = ray_remote_args
         self._reduce_args = reduce_args
+        self._split_outputs = split_outputs
 
         for reduce_idx in self._stage.merge_schedule.round_robin_reduce_idx_iterator():
             merge_idx = self._stage.merge_schedule.get_merge_idx_for_reducer_idx(
@@ -314,6 +316,16 @@ class _ReduceStageIterator:
         # outputs produced by the corresponding merge task.
         # We also add the merge task arguments so that the reduce task
         # is colocated with its inputs.
+        if self._split_outputs:
+            # The reduce task returns a generator of its output blocks followed by
+            # their metadata, which is waited for in place of the metadata.
+            ref_generator = self._shuffle_reduce.options(
+                **self._ray_remote_args,
+                **self._stage.get_merge_task_options(merge_idx),
+                num_returns="dynamic",
+            ).remote(*self._reduce_args, *reduce_arg_blocks, partial_reduce=False)
+            self._reduce_results.append((reduce_idx, ref_generator))
+            return ref_generator
         block, meta = self._shuffle_reduce.options(
             **self._ray_remote_args,
             **self._stage.get_merge_task_options(merge_idx),
@@ -473,6 +485,7 @@ class PushBasedShuffleTaskScheduler(ExchangeTaskScheduler):
             all_merge_results,
             reduce_ray_remote_args,
             self._exchange_spec._reduce_args,
+            self._exchange_spec._split_reduce_outputs,
         )
 
         max_reduce_tasks_in_flight = output_num_blocks
@@ -512,18 +525,29 @@ class PushBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         reduce_bar.close()
 
         output = []
-        for block, meta in zip(new_blocks, reduce_stage_metadata):
-            output.append(
-                RefBundle(
-                    [
-                        (
-                            block,
-                            meta,
-                        )
-                    ],
-                    owns_blocks=input_owned,
+        if self._exchange_spec._split_reduce_outputs:
+            new_metadata = []
+            for ref_generator in reduce_stage_metadata:
+                refs = list(ref_generator)
+                metadata = ray.get(refs.pop(-1))
+                output.append(
+                    RefBundle(list(zip(refs, metadata)), owns_blocks=input_owned)
+                )
+                new_metadata += metadata
+            reduce_stage_metadata = new_metadata
+        else:
+            for block, meta in zip(new_blocks, reduce_stage_metadata):
+                output.append(
+                    RefBundle(
+                        [
+                            (
+                                block,
+                                meta,
+                            )
+                        ],
+                        owns_blocks=input_owned,
+                    )
                 )
-            )
         stats = {
             "map": map_stage_metadata,
             "merge": merge_stage_metadata,
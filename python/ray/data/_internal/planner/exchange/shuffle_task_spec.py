@@ -5,6 +5,7 @@ import numpy as np
 
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import MapTransformFn
+from ray.data._internal.planner.exchange.aggregate_task_spec import _hash_partition
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 
@@ -96,3 +97,51 @@ class ShuffleTaskSpec(ExchangeTaskSpec):
             exec_stats=stats.build(),
         )
         return new_block, new_metadata
+
+
+class HashShuffleTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash partitioning blocks by key columns.
+
+    This is used by join() and partitioned writes. The rows with equal keys end up in
+    the output partition with the same index, so when both sides of a join are
+    partitioned into the same number of partitions, their matching rows are in
+    partitions with the same index.
+
+    Partition (`map`): the rows of each block are partitioned by the hash of their
+    key columns.
+
+    Combine (`reduce`): each task concatenates the blocks of one partition from every
+    map task.
+    """
+
+    def __init__(self, keys: List[str]):
+        super().__init__(map_args=[keys])
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        keys: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        parts = _hash_partition(block, keys, output_num_blocks)
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        stats = BlockExecStats.builder()
+        builder = DelegatingBlockBuilder()
+        for block in mapper_outputs:
+            builder.add_block(block)
+        block = builder.build()
+        return block, BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Tuple, TypeVar, Union
+from typing import Any, Callable, Iterator, List, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -6,6 +6,7 @@ from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.sort import external_merge_sorted_blocks
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.types import ObjectRef
 
@@ -37,7 +38,9 @@ class SortTaskSpec(ExchangeTaskSpec):
 
     Merging (`reduce`): a merge task would receive a block from every worker that
     consists of items in a certain range. It then merges the sorted blocks into one
-    sorted block and becomes part of the new, sorted block.
+    sorted block and becomes part of the new, sorted block. If `use_external_sort` is
+    set, the sorted blocks are merged with a bounded-memory k-way merge that outputs
+    the merged rows as multiple blocks.
     """
 
     def __init__(
@@ -45,10 +48,12 @@ class SortTaskSpec(ExchangeTaskSpec):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        use_external_sort: bool = False,
     ):
         super().__init__(
             map_args=[boundaries, key, descending],
-            reduce_args=[key, descending],
+            reduce_args=[key, descending, use_external_sort],
+            split_reduce_outputs=use_external_sort,
         )
 
     @staticmethod
@@ -73,9 +78,14 @@ class SortTaskSpec(ExchangeTaskSpec):
     def reduce(
         key: SortKeyT,
         descending: bool,
+        use_external_sort: bool,
         *mapper_outputs: List[Block],
         partial_reduce: bool = False,
-    ) -> Tuple[Block, BlockMetadata]:
+    ) -> Union[
+        Tuple[Block, BlockMetadata], Iterator[Union[Block, List[BlockMetadata]]]
+    ]:
+        if use_external_sort and not partial_reduce:
+            return external_merge_sorted_blocks(mapper_outputs, key, descending)
         return BlockAccessor.for_block(mapper_outputs[0]).merge_sorted_blocks(
             mapper_outputs, key, descending
         )
@@ -1,9 +1,12 @@
-from typing import Callable, Iterator
+from typing import TYPE_CHECKING, Callable, Iterator
 
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data.block import Block, BlockAccessor, UserDefinedFunction
 from ray.data.context import DataContext
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 def generate_filter_fn() -> Callable[
     [Iterator[Block], TaskContext, UserDefinedFunction], Iterator[Block]
@@ -30,3 +33,26 @@ def generate_filter_fn() -> Callable[
             yield builder.build()
 
     return fn
+
+
+def generate_filter_expr_fn() -> Callable[
+    [Iterator[Block], TaskContext, "pyarrow.compute.Expression"], Iterator[Block]
+]:
+    """Generate function to filter out records of blocks that do not satisfy the
+    given ``pyarrow.compute.Expression``.
+    """
+    import pyarrow.dataset as pds
+
+    context = DataContext.get_current()
+
+    def fn(
+        blocks: Iterator[Block],
+        ctx: TaskContext,
+        filter_expr: "pyarrow.compute.Expression",
+    ) -> Iterator[Block]:
+        DataContext._set_current(context)
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            yield pds.dataset(table).to_table(filter=filter_expr)
+
+    return fn
@@ -0,0 +1,134 @@
+from typing import Callable, List, Optional, Tuple
+
+import ray
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.execution.interfaces import RefBundle
+from ray.data._internal.planner.exchange.join_task_spec import _join_blocks
+from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
+    PushBasedShuffleTaskScheduler,
+)
+from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
+    PullBasedShuffleTaskScheduler,
+)
+from ray.data._internal.planner.exchange.shuffle_task_spec import HashShuffleTaskSpec
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.util import capfirst
+from ray.data.block import Block, BlockPartition
+from ray.data.context import DataContext
+from ray.types import ObjectRef
+
+JoinTransformFn = Callable[
+    [List[RefBundle], List[RefBundle]], Tuple[List[RefBundle], StatsDict]
+]
+
+
+def generate_join_fn(on: List[str], how: str, right_suffix: str) -> JoinTransformFn:
+    """Generate function to join the blocks of two inputs on the key columns.
+
+    If the estimated size of a side is at most
+    `DataContext.broadcast_join_threshold` and the join type doesn't need its
+    unmatched rows, that side is concatenated into a single block, which is joined
+    with each block of the other side. Ray transfers the broadcast block once per
+    node. Otherwise, both sides are hash partitioned by the key columns, and each
+    pair of partitions is joined.
+    """
+
+    def fn(
+        left: List[RefBundle], right: List[RefBundle]
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        left_blocks = [b for bundle in left for b in bundle.blocks]
+        right_blocks = [b for bundle in right for b in bundle.blocks]
+        if not left_blocks and not right_blocks:
+            return [], {}
+
+        threshold = DataContext.get_current().broadcast_join_threshold
+        left_bytes = _estimate_size_bytes(left_blocks)
+        right_bytes = _estimate_size_bytes(right_blocks)
+        broadcast_right = (
+            how in ("inner", "left")
+            and right_bytes is not None
+            and right_bytes <= threshold
+        )
+        broadcast_left = (
+            how in ("inner", "right")
+            and left_bytes is not None
+            and left_bytes <= threshold
+        )
+        if broadcast_left and broadcast_right:
+            # Broadcast the smaller side.
+            broadcast_left = left_bytes < right_bytes
+            broadcast_right = not broadcast_left
+
+        join_blocks = cached_remote_fn(_join_blocks, num_returns=2)
+        output_blocks = []
+        output_metadata = []
+        stats = {}
+        if broadcast_left or broadcast_right:
+            concat_blocks = cached_remote_fn(_concat_blocks)
+            if broadcast_right:
+                small = concat_blocks.remote(*[b for b, _ in right_blocks])
+                pairs = [(b, small) for b, _ in left_blocks]
+            else:
+                small = concat_blocks.remote(*[b for b, _ in left_blocks])
+                pairs = [(small, b) for b, _ in right_blocks]
+        else:
+            # Partition both sides into the same number of partitions.
+            num_partitions = max(len(left_blocks), len(right_blocks))
+            left_partitions, left_stats = _hash_partition(left, on, num_partitions)
+            right_partitions, right_stats = _hash_partition(right, on, num_partitions)
+            pairs = list(zip(left_partitions, right_partitions))
+            stats.update({"left" + capfirst(k): v for k, v in left_stats.items()})
+            stats.update({"right" + capfirst(k): v for k, v in right_stats.items()})
+
+        for left_block, right_block in pairs:
+            block, meta = join_blocks.remote(
+                on, how, right_suffix, left_block, right_block
+            )
+            output_blocks.append(block)
+            output_metadata.append(meta)
+        output_metadata = ray.get(output_metadata)
+        stats["probe"] = output_metadata
+
+        input_owned = all(b.owns_blocks for b in left + right)
+        for bundle in left + right:
+            bundle.destroy_if_owned()
+        return [
+            RefBundle([(block, meta)], owns_blocks=input_owned)
+            for block, meta in zip(output_blocks, output_metadata)
+        ], stats
+
+    return fn
+
+
+def _estimate_size_bytes(blocks: BlockPartition) -> Optional[int]:
+    """Estimate the size of the blocks from their metadata, or return None if it's
+    unknown."""
+    if any(meta.size_bytes is None for _, meta in blocks):
+        return None
+    return sum(meta.size_bytes for _, meta in blocks)
+
+
+def _hash_partition(
+    refs: List[RefBundle], on: List[str], num_partitions: int
+) -> Tuple[List[ObjectRef[Block]], StatsDict]:
+    """Hash partition the blocks by the key columns, returning the block of each
+    partition in order."""
+    if not any(bundle.blocks for bundle in refs):
+        concat_blocks = cached_remote_fn(_concat_blocks)
+        return [concat_blocks.remote()] * num_partitions, {}
+    spec = HashShuffleTaskSpec(on)
+    if DataContext.get_current().use_push_based_shuffle:
+        scheduler = PushBasedShuffleTaskScheduler(spec)
+    else:
+        scheduler = PullBasedShuffleTaskScheduler(spec)
+    output, stats = scheduler.execute(refs, num_partitions)
+    return [block for bundle in output for block, _ in bundle.blocks], stats
+
+
+def _concat_blocks(*blocks: Block) -> Block:
+    """Concatenate the blocks into a single block."""
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
@@ -1,5 +1,10 @@
+from typing import Optional
+
 from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.operators.all_to_all_operator import AllToAllOperator
+from ray.data._internal.execution.operators.streaming_shuffle_operator import (
+    StreamingShuffleOperator,
+)
 from ray.data._internal.logical.operators.all_to_all_operator import (
     AbstractAllToAll,
     Aggregate,
@@ -9,10 +14,12 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     Sort,
 )
 from ray.data._internal.planner.aggregate import generate_aggregate_fn
+from ray.data._internal.planner.exchange.shuffle_task_spec import ShuffleTaskSpec
 from ray.data._internal.planner.random_shuffle import generate_random_shuffle_fn
 from ray.data._internal.planner.randomize_blocks import generate_randomize_blocks_fn
 from ray.data._internal.planner.repartition import generate_repartition_fn
 from ray.data._internal.planner.sort import generate_sort_fn
+from ray.data.context import DataContext
 
 
 def _plan_all_to_all_op(
@@ -24,12 +31,17 @@ def _plan_all_to_all_op(
     Note this method only converts the given `op`, but not its input dependencies.
     See Planner.plan() for more details.
     """
+    if DataContext.get_current().use_streaming_shuffle:
+        streaming_op = _plan_streaming_shuffle_op(op, input_physical_dag)
+        if streaming_op is not None:
+            return streaming_op
+
     if isinstance(op, RandomizeBlocks):
         fn = generate_randomize_blocks_fn(op._seed)
     elif isinstance(op, RandomShuffle):
         fn = generate_random_shuffle_fn(op._seed, op._num_outputs)
     elif isinstance(op, Repartition):
-        fn = generate_repartition_fn(op._num_outputs, op._shuffle)
+        fn = generate_repartition_fn(op._num_outputs, op._shuffle, op._keys)
     elif isinstance(op, Sort):
         fn = generate_sort_fn(op._key, op._descending)
     elif isinstance(op, Aggregate):
@@ -43,3 +55,31 @@ def _plan_all_to_all_op(
         num_outputs=op._num_outputs,
         name=op.name,
     )
+
+
+def _plan_streaming_shuffle_op(
+    op: AbstractAllToAll,
+    input_physical_dag: PhysicalOperator,
+) -> Optional[StreamingShuffleOperator]:
+    """Get a StreamingShuffleOperator for random shuffle and shuffling repartition
+    operators, or None if the operator can't be executed in a streaming fashion.
+
+    Sorts and aggregations need to sample all of their inputs before shuffling, so
+    they are always executed by an AllToAllOperator.
+    """
+    if isinstance(op, RandomShuffle):
+        shuffle_spec = ShuffleTaskSpec(random_shuffle=True, random_seed=op._seed)
+        ray_remote_args = op._ray_remote_args
+    elif isinstance(op, Repartition) and op._shuffle and not op._keys:
+        shuffle_spec = ShuffleTaskSpec(random_shuffle=False)
+        ray_remote_args = None
+    else:
+        return None
+
+    return StreamingShuffleOperator(
+        shuffle_spec,
+        input_physical_dag,
+        num_outputs=op._num_outputs,
+        ray_remote_args=ray_remote_args,
+        name=op.name,
+    )
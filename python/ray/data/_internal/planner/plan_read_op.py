@@ -21,29 +21,30 @@ def _plan_read_op(op: Read) -> PhysicalOperator:
     See Planner.plan() for more details.
     """
 
+    # The remote args of the read tasks that have their own, by task ref.
+    read_task_remote_args = {}
+
     def get_input_data() -> List[RefBundle]:
         reader = op._datasource.create_reader(**op._read_args)
         read_tasks = reader.get_read_tasks(op._parallelism)
-        return [
-            RefBundle(
-                [
-                    (
-                        # TODO(chengsu): figure out a better way to pass read
-                        # tasks other than ray.put().
-                        ray.put(read_task),
-                        BlockMetadata(
-                            num_rows=1,
-                            size_bytes=len(cloudpickle.dumps(read_task)),
-                            schema=None,
-                            input_files=[],
-                            exec_stats=None,
-                        ),
-                    )
-                ],
-                owns_blocks=True,
+        if op._limit is not None:
+            read_tasks = _truncate_read_tasks(read_tasks, op._limit)
+        input_data = []
+        for read_task in read_tasks:
+            # TODO(chengsu): figure out a better way to pass read tasks other than
+            # ray.put().
+            ref = ray.put(read_task)
+            if read_task._ray_remote_args:
+                read_task_remote_args[ref] = read_task._ray_remote_args
+            metadata = BlockMetadata(
+                num_rows=1,
+                size_bytes=len(cloudpickle.dumps(read_task)),
+                schema=None,
+                input_files=[],
+                exec_stats=None,
             )
-            for read_task in read_tasks
-        ]
+            input_data.append(RefBundle([(ref, metadata)], owns_blocks=True))
+        return input_data
 
     inputs = InputDataBuffer(input_data_factory=get_input_data)
 
@@ -51,4 +52,25 @@ def _plan_read_op(op: Read) -> PhysicalOperator:
         for read_task in blocks:
             yield from read_task()
 
-    return MapOperator.create(do_read, inputs, name="DoRead")
+    map_op = MapOperator.create(do_read, inputs, name="DoRead")
+    map_op._ray_remote_args_fn = lambda bundle: read_task_remote_args.get(
+        bundle.blocks[0][0], {}
+    )
+    return map_op
+
+
+def _truncate_read_tasks(read_tasks: List[ReadTask], limit: int) -> List[ReadTask]:
+    """Drop the read tasks that aren't needed to produce the first `limit` rows.
+
+    Tasks are only dropped after a prefix of tasks with known row counts is
+    guaranteed to produce at least `limit` rows.
+    """
+    num_rows = 0
+    for i, read_task in enumerate(read_tasks):
+        if num_rows >= limit:
+            return read_tasks[:i]
+        task_num_rows = read_task.get_metadata().num_rows
+        if task_num_rows is None:
+            return read_tasks
+        num_rows += task_num_rows
+    return read_tasks
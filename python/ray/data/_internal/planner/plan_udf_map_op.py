@@ -15,11 +15,16 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
+)
+from ray.data._internal.planner.filter import (
+    generate_filter_expr_fn,
+    generate_filter_fn,
 )
-from ray.data._internal.planner.filter import generate_filter_fn
 from ray.data._internal.planner.flat_map import generate_flat_map_fn
 from ray.data._internal.planner.map_batches import generate_map_batches_fn
 from ray.data._internal.planner.map_rows import generate_map_rows_fn
+from ray.data._internal.planner.project import generate_project_fn
 from ray.data.block import Block, CallableClass
 
 
@@ -42,7 +47,12 @@ def _plan_udf_map_op(
     elif isinstance(op, FlatMap):
         transform_fn = generate_flat_map_fn()
     elif isinstance(op, Filter):
-        transform_fn = generate_filter_fn()
+        if op._filter_expr is not None:
+            transform_fn = generate_filter_expr_fn()
+        else:
+            transform_fn = generate_filter_fn()
+    elif isinstance(op, Project):
+        transform_fn = generate_project_fn()
     else:
         raise ValueError(f"Found unknown logical operator during planning: {op}")
 
@@ -75,7 +85,9 @@ def _plan_udf_map_op(
     else:
         fn = op._fn
         init_fn = None
-    fn_args = (fn,)
+    # Operators such as Project and expression-based Filter have no UDF, and pass
+    # everything needed by the transform through `fn_args` instead.
+    fn_args = (fn,) if fn is not None else ()
     if op._fn_args:
         fn_args += op._fn_args
     fn_kwargs = op._fn_kwargs or {}
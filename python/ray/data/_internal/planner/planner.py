@@ -1,6 +1,8 @@
 from typing import Dict
 
 from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.join_operator import JoinOperator
+from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
 from ray.data._internal.logical.interfaces import (
     LogicalOperator,
@@ -8,13 +10,15 @@ from ray.data._internal.logical.interfaces import (
     PhysicalPlan,
 )
 from ray.data._internal.logical.operators.all_to_all_operator import AbstractAllToAll
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.limit_operator import Limit
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.operators.from_arrow_operator import FromArrowRefs
 from ray.data._internal.logical.operators.from_items_operator import FromItems
 from ray.data._internal.logical.operators.from_numpy_operator import FromNumpyRefs
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
+from ray.data._internal.planner.join import generate_join_fn
 from ray.data._internal.planner.plan_all_to_all_op import _plan_all_to_all_op
 from ray.data._internal.planner.plan_from_arrow_op import _plan_from_arrow_refs_op
 from ray.data._internal.planner.plan_from_items_op import _plan_from_items_op
@@ -78,6 +82,18 @@ class Planner:
         elif isinstance(logical_op, Zip):
             assert len(physical_children) == 2
             physical_op = ZipOperator(physical_children[0], physical_children[1])
+        elif isinstance(logical_op, Join):
+            assert len(physical_children) == 2
+            physical_op = JoinOperator(
+                generate_join_fn(
+                    logical_op._on, logical_op._how, logical_op._right_suffix
+                ),
+                physical_children[0],
+                physical_children[1],
+            )
+        elif isinstance(logical_op, Limit):
+            assert len(physical_children) == 1
+            physical_op = LimitOperator(logical_op._limit, physical_children[0])
         else:
             raise ValueError(
                 f"Found unknown logical operator during planning: {logical_op}"
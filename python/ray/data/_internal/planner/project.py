@@ -0,0 +1,25 @@
+from typing import Callable, Iterator, List
+
+from ray.data._internal.execution.interfaces import TaskContext
+from ray.data.block import Block, BlockAccessor
+from ray.data.context import DataContext
+
+
+def generate_project_fn() -> Callable[
+    [Iterator[Block], TaskContext, List[str]], Iterator[Block]
+]:
+    """Generate function to select a subset of columns from each block."""
+
+    context = DataContext.get_current()
+
+    def fn(
+        blocks: Iterator[Block], ctx: TaskContext, cols: List[str]
+    ) -> Iterator[Block]:
+        DataContext._set_current(context)
+        for block in blocks:
+            # Select on the pandas form of the block, so that selection semantics
+            # (e.g., empty and duplicate columns) don't depend on the block format.
+            block = BlockAccessor.for_block(block).to_pandas()
+            yield BlockAccessor.for_block(block).select(columns=cols)
+
+    return fn
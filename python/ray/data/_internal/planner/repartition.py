@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
@@ -12,7 +12,10 @@ from ray.data._internal.planner.exchange.split_repartition_task_scheduler import
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
     PushBasedShuffleTaskScheduler,
 )
-from ray.data._internal.planner.exchange.shuffle_task_spec import ShuffleTaskSpec
+from ray.data._internal.planner.exchange.shuffle_task_spec import (
+    HashShuffleTaskSpec,
+    ShuffleTaskSpec,
+)
 from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
     PullBasedShuffleTaskScheduler,
 )
@@ -23,8 +26,12 @@ from ray.data.context import DataContext
 def generate_repartition_fn(
     num_outputs: int,
     shuffle: bool,
+    keys: Optional[List[str]] = None,
 ) -> AllToAllTransformFn:
-    """Generate function to partition each records of blocks."""
+    """Generate function to partition each records of blocks.
+
+    If key columns are given, the rows are partitioned by the hash of their keys.
+    """
 
     def shuffle_repartition_fn(
         refs: List[RefBundle],
@@ -47,6 +54,23 @@ def generate_repartition_fn(
         scheduler = SplitRepartitionTaskScheduler(shuffle_spec)
         return scheduler.execute(refs, num_outputs)
 
+    def hash_repartition_fn(
+        refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        if not any(ref_bundle.blocks for ref_bundle in refs):
+            return [], {}
+        shuffle_spec = HashShuffleTaskSpec(keys)
+
+        if DataContext.get_current().use_push_based_shuffle:
+            scheduler = PushBasedShuffleTaskScheduler(shuffle_spec)
+        else:
+            scheduler = PullBasedShuffleTaskScheduler(shuffle_spec)
+
+        return scheduler.execute(refs, num_outputs)
+
+    if keys:
+        return hash_repartition_fn
     if shuffle:
         return shuffle_repartition_fn
     return split_repartition_fn
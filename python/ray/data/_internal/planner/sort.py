@@ -55,9 +55,15 @@ def generate_sort_fn(
         boundaries = SortTaskSpec.sample_boundaries(blocks, key, num_outputs)
         if descending:
             boundaries.reverse()
-        sort_spec = SortTaskSpec(boundaries=boundaries, key=key, descending=descending)
+        context = DataContext.get_current()
+        sort_spec = SortTaskSpec(
+            boundaries=boundaries,
+            key=key,
+            descending=descending,
+            use_external_sort=context.use_external_sort,
+        )
 
-        if DataContext.get_current().use_push_based_shuffle:
+        if context.use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(sort_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(sort_spec)
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import ray
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.progress_bar import ProgressBar
@@ -14,11 +15,21 @@ class ShuffleOp:
     inheriting from the appropriate class. A SimpleShufflePlan is provided
     below. Any custom arguments for map and reduce tasks should be specified by
     setting `ShuffleOp._map_args` and `ShuffleOp._reduce_args`.
+
+    If `split_reduce_outputs` is set, reduce tasks are run with dynamic returns, and
+    `reduce` may split its output into multiple blocks. It then returns a generator
+    of the output blocks, followed by the list of their metadata.
     """
 
-    def __init__(self, map_args: List[Any] = None, reduce_args: List[Any] = None):
+    def __init__(
+        self,
+        map_args: List[Any] = None,
+        reduce_args: List[Any] = None,
+        split_reduce_outputs: bool = False,
+    ):
         self._map_args = map_args or []
         self._reduce_args = reduce_args or []
+        self._split_reduce_outputs = split_reduce_outputs
         assert isinstance(self._map_args, list)
         assert isinstance(self._reduce_args, list)
 
@@ -48,7 +59,9 @@ class ShuffleOp:
                 mapper outputs.
 
         Returns:
-            The reduced block and its metadata.
+            The reduced block and its metadata. If `split_reduce_outputs` is set
+            and `partial_reduce` isn't, a generator of the reduced blocks
+            followed by the list of their metadata.
         """
         raise NotImplementedError
 
@@ -121,8 +134,11 @@ class SimpleShufflePlan(ShuffleOp):
         else:
             reduce_bar = ProgressBar("Shuffle Reduce", total=output_num_blocks)
 
+        num_returns = "dynamic" if self._split_reduce_outputs else 2
         shuffle_reduce_out = [
-            shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2,).remote(
+            shuffle_reduce.options(
+                **reduce_ray_remote_args, num_returns=num_returns
+            ).remote(
                 *self._reduce_args,
                 *[shuffle_map_out[i][j] for i in range(input_num_blocks)],
             )
@@ -131,8 +147,15 @@ class SimpleShufflePlan(ShuffleOp):
         # Eagerly delete the map block references in order to eagerly release
         # the blocks' memory.
         del shuffle_map_out
-        new_blocks, new_metadata = zip(*shuffle_reduce_out)
-        new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
+        if self._split_reduce_outputs:
+            new_blocks, new_metadata = [], []
+            for ref_generator in reduce_bar.fetch_until_complete(shuffle_reduce_out):
+                refs = list(ref_generator)
+                new_metadata += ray.get(refs.pop(-1))
+                new_blocks += refs
+        else:
+            new_blocks, new_metadata = zip(*shuffle_reduce_out)
+            new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
 
         if should_close_bar:
             reduce_bar.close()
@@ -14,9 +14,12 @@ This is an all-to-all shuffle.
 
 Merging: a merge task would receive a block from every worker that consists
 of items in a certain range. It then merges the sorted blocks into one sorted
-block and becomes part of the new, sorted datastream.
+block and becomes part of the new, sorted datastream. If external sort is
+enabled (`DataContext.use_external_sort`), the sorted blocks are merged in
+bounded-size rounds and the merged rows are returned as a stream of output blocks,
+instead of being merged in memory all at once.
 """
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -62,9 +65,14 @@ class _SortOp(ShuffleOp):
     def reduce(
         key: SortKeyT,
         descending: bool,
+        use_external_sort: bool,
         *mapper_outputs: List[Block],
         partial_reduce: bool = False,
-    ) -> (Block, BlockMetadata):
+    ) -> Union[
+        Tuple[Block, BlockMetadata], Iterator[Union[Block, List[BlockMetadata]]]
+    ]:
+        if use_external_sort and not partial_reduce:
+            return external_merge_sorted_blocks(mapper_outputs, key, descending)
         return BlockAccessor.for_block(mapper_outputs[0]).merge_sorted_blocks(
             mapper_outputs, key, descending
         )
@@ -164,7 +172,9 @@ def sort_impl(
     else:
         sort_op_cls = SimpleSortOp
     sort_op = sort_op_cls(
-        map_args=[boundaries, key, descending], reduce_args=[key, descending]
+        map_args=[boundaries, key, descending],
+        reduce_args=[key, descending, context.use_external_sort],
+        split_reduce_outputs=context.use_external_sort,
     )
     return sort_op.execute(
         blocks,
@@ -175,3 +185,100 @@ def sort_impl(
 
 def _sample_block(block: Block, n_samples: int, key: SortKeyT) -> Block:
     return BlockAccessor.for_block(block).sample(n_samples, key)
+
+
+def external_merge_sorted_blocks(
+    blocks: List[Block], key: SortKeyT, descending: bool
+) -> Iterator[Union[Block, List[BlockMetadata]]]:
+    """Merge the sorted blocks into a stream of sorted blocks with bounded memory.
+
+    The blocks are merged as a k-way merge in rounds. Each round takes the next
+    batch of rows of each block, with batches sized so that a round buffers about
+    `DataContext.external_sort_buffer_size` bytes, and merges the rows that are
+    not greater (or smaller if descending) than the last key of every batch that
+    doesn't exhaust its block. The merged rows are yielded as output blocks of about
+    `DataContext.target_max_block_size` bytes, followed by the list of their
+    metadata, so that this can be run as a task with dynamic returns.
+
+    Only single-column sorts of Arrow blocks are merged externally. Other blocks
+    are merged in memory with `BlockAccessor.merge_sorted_blocks`.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from ray.data._internal.arrow_block import get_concat_and_sort_transform
+
+    if (
+        not isinstance(key, list)
+        or len(key) != 1
+        or not all(isinstance(b, pa.Table) for b in blocks)
+        or sum(b.num_rows > 0 for b in blocks) <= 1
+    ):
+        block, meta = BlockAccessor.for_block(blocks[0]).merge_sorted_blocks(
+            blocks, key, descending
+        )
+        yield block
+        yield [meta]
+        return
+    stats = BlockExecStats.builder()
+    blocks = [b for b in blocks if b.num_rows > 0]
+
+    context = DataContext.get_current()
+    concat_and_sort = get_concat_and_sort_transform(context)
+    col, _ = key[0]
+    num_rows = sum(b.num_rows for b in blocks)
+    bytes_per_row = max(1, sum(b.nbytes for b in blocks) // num_rows)
+    batch_size = max(
+        1, context.external_sort_buffer_size // bytes_per_row // len(blocks)
+    )
+    compare = pc.greater_equal if descending else pc.less_equal
+    offsets = [0] * len(blocks)
+
+    # The merged rows that haven't been yielded yet.
+    output = []
+    output_bytes = 0
+    metadata = []
+
+    def build_output_block() -> Block:
+        nonlocal output, output_bytes, stats
+        block = pa.concat_tables(output)
+        output = []
+        output_bytes = 0
+        metadata.append(
+            BlockAccessor.for_block(block).get_metadata(None, exec_stats=stats.build())
+        )
+        stats = BlockExecStats.builder()
+        return block
+
+    while any(offset < b.num_rows for offset, b in zip(offsets, blocks)):
+        batches = [b.slice(offset, batch_size) for offset, b in zip(offsets, blocks)]
+        # Rows up to the smallest (largest if descending) last key of the batches
+        # that don't exhaust their blocks can be merged, since all remaining rows
+        # of those blocks come after it. Nulls are sorted last, so they never bound
+        # the merge.
+        bound = None
+        for offset, block, batch in zip(offsets, blocks, batches):
+            if offset + batch.num_rows == block.num_rows:
+                continue
+            last = batch[col][-1]
+            if not last.is_valid:
+                continue
+            if bound is None or compare(last, bound).as_py():
+                bound = last
+        merged = []
+        for i, batch in enumerate(batches):
+            if bound is not None:
+                mask = pc.fill_null(compare(batch[col], bound), False)
+                batch = batch.slice(0, pc.sum(mask).as_py() or 0)
+            offsets[i] += batch.num_rows
+            merged.append(batch)
+        merged = [b for b in merged if b.num_rows > 0]
+        if merged:
+            merged = concat_and_sort(merged, key, descending)
+            output.append(merged)
+            output_bytes += merged.nbytes
+            if output_bytes >= context.target_max_block_size:
+                yield build_output_block()
+    if output:
+        yield build_output_block()
+    yield metadata
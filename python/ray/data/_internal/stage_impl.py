@@ -14,7 +14,7 @@ from ray.data._internal.split import (
 )
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
-from ray.data._internal.execution.interfaces import TaskContext
+from ray.data._internal.execution.interfaces import RefBundle, TaskContext
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.sort import sort_impl
 from ray.data.context import DataContext
@@ -34,8 +34,49 @@ if TYPE_CHECKING:
 class RepartitionStage(AllToAllStage):
     """Implementation of `Datastream.repartition()`."""
 
-    def __init__(self, num_blocks: int, shuffle: bool):
-        if shuffle:
+    def __init__(
+        self, num_blocks: int, shuffle: bool, keys: Optional[List[str]] = None
+    ):
+        if keys:
+
+            def do_hash_repartition(
+                block_list: BlockList,
+                ctx: TaskContext,
+                clear_input_blocks: bool,
+                *_,
+            ):
+                from ray.data._internal.planner.repartition import (
+                    generate_repartition_fn,
+                )
+
+                owned_by_consumer = block_list._owned_by_consumer
+                refs = [
+                    RefBundle([(block, meta)], owns_blocks=False)
+                    for block, meta in block_list.get_blocks_with_metadata()
+                ]
+                if clear_input_blocks:
+                    block_list.clear()
+                output, stats = generate_repartition_fn(num_blocks, True, keys)(
+                    refs, ctx
+                )
+                blocks, metadata = [], []
+                for bundle in output:
+                    for block, meta in bundle.blocks:
+                        blocks.append(block)
+                        metadata.append(meta)
+                return (
+                    BlockList(blocks, metadata, owned_by_consumer=owned_by_consumer),
+                    stats,
+                )
+
+            super().__init__(
+                "Repartition",
+                num_blocks,
+                do_hash_repartition,
+                sub_stage_names=["ShuffleMap", "ShuffleReduce"],
+            )
+
+        elif shuffle:
 
             def do_shuffle(
                 block_list,
@@ -312,6 +353,39 @@ def _do_zip(
     return result, br.get_metadata(input_files=[], exec_stats=stats.build())
 
 
+class JoinStage(AllToAllStage):
+    """Implementation of `Datastream.join()`."""
+
+    def __init__(self, other: "Datastream", on: List[str], how: str, right_suffix: str):
+        def do_join_all(block_list: BlockList, clear_input_blocks: bool, *_):
+            from ray.data._internal.planner.join import generate_join_fn
+
+            other_block_list = other._plan.execute()
+            owned_by_consumer = block_list._owned_by_consumer
+            left = [
+                RefBundle([(block, meta)], owns_blocks=False)
+                for block, meta in block_list.get_blocks_with_metadata()
+            ]
+            right = [
+                RefBundle([(block, meta)], owns_blocks=False)
+                for block, meta in other_block_list.get_blocks_with_metadata()
+            ]
+            if clear_input_blocks:
+                block_list.clear()
+            output, stats = generate_join_fn(on, how, right_suffix)(left, right)
+            blocks, metadata = [], []
+            for bundle in output:
+                for block, meta in bundle.blocks:
+                    blocks.append(block)
+                    metadata.append(meta)
+            return (
+                BlockList(blocks, metadata, owned_by_consumer=owned_by_consumer),
+                stats,
+            )
+
+        super().__init__("Join", None, do_join_all)
+
+
 class SortStage(AllToAllStage):
     """Implementation of `Datastream.sort()`."""
 
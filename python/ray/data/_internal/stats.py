@@ -1,8 +1,9 @@
 import collections
 from dataclasses import dataclass
+import json
 import time
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from typing import Dict, List, Optional, Set, Tuple, Union, Any, TYPE_CHECKING
 
 import numpy as np
 
@@ -14,6 +15,9 @@ from ray.data.context import DataContext
 from ray.util.annotations import DeveloperAPI
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces import PhysicalOperator, RefBundle
+
 STATS_ACTOR_NAME = "datastreams_stats_actor"
 STATS_ACTOR_NAMESPACE = "_datastream_stats_actor"
 
@@ -76,6 +80,308 @@ class Timer:
         return self._value / self._total_count if self._total_count else float("inf")
 
 
+class OperatorTimeline:
+    """The timeline of the streaming execution of an operator.
+
+    The timestamps are seconds since the epoch, as observed by the executor.
+    """
+
+    # The max number of intervals of each kind to keep, to bound the memory usage of
+    # long running executions.
+    MAX_INTERVALS = 10000
+
+    def __init__(self, name: str):
+        self.name = name
+        # The (start, end) intervals of the tasks of the operator.
+        self.tasks: List[Tuple[float, float]] = []
+        # The (enqueue, dispatch) intervals of the input bundles of the operator.
+        self.queue_waits: List[Tuple[float, float]] = []
+        # The (start, end) intervals during which the operator had queued inputs but
+        # was throttled by resource limits or backpressure.
+        self.backpressure: List[Tuple[float, float]] = []
+        # The (timestamp, total input bytes, total output bytes) samples.
+        self.bytes_samples: List[Tuple[float, int, int]] = []
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.queue_wait_s = 0.0
+        self.backpressure_s = 0.0
+        self.num_tasks_finished = 0
+        self._task_start_times: Dict[ray.ObjectRef, float] = {}
+        self._backpressure_start: Optional[float] = None
+
+    def _append(self, intervals: List[Tuple], interval: Tuple) -> None:
+        if len(intervals) < self.MAX_INTERVALS:
+            intervals.append(interval)
+
+    def to_chrome_trace_events(self, pid: int) -> List[Dict[str, Any]]:
+        """Return the Chrome trace events of this timeline, as a process with one
+        thread for backpressure, and the minimal number of threads for the tasks
+        and input queue waits so that the intervals in a thread don't overlap."""
+        events = [
+            _chrome_metadata_event("process_name", pid, 0, self.name),
+            _chrome_metadata_event("thread_name", pid, 0, "backpressure"),
+        ]
+        events.extend(
+            _chrome_interval_event("backpressure", "backpressure", pid, 0, start, end)
+            for start, end in self.backpressure
+        )
+        tid = 1
+        for category, intervals in [("task", self.tasks), ("queue", self.queue_waits)]:
+            lanes = _assign_lanes(intervals)
+            for lane in range(max(lanes, default=-1) + 1):
+                events.append(
+                    _chrome_metadata_event(
+                        "thread_name", pid, tid + lane, f"{category} {lane}"
+                    )
+                )
+            for lane, (start, end) in zip(lanes, intervals):
+                events.append(
+                    _chrome_interval_event(
+                        category, category, pid, tid + lane, start, end
+                    )
+                )
+            tid += max(lanes, default=-1) + 1
+        events.extend(
+            {
+                "name": "bytes",
+                "ph": "C",
+                "ts": ts * 1e6,
+                "pid": pid,
+                "args": {"input": bytes_in, "output": bytes_out},
+            }
+            for ts, bytes_in, bytes_out in self.bytes_samples
+        )
+        return events
+
+
+class ExecutionTimeline:
+    """Records the timeline of each operator of a streaming execution, and reports
+    it as live Prometheus metrics.
+
+    The executor calls the ``on_*`` methods from its scheduling loop. The metrics
+    are tagged by operator name only, so that their cardinality doesn't grow with
+    the number of executions.
+    """
+
+    # Min number of seconds between two reports of the Prometheus metrics.
+    METRICS_REPORT_INTERVAL_S = 1.0
+
+    def __init__(self):
+        self.operators: Dict["PhysicalOperator", OperatorTimeline] = {}
+        self._enqueue_times: Dict[int, float] = {}
+        self._last_metrics_report_time = 0.0
+        # The counter values at the last metrics report, by operator.
+        self._reported: Dict[
+            "PhysicalOperator", Tuple[int, int, int, float, float]
+        ] = {}
+
+    def _get(self, op: "PhysicalOperator") -> OperatorTimeline:
+        if op not in self.operators:
+            self.operators[op] = OperatorTimeline(op.name)
+        return self.operators[op]
+
+    def on_output_queued(self, op: "PhysicalOperator", bundle: "RefBundle") -> None:
+        """Called when a bundle output by the operator is queued for the downstream
+        operator."""
+        now = time.time()
+        timeline = self._get(op)
+        timeline.bytes_out += int(bundle.size_bytes())
+        timeline._append(
+            timeline.bytes_samples, (now, timeline.bytes_in, timeline.bytes_out)
+        )
+        if op.output_dependencies:
+            self._enqueue_times[id(bundle)] = now
+
+    def on_input_dispatched(self, op: "PhysicalOperator", bundle: "RefBundle") -> None:
+        """Called when a queued bundle is passed to the operator."""
+        now = time.time()
+        timeline = self._get(op)
+        timeline.bytes_in += int(bundle.size_bytes())
+        timeline._append(
+            timeline.bytes_samples, (now, timeline.bytes_in, timeline.bytes_out)
+        )
+        enqueue_time = self._enqueue_times.pop(id(bundle), None)
+        if enqueue_time is not None:
+            timeline.queue_wait_s += now - enqueue_time
+            timeline._append(timeline.queue_waits, (enqueue_time, now))
+
+    def on_task_submitted(self, op: "PhysicalOperator", ref: ray.ObjectRef) -> None:
+        """Called when the operator submits the task with the given work ref."""
+        self._get(op)._task_start_times[ref] = time.time()
+
+    def on_task_finished(self, op: "PhysicalOperator", ref: ray.ObjectRef) -> None:
+        """Called when the task of the operator with the given work ref finishes."""
+        now = time.time()
+        timeline = self._get(op)
+        start_time = timeline._task_start_times.pop(ref, None)
+        if start_time is not None:
+            timeline.num_tasks_finished += 1
+            timeline._append(timeline.tasks, (start_time, now))
+
+    def on_task_cancelled(self, op: "PhysicalOperator", ref: ray.ObjectRef) -> None:
+        """Called when the operator cancels the task with the given work ref."""
+        self._get(op)._task_start_times.pop(ref, None)
+
+    def on_scheduling_step(
+        self,
+        backpressured_ops: Set["PhysicalOperator"],
+        ops: List["PhysicalOperator"],
+        num_queued: Dict["PhysicalOperator", int],
+    ) -> None:
+        """Called at the end of each scheduling step with the operators that have
+        queued inputs but were throttled during the step."""
+        now = time.time()
+        for op in ops:
+            timeline = self._get(op)
+            if op in backpressured_ops and timeline._backpressure_start is None:
+                timeline._backpressure_start = now
+            elif op not in backpressured_ops:
+                self._end_backpressure(timeline, now)
+        if now - self._last_metrics_report_time >= self.METRICS_REPORT_INTERVAL_S:
+            self._last_metrics_report_time = now
+            self._report_metrics(num_queued)
+
+    def on_execution_finished(self) -> None:
+        now = time.time()
+        for timeline in self.operators.values():
+            self._end_backpressure(timeline, now)
+        self._report_metrics({op: 0 for op in self.operators})
+
+    def _end_backpressure(self, timeline: OperatorTimeline, now: float) -> None:
+        if timeline._backpressure_start is not None:
+            timeline.backpressure_s += now - timeline._backpressure_start
+            timeline._append(timeline.backpressure, (timeline._backpressure_start, now))
+            timeline._backpressure_start = None
+
+    def _report_metrics(self, num_queued: Dict["PhysicalOperator", int]) -> None:
+        metrics = _get_execution_metrics()
+        for op, timeline in self.operators.items():
+            tags = {"operator": timeline.name}
+            metrics["active_tasks"].set(len(timeline._task_start_times), tags=tags)
+            metrics["queued_bundles"].set(num_queued.get(op, 0), tags=tags)
+            metrics["backpressured"].set(
+                int(timeline._backpressure_start is not None), tags=tags
+            )
+            current = (
+                timeline.num_tasks_finished,
+                timeline.bytes_in,
+                timeline.bytes_out,
+                timeline.queue_wait_s,
+                timeline.backpressure_s,
+            )
+            previous = self._reported.get(op, (0, 0, 0, 0.0, 0.0))
+            for name, value, previous_value in zip(
+                [
+                    "finished_tasks",
+                    "input_bytes",
+                    "output_bytes",
+                    "queue_wait_seconds",
+                    "backpressure_seconds",
+                ],
+                current,
+                previous,
+            ):
+                if value > previous_value:
+                    metrics[name].inc(value - previous_value, tags=tags)
+            self._reported[op] = current
+
+
+_execution_metrics: Optional[Dict[str, Any]] = None
+
+
+def _get_execution_metrics() -> Dict[str, Any]:
+    """Return the Prometheus metrics of streaming executions, creating them on the
+    first call."""
+    global _execution_metrics
+    if _execution_metrics is None:
+        from ray.util import metrics
+
+        tag_keys = ("operator",)
+        _execution_metrics = {
+            "active_tasks": metrics.Gauge(
+                "data_operator_active_tasks",
+                description="The number of running tasks of the operator.",
+                tag_keys=tag_keys,
+            ),
+            "queued_bundles": metrics.Gauge(
+                "data_operator_queued_bundles",
+                description="The number of input bundles queued for the operator.",
+                tag_keys=tag_keys,
+            ),
+            "backpressured": metrics.Gauge(
+                "data_operator_backpressured",
+                description=(
+                    "Whether the operator has queued inputs but is throttled by "
+                    "resource limits or backpressure."
+                ),
+                tag_keys=tag_keys,
+            ),
+            "finished_tasks": metrics.Counter(
+                "data_operator_finished_tasks",
+                description="The number of finished tasks of the operator.",
+                tag_keys=tag_keys,
+            ),
+            "input_bytes": metrics.Counter(
+                "data_operator_input_bytes",
+                description="The bytes of the inputs passed to the operator.",
+                tag_keys=tag_keys,
+            ),
+            "output_bytes": metrics.Counter(
+                "data_operator_output_bytes",
+                description="The bytes of the outputs of the operator.",
+                tag_keys=tag_keys,
+            ),
+            "queue_wait_seconds": metrics.Counter(
+                "data_operator_queue_wait_seconds",
+                description="The total time that inputs waited in the operator queue.",
+                tag_keys=tag_keys,
+            ),
+            "backpressure_seconds": metrics.Counter(
+                "data_operator_backpressure_seconds",
+                description="The total time that the operator was backpressured.",
+                tag_keys=tag_keys,
+            ),
+        }
+    return _execution_metrics
+
+
+def _assign_lanes(intervals: List[Tuple[float, float]]) -> List[int]:
+    """Assign each interval to the lowest lane where it doesn't overlap with the
+    intervals already assigned to it."""
+    lanes = [0] * len(intervals)
+    # The end time of the last interval of each lane.
+    lane_ends: List[float] = []
+    for i in sorted(range(len(intervals)), key=lambda i: intervals[i][0]):
+        start, end = intervals[i]
+        for lane, lane_end in enumerate(lane_ends):
+            if lane_end <= start:
+                break
+        else:
+            lane = len(lane_ends)
+            lane_ends.append(0)
+        lanes[i] = lane
+        lane_ends[lane] = end
+    return lanes
+
+
+def _chrome_metadata_event(name: str, pid: int, tid: int, value: str) -> Dict:
+    return {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": {"name": value}}
+
+
+def _chrome_interval_event(
+    name: str, category: str, pid: int, tid: int, start: float, end: float
+) -> Dict:
+    return {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start * 1e6,
+        "dur": (end - start) * 1e6,
+        "pid": pid,
+        "tid": tid,
+    }
+
+
 class _DatastreamStatsBuilder:
     """Helper class for building datastream stats.
 
@@ -264,6 +570,10 @@ class DatastreamStats:
         self.iter_blocks_remote: int = 0
         self.iter_unknown_location: int = 0
 
+        # The timeline of the operator that produced this Datastream, if it was
+        # executed by the streaming executor.
+        self.timeline: Optional[OperatorTimeline] = None
+
     @property
     def stats_actor(self):
         return _get_or_create_stats_actor()
@@ -339,6 +649,7 @@ class DatastreamStats:
             self.time_total_s,
             self.base_name,
             self.extra_metrics,
+            self.timeline,
         )
 
 
@@ -353,6 +664,34 @@ class DatastreamStatsSummary:
     time_total_s: float
     base_name: str
     extra_metrics: Dict[str, Any]
+    timeline: Optional[OperatorTimeline] = None
+
+    def to_chrome_trace(self, path: str) -> None:
+        """Write the timelines of the operators of the streaming execution to a
+        Chrome trace file, which can be viewed in ``chrome://tracing`` or Perfetto.
+
+        Each operator is shown as a process, with its tasks, the time its inputs
+        waited in its queue, the intervals when it was backpressured, and the bytes
+        of its inputs and outputs.
+
+        Args:
+            path: The path of the JSON file to write.
+        """
+        timelines = []
+
+        def collect(summary: "DatastreamStatsSummary") -> None:
+            for parent in summary.parents:
+                collect(parent)
+            timeline = summary.timeline
+            if timeline is not None and not any(t is timeline for t in timelines):
+                timelines.append(timeline)
+
+        collect(self)
+        events = []
+        for pid, timeline in enumerate(timelines):
+            events.extend(timeline.to_chrome_trace_events(pid))
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
 
     def to_string(
         self, already_printed: Optional[Set[str]] = None, include_parent: bool = True
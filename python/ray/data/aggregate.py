@@ -119,6 +119,7 @@ class Sum(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -150,6 +151,7 @@ class Min(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -181,6 +183,7 @@ class Max(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -212,6 +215,7 @@ class Mean(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
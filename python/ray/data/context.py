@@ -1,4 +1,5 @@
 import os
+import tempfile
 import threading
 from typing import Optional, TYPE_CHECKING
 
@@ -62,6 +63,79 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATA_PUSH_BASED_SHUFFLE", None)
 )
 
+# Whether to use hash-based aggregation for groupbys on a column. Hash-based
+# aggregation avoids sorting the datastream, but the output isn't sorted by key.
+DEFAULT_USE_HASH_AGGREGATE = bool(
+    int(os.environ.get("RAY_DATA_USE_HASH_AGGREGATE", "0"))
+)
+
+# Whether sort reducers merge their sorted inputs with a streaming k-way merge
+# that outputs the merged rows as multiple blocks, instead of merging them all in
+# memory into one block.
+DEFAULT_USE_EXTERNAL_SORT = bool(int(os.environ.get("RAY_DATA_USE_EXTERNAL_SORT", "0")))
+
+# The number of bytes that external sort reducers buffer in each merge round.
+DEFAULT_EXTERNAL_SORT_BUFFER_SIZE = 64 * 1024 * 1024
+
+# Whether to execute random shuffles and shuffling repartitions with a streaming
+# operator, whose map tasks start as soon as upstream blocks are produced.
+DEFAULT_USE_STREAMING_SHUFFLE = bool(
+    int(os.environ.get("RAY_DATA_STREAMING_SHUFFLE", "0"))
+)
+
+# The number of map or merge task outputs merged by a merge task of the streaming
+# shuffle. The merges are hierarchical, so each reducer gets at most
+# (merge factor - 1) * log_{merge factor}(num map tasks) blocks.
+DEFAULT_STREAMING_SHUFFLE_MERGE_FACTOR = 4
+
+# Whether map operators adapt the number of input blocks per task and the size of
+# output blocks to the observed output/input size ratio of their tasks, so that
+# output blocks converge to the target block sizes.
+DEFAULT_ADAPTIVE_BLOCK_SIZING = bool(
+    int(os.environ.get("RAY_DATA_ADAPTIVE_BLOCK_SIZING", "0"))
+)
+
+# Whether local shuffles during batch iteration gather rows by index from the
+# buffered blocks instead of concatenating them into a shuffle buffer, and prefetch
+# enough blocks to fill the shuffle buffer. This copies each row only once, which
+# speeds up shuffling wide rows such as tensors, but gathering a batch from many
+# blocks has a per-block overhead that can dominate for narrow rows.
+DEFAULT_USE_INDEX_BASED_LOCAL_SHUFFLE = bool(
+    int(os.environ.get("RAY_DATA_INDEX_BASED_LOCAL_SHUFFLE", "0"))
+)
+
+# The max estimated size in bytes of a side of Datastream.join() for it to be
+# broadcast to the tasks joining the blocks of the other side, instead of hash
+# partitioning both sides.
+DEFAULT_BROADCAST_JOIN_THRESHOLD = int(
+    os.environ.get("RAY_DATA_BROADCAST_JOIN_THRESHOLD", 10 * 1024 * 1024)
+)
+
+# The node-local directory that Datastream.cache(storage="local_disk") writes the
+# cached blocks to.
+DEFAULT_LOCAL_DISK_CACHE_DIR = os.environ.get(
+    "RAY_DATA_LOCAL_DISK_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "ray_data_cache"),
+)
+
+# Whether the streaming executor records the timeline of the tasks, queueing and
+# backpressure of each operator, for Chrome trace export and Prometheus metrics.
+# This is off by default, since it adds bookkeeping to each scheduling step.
+DEFAULT_ENABLE_OPERATOR_TIMELINE = bool(
+    int(os.environ.get("RAY_DATA_ENABLE_OPERATOR_TIMELINE", "0"))
+)
+
+# The number of threads that each read task of read_images() decodes images with.
+# Pillow releases the GIL while decoding and resizing.
+DEFAULT_IMAGE_DECODE_THREADS = int(os.environ.get("RAY_DATA_IMAGE_DECODE_THREADS", 4))
+
+# The max number of blocks that a Datastream.streaming_split() iterator fetches from
+# the split coordinator actor in a single request. All the blocks that are already
+# routed to the iterator's split are handed out together, up to this limit.
+DEFAULT_STREAMING_SPLIT_MAX_BLOCKS_PER_FETCH = int(
+    os.environ.get("RAY_DATA_STREAMING_SPLIT_MAX_BLOCKS_PER_FETCH", 32)
+)
+
 # The default global scheduling strategy.
 DEFAULT_SCHEDULING_STRATEGY = "DEFAULT"
 
@@ -152,6 +226,18 @@ class DataContext:
         actor_prefetcher_enabled: bool,
         use_push_based_shuffle: bool,
         pipeline_push_based_shuffle_reduce_tasks: bool,
+        use_hash_aggregate: bool,
+        use_external_sort: bool,
+        external_sort_buffer_size: int,
+        use_streaming_shuffle: bool,
+        streaming_shuffle_merge_factor: int,
+        adaptive_block_sizing: bool,
+        use_index_based_local_shuffle: bool,
+        broadcast_join_threshold: int,
+        local_disk_cache_dir: str,
+        enable_operator_timeline: bool,
+        image_decode_threads: int,
+        streaming_split_max_blocks_per_fetch: int,
         scheduling_strategy: SchedulingStrategyT,
         use_polars: bool,
         new_execution_backend: bool,
@@ -184,6 +270,18 @@ class DataContext:
         self.pipeline_push_based_shuffle_reduce_tasks = (
             pipeline_push_based_shuffle_reduce_tasks
         )
+        self.use_hash_aggregate = use_hash_aggregate
+        self.use_external_sort = use_external_sort
+        self.external_sort_buffer_size = external_sort_buffer_size
+        self.use_streaming_shuffle = use_streaming_shuffle
+        self.streaming_shuffle_merge_factor = streaming_shuffle_merge_factor
+        self.adaptive_block_sizing = adaptive_block_sizing
+        self.use_index_based_local_shuffle = use_index_based_local_shuffle
+        self.broadcast_join_threshold = broadcast_join_threshold
+        self.local_disk_cache_dir = local_disk_cache_dir
+        self.enable_operator_timeline = enable_operator_timeline
+        self.image_decode_threads = image_decode_threads
+        self.streaming_split_max_blocks_per_fetch = streaming_split_max_blocks_per_fetch
         self.scheduling_strategy = scheduling_strategy
         self.use_polars = use_polars
         self.new_execution_backend = new_execution_backend
@@ -232,6 +330,24 @@ class DataContext:
                     # because of a scheduling bug at large scale.
                     # See https://github.com/ray-project/ray/issues/25412.
                     pipeline_push_based_shuffle_reduce_tasks=True,
+                    use_hash_aggregate=DEFAULT_USE_HASH_AGGREGATE,
+                    use_external_sort=DEFAULT_USE_EXTERNAL_SORT,
+                    external_sort_buffer_size=DEFAULT_EXTERNAL_SORT_BUFFER_SIZE,
+                    use_streaming_shuffle=DEFAULT_USE_STREAMING_SHUFFLE,
+                    streaming_shuffle_merge_factor=(
+                        DEFAULT_STREAMING_SHUFFLE_MERGE_FACTOR
+                    ),
+                    adaptive_block_sizing=DEFAULT_ADAPTIVE_BLOCK_SIZING,
+                    use_index_based_local_shuffle=(
+                        DEFAULT_USE_INDEX_BASED_LOCAL_SHUFFLE
+                    ),
+                    broadcast_join_threshold=DEFAULT_BROADCAST_JOIN_THRESHOLD,
+                    local_disk_cache_dir=DEFAULT_LOCAL_DISK_CACHE_DIR,
+                    enable_operator_timeline=DEFAULT_ENABLE_OPERATOR_TIMELINE,
+                    image_decode_threads=DEFAULT_IMAGE_DECODE_THREADS,
+                    streaming_split_max_blocks_per_fetch=(
+                        DEFAULT_STREAMING_SPLIT_MAX_BLOCKS_PER_FETCH
+                    ),
                     scheduling_strategy=DEFAULT_SCHEDULING_STRATEGY,
                     use_polars=DEFAULT_USE_POLARS,
                     new_execution_backend=DEFAULT_NEW_EXECUTION_BACKEND,
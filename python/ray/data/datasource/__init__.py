@@ -20,6 +20,7 @@ from ray.data.datasource.file_based_datasource import (
 )
 from ray.data.datasource.file_meta_provider import (
     BaseFileMetadataProvider,
+    CachingFileMetadataProvider,
     DefaultFileMetadataProvider,
     DefaultParquetMetadataProvider,
     FastFileMetadataProvider,
@@ -47,6 +48,7 @@ __all__ = [
     "BaseFileMetadataProvider",
     "BinaryDatasource",
     "BlockWritePathProvider",
+    "CachingFileMetadataProvider",
     "Connection",
     "CSVDatasource",
     "Datasource",
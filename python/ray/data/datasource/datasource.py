@@ -127,6 +127,16 @@ class Datasource:
             name = name[: -len(datasource_suffix)]
         return name
 
+    def supports_read_pushdown(self) -> bool:
+        """Whether ``create_reader()`` accepts the ``columns`` and ``filter`` read
+        args.
+
+        If so, the logical optimizer pushes column selections and
+        ``pyarrow.compute.Expression`` filters that directly follow the read into
+        these read args, so that the reader can skip unneeded columns and rows.
+        """
+        return False
+
 
 @PublicAPI
 class Reader:
@@ -191,11 +201,20 @@ class ReadTask(Callable[[], Iterable[Block]]):
 
     The final metadata (returned with the actual block) reflects the exact
     contents of the block itself.
+
+    A read task can specify Ray remote arguments of its own, e.g. to run on the node
+    that holds its data. They override the remote arguments of the read.
     """
 
-    def __init__(self, read_fn: Callable[[], Iterable[Block]], metadata: BlockMetadata):
+    def __init__(
+        self,
+        read_fn: Callable[[], Iterable[Block]],
+        metadata: BlockMetadata,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
         self._metadata = metadata
         self._read_fn = read_fn
+        self._ray_remote_args = ray_remote_args or {}
 
     def get_metadata(self) -> BlockMetadata:
         return self._metadata
@@ -36,6 +36,7 @@ from ray.data.datasource.file_meta_provider import (
 )
 from ray.data.datasource.partitioning import (
     Partitioning,
+    PathPartitionEncoder,
     PathPartitionFilter,
     PathPartitionParser,
 )
@@ -58,6 +59,13 @@ FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD = 16
 # 16 file size fetches from S3 takes ~1.5 seconds with Arrow's S3FileSystem.
 PATHS_PER_FILE_SIZE_FETCH_TASK = 16
 
+# The temporary column that holds the bucket of each row in bucketed writes.
+BUCKET_COLUMN = "__bucket"
+
+# The partition directory value of null partition column values, which Hive and
+# Arrow read back as null.
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
 
 @DeveloperAPI
 class BlockWritePathProvider:
@@ -282,10 +290,21 @@ class FileBasedDatasource(Datasource):
         open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         write_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        partition_cols: Optional[List[str]] = None,
+        num_buckets: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
         _block_udf: Optional[Callable[[Block], Block]] = None,
         **write_args,
     ) -> WriteResult:
-        """Write blocks for a file-based datasource."""
+        """Write blocks for a file-based datasource.
+
+        If ``partition_cols`` is given, the rows are written to Hive-style
+        ``{col}={value}`` directories by the values of the partition columns, which
+        are dropped from the files. If ``num_buckets`` is given, the blocks must have
+        the bucket column added by ``_add_bucket_column()``, and the rows of each
+        bucket are written to separate files. If ``target_file_size_bytes`` is given,
+        a new file is started whenever a file reaches this in-memory size.
+        """
         path, filesystem = _resolve_paths_and_filesystem(path, filesystem)
         path = path[0]
         if try_create_dir:
@@ -328,15 +347,54 @@ class FileBasedDatasource(Datasource):
 
         if not block_path_provider:
             block_path_provider = DefaultBlockWritePathProvider()
-        write_path = block_path_provider(
-            path,
-            filesystem=filesystem,
-            datastream_uuid=datastream_uuid,
-            block=block,
-            block_index=ctx.task_idx,
-            file_format=file_format,
-        )
-        return write_block(write_path, block)
+        if not partition_cols and not num_buckets and not target_file_size_bytes:
+            write_path = block_path_provider(
+                path,
+                filesystem=filesystem,
+                datastream_uuid=datastream_uuid,
+                block=block,
+                block_index=ctx.task_idx,
+                file_format=file_format,
+            )
+            return write_block(write_path, block)
+
+        encoder = None
+        if partition_cols:
+            encoder = PathPartitionEncoder.of(
+                base_dir=path, field_names=partition_cols, filesystem=filesystem
+            )
+        keys = list(partition_cols or [])
+        if num_buckets:
+            keys.append(BUCKET_COLUMN)
+        for key_values, group in _group_by_keys(block, keys):
+            key_values = dict(zip(keys, key_values))
+            base_path = path
+            if encoder is not None:
+                base_path = encoder(
+                    [_partition_value_str(key_values[col]) for col in partition_cols]
+                )
+                _unwrap_s3_serialization_workaround(filesystem).create_dir(
+                    base_path, recursive=True
+                )
+            group = group.drop(keys)
+            files = _split_by_size(group, target_file_size_bytes)
+            for file_idx, file_block in enumerate(files):
+                write_path = block_path_provider(
+                    base_path,
+                    filesystem=filesystem,
+                    datastream_uuid=datastream_uuid,
+                    block=file_block,
+                    block_index=ctx.task_idx,
+                    file_format=file_format,
+                )
+                # Make the file names unique within the directory.
+                root, ext = posixpath.splitext(write_path)
+                if num_buckets:
+                    root += f"_b{key_values[BUCKET_COLUMN]:05}"
+                if target_file_size_bytes:
+                    root += f"_{file_idx:06}"
+                write_block(root + ext, file_block)
+        return "ok"
 
     def _write_block(
         self,
@@ -808,6 +866,83 @@ def _resolve_kwargs(
     return kwargs
 
 
+def _add_bucket_column(
+    batch: "pyarrow.Table", bucket_cols: List[str], num_buckets: int
+) -> "pyarrow.Table":
+    """Add the bucket of each row, from the hash of its bucket columns, as the
+    ``BUCKET_COLUMN`` column."""
+    from ray.data._internal.planner.exchange.aggregate_task_spec import (
+        _hash_key_columns,
+    )
+
+    buckets = _hash_key_columns(batch, bucket_cols) % np.uint64(num_buckets)
+    return batch.append_column(BUCKET_COLUMN, [buckets.astype(np.int64)])
+
+
+def _group_by_keys(
+    block: Block, keys: List[str]
+) -> Iterator[Tuple[Tuple[Any, ...], "pyarrow.Table"]]:
+    """Group the rows of the block by the values of the key columns, yielding the
+    key values and the rows of each group."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(block, pd.DataFrame):
+        table = pa.Table.from_pandas(block, preserve_index=False)
+    else:
+        table = BlockAccessor.for_block(block).to_arrow()
+    if table.num_rows == 0:
+        return
+    if not keys:
+        yield (), table
+        return
+    table = table.combine_chunks()
+    codes = []
+    dictionaries = []
+    for key in keys:
+        encoded = pc.dictionary_encode(table[key].chunk(0))
+        codes.append(encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False))
+        dictionaries.append(encoded.dictionary)
+    groups, group_ids = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+    order = np.argsort(group_ids.reshape(-1), kind="stable")
+    bounds = np.cumsum(np.bincount(group_ids.reshape(-1), minlength=len(groups)))
+    start = 0
+    for group, end in zip(groups, bounds):
+        key_values = tuple(
+            None if code < 0 else dictionary[int(code)].as_py()
+            for code, dictionary in zip(group, dictionaries)
+        )
+        yield key_values, table.take(order[start:end])
+        start = end
+
+
+def _split_by_size(
+    table: "pyarrow.Table", target_size_bytes: Optional[int]
+) -> List["pyarrow.Table"]:
+    """Split the table into slices of about the target in-memory size."""
+    if not target_size_bytes or table.nbytes <= target_size_bytes:
+        return [table]
+    rows_per_slice = max(1, table.num_rows * target_size_bytes // table.nbytes)
+    return [
+        table.slice(offset, rows_per_slice)
+        for offset in range(0, table.num_rows, rows_per_slice)
+    ]
+
+
+def _partition_value_str(value: Any) -> str:
+    """Return the Hive partition directory value of a partition column value."""
+    if value is None:
+        return HIVE_DEFAULT_PARTITION
+    value = str(value)
+    if "/" in value or "=" in value:
+        raise ValueError(
+            f"Partition column value {value!r} can't be written to a Hive-style "
+            "partition directory, because it contains '/' or '='."
+        )
+    return value
+
+
 Uri = TypeVar("Uri")
 Meta = TypeVar("Meta")
 
@@ -2,8 +2,13 @@ import itertools
 import logging
 import pathlib
 import os
+import pickle
 import re
+import sqlite3
+import time
+from contextlib import contextmanager
 from typing import (
+    Dict,
     List,
     Optional,
     Union,
@@ -335,6 +340,258 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
             return _fetch_metadata(pieces)
 
 
+@DeveloperAPI
+class CachingFileMetadataProvider(
+    DefaultFileMetadataProvider, DefaultParquetMetadataProvider
+):
+    """File metadata provider that caches file metadata in a local on-disk index.
+
+    The index stores the size and modification time of every file read, as well as
+    the footers of Parquet files, keyed by file path. Files are checked against the
+    index on each read, and the entries of files whose size or modification time
+    changed are invalidated, so that repeated reads of a slowly changing datastream
+    only fetch the Parquet footers of new and modified files.
+
+    Directory listings are additionally cached if ``listing_ttl_s`` is set, which
+    skips re-listing directories read within the last ``listing_ttl_s`` seconds.
+    Files added, removed or modified within that time aren't seen by reads.
+
+    This provider can be used both with ``read_parquet()`` and with the other
+    file-based read APIs.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.datasource import CachingFileMetadataProvider
+        >>> provider = CachingFileMetadataProvider() # doctest: +SKIP
+        >>> ray.data.read_parquet( # doctest: +SKIP
+        ...     "s3://bucket/path", meta_provider=provider)
+
+    Args:
+        index_path: The path of the local index file. Defaults to
+            ``~/.cache/ray/data/file_metadata.db``.
+        listing_ttl_s: If set, the number of seconds for which directory listings
+            and file sizes and modification times are cached.
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        listing_ttl_s: Optional[float] = None,
+    ):
+        if index_path is None:
+            index_path = os.path.join(
+                os.path.expanduser("~"), ".cache", "ray", "data", "file_metadata.db"
+            )
+        self._index_path = index_path
+        self._listing_ttl_s = listing_ttl_s
+
+    def _get_block_metadata(
+        self,
+        paths: List[str],
+        schema: Optional[Union[type, "pyarrow.lib.Schema"]],
+        **kwargs,
+    ) -> BlockMetadata:
+        if "pieces" in kwargs:
+            return DefaultParquetMetadataProvider._get_block_metadata(
+                self, paths, schema, **kwargs
+            )
+        return DefaultFileMetadataProvider._get_block_metadata(
+            self, paths, schema, **kwargs
+        )
+
+    def expand_paths(
+        self,
+        paths: List[str],
+        filesystem: "pyarrow.fs.FileSystem",
+        partitioning: Optional[Partitioning] = None,
+        ignore_missing_paths: bool = False,
+    ) -> Iterator[Tuple[str, int]]:
+        if self._listing_ttl_s is None:
+            yield from super().expand_paths(
+                paths, filesystem, partitioning, ignore_missing_paths
+            )
+            return
+
+        fs_key = filesystem.type_name
+        file_infos = []
+        with self._connect() as conn:
+            for path in paths:
+                entries = self._get_listing(conn, fs_key, path)
+                if entries is None:
+                    entries = _get_file_infos_with_mtimes(
+                        path, filesystem, ignore_missing_paths
+                    )
+                    self._put_listing(conn, fs_key, path, entries)
+                file_infos.extend((p, size) for p, size, _ in entries)
+        yield from file_infos
+
+    def prefetch_file_metadata(
+        self,
+        pieces: List["pyarrow.dataset.ParquetFileFragment"],
+        **ray_remote_args,
+    ) -> Optional[List["pyarrow.parquet.FileMetaData"]]:
+        if len(pieces) == 0:
+            return []
+
+        filesystem = pieces[0].filesystem
+        fs_key = filesystem.type_name
+        paths = [p.path for p in pieces]
+        now = time.time()
+        with self._connect() as conn:
+            entries = self._get_file_entries(conn, fs_key, paths)
+            if self._listing_ttl_s is None:
+                fresh_paths = set()
+            else:
+                fresh_paths = {
+                    path
+                    for path, (_, _, checked_at, _) in entries.items()
+                    if now - checked_at <= self._listing_ttl_s
+                }
+            paths_to_check = [p for p in paths if p not in fresh_paths]
+            file_infos = _get_file_mtimes(paths_to_check, filesystem)
+            self._put_file_entries(
+                conn,
+                fs_key,
+                [(p, size, mtime_ns) for p, (size, mtime_ns) in file_infos.items()],
+                now,
+            )
+
+        file_metadata = {}
+        for path, (size, mtime_ns, _, footer) in entries.items():
+            if footer is None:
+                continue
+            if path in fresh_paths or file_infos.get(path) == (size, mtime_ns):
+                try:
+                    file_metadata[path] = pickle.loads(footer)
+                except Exception:
+                    logger.debug(f"Failed to load cached metadata of {path}.")
+
+        pieces_to_fetch = [p for p in pieces if p.path not in file_metadata]
+        if len(pieces_to_fetch) > 0:
+            fetched_metadata = super().prefetch_file_metadata(
+                pieces_to_fetch, **ray_remote_args
+            )
+            if fetched_metadata is None or len(fetched_metadata) != len(
+                pieces_to_fetch
+            ):
+                # Metadata isn't available for all pieces.
+                return fetched_metadata
+            with self._connect() as conn:
+                for piece, metadata in zip(pieces_to_fetch, fetched_metadata):
+                    file_metadata[piece.path] = metadata
+                    if piece.path in file_infos:
+                        size, mtime_ns = file_infos[piece.path]
+                    elif piece.path in entries:
+                        size, mtime_ns = entries[piece.path][:2]
+                    else:
+                        continue
+                    # Only cache the footer if the file hasn't changed since it was
+                    # checked.
+                    conn.execute(
+                        "UPDATE files SET footer = ? WHERE fs = ? AND path = ? "
+                        "AND size IS ? AND mtime_ns IS ?",
+                        (pickle.dumps(metadata), fs_key, piece.path, size, mtime_ns),
+                    )
+        return [file_metadata[p] for p in paths]
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the index, and commit the changes made to it on exit."""
+        os.makedirs(os.path.dirname(os.path.abspath(self._index_path)), exist_ok=True)
+        conn = sqlite3.connect(self._index_path, timeout=60)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS files (fs TEXT, path TEXT, "
+                    "size INTEGER, mtime_ns INTEGER, checked_at REAL, footer BLOB, "
+                    "PRIMARY KEY (fs, path))"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS listings (fs TEXT, path TEXT, "
+                    "listed_at REAL, entries BLOB, PRIMARY KEY (fs, path))"
+                )
+                yield conn
+        finally:
+            conn.close()
+
+    def _get_listing(
+        self, conn: sqlite3.Connection, fs_key: str, path: str
+    ) -> Optional[List[Tuple[str, int, Optional[int]]]]:
+        row = conn.execute(
+            "SELECT listed_at, entries FROM listings WHERE fs = ? AND path = ?",
+            (fs_key, path),
+        ).fetchone()
+        if row is None or time.time() - row[0] > self._listing_ttl_s:
+            return None
+        return pickle.loads(row[1])
+
+    def _put_listing(
+        self,
+        conn: sqlite3.Connection,
+        fs_key: str,
+        path: str,
+        entries: List[Tuple[str, int, Optional[int]]],
+    ):
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO listings (fs, path, listed_at, entries) "
+            "VALUES (?, ?, ?, ?)",
+            (fs_key, path, now, pickle.dumps(entries)),
+        )
+        self._put_file_entries(conn, fs_key, entries, now)
+        # Drop the entries of files that were removed from the directory.
+        prefix = path.rstrip("/") + "/"
+        listed_paths = {p for p, _, _ in entries}
+        removed_paths = [
+            (fs_key, p)
+            for (p,) in conn.execute(
+                "SELECT path FROM files WHERE fs = ? AND path >= ? AND path < ?",
+                (fs_key, prefix, prefix[:-1] + "0"),
+            )
+            if p not in listed_paths
+        ]
+        conn.executemany("DELETE FROM files WHERE fs = ? AND path = ?", removed_paths)
+
+    def _get_file_entries(
+        self, conn: sqlite3.Connection, fs_key: str, paths: List[str]
+    ) -> Dict[str, Tuple[int, Optional[int], float, Optional[bytes]]]:
+        entries = {}
+        # Stay below SQLite's limit on the number of query parameters.
+        for i in range(0, len(paths), 500):
+            chunk = paths[i : i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for path, size, mtime_ns, checked_at, footer in conn.execute(
+                "SELECT path, size, mtime_ns, checked_at, footer FROM files "
+                f"WHERE fs = ? AND path IN ({placeholders})",
+                (fs_key, *chunk),
+            ):
+                entries[path] = (size, mtime_ns, checked_at, footer)
+        return entries
+
+    def _put_file_entries(
+        self,
+        conn: sqlite3.Connection,
+        fs_key: str,
+        file_infos: List[Tuple[str, int, Optional[int]]],
+        checked_at: float,
+    ):
+        # The cached footer of a file is invalidated if its size or modification
+        # time changed.
+        conn.executemany(
+            "INSERT INTO files (fs, path, size, mtime_ns, checked_at, footer) "
+            "VALUES (?, ?, ?, ?, ?, NULL) ON CONFLICT (fs, path) DO UPDATE SET "
+            "footer = CASE WHEN size IS excluded.size "
+            "AND mtime_ns IS excluded.mtime_ns AND mtime_ns IS NOT NULL "
+            "THEN footer ELSE NULL END, "
+            "size = excluded.size, mtime_ns = excluded.mtime_ns, "
+            "checked_at = excluded.checked_at",
+            [
+                (fs_key, path, size, mtime_ns, checked_at)
+                for path, size, mtime_ns in file_infos
+            ],
+        )
+
+
 def _handle_read_os_error(error: OSError, paths: Union[str, List[str]]) -> str:
     # NOTE: this is not comprehensive yet, and should be extended as more errors arise.
     # NOTE: The latter patterns are raised in Arrow 10+, while the former is raised in
@@ -527,6 +784,20 @@ def _expand_directory(
     Returns:
         An iterator of (file_path, file_size) tuples.
     """
+    files = _list_directory(path, filesystem, exclude_prefixes, ignore_missing_path)
+    return [(file_.path, file_.size) for file_ in files]
+
+
+def _list_directory(
+    path: str,
+    filesystem: "pyarrow.fs.FileSystem",
+    exclude_prefixes: Optional[List[str]] = None,
+    ignore_missing_path: bool = False,
+) -> List["pyarrow.fs.FileInfo"]:
+    """Return the file infos of the files under the provided directory path.
+
+    See `_expand_directory` for the arguments. The file infos are sorted by path.
+    """
     if exclude_prefixes is None:
         exclude_prefixes = [".", "_"]
 
@@ -545,6 +816,61 @@ def _expand_directory(
         relative = file_path[len(base_path) :]
         if any(relative.startswith(prefix) for prefix in exclude_prefixes):
             continue
-        out.append((file_path, file_.size))
+        out.append(file_)
     # We sort the paths to guarantee a stable order.
-    return sorted(out)
+    return sorted(out, key=lambda file_: file_.path)
+
+
+def _get_file_infos_with_mtimes(
+    path: str, filesystem: "pyarrow.fs.FileSystem", ignore_missing_path: bool = False
+) -> List[Tuple[str, int, Optional[int]]]:
+    """Get the file size and modification time for all files at or under the
+    provided path."""
+    from pyarrow.fs import FileType
+
+    try:
+        file_info = filesystem.get_file_info(path)
+    except OSError as e:
+        _handle_read_os_error(e, path)
+    if file_info.type == FileType.Directory:
+        files = _list_directory(path, filesystem)
+    elif file_info.type == FileType.File:
+        files = [file_info]
+    elif file_info.type == FileType.NotFound and ignore_missing_path:
+        files = []
+    else:
+        raise FileNotFoundError(path)
+    return [(file_.path, file_.size, file_.mtime_ns) for file_ in files]
+
+
+def _get_file_mtimes(
+    paths: List[str], filesystem: "pyarrow.fs.FileSystem"
+) -> Dict[str, Tuple[int, Optional[int]]]:
+    """Get the size and modification time of the provided file paths."""
+    from pyarrow.fs import LocalFileSystem
+    from ray.data.datasource.file_based_datasource import (
+        FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD,
+    )
+
+    if len(paths) == 0:
+        return {}
+    if len(paths) >= FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD and not isinstance(
+        filesystem, LocalFileSystem
+    ):
+        # Fetch all file infos under the common path with a single listing, instead
+        # of one request per file.
+        path_set = set(paths)
+        file_infos = [
+            file_
+            for file_ in _list_directory(
+                os.path.commonpath(paths), filesystem, exclude_prefixes=[]
+            )
+            if file_.path in path_set
+        ]
+    else:
+        file_infos = filesystem.get_file_info(paths)
+    return {
+        file_.path: (file_.size, file_.mtime_ns)
+        for file_ in file_infos
+        if file_.is_file
+    }
@@ -1,19 +1,31 @@
 import io
+import itertools
 import logging
 import time
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
+from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data._internal.util import _check_import
 from ray.data.block import Block, BlockMetadata
+from ray.data.context import DataContext
 from ray.data.datasource.binary_datasource import BinaryDatasource
-from ray.data.datasource.datasource import Reader
+from ray.data.datasource.datasource import Reader, ReadTask
 from ray.data.datasource.file_based_datasource import (
     _FileBasedDatasourceReader,
     FileBasedDatasource,
 )
-from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data.datasource.file_meta_provider import (
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
@@ -84,29 +96,18 @@ class ImageDatasource(BinaryDatasource):
         include_paths: bool,
         **reader_args,
     ) -> "pyarrow.Table":
-        from PIL import Image
+        import pyarrow as pa
 
+        # The encoded images are decoded in batches by the read tasks, see
+        # `_decode_images()`.
         records = super()._read_file(f, path, include_paths=True, **reader_args)
         assert len(records) == 1
         path, data = records[0]
 
-        image = Image.open(io.BytesIO(data))
-        if size is not None:
-            height, width = size
-            image = image.resize((width, height))
-        if mode is not None:
-            image = image.convert(mode)
-
-        builder = DelegatingBlockBuilder()
-        array = np.array(image)
+        columns = {"image": pa.array([data], type=pa.large_binary())}
         if include_paths:
-            item = {"image": array, "path": path}
-        else:
-            item = {"image": array}
-        builder.add(item)
-        block = builder.build()
-
-        return block
+            columns["path"] = [path]
+        return pa.table(columns)
 
 
 class _ImageFileMetadataProvider(DefaultFileMetadataProvider):
@@ -141,6 +142,8 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
         meta_provider: BaseFileMetadataProvider,
         **reader_args,
     ):
+        # Apply the block UDF to the decoded blocks instead of the encoded ones.
+        self._block_udf = reader_args.pop("_block_udf", None)
         super().__init__(
             delegate=delegate,
             paths=paths,
@@ -157,6 +160,21 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
         else:
             self._encoding_ratio = IMAGE_ENCODING_RATIO_ESTIMATE_DEFAULT
 
+    def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+        ctx = DataContext.get_current()
+        size = self._reader_args.get("size")
+        mode = self._reader_args.get("mode")
+        block_udf = self._block_udf
+        return [
+            ReadTask(
+                lambda read_task=read_task: _decode_images(
+                    read_task(), size, mode, block_udf, ctx
+                ),
+                read_task.get_metadata(),
+            )
+            for read_task in super().get_read_tasks(parallelism)
+        ]
+
     def estimate_inmemory_data_size(self) -> Optional[int]:
         total_size = 0
         for file_size in self._file_sizes:
@@ -214,3 +232,129 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
             )
         logger.debug(f"Estimated image encoding ratio from sampling is {ratio}.")
         return max(ratio, IMAGE_ENCODING_RATIO_ESTIMATE_LOWER_BOUND)
+
+
+def _decode_images(
+    blocks: Iterable[Block],
+    size: Optional[Tuple[int, int]],
+    mode: Optional[str],
+    block_udf: Optional[Callable[[Block], Block]],
+    ctx: DataContext,
+) -> Iterator[Block]:
+    """Decode the encoded images of the blocks read by a read task with a thread
+    pool, yielding blocks of about the target max block size."""
+    output_buffer = BlockOutputBuffer(block_udf, ctx.target_max_block_size)
+    with ThreadPoolExecutor(max_workers=max(1, ctx.image_decode_threads)) as pool:
+        for block in blocks:
+            for decoded in _decode_block(
+                block, size, mode, pool, ctx.target_max_block_size
+            ):
+                output_buffer.add_block(decoded)
+                if output_buffer.has_next():
+                    yield output_buffer.next()
+    output_buffer.finalize()
+    if output_buffer.has_next():
+        yield output_buffer.next()
+
+
+def _decode_block(
+    block: "pyarrow.Table",
+    size: Optional[Tuple[int, int]],
+    mode: Optional[str],
+    pool: ThreadPoolExecutor,
+    target_max_block_size: int,
+) -> Iterator["pyarrow.Table"]:
+    """Decode the encoded images in the "image" column of the block, in slices of
+    about the target max block size."""
+    from ray.air.util.tensor_extensions.arrow import (
+        ArrowTensorArray,
+        ArrowVariableShapedTensorArray,
+    )
+
+    if block.num_rows == 0:
+        return
+    encoded = block["image"].to_pylist()
+    first = _decode_image(encoded[0], size, mode)
+    rows_per_slice = max(1, target_max_block_size // max(first.nbytes, 1))
+    index = block.schema.get_field_index("image")
+    for start in range(0, len(encoded), rows_per_slice):
+        images = _decode_image_batch(
+            encoded[start : start + rows_per_slice],
+            size,
+            mode,
+            pool,
+            first if start == 0 else None,
+        )
+        # Images with different numbers of dimensions (e.g., grayscale and RGB
+        # images) can't be in the same tensor column, so split them into blocks.
+        offset = 0
+        for _, group in itertools.groupby(images, key=lambda image: image.ndim):
+            group = list(group)
+            if len(group) == len(images) and isinstance(images, np.ndarray):
+                tensors = ArrowTensorArray.from_numpy(images)
+            elif all(image.shape == group[0].shape for image in group):
+                tensors = ArrowTensorArray.from_numpy(group)
+            else:
+                # Stacking images with different shapes into an object ndarray
+                # fails if they have the same first dimension, so build the
+                # variable-shaped tensors from the images directly.
+                tensors = ArrowVariableShapedTensorArray.from_numpy(group)
+            yield block.slice(start + offset, len(group)).set_column(
+                index, "image", tensors
+            )
+            offset += len(group)
+
+
+def _decode_image_batch(
+    encoded: List[bytes],
+    size: Optional[Tuple[int, int]],
+    mode: Optional[str],
+    pool: ThreadPoolExecutor,
+    first: Optional[np.ndarray] = None,
+) -> Union[np.ndarray, List[np.ndarray]]:
+    """Decode the images with the thread pool.
+
+    If the images are resized, they are written directly into a preallocated tensor,
+    unless they have different shapes because they have different modes.
+    """
+    if first is None:
+        first = _decode_image(encoded[0], size, mode)
+    if size is None:
+        return [first] + list(
+            pool.map(lambda data: _decode_image(data, size, mode), encoded[1:])
+        )
+
+    images = np.empty((len(encoded),) + first.shape, dtype=first.dtype)
+    images[0] = first
+
+    def decode_into(i: int) -> Optional[np.ndarray]:
+        image = _decode_image(encoded[i], size, mode)
+        if image.shape != first.shape or image.dtype != first.dtype:
+            return image
+        images[i] = image
+        return None
+
+    mismatched = list(pool.map(decode_into, range(1, len(encoded))))
+    if all(image is None for image in mismatched):
+        return images
+    return [images[0]] + [
+        images[i] if image is None else image for i, image in enumerate(mismatched, 1)
+    ]
+
+
+def _decode_image(
+    data: bytes, size: Optional[Tuple[int, int]], mode: Optional[str]
+) -> np.ndarray:
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    if size is not None:
+        height, width = size
+        # Let the JPEG decoder downscale the image by up to 8x while decoding it,
+        # which is much faster than decoding it at full size before resizing it.
+        # Other formats ignore this.
+        image.draft(mode, (width, height))
+        image = image.resize((width, height))
+    if mode is not None:
+        image = image.convert(mode)
+    return np.asarray(image)
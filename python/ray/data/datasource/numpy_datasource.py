@@ -32,20 +32,52 @@ class NumpyDatasource(FileBasedDatasource):
     _COLUMN_NAME = "data"
     _FILE_EXTENSION = "npy"
 
-    def _read_file(self, f: "pyarrow.NativeFile", path: str, **reader_args):
-        # TODO(ekl) Ideally numpy can read directly from the file, but it
-        # seems like it requires the file to be seekable.
-        buf = BytesIO()
-        data = f.readall()
-        buf.write(data)
-        buf.seek(0)
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        import pyarrow as pa
+
+        # Memory-map local uncompressed files, so that they can be loaded without
+        # copying them into the heap.
+        if (
+            isinstance(filesystem, pa.fs.LocalFileSystem)
+            and open_args.get("compression") is None
+        ):
+            return pa.memory_map(path)
+        return super()._open_input_source(filesystem, path, **open_args)
+
+    def _read_file(
+        self,
+        f: "pyarrow.NativeFile",
+        path: str,
+        mmap_mode: Optional[str] = None,
+        **reader_args,
+    ):
+        import pyarrow as pa
+
+        if mmap_mode not in (None, "r"):
+            raise ValueError(
+                f"Only mmap_mode='r' is supported, since blocks are read-only, got "
+                f"mmap_mode={mmap_mode!r}."
+            )
+        data = None
+        if mmap_mode is not None and isinstance(f, pa.MemoryMappedFile):
+            data = _load_memory_mapped(f)
+        if data is None:
+            # TODO(ekl) Ideally numpy can read directly from the file, but it
+            # seems like it requires the file to be seekable.
+            buf = BytesIO()
+            buf.write(f.readall())
+            buf.seek(0)
+            data = np.load(buf, allow_pickle=True)
         ctx = ray.data.DataContext.get_current()
         if ctx.strict_mode:
-            return BlockAccessor.batch_to_block(
-                {"data": np.load(buf, allow_pickle=True)}
-            )
+            return BlockAccessor.batch_to_block({"data": data})
         else:
-            return BlockAccessor.batch_to_block(np.load(buf, allow_pickle=True))
+            return BlockAccessor.batch_to_block(data)
 
     def _convert_block_to_tabular_block(
         self, block: Block, column_name: Optional[str] = None
@@ -67,3 +99,30 @@ class NumpyDatasource(FileBasedDatasource):
     ):
         value = block.to_numpy(column)
         np.save(f, value)
+
+
+def _load_memory_mapped(f: "pyarrow.MemoryMappedFile") -> Optional[np.ndarray]:
+    """Load the array in a memory-mapped .npy file without copying it, or return None
+    if it can't be loaded without copying.
+
+    The returned array is backed by the memory map, which stays open as long as the
+    array is referenced.
+    """
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    else:
+        f.seek(0)
+        return None
+    if dtype.hasobject:
+        # Arrays of Python objects are pickled.
+        f.seek(0)
+        return None
+    offset = f.tell()
+    f.seek(0)
+    data = np.frombuffer(
+        f.read_buffer(), dtype=dtype, count=int(np.prod(shape)), offset=offset
+    )
+    return data.reshape(shape, order="F" if fortran_order else "C")
@@ -1,5 +1,15 @@
+import itertools
 import logging
-from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
@@ -68,9 +78,20 @@ PARQUET_ENCODING_RATIO_ESTIMATE_NUM_ROWS = 1024
 # TODO(ekl) this is a workaround for a pyarrow serialization bug, where serializing a
 # raw pyarrow file fragment causes S3 network calls.
 class _SerializedPiece:
-    def __init__(self, frag: "ParquetFileFragment"):
+    def __init__(
+        self,
+        frag: "ParquetFileFragment",
+        row_group_ids: Optional[List[int]] = None,
+    ):
+        # If row_group_ids is None, the whole file is read.
         self._data = cloudpickle.dumps(
-            (frag.format, frag.path, frag.filesystem, frag.partition_expression)
+            (
+                frag.format,
+                frag.path,
+                frag.filesystem,
+                frag.partition_expression,
+                row_group_ids,
+            )
         )
 
     def deserialize(self) -> "ParquetFileFragment":
@@ -78,10 +99,16 @@ class _SerializedPiece:
         # pyarrow.fs.
         import pyarrow.fs  # noqa: F401
 
-        (file_format, path, filesystem, partition_expression) = cloudpickle.loads(
-            self._data
+        (
+            file_format,
+            path,
+            filesystem,
+            partition_expression,
+            row_group_ids,
+        ) = cloudpickle.loads(self._data)
+        return file_format.make_fragment(
+            path, filesystem, partition_expression, row_groups=row_group_ids
         )
-        return file_format.make_fragment(path, filesystem, partition_expression)
 
 
 # Visible for test mocking.
@@ -166,6 +193,9 @@ class ParquetDatasource(ParquetBaseDatasource):
         """
         return "Parquet"
 
+    def supports_read_pushdown(self) -> bool:
+        return True
+
     def create_reader(self, **kwargs):
         return _ParquetDatasourceReader(**kwargs)
 
@@ -266,21 +296,37 @@ class _ParquetDatasourceReader(Reader):
         # method in order to leverage pyarrow's ParquetDataset abstraction,
         # which simplifies partitioning logic. We still use
         # FileBasedDatasource's write side (do_write), however.
+        pieces, metadata, row_group_ids = self._split_pieces_by_row_groups()
         read_tasks = []
-        for pieces, metadata in zip(
-            np.array_split(self._pq_ds.pieces, parallelism),
-            np.array_split(self._metadata, parallelism),
-        ):
-            if len(pieces) <= 0:
+        for idxs in np.array_split(np.arange(len(pieces)), parallelism):
+            if len(idxs) <= 0:
                 continue
-            serialized_pieces = [_SerializedPiece(p) for p in pieces]
-            input_files = [p.path for p in pieces]
+            task_pieces = [pieces[i] for i in idxs]
+            task_metadata = [metadata[i] for i in idxs if metadata[i] is not None]
+            task_row_group_ids = [row_group_ids[i] for i in idxs]
+            serialized_pieces = [
+                _SerializedPiece(p, ids)
+                for p, ids in zip(task_pieces, task_row_group_ids)
+            ]
+            input_files = [p.path for p in task_pieces]
             meta = self._meta_provider(
                 input_files,
                 self._inferred_schema,
-                pieces=pieces,
-                prefetched_metadata=metadata,
+                pieces=task_pieces,
+                prefetched_metadata=task_metadata,
             )
+            if len(task_metadata) == len(task_pieces) and any(
+                ids is not None for ids in task_row_group_ids
+            ):
+                # Only a subset of the row groups of some files is read, so compute
+                # the row count and size from the row group metadata.
+                row_groups = [
+                    m.row_group(i)
+                    for m, ids in zip(task_metadata, task_row_group_ids)
+                    for i in (range(m.num_row_groups) if ids is None else ids)
+                ]
+                meta.num_rows = sum(rg.num_rows for rg in row_groups)
+                meta.size_bytes = sum(rg.total_byte_size for rg in row_groups)
             # If there is a filter operation, reset the calculated row count,
             # since the resulting row count is unknown.
             if self._reader_args.get("filter") is not None:
@@ -309,6 +355,84 @@ class _ParquetDatasourceReader(Reader):
 
         return read_tasks
 
+    def _split_pieces_by_row_groups(
+        self,
+    ) -> Tuple[
+        List["ParquetFileFragment"],
+        List[Optional["pyarrow.parquet.FileMetaData"]],
+        List[Optional[List[int]]],
+    ]:
+        """Split the Parquet files into pieces of contiguous row groups to read.
+
+        Row groups that can't match the pushed down filter according to their
+        min/max statistics are skipped, and files larger than the target max block
+        size are split into multiple pieces at row group boundaries, so that a single
+        large file doesn't end up as a straggler read task.
+
+        Returns:
+            A tuple of the file fragment, the file metadata (if prefetched) and the
+            IDs of the row groups to read (or None to read the whole file) of each
+            piece.
+        """
+        pieces = self._pq_ds.pieces
+        metadata = self._metadata
+        if len(metadata) != len(pieces):
+            # Without the file metadata, the row groups of the files are unknown.
+            metadata = [None] * len(pieces)
+
+        filter_expr = self._reader_args.get("filter")
+        if filter_expr is not None and len(pieces) > 0:
+            pruned_row_group_ids = _prune_row_groups(
+                pieces, filter_expr, self._pq_ds.schema, self._local_scheduling
+            )
+        else:
+            pruned_row_group_ids = [None] * len(pieces)
+
+        target_max_block_size = DataContext.get_current().target_max_block_size
+        split_pieces, split_metadata, split_row_group_ids = [], [], []
+        for piece, file_metadata, row_group_ids in zip(
+            pieces, metadata, pruned_row_group_ids
+        ):
+            if row_group_ids is not None and len(row_group_ids) == 0:
+                # All row groups of this file are ruled out by the filter.
+                continue
+            if file_metadata is None:
+                chunks = [row_group_ids]
+            else:
+                if row_group_ids is None:
+                    row_group_ids = list(range(file_metadata.num_row_groups))
+                chunks = [[]]
+                chunk_size = 0
+                for row_group_id in row_group_ids:
+                    row_group_size = (
+                        file_metadata.row_group(row_group_id).total_byte_size
+                        * self._encoding_ratio
+                    )
+                    if (
+                        len(chunks[-1]) > 0
+                        and chunk_size + row_group_size > target_max_block_size
+                    ):
+                        chunks.append([])
+                        chunk_size = 0
+                    chunks[-1].append(row_group_id)
+                    chunk_size += row_group_size
+                if len(chunks) == 1 and len(chunks[0]) == file_metadata.num_row_groups:
+                    # Read the whole file.
+                    chunks = [None]
+            for chunk in chunks:
+                split_pieces.append(piece)
+                split_metadata.append(file_metadata)
+                split_row_group_ids.append(chunk)
+
+        if len(split_pieces) == 0 and len(pieces) > 0:
+            # Keep a single empty piece, so that the datastream has a read task.
+            split_pieces, split_metadata, split_row_group_ids = (
+                [pieces[0]],
+                [metadata[0]],
+                [[]],
+            )
+        return split_pieces, split_metadata, split_row_group_ids
+
     def _estimate_files_encoding_ratio(self) -> float:
         """Return an estimate of the Parquet files encoding ratio.
 
@@ -401,8 +525,12 @@ def _read_pieces(
             table = pa.Table.from_batches([batch], schema=schema)
             if part:
                 for col, value in part.items():
+                    idx = table.schema.get_field_index(col)
+                    # The partition column may have been projected out.
+                    if idx < 0:
+                        continue
                     table = table.set_column(
-                        table.schema.get_field_index(col),
+                        idx,
                         col,
                         pa.array([value] * len(table)),
                     )
@@ -416,6 +544,60 @@ def _read_pieces(
         yield output_buffer.next()
 
 
+def _prune_row_groups(
+    pieces: List["pyarrow.dataset.ParquetFileFragment"],
+    filter_expr: "pyarrow.compute.Expression",
+    schema: "pyarrow.lib.Schema",
+    scheduling_strategy: Optional[Any] = None,
+) -> List[List[int]]:
+    """Return the IDs of the row groups of each piece that may match the filter.
+
+    Row groups are ruled out using the min/max statistics in the file footers. The
+    footers are read with parallel Ray tasks if there are many pieces.
+    """
+    if len(pieces) > PARALLELIZE_META_FETCH_THRESHOLD:
+        prune_row_groups = cached_remote_fn(
+            _prune_row_groups_serialization_wrapper, num_cpus=0.5
+        )
+        if scheduling_strategy is not None:
+            prune_row_groups = prune_row_groups.options(
+                scheduling_strategy=scheduling_strategy
+            )
+        serialized_pieces = [_SerializedPiece(p) for p in pieces]
+        parallelism = max(len(pieces) // PIECES_PER_META_FETCH, 2)
+        futures = [
+            prune_row_groups.remote(chunk, filter_expr, schema)
+            for chunk in np.array_split(serialized_pieces, parallelism)
+            if len(chunk) > 0
+        ]
+        prune_bar = ProgressBar("Parquet Row Group Pruning", len(futures))
+        results = prune_bar.fetch_until_complete(futures)
+        prune_bar.close()
+        return list(itertools.chain.from_iterable(results))
+    else:
+        return _prune_row_groups_local(pieces, filter_expr, schema)
+
+
+def _prune_row_groups_serialization_wrapper(
+    serialized_pieces: List[_SerializedPiece],
+    filter_expr: "pyarrow.compute.Expression",
+    schema: "pyarrow.lib.Schema",
+) -> List[List[int]]:
+    pieces = _deserialize_pieces_with_retry(serialized_pieces)
+    return _prune_row_groups_local(pieces, filter_expr, schema)
+
+
+def _prune_row_groups_local(
+    pieces: List["pyarrow.dataset.ParquetFileFragment"],
+    filter_expr: "pyarrow.compute.Expression",
+    schema: "pyarrow.lib.Schema",
+) -> List[List[int]]:
+    return [
+        [row_group.id for row_group in p.subset(filter_expr, schema).row_groups]
+        for p in pieces
+    ]
+
+
 def _fetch_metadata_serialization_wrapper(
     pieces: _SerializedPiece,
 ) -> List["pyarrow.parquet.FileMetaData"]:
@@ -35,7 +35,7 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     Repartition,
     Sort,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.optimizers import LogicalPlan
 from ray.data._internal.logical.operators.limit_operator import Limit
 from ray.data._internal.logical.operators.map_operator import (
@@ -43,12 +43,17 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapRows,
     MapBatches,
+    Project,
 )
 from ray.data._internal.logical.operators.write_operator import Write
-from ray.data._internal.planner.filter import generate_filter_fn
+from ray.data._internal.planner.filter import (
+    generate_filter_expr_fn,
+    generate_filter_fn,
+)
 from ray.data._internal.planner.flat_map import generate_flat_map_fn
 from ray.data._internal.planner.map_batches import generate_map_batches_fn
 from ray.data._internal.planner.map_rows import generate_map_rows_fn
+from ray.data._internal.planner.project import generate_project_fn
 from ray.data._internal.planner.write import generate_write_fn
 from ray.data.iterator import DataIterator
 from ray.data._internal.block_list import BlockList
@@ -82,6 +87,7 @@ from ray.data._internal.stage_impl import (
     RepartitionStage,
     RandomShuffleStage,
     ZipStage,
+    JoinStage,
     SortStage,
     LimitStage,
 )
@@ -125,6 +131,8 @@ from ray.data.datasource import (
     WriteResult,
 )
 from ray.data.datasource.file_based_datasource import (
+    BUCKET_COLUMN,
+    _add_bucket_column,
     _unwrap_arrow_serialization_workaround,
     _wrap_arrow_serialization_workaround,
 )
@@ -753,7 +761,7 @@ class Datastream:
             >>> # Select only "col1" and "col2" columns.
             >>> ds = ds.select_columns(cols=["col1", "col2"])
             >>> ds
-            MapBatches(<lambda>)
+            Project
             +- Datastream(
                   num_blocks=10,
                   num_rows=10,
@@ -773,14 +781,25 @@ class Datastream:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
-        return self.map_batches(
-            lambda batch: BlockAccessor.for_block(batch).select(columns=cols),
-            batch_format="pandas",
-            zero_copy_batch=True,
-            compute=compute,
-            **ray_remote_args,
+        transform_fn = generate_project_fn()
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "Project", transform_fn, compute, ray_remote_args, fn_args=(cols,)
+            )
         )
 
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = Project(
+                input_op=logical_plan.dag,
+                cols=cols,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+        return Datastream(plan, self._epoch, self._lazy, logical_plan)
+
     def flat_map(
         self,
         fn: UserDefinedFunction[Dict[str, Any], List[Dict[str, Any]]],
@@ -857,13 +876,20 @@ class Datastream:
 
     def filter(
         self,
-        fn: UserDefinedFunction[Dict[str, Any], bool],
+        fn: Optional[UserDefinedFunction[Dict[str, Any], bool]] = None,
         *,
+        expr: Optional["pyarrow.compute.Expression"] = None,
         compute: Union[str, ComputeStrategy] = None,
         **ray_remote_args,
     ) -> "Datastream":
         """Filter out records that do not satisfy the given predicate.
 
+        The predicate is either a UDF ``fn`` called on each record, or a
+        ``pyarrow.compute.Expression`` ``expr`` evaluated on whole blocks. Prefer
+        ``expr`` when possible: it is vectorized, and when it directly follows a
+        read of a datasource that supports it (e.g., ``read_parquet()``), it is
+        pushed down into the read so that rows it rules out are never loaded.
+
         Consider using ``.map_batches()`` for better performance (you can implement
         filter by dropping records).
 
@@ -873,6 +899,10 @@ class Datastream:
             >>> ds.filter(lambda x: x["id"] % 2 == 0)
             Filter
             +- Datastream(num_blocks=..., num_rows=100, schema={id: int64})
+            >>> import pyarrow.compute as pc
+            >>> ds.filter(expr=pc.field("id") < 10)
+            Filter
+            +- Datastream(num_blocks=..., num_rows=100, schema={id: int64})
 
         Time complexity: O(datastream size / parallelism)
 
@@ -880,6 +910,9 @@ class Datastream:
             fn: The predicate to apply to each record, or a class type
                 that can be instantiated to create such a callable. Callable classes are
                 only supported for the actor compute strategy.
+            expr: The predicate as a ``pyarrow.compute.Expression``, e.g.
+                ``pc.field("id") < 10``. Exactly one of ``fn`` and ``expr`` must be
+                provided.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
                 pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
@@ -887,6 +920,9 @@ class Datastream:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be provided.")
+
         if isinstance(fn, CallableClass) and (
             compute is None
             or compute == "tasks"
@@ -898,13 +934,18 @@ class Datastream:
                 "For example, use ``compute=ActorPoolStrategy(size=n)``."
             )
 
-        self._warn_slow()
-
-        transform_fn = generate_filter_fn()
-
-        plan = self._plan.with_stage(
-            OneToOneStage("Filter", transform_fn, compute, ray_remote_args, fn=fn)
-        )
+        if expr is not None:
+            transform_fn = generate_filter_expr_fn()
+            stage = OneToOneStage(
+                "Filter", transform_fn, compute, ray_remote_args, fn_args=(expr,)
+            )
+        else:
+            self._warn_slow()
+            transform_fn = generate_filter_fn()
+            stage = OneToOneStage(
+                "Filter", transform_fn, compute, ray_remote_args, fn=fn
+            )
+        plan = self._plan.with_stage(stage)
 
         logical_plan = self._logical_plan
         if logical_plan is not None:
@@ -913,6 +954,7 @@ class Datastream:
                 fn=fn,
                 compute=compute,
                 ray_remote_args=ray_remote_args,
+                filter_expr=expr,
             )
             logical_plan = LogicalPlan(op)
 
@@ -1117,6 +1159,11 @@ class Datastream:
         each iteration, which means that `next` must be called on all iterators before
         the iteration starts.
 
+        Each request of an iterator to the coordinator returns all the blocks that
+        are already routed to it, up to
+        ``DataContext.streaming_split_max_blocks_per_fetch``, and the next request is
+        made while these blocks are consumed.
+
         Warning: because iterators are pulling blocks from the same Datastream
         execution, if one iterator falls behind other iterators may be stalled.
 
@@ -1151,8 +1198,10 @@ class Datastream:
                 slightly more or less rows than other, but no data will be dropped.
             locality_hints: Specify the node ids corresponding to each iterator
                 location. Datastream will try to minimize data movement based on the
-                iterator output locations. This list must have length ``n``. You can
-                get the current node id of a task or actor by calling
+                iterator output locations: a block is only routed to an iterator on
+                another node if no buffered block is local to an iterator that is
+                at most one block ahead of the others. This list must have length
+                ``n``. You can get the current node id of a task or actor by calling
                 ``ray.get_runtime_context().get_node_id()``.
 
         Returns:
@@ -1995,6 +2044,79 @@ class Datastream:
             logical_plan = LogicalPlan(op)
         return Datastream(plan, self._epoch, self._lazy, logical_plan)
 
+    def join(
+        self,
+        other: "Datastream",
+        on: Union[str, List[str]],
+        how: str = "inner",
+        *,
+        right_suffix: str = "_1",
+    ) -> "Datastream":
+        """Materialize and join this datastream with another on key columns.
+
+        Rows of both datastreams whose key columns are all equal are combined into
+        one row, with SQL semantics: rows with null keys never match. The output
+        has the columns of this datastream, followed by the non-key columns of the
+        other datastream. The order of the output rows isn't specified.
+
+        .. note::
+            If the estimated size of one datastream is at most
+            ``DataContext.broadcast_join_threshold`` bytes, and its unmatched rows
+            aren't needed by the join type, it's broadcast to the tasks joining the
+            blocks of the other datastream. Otherwise, both datastreams are hash
+            partitioned by the key columns, and each pair of partitions is joined.
+
+        Examples:
+            >>> import ray
+            >>> ds1 = ray.data.from_items(
+            ...     [{"id": 1, "a": "x"}, {"id": 2, "a": "y"}, {"id": 3, "a": "z"}]
+            ... )
+            >>> ds2 = ray.data.from_items([{"id": 2, "b": 20}, {"id": 3, "b": 30}])
+            >>> ds1.join(ds2, on="id").sort("id").take_all()
+            [{'id': 2, 'a': 'y', 'b': 20}, {'id': 3, 'a': 'z', 'b': 30}]
+            >>> ds = ds1.join(ds2, on="id", how="left").sort("id")
+            >>> ds.take_batch()["b"]
+            array([nan, 20., 30.])
+
+        Time complexity: O(datastream size / parallelism)
+
+        Args:
+            other: The datastream to join with on the right hand side.
+            on: The name or names of the key columns, which both datastreams must
+                have.
+            how: The type of join, one of ``"inner"``, ``"left"``, ``"right"`` or
+                ``"outer"``. Outer joins keep the rows without a match on the
+                respective sides, with nulls for the columns of the other side.
+            right_suffix: The suffix appended to the names of the non-key columns of
+                the other datastream that are also columns of this datastream.
+
+        Returns:
+            A ``Datastream`` of the joined rows.
+        """
+        if how not in ("inner", "left", "right", "outer"):
+            raise ValueError(
+                "The join type must be one of 'inner', 'left', 'right' or 'outer', "
+                f"got: {how!r}"
+            )
+        on = [on] if isinstance(on, str) else list(on)
+        if not on:
+            raise ValueError("At least one key column must be specified to join on.")
+
+        plan = self._plan.with_stage(JoinStage(other, on, how, right_suffix))
+
+        logical_plan = self._logical_plan
+        other_logical_plan = other._logical_plan
+        if logical_plan is not None and other_logical_plan is not None:
+            op = Join(
+                logical_plan.dag,
+                other_logical_plan.dag,
+                on=on,
+                how=how,
+                right_suffix=right_suffix,
+            )
+            logical_plan = LogicalPlan(op)
+        return Datastream(plan, self._epoch, self._lazy, logical_plan)
+
     @ConsumptionAPI
     def limit(self, limit: int) -> "Datastream":
         """Materialize and truncate the datastream to the first ``limit`` records.
@@ -2248,13 +2370,18 @@ class Datastream:
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        partition_cols: Optional[List[str]] = None,
+        num_buckets: Optional[int] = None,
+        bucket_cols: Optional[List[str]] = None,
+        target_file_size_bytes: Optional[int] = None,
         ray_remote_args: Dict[str, Any] = None,
         **arrow_parquet_args,
     ) -> None:
         """Write the datastream to parquet.
 
         This is only supported for datastreams convertible to Arrow records.
-        To control the number of files, use ``.repartition()``.
+        To control the number of files, use ``.repartition()`` or
+        ``target_file_size_bytes``.
 
         Unless a custom block path provider is given, the format of the output
         files will be {uuid}_{block_idx}.parquet, where ``uuid`` is an unique
@@ -2283,13 +2410,30 @@ class Datastream:
                 instead of arrow_parquet_args if any of your write arguments
                 cannot be pickled, or if you'd like to lazily resolve the write
                 arguments for each datastream block.
+            partition_cols: Columns to partition the output by. The rows are shuffled
+                by these columns and written to Hive-style ``{col}={value}``
+                directories, which ``PathPartitionParser`` and partition filters
+                can read back. The partition columns aren't written to the files.
+            num_buckets: The number of buckets to hash the rows into by
+                ``bucket_cols``. The rows are shuffled by bucket, and the rows of
+                each bucket of each partition are written by one write task, to
+                files whose names end with ``_b{bucket}``.
+            bucket_cols: Columns to bucket the output by. Required with
+                ``num_buckets``.
+            target_file_size_bytes: If set, each write task starts a new file
+                whenever a file reaches this in-memory size, instead of writing
+                one file per block, partition and bucket.
             ray_remote_args: Kwargs passed to ray.remote in the write tasks.
             arrow_parquet_args: Options to pass to
                 pyarrow.parquet.write_table(), which is used to write out each
                 block to a file.
         """
-        self.write_datasource(
+        self._write_files(
             ParquetDatasource(),
+            partition_cols=partition_cols,
+            num_buckets=num_buckets,
+            bucket_cols=bucket_cols,
+            target_file_size_bytes=target_file_size_bytes,
             ray_remote_args=ray_remote_args,
             path=path,
             datastream_uuid=self._uuid,
@@ -2311,13 +2455,18 @@ class Datastream:
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         pandas_json_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        partition_cols: Optional[List[str]] = None,
+        num_buckets: Optional[int] = None,
+        bucket_cols: Optional[List[str]] = None,
+        target_file_size_bytes: Optional[int] = None,
         ray_remote_args: Dict[str, Any] = None,
         **pandas_json_args,
     ) -> None:
         """Write the datastream to json.
 
         This is only supported for datastreams convertible to Arrow records.
-        To control the number of files, use ``.repartition()``.
+        To control the number of files, use ``.repartition()`` or
+        ``target_file_size_bytes``.
 
         Unless a custom block path provider is given, the format of the output
         files will be {self._uuid}_{block_idx}.json, where ``uuid`` is an
@@ -2346,14 +2495,31 @@ class Datastream:
                 instead of pandas_json_args if any of your write arguments
                 cannot be pickled, or if you'd like to lazily resolve the write
                 arguments for each datastream block.
+            partition_cols: Columns to partition the output by. The rows are shuffled
+                by these columns and written to Hive-style ``{col}={value}``
+                directories, which ``PathPartitionParser`` and partition filters
+                can read back. The partition columns aren't written to the files.
+            num_buckets: The number of buckets to hash the rows into by
+                ``bucket_cols``. The rows are shuffled by bucket, and the rows of
+                each bucket of each partition are written by one write task, to
+                files whose names end with ``_b{bucket}``.
+            bucket_cols: Columns to bucket the output by. Required with
+                ``num_buckets``.
+            target_file_size_bytes: If set, each write task starts a new file
+                whenever a file reaches this in-memory size, instead of writing
+                one file per block, partition and bucket.
             ray_remote_args: Kwargs passed to ray.remote in the write tasks.
             pandas_json_args: These args will be passed to
                 pandas.DataFrame.to_json(), which we use under the hood to
                 write out each Datastream block. These
                 are dict(orient="records", lines=True) by default.
         """
-        self.write_datasource(
+        self._write_files(
             JSONDatasource(),
+            partition_cols=partition_cols,
+            num_buckets=num_buckets,
+            bucket_cols=bucket_cols,
+            target_file_size_bytes=target_file_size_bytes,
             ray_remote_args=ray_remote_args,
             path=path,
             datastream_uuid=self._uuid,
@@ -2375,13 +2541,18 @@ class Datastream:
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         arrow_csv_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        partition_cols: Optional[List[str]] = None,
+        num_buckets: Optional[int] = None,
+        bucket_cols: Optional[List[str]] = None,
+        target_file_size_bytes: Optional[int] = None,
         ray_remote_args: Dict[str, Any] = None,
         **arrow_csv_args,
     ) -> None:
         """Write the datastream to csv.
 
         This is only supported for datastreams convertible to Arrow records.
-        To control the number of files, use ``.repartition()``.
+        To control the number of files, use ``.repartition()`` or
+        ``target_file_size_bytes``.
 
         Unless a custom block path provider is given, the format of the output
         files will be {uuid}_{block_idx}.csv, where ``uuid`` is an unique id
@@ -2410,11 +2581,28 @@ class Datastream:
                 instead of arrow_csv_args if any of your write arguments
                 cannot be pickled, or if you'd like to lazily resolve the write
                 arguments for each datastream block.
+            partition_cols: Columns to partition the output by. The rows are shuffled
+                by these columns and written to Hive-style ``{col}={value}``
+                directories, which ``PathPartitionParser`` and partition filters
+                can read back. The partition columns aren't written to the files.
+            num_buckets: The number of buckets to hash the rows into by
+                ``bucket_cols``. The rows are shuffled by bucket, and the rows of
+                each bucket of each partition are written by one write task, to
+                files whose names end with ``_b{bucket}``.
+            bucket_cols: Columns to bucket the output by. Required with
+                ``num_buckets``.
+            target_file_size_bytes: If set, each write task starts a new file
+                whenever a file reaches this in-memory size, instead of writing
+                one file per block, partition and bucket.
             ray_remote_args: Kwargs passed to ray.remote in the write tasks.
             arrow_csv_args: Other CSV write options to pass to pyarrow.
         """
-        self.write_datasource(
+        self._write_files(
             CSVDatasource(),
+            partition_cols=partition_cols,
+            num_buckets=num_buckets,
+            bucket_cols=bucket_cols,
+            target_file_size_bytes=target_file_size_bytes,
             ray_remote_args=ray_remote_args,
             path=path,
             datastream_uuid=self._uuid,
@@ -2685,6 +2873,66 @@ class Datastream:
             collection=collection,
         )
 
+    def _write_files(
+        self,
+        datasource: Datasource,
+        *,
+        partition_cols: Optional[List[str]],
+        num_buckets: Optional[int],
+        bucket_cols: Optional[List[str]],
+        target_file_size_bytes: Optional[int],
+        ray_remote_args: Dict[str, Any],
+        **write_args,
+    ) -> None:
+        """Write the datastream with a file-based datasource, shuffling the rows by
+        partition and bucket first if requested."""
+        if (num_buckets is None) != (bucket_cols is None):
+            raise ValueError(
+                "`num_buckets` and `bucket_cols` must be specified together, got "
+                f"num_buckets={num_buckets} and bucket_cols={bucket_cols}."
+            )
+        if num_buckets is not None and num_buckets < 1:
+            raise ValueError(f"`num_buckets` must be positive, got {num_buckets}.")
+        if target_file_size_bytes is not None and target_file_size_bytes < 1:
+            raise ValueError(
+                "`target_file_size_bytes` must be positive, got "
+                f"{target_file_size_bytes}."
+            )
+        ds = self
+        keys = list(partition_cols or [])
+        if num_buckets is not None:
+            ds = ds.map_batches(
+                _add_bucket_column,
+                batch_format="pyarrow",
+                fn_kwargs={"bucket_cols": bucket_cols, "num_buckets": num_buckets},
+            )
+            keys.append(BUCKET_COLUMN)
+        if keys:
+            # Shuffle the rows, so that each partition and bucket is written by a
+            # single task instead of by every task that has some of its rows.
+            num_blocks = self.num_blocks()
+            plan = ds._plan.with_stage(RepartitionStage(num_blocks, True, keys))
+            logical_plan = ds._logical_plan
+            if logical_plan is not None:
+                op = Repartition(
+                    logical_plan.dag,
+                    num_outputs=num_blocks,
+                    shuffle=True,
+                    keys=keys,
+                )
+                logical_plan = LogicalPlan(op)
+            ds = Datastream(plan, ds._epoch, ds._lazy, logical_plan)
+        ds.write_datasource(
+            datasource,
+            ray_remote_args=ray_remote_args,
+            partition_cols=partition_cols,
+            num_buckets=num_buckets,
+            target_file_size_bytes=target_file_size_bytes,
+            **write_args,
+        )
+        if ds is not self:
+            self._write_ds = ds._write_ds
+
     @ConsumptionAPI
     def write_datasource(
         self,
@@ -3605,13 +3853,21 @@ class Datastream:
         self,
         key: str,
         num_workers: Optional[int] = None,
+        *,
+        index: str = "sort",
     ) -> RandomAccessDataset:
         """Convert this datastream into a distributed RandomAccessDataset (EXPERIMENTAL).
 
         RandomAccessDataset partitions the datastream across the cluster by the given
-        sort key, providing efficient random access to records via binary search. A
-        number of worker actors are created, each of which has zero-copy access to the
-        underlying sorted data blocks of the datastream.
+        key, providing efficient random access to records. A number of worker actors
+        are created, each of which serves a partition of the datastream.
+
+        With ``index="sort"``, the datastream is range partitioned by sorting it, and
+        each worker has zero-copy access to the underlying sorted data blocks of the
+        datastream, which are searched via binary search. With ``index="hash"``, the
+        datastream is hash partitioned by the key into one shard per worker, and
+        each worker builds a hash index over its shard. The hash index avoids the
+        sort and is faster for large batches of lookups via ``multiget_batch()``.
 
         Note that the key must be unique in the datastream. If there are duplicate keys,
         an arbitrary value is returned.
@@ -3625,10 +3881,12 @@ class Datastream:
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            index: The type of index to build over the key, either ``"sort"`` or
+                ``"hash"``.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(self, key, num_workers=num_workers, index=index)
 
     @ConsumptionAPI
     def repeat(self, times: Optional[int] = None) -> "DatasetPipeline":
@@ -3950,6 +4208,80 @@ class Datastream:
         copy._plan.execute(force_read=True)
         return copy
 
+    @ConsumptionAPI(pattern="Time complexity:")
+    def cache(
+        self, storage: str = "local_disk", max_bytes: Optional[int] = None
+    ) -> "Datastream":
+        """Execute this datastream and cache its blocks to node-local storage.
+
+        Unlike ``materialize()``, the blocks aren't pinned in object store memory,
+        so iterating repeatedly over a datastream larger than memory doesn't cause
+        spilling. Each block is written to an Arrow IPC file on the node that
+        computed it, under ``DataContext.local_disk_cache_dir``. The returned
+        datastream reads the blocks by memory mapping the files, on the node that
+        cached them, without recomputing them.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100).map_batches(lambda batch: batch)
+            >>> cached = ds.cache(max_bytes=1024 ** 3) # doctest: +SKIP
+            >>> for epoch in range(2): # doctest: +SKIP
+            ...     for batch in cached.iter_batches():
+            ...         pass
+
+        Time complexity: O(datastream size / parallelism)
+
+        Args:
+            storage: Where to cache the blocks. Only ``"local_disk"`` is supported.
+            max_bytes: The max total size in bytes of the cached blocks on each node.
+                When it's exceeded, the least recently used blocks of the caches
+                that aren't in use anymore are evicted. The blocks of cached
+                datastreams that are still in use are never evicted, so if that
+                isn't enough, a ``RuntimeError`` is raised. The blocks of a cached
+                datastream are removed when it's garbage collected, and the blocks
+                left by jobs that exited are removed the next time a datastream is
+                cached. By default, the size isn't limited.
+
+        Returns:
+            A datastream that reads the cached blocks.
+        """
+        from ray.data._internal.local_disk_cache import (
+            LocalDiskCache,
+            LocalDiskCacheDatasource,
+            write_cached_blocks,
+        )
+        from ray.data.read_api import read_datasource
+
+        if storage != "local_disk":
+            raise ValueError(
+                f"Invalid storage: {storage!r}. Only 'local_disk' is supported."
+            )
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}.")
+
+        cache = LocalDiskCache.create(DataContext.get_current().local_disk_cache_dir)
+        try:
+            entries = self.map_batches(
+                write_cached_blocks,
+                batch_size=None,
+                batch_format="pyarrow",
+                zero_copy_batch=True,
+                fn_kwargs={"cache": cache, "max_bytes": max_bytes},
+            ).take_all()
+        except Exception:
+            # Remove the blocks cached before the failure on any node.
+            cache.node_ids.update(
+                node["NodeID"] for node in ray.nodes() if node["Alive"]
+            )
+            raise
+        cache.node_ids.update(entry["node_id"] for entry in entries)
+        return read_datasource(
+            LocalDiskCacheDatasource(),
+            parallelism=max(len(entries), 1),
+            cache=cache,
+            entries=[dict(entry) for entry in entries],
+        )
+
     @ConsumptionAPI(pattern="timing information.", insert_after=True)
     def stats(self) -> str:
         """Returns a string containing execution timing information.
@@ -3959,6 +4291,30 @@ class Datastream:
         """
         return self._get_stats_summary().to_string()
 
+    @DeveloperAPI
+    def export_chrome_trace(self, path: str) -> None:
+        """Write the per-operator timeline of the streaming execution of this
+        datastream to a Chrome trace file.
+
+        The file can be viewed in ``chrome://tracing`` or Perfetto. Each operator is
+        shown with its tasks, the time its inputs waited in its queue, the intervals
+        when it was backpressured, and the bytes of its inputs and outputs. The
+        timeline is only recorded when
+        ``DataContext.get_current().enable_operator_timeline`` is set.
+
+        Note that this does not trigger execution, so if the datastream has not yet
+        executed, the trace will be empty.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100).map_batches(lambda x: x).materialize()
+            >>> ds.export_chrome_trace("/tmp/trace.json") # doctest: +SKIP
+
+        Args:
+            path: The path of the JSON file to write.
+        """
+        self._get_stats_summary().to_chrome_trace(path)
+
     def _get_stats_summary(self) -> DatastreamStatsSummary:
         return self._plan.stats_summary()
 
@@ -7,6 +7,9 @@ from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.logical.interfaces import LogicalPlan
 from ray.data._internal.logical.operators.all_to_all_operator import Aggregate
 from ray.data._internal.plan import AllToAllStage
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
+)
 from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ._internal.table_block import TableBlockAccessor
@@ -29,7 +32,7 @@ from ray.data.block import (
     UserDefinedFunction,
 )
 from ray.data.context import DataContext
-from ray.data.datastream import DataBatch, Datastream
+from ray.data.datastream import DataBatch, Datastream, Schema
 from ray.util.annotations import PublicAPI
 
 
@@ -115,6 +118,45 @@ class PushBasedGroupbyOp(_GroupbyOp, PushBasedShufflePlan):
     pass
 
 
+class _HashGroupbyOp(ShuffleOp):
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: Tuple[AggregateFn],
+        vectorized: bool,
+        float_columns: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Partition the block by the hash of the key and combine rows with the
+        same key."""
+        return HashAggregateTaskSpec.map(
+            idx, block, output_num_blocks, key, aggs, vectorized, float_columns
+        )
+
+    @staticmethod
+    def reduce(
+        key: str,
+        aggs: Tuple[AggregateFn],
+        vectorized: bool,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> (Block, BlockMetadata):
+        """Aggregate partially combined blocks with the same key hashes."""
+        return HashAggregateTaskSpec.reduce(
+            key, aggs, vectorized, *mapper_outputs, partial_reduce=partial_reduce
+        )
+
+
+class SimpleShuffleHashGroupbyOp(_HashGroupbyOp, SimpleShufflePlan):
+    pass
+
+
+class PushBasedHashGroupbyOp(_HashGroupbyOp, PushBasedShufflePlan):
+    pass
+
+
 @PublicAPI
 class GroupedData:
     """Represents a grouped datastream created by calling ``Datastream.groupby()``.
@@ -161,8 +203,35 @@ class GroupedData:
             if blocks.initial_num_blocks() == 0:
                 return blocks, stage_info
 
+            ctx = DataContext.get_current()
             num_mappers = blocks.initial_num_blocks()
             num_reducers = num_mappers
+            if isinstance(self._key, str) and ctx.use_hash_aggregate:
+                # Hash-based aggregation doesn't need to sample the key boundaries.
+                schema = self._datastream.schema(fetch_if_missing=True)
+                if isinstance(schema, Schema):
+                    schema = schema.base_schema
+                vectorized = HashAggregateTaskSpec.can_vectorize(
+                    self._key, aggs, schema
+                )
+                float_columns = HashAggregateTaskSpec.float_columns(
+                    aggs, [m.schema for m in blocks.get_metadata()]
+                )
+                if ctx.use_push_based_shuffle:
+                    shuffle_op_cls = PushBasedHashGroupbyOp
+                else:
+                    shuffle_op_cls = SimpleShuffleHashGroupbyOp
+                shuffle_op = shuffle_op_cls(
+                    map_args=[self._key, aggs, vectorized, float_columns],
+                    reduce_args=[self._key, aggs, vectorized],
+                )
+                return shuffle_op.execute(
+                    blocks,
+                    num_reducers,
+                    clear_input_blocks,
+                    ctx=task_ctx,
+                )
+
             if self._key is None:
                 num_reducers = 1
                 boundaries = []
@@ -175,7 +244,6 @@ class GroupedData:
                     num_reducers,
                     task_ctx,
                 )
-            ctx = DataContext.get_current()
             if ctx.use_push_based_shuffle:
                 shuffle_op_cls = PushBasedGroupbyOp
             else:
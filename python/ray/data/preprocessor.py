@@ -2,7 +2,7 @@ import abc
 import collections
 import warnings
 from enum import Enum
-from typing import TYPE_CHECKING, Optional, Union, Dict, Any
+from typing import TYPE_CHECKING, Optional, Union, Dict, Any, List
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     import pandas as pd
     import numpy as np
     from ray.air.data_batch_type import DataBatchType
+    from ray.data.aggregate import AggregateFn
 
 
 @PublicAPI(stability="beta")
@@ -217,6 +218,17 @@ class Preprocessor(abc.ABC):
         """Sub-classes should override this instead of fit()."""
         raise NotImplementedError()
 
+    def _aggregates_to_fit(self) -> Optional[List["AggregateFn"]]:
+        """Return the aggregations that this preprocessor is fit with, or None if it
+        isn't fit by aggregating its ``columns``.
+
+        Sub-classes that return aggregations must be fit by setting ``stats_`` to the
+        result of ``Datastream.aggregate()`` with them, and may only transform their
+        ``columns``. ``Chain`` uses this to compute the aggregations of several
+        preprocessors in a single pass over the data.
+        """
+        return None
+
     def _determine_transform_to_use(self) -> BatchFormat:
         """Determine which batch format to use based on Preprocessor implementation.
 
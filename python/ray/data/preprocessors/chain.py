@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, List, Set, Union
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Datastream, DatasetPipeline
 from ray.data.preprocessor import Preprocessor
@@ -13,7 +13,10 @@ class Chain(Preprocessor):
     """Combine multiple preprocessors into a single :py:class:`Preprocessor`.
 
     When you call ``fit``, each preprocessor is fit on the datastream produced by the
-    preceeding preprocessor's ``fit_transform``.
+    preceeding preprocessor's ``fit_transform``. Consecutive preprocessors that are
+    fit with aggregations, like :class:`StandardScaler` and :class:`MinMaxScaler`,
+    are fit together in a single ``Datastream.aggregate()`` pass, as long as none of
+    them aggregates a column that a preceding one transforms.
 
     Example:
         >>> import pandas as pd
@@ -70,15 +73,50 @@ class Chain(Preprocessor):
         self.preprocessors = preprocessors
 
     def _fit(self, ds: Datastream) -> Preprocessor:
-        for preprocessor in self.preprocessors[:-1]:
-            ds = preprocessor.fit_transform(ds)
-        self.preprocessors[-1].fit(ds)
-        return self
+        # The preprocessors fit with aggregations that haven't been computed yet, and
+        # the columns that they transform.
+        pending: List[Preprocessor] = []
+        pending_columns: Set[str] = set()
+
+        def fit_pending(ds: Datastream) -> Datastream:
+            if not pending:
+                return ds
+            aggregates = [agg for p in pending for agg in p._aggregates_to_fit()]
+            stats = ds.aggregate(*aggregates)
+            for preprocessor in pending:
+                if stats is None:
+                    preprocessor.stats_ = None
+                else:
+                    preprocessor.stats_ = {
+                        agg.name: stats[agg.name]
+                        for agg in preprocessor._aggregates_to_fit()
+                    }
+                # The transform is lazy, so it's fused with the next fit.
+                ds = preprocessor.transform(ds)
+            pending.clear()
+            pending_columns.clear()
+            return ds
 
-    def fit_transform(self, ds: Datastream) -> Datastream:
         for preprocessor in self.preprocessors:
-            ds = preprocessor.fit_transform(ds)
-        return ds
+            aggregates = None
+            if preprocessor.fit_status() != Preprocessor.FitStatus.NOT_FITTABLE:
+                aggregates = preprocessor._aggregates_to_fit()
+            if aggregates is not None and pending_columns.isdisjoint(
+                preprocessor.columns
+            ):
+                # The preprocessor doesn't depend on the pending transforms, so it
+                # can be fit in the same pass as the pending preprocessors.
+                pending.append(preprocessor)
+                pending_columns.update(preprocessor.columns)
+                continue
+            ds = fit_pending(ds)
+            if aggregates is not None:
+                pending.append(preprocessor)
+                pending_columns.update(preprocessor.columns)
+            else:
+                ds = preprocessor.fit_transform(ds)
+        fit_pending(ds)
+        return self
 
     def _transform(
         self, ds: Union[Datastream, DatasetPipeline]
@@ -6,7 +6,7 @@ import pandas as pd
 from pandas.api.types import is_categorical_dtype
 
 from ray.data import Datastream
-from ray.data.aggregate import Mean
+from ray.data.aggregate import AggregateFn, Mean
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
@@ -108,13 +108,17 @@ class SimpleImputer(Preprocessor):
 
     def _fit(self, datastream: Datastream) -> Preprocessor:
         if self.strategy == "mean":
-            aggregates = [Mean(col) for col in self.columns]
-            self.stats_ = datastream.aggregate(*aggregates)
+            self.stats_ = datastream.aggregate(*self._aggregates_to_fit())
         elif self.strategy == "most_frequent":
             self.stats_ = _get_most_frequent_values(datastream, *self.columns)
 
         return self
 
+    def _aggregates_to_fit(self) -> Optional[List[AggregateFn]]:
+        if self.strategy == "mean":
+            return [Mean(col) for col in self.columns]
+        return None
+
     def _transform_pandas(self, df: pd.DataFrame):
         if self.strategy == "mean":
             new_values = {
@@ -1,10 +1,10 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from ray.data import Datastream
-from ray.data.aggregate import Mean, Std, Min, Max, AbsMax
+from ray.data.aggregate import AggregateFn, Mean, Std, Min, Max, AbsMax
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
@@ -67,10 +67,13 @@ class StandardScaler(Preprocessor):
         self.columns = columns
 
     def _fit(self, datastream: Datastream) -> Preprocessor:
+        self.stats_ = datastream.aggregate(*self._aggregates_to_fit())
+        return self
+
+    def _aggregates_to_fit(self) -> Optional[List[AggregateFn]]:
         mean_aggregates = [Mean(col) for col in self.columns]
         std_aggregates = [Std(col, ddof=0) for col in self.columns]
-        self.stats_ = datastream.aggregate(*mean_aggregates, *std_aggregates)
-        return self
+        return mean_aggregates + std_aggregates
 
     def _transform_pandas(self, df: pd.DataFrame):
         def column_standard_scaler(s: pd.Series):
@@ -151,10 +154,12 @@ class MinMaxScaler(Preprocessor):
         self.columns = columns
 
     def _fit(self, datastream: Datastream) -> Preprocessor:
-        aggregates = [Agg(col) for Agg in [Min, Max] for col in self.columns]
-        self.stats_ = datastream.aggregate(*aggregates)
+        self.stats_ = datastream.aggregate(*self._aggregates_to_fit())
         return self
 
+    def _aggregates_to_fit(self) -> Optional[List[AggregateFn]]:
+        return [Agg(col) for Agg in [Min, Max] for col in self.columns]
+
     def _transform_pandas(self, df: pd.DataFrame):
         def column_min_max_scaler(s: pd.Series):
             s_min = self.stats_[f"min({s.name})"]
@@ -231,10 +236,12 @@ class MaxAbsScaler(Preprocessor):
         self.columns = columns
 
     def _fit(self, datastream: Datastream) -> Preprocessor:
-        aggregates = [AbsMax(col) for col in self.columns]
-        self.stats_ = datastream.aggregate(*aggregates)
+        self.stats_ = datastream.aggregate(*self._aggregates_to_fit())
         return self
 
+    def _aggregates_to_fit(self) -> Optional[List[AggregateFn]]:
+        return [AbsMax(col) for col in self.columns]
+
     def _transform_pandas(self, df: pd.DataFrame):
         def column_abs_max_scaler(s: pd.Series):
             s_abs_max = self.stats_[f"abs_max({s.name})"]
@@ -8,8 +8,14 @@ from typing import List, Any, Optional, TYPE_CHECKING
 
 import ray
 from ray.types import ObjectRef
-from ray.data.block import BlockAccessor
+from ray.data.block import Block, BlockAccessor
 from ray.data.context import DataContext, DEFAULT_SCHEDULING_STRATEGY
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    _hash_key_columns,
+    _hash_partition,
+)
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.util.annotations import PublicAPI
 
@@ -19,6 +25,8 @@ except ImportError:
     pa = None
 
 if TYPE_CHECKING:
+    import pyarrow
+
     from ray.data import Datastream
 
 logger = logging.getLogger(__name__)
@@ -36,6 +44,7 @@ class RandomAccessDataset:
         ds: "Datastream",
         key: str,
         num_workers: int,
+        index: str = "sort",
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -45,8 +54,22 @@ class RandomAccessDataset:
         schema = ds.schema(fetch_if_missing=True)
         if schema is None or isinstance(schema, type):
             raise ValueError("RandomAccessDataset only supports Arrow-format blocks.")
+        if index not in ("sort", "hash"):
+            raise ValueError(
+                f"Invalid index: {index!r}. Supported indexes are 'sort' and 'hash'."
+            )
 
+        self._key = key
+        self._index = index
         start = time.perf_counter()
+        if index == "hash":
+            self._build_hash_index(ds, schema, num_workers)
+        else:
+            self._build_sort_index(ds, num_workers)
+        self._build_time = time.perf_counter() - start
+
+    def _build_sort_index(self, ds: "Datastream", num_workers: int):
+        key = self._key
         logger.info("[setup] Indexing datastream by sort key.")
         sorted_ds = ds.sort(key)
         get_bounds = cached_remote_fn(_get_bounds)
@@ -64,18 +87,7 @@ class RandomAccessDataset:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
 
-        logger.info("[setup] Creating {} random access workers.".format(num_workers))
-        ctx = DataContext.get_current()
-        if ctx.scheduling_strategy != DEFAULT_SCHEDULING_STRATEGY:
-            scheduling_strategy = ctx.scheduling_strategy
-        else:
-            scheduling_strategy = "SPREAD"
-        self._workers = [
-            _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
-            )
-            for _ in range(num_workers)
-        ]
+        self._workers = self._create_workers(num_workers)
         (
             self._block_to_workers_map,
             self._worker_to_blocks_map,
@@ -97,7 +109,49 @@ class RandomAccessDataset:
         )
 
         logger.info("[setup] Finished assigning blocks to workers.")
-        self._build_time = time.perf_counter() - start
+
+    def _build_hash_index(self, ds: "Datastream", schema, num_workers: int):
+        key = self._key
+        if key not in schema.names:
+            raise ValueError(
+                f"The key column {key!r} is not in the datastream schema: {schema}"
+            )
+        self._key_type = _to_arrow_type(schema.types[schema.names.index(key)])
+
+        logger.info(
+            "[setup] Hash partitioning datastream into {} shards.".format(num_workers)
+        )
+        shard_block = cached_remote_fn(_shard_block).options(num_returns=num_workers)
+        shards = [[] for _ in range(num_workers)]
+        for block in ds.get_internal_block_refs():
+            parts = shard_block.remote(block, key, num_workers)
+            if num_workers == 1:
+                parts = [parts]
+            for shard, part in zip(shards, parts):
+                shard.append(part)
+
+        self._workers = self._create_workers(num_workers)
+        # Shard i is served by worker i.
+        self._block_to_workers_map = {i: [w] for i, w in enumerate(self._workers)}
+        self._worker_to_blocks_map = {w: [i] for i, w in enumerate(self._workers)}
+        ray.get(
+            [w.assign_shard.remote(i, shards[i]) for i, w in enumerate(self._workers)]
+        )
+        logger.info("[setup] Finished building hash index on workers.")
+
+    def _create_workers(self, num_workers: int) -> List["ray.actor.ActorHandle"]:
+        logger.info("[setup] Creating {} random access workers.".format(num_workers))
+        ctx = DataContext.get_current()
+        if ctx.scheduling_strategy != DEFAULT_SCHEDULING_STRATEGY:
+            scheduling_strategy = ctx.scheduling_strategy
+        else:
+            scheduling_strategy = "SPREAD"
+        return [
+            _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
+                self._key
+            )
+            for _ in range(num_workers)
+        ]
 
     def _compute_block_to_worker_assignments(self):
         # Return values.
@@ -139,7 +193,10 @@ class RandomAccessDataset:
         Returns:
             ObjectRef containing the record (in pydict form), or None if not found.
         """
-        block_index = self._find_le(key)
+        if self._index == "hash":
+            block_index = int(self._find_shards([key])[0])
+        else:
+            block_index = self._find_le(key)
         if block_index is None:
             return ray.put(None)
         return self._worker_for(block_index).get.remote(block_index, key)
@@ -154,8 +211,12 @@ class RandomAccessDataset:
             List of found records (in pydict form), or None for missing records.
         """
         batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
+        if self._index == "hash":
+            for k, shard in zip(keys, self._find_shards(keys)):
+                batches[int(shard)].append(k)
+        else:
+            for k in keys:
+                batches[self._find_le(k)].append(k)
         futures = {}
         for index, keybatch in batches.items():
             if index is None:
@@ -172,6 +233,50 @@ class RandomAccessDataset:
                 results[k] = v
         return [results.get(k) for k in keys]
 
+    def multiget_batch(self, keys: List[Any]) -> "pyarrow.Table":
+        """Synchronously find the records for a list of keys as an Arrow table.
+
+        Each worker resolves all of the keys it serves with a single vectorized
+        lookup and ``take``, which is much faster than ``multiget()`` for large
+        batches of keys.
+
+        Args:
+            keys: List of keys to find the records for.
+
+        Returns:
+            A ``pyarrow.Table`` with one row per key, in the order of the keys. The
+            rows of missing keys are null.
+        """
+        if self._index == "hash":
+            block_indices = self._find_shards(keys)
+        else:
+            if not self._non_empty_blocks:
+                raise ValueError("Can't look up keys in an empty datastream.")
+            # Route each key to the block whose range it falls in. Keys outside of
+            # all ranges are looked up in the first or last block, and not found.
+            block_indices = np.minimum(
+                np.searchsorted(self._upper_bounds, keys, side="left"),
+                len(self._upper_bounds) - 1,
+            )
+        if len(keys) == 0:
+            return ray.get(self._worker_for(0).multiget_batch.remote(0, []))
+
+        futures = []
+        positions = []
+        for block_index in np.unique(block_indices):
+            indices = np.flatnonzero(block_indices == block_index)
+            futures.append(
+                self._worker_for(int(block_index)).multiget_batch.remote(
+                    int(block_index), [keys[i] for i in indices]
+                )
+            )
+            positions.append(indices)
+        tables = ray.get(futures)
+        table = transform_pyarrow.concat(tables)
+        # Reorder the rows to match the order of the keys.
+        order = np.argsort(np.concatenate(positions), kind="stable")
+        return transform_pyarrow.take_table(table, pa.array(order))
+
     def stats(self) -> str:
         """Returns a string containing access timing information."""
         stats = ray.get([w.stats.remote() for w in self._workers])
@@ -195,6 +300,15 @@ class RandomAccessDataset:
     def _worker_for(self, block_index: int):
         return random.choice(self._block_to_workers_map[block_index])
 
+    def _find_shards(self, keys: List[Any]) -> np.ndarray:
+        # Hash the keys the same way as the rows of the datastream were hashed.
+        try:
+            column = pa.array(keys, type=self._key_type)
+        except (pa.ArrowException, TypeError, ValueError):
+            column = pa.array(keys)
+        hashes = _hash_key_columns(pa.table({self._key: column}), [self._key])
+        return (hashes % np.uint64(len(self._workers))).astype(np.int64)
+
     def _find_le(self, x: Any) -> int:
         i = bisect.bisect_left(self._upper_bounds, x)
         if i >= len(self._upper_bounds) or x < self._lower_bound:
@@ -207,12 +321,39 @@ class _RandomAccessWorker:
     def __init__(self, key_field):
         self.blocks = None
         self.key_field = key_field
+        # The hash index of the shard, if the worker serves a hash partitioned shard.
+        self.index = None
+        self.positions = None
+        self.tables = {}
+        self.key_columns = {}
         self.num_accesses = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
         self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
 
+    def assign_shard(self, shard_index, block_refs):
+        import pandas as pd
+
+        builder = DelegatingBlockBuilder()
+        for block in ray.get(block_refs):
+            builder.add_block(block)
+        table = _to_arrow(builder.build())
+        self.blocks = {shard_index: table}
+
+        if table.num_rows == 0:
+            # No row was hashed to this shard, and empty blocks may have no columns.
+            index = pd.Index([])
+        else:
+            index = pd.Index(BlockAccessor.for_block(table).to_numpy(self.key_field))
+        # Keep the first row of each duplicate key.
+        self.positions = np.arange(len(index))
+        if not index.is_unique:
+            unique = ~index.duplicated()
+            index = index[unique]
+            self.positions = self.positions[unique]
+        self.index = index
+
     def get(self, block_index, key):
         start = time.perf_counter()
         result = self._get(block_index, key)
@@ -223,7 +364,13 @@ class _RandomAccessWorker:
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
         block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
+        if self.index is not None:
+            acc = BlockAccessor.for_block(block)
+            result = [
+                acc._get_row(i) if i >= 0 else None
+                for i in self._lookup(block_indices[0], keys)
+            ]
+        elif len(set(block_indices)) == 1 and isinstance(
             self.blocks[block_indices[0]], pa.Table
         ):
             # Fast path: use np.searchsorted for vectorized search on a single block.
@@ -240,6 +387,20 @@ class _RandomAccessWorker:
         self.num_accesses += 1
         return result
 
+    def multiget_batch(self, block_index, keys):
+        start = time.perf_counter()
+        table = self.tables.get(block_index)
+        if table is None:
+            table = _to_arrow(self.blocks[block_index])
+            self.tables[block_index] = table
+        indices = self._lookup(block_index, keys)
+        result = transform_pyarrow.take_table(
+            table, pa.array(indices, mask=indices < 0)
+        )
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return result
+
     def ping(self):
         return ray.get_runtime_context().get_node_id()
 
@@ -250,9 +411,30 @@ class _RandomAccessWorker:
             "total_time": self.total_time,
         }
 
+    def _lookup(self, block_index, keys) -> np.ndarray:
+        """Return the row index of each key in the block, or -1 if it's missing."""
+        if self.index is not None:
+            indices = self.index.get_indexer(keys)
+            return np.where(indices >= 0, self.positions[indices], -1)
+        column = self.key_columns.get(block_index)
+        if column is None:
+            block = self.blocks[block_index]
+            column = BlockAccessor.for_block(block).to_numpy(self.key_field)
+            self.key_columns[block_index] = column
+        if len(column) == 0 or len(keys) == 0:
+            return np.full(len(keys), -1)
+        keys = np.asarray(keys)
+        indices = np.minimum(np.searchsorted(column, keys), len(column) - 1)
+        return np.where(column[indices] == keys, indices, -1)
+
     def _get(self, block_index, key):
         if block_index is None:
             return None
+        if self.index is not None:
+            [i] = self._lookup(block_index, [key])
+            if i < 0:
+                return None
+            return BlockAccessor.for_block(self.blocks[block_index])._get_row(i)
         block = self.blocks[block_index]
         column = block[self.key_field]
         if isinstance(block, pa.Table):
@@ -282,6 +464,29 @@ class _ArrowListWrapper:
         return len(self.arrow_col)
 
 
+def _shard_block(block: Block, key: str, num_shards: int) -> List[Block]:
+    parts = _hash_partition(block, key, num_shards)
+    return parts[0] if num_shards == 1 else parts
+
+
+def _to_arrow(block: Block) -> "pyarrow.Table":
+    import pandas as pd
+
+    if isinstance(block, pd.DataFrame):
+        # Don't convert the index of the sorted rows into a column.
+        block = block.reset_index(drop=True)
+    return BlockAccessor.for_block(block).to_arrow()
+
+
+def _to_arrow_type(t) -> Optional["pyarrow.DataType"]:
+    if isinstance(t, pa.DataType):
+        return t
+    try:
+        return pa.from_numpy_dtype(t)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+
 def _get_bounds(block, key):
     if len(block) == 0:
         return None
@@ -1104,6 +1104,9 @@ def read_numpy(
         >>> ray.data.read_numpy( # doctest: +SKIP
         ...     ["s3://bucket/path1", "s3://bucket/path2"])
 
+        >>> # Memory-map local files instead of copying them into the heap.
+        >>> ray.data.read_numpy("/path/to/dir", mmap_mode="r") # doctest: +SKIP
+
     Args:
         paths: A single file/directory path or a list of file/directory paths.
             A list of paths can contain both files and directories.
@@ -1112,7 +1115,11 @@ def read_numpy(
             limited by the number of files of the datastream.
         arrow_open_stream_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_stream
-        numpy_load_args: Other options to pass to np.load.
+        numpy_load_args: Other options to pass to np.load. If ``mmap_mode="r"``
+            is given, local uncompressed files are memory-mapped, and their arrays
+            are wrapped as blocks without copying them into the heap of the read
+            tasks. The blocks are then copied from the page cache directly into
+            the object store.
         meta_provider: File metadata provider. Custom metadata providers may
             be able to resolve file metadata more quickly and/or accurately.
         partition_filter: Path-based partition filter, if any. Can be used
@@ -326,6 +326,15 @@ def use_push_based_shuffle(request):
     ctx.use_push_based_shuffle = original
 
 
+@pytest.fixture(params=[True, False])
+def use_hash_aggregate(request):
+    ctx = ray.data.context.DataContext.get_current()
+    original = ctx.use_hash_aggregate
+    ctx.use_hash_aggregate = request.param
+    yield request.param
+    ctx.use_hash_aggregate = original
+
+
 @pytest.fixture(params=[True, False])
 def enable_automatic_tensor_extension_cast(request):
     ctx = ray.data.context.DataContext.get_current()
@@ -1,13 +1,18 @@
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
 import ray
 from ray.air.util.data_batch_conversion import BatchFormat
+from ray.data import Datastream
 from ray.data.preprocessor import Preprocessor
 from ray.data.preprocessors import (
     BatchMapper,
     Chain,
     LabelEncoder,
+    MaxAbsScaler,
+    MinMaxScaler,
     SimpleImputer,
     StandardScaler,
 )
@@ -83,6 +88,44 @@ def test_chain():
     assert pred_out_df.equals(pred_expected_df)
 
 
+def test_chain_fused_fit():
+    """Tests that aggregation-based preprocessors are fit in as few passes as the
+    dependencies between them allow."""
+    in_df = pd.DataFrame(
+        {
+            "A": [1.0, 2.0, 3.0, 4.0],
+            "B": [0.0, None, 2.0, 4.0],
+            "C": [-1.0, 1.0, 3.0, 5.0],
+        }
+    )
+    ds = ray.data.from_pandas(in_df)
+
+    def make_preprocessors():
+        return [
+            StandardScaler(["A"]),
+            SimpleImputer(["B"]),
+            MinMaxScaler(["C"]),
+            # Depends on the transform of the StandardScaler.
+            MaxAbsScaler(["A"]),
+        ]
+
+    expected = make_preprocessors()
+    expected_ds = ds
+    for preprocessor in expected:
+        expected_ds = preprocessor.fit_transform(expected_ds)
+
+    chain = Chain(*make_preprocessors())
+    with patch.object(
+        Datastream, "aggregate", autospec=True, side_effect=Datastream.aggregate
+    ) as aggregate:
+        out_ds = chain.fit_transform(ds)
+    assert aggregate.call_count == 2
+
+    for preprocessor, expected_preprocessor in zip(chain.preprocessors, expected):
+        assert preprocessor.stats_ == pytest.approx(dict(expected_preprocessor.stats_))
+    assert out_ds.to_pandas().equals(expected_ds.to_pandas())
+
+
 def test_chain_pipeline():
     """Tests Chain functionality with DatasetPipeline."""
 
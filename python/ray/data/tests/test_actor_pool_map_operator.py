@@ -1,16 +1,20 @@
 import collections
 import time
+from unittest.mock import patch
 
 import pytest
 
 import ray
 from ray.tests.conftest import *  # noqa
 from ray.data._internal.compute import ActorPoolStrategy
+from ray.data._internal.execution.interfaces import RefBundle
 from ray.data._internal.execution.operators.actor_pool_map_operator import (
     _ActorPool,
     AutoscalingConfig,
     AutoscalingPolicy,
 )
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.util import make_ref_bundles
 
 
@@ -499,6 +503,74 @@ class TestActorPool:
         res3 = pool.pick_actor(bundles[0])
         assert res3 is None
 
+    def test_has_free_local_actor(self):
+        pool = _ActorPool(max_tasks_in_flight=1)
+        bundles = make_ref_bundles([[0] for _ in range(3)])
+        fake_loc_map = {bundles[0]: "node1", bundles[1]: "node2", bundles[2]: None}
+        pool._get_location = lambda b: fake_loc_map[b]
+
+        actor = PoolWorker.remote(node_id="node1")
+        ready_ref = actor.get_location.remote()
+        pool.add_pending_actor(actor, ready_ref)
+        ray.get(ready_ref)
+        pool.pending_to_running(ready_ref)
+
+        assert pool.has_free_local_actor(bundles[0])
+        assert not pool.has_free_local_actor(bundles[1])
+        assert not pool.has_free_local_actor(bundles[2])
+        # The local actor is saturated.
+        assert pool.pick_actor(bundles[0]) == actor
+        assert not pool.has_free_local_actor(bundles[0])
+
+
+@pytest.mark.parametrize("preserve_order", [False, True])
+def test_dispatch_prefers_local_bundles(ray_start_regular_shared, preserve_order):
+    bundles = make_ref_bundles([[i] for i in range(4)])
+    op = MapOperator.create(
+        lambda block_iter, ctx: block_iter,
+        InputDataBuffer(bundles),
+        compute_strategy=ActorPoolStrategy(size=1),
+    )
+    op._actor_locality_enabled = True
+    op._preserve_order = preserve_order
+    pool = op._actor_pool
+    fake_loc_map = dict(zip(bundles, ["node1", "node1", "node2", "node1"]))
+    pool._get_location = lambda b: fake_loc_map[b]
+    for node_id in ["node1", "node2"]:
+        actor = PoolWorker.remote(node_id=node_id)
+        ready_ref = actor.get_location.remote()
+        pool.add_pending_actor(actor, ready_ref)
+        ray.get(ready_ref)
+        pool.pending_to_running(ready_ref)
+    op._bundle_queue.extend(bundles)
+    assert op._next_bundle_index() == 0
+
+    # The actor on node1 is saturated, so the bundle on node2 is dispatched first,
+    # unless the order must be preserved.
+    for _ in range(pool._max_tasks_in_flight):
+        pool.pick_actor(bundles[0])
+    assert op._next_bundle_index() == (0 if preserve_order else 2)
+
+
+def test_bundle_location_most_bytes(ray_start_regular_shared):
+    bundle = RefBundle(
+        [b for bundle in make_ref_bundles([[0], [1], [2]]) for b in bundle.blocks],
+        owns_blocks=True,
+    )
+    refs = [ref for ref, _ in bundle.blocks]
+    with patch("ray.experimental.get_object_locations") as location_mock:
+        location_mock.return_value = {
+            refs[0]: {"node_ids": ["node1"], "object_size": 100},
+            refs[1]: {"node_ids": ["node2"], "object_size": 60},
+            refs[2]: {"node_ids": ["node2", "node3"], "object_size": 60},
+        }
+        # node2 holds most of the bytes, even though node1 holds the first block.
+        assert bundle.get_cached_location() == "node2"
+        location_mock.assert_called_once_with(refs)
+        # The location is cached.
+        assert bundle.get_cached_location() == "node2"
+        assert location_mock.call_count == 1
+
 
 class TestAutoscalingConfig:
     def test_min_workers_validation(self):
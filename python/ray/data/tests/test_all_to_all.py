@@ -135,6 +135,79 @@ def test_zip_preserve_order(ray_start_regular_shared):
     ), result
 
 
+def _sorted_rows(rows, key):
+    return sorted(
+        rows, key=lambda r: tuple(float("inf") if r[k] is None else r[k] for k in key)
+    )
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join(ray_start_regular_shared, restore_data_context, how, broadcast):
+    ctx = DataContext.get_current()
+    ctx.broadcast_join_threshold = 10**9 if broadcast else 0
+    left = pa.table({"k": [0, 1, 1, 2, 3, None], "v": [0, 1, 2, 3, 4, 5]})
+    right = pa.table({"k": [1, 2, 2, 4, None], "v": [10, 20, 21, 40, 50]})
+    left_ds = ray.data.from_arrow(left).repartition(3)
+    right_ds = ray.data.from_arrow(right).repartition(2)
+    ds = left_ds.join(right_ds, on="k", how=how)
+    assert ds.schema().names == ["k", "v", "v_1"]
+
+    # Null keys never match.
+    expected = [(1, 1, 10), (1, 2, 10), (2, 3, 20), (2, 3, 21)]
+    if how in ("left", "outer"):
+        expected += [(0, 0, None), (3, 4, None), (None, 5, None)]
+    if how in ("right", "outer"):
+        expected += [(4, None, 40), (None, None, 50)]
+    assert _sorted_rows(ds.take_all(), ["k", "v", "v_1"]) == _sorted_rows(
+        named_values(["k", "v", "v_1"], expected), ["k", "v", "v_1"]
+    )
+
+
+def test_join_multiple_keys(ray_start_regular_shared, restore_data_context):
+    ctx = DataContext.get_current()
+    ctx.broadcast_join_threshold = 0
+    ds1 = ray.data.range(100, parallelism=10).map(
+        lambda r: {"a": r["id"] % 10, "b": r["id"] // 10, "x": r["id"]}
+    )
+    ds2 = ray.data.range(50, parallelism=4).map(
+        lambda r: {"a": r["id"] % 10, "b": r["id"] % 5, "y": -r["id"]}
+    )
+    ds = ds1.join(ds2, on=["a", "b"])
+    expected = [
+        {"a": x % 10, "b": x // 10, "x": x, "y": -y}
+        for x in range(100)
+        for y in range(50)
+        if x % 10 == y % 10 and x // 10 == y % 5
+    ]
+    assert _sorted_rows(ds.take_all(), ["x", "y"]) == _sorted_rows(expected, ["x", "y"])
+
+
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join_tensor_columns(ray_start_regular_shared, restore_data_context, broadcast):
+    ctx = DataContext.get_current()
+    ctx.broadcast_join_threshold = 10**9 if broadcast else 0
+    ds1 = ray.data.range_tensor(10, shape=(2, 2), parallelism=3).add_column(
+        "k", lambda df: df["data"].map(lambda t: int(t[0, 0]))
+    )
+    ds2 = ray.data.from_items(
+        [{"k": i, "tags": [i] * i} for i in range(0, 10, 2)], parallelism=2
+    )
+    rows = sorted(ds1.join(ds2, on="k", how="left").take_all(), key=lambda r: r["k"])
+    assert [r["k"] for r in rows] == list(range(10))
+    for r in rows:
+        np.testing.assert_array_equal(r["data"], np.full((2, 2), r["k"]))
+        assert r["tags"] == ([r["k"]] * r["k"] if r["k"] % 2 == 0 else None)
+
+
+def test_join_invalid(ray_start_regular_shared):
+    ds = ray.data.range(10)
+    with pytest.raises(ValueError, match="join type"):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError, match="key column"):
+        ds.join(ds, on=[])
+
+
 def test_empty_shuffle(ray_start_regular_shared):
     ds = ray.data.range(100, parallelism=100)
     ds = ds.filter(lambda x: x)
@@ -286,7 +359,11 @@ def test_groupby_agg_name_conflict(ray_start_regular_shared, num_parts):
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
 def test_groupby_tabular_count(
-    ray_start_regular_shared, ds_format, num_parts, use_push_based_shuffle
+    ray_start_regular_shared,
+    ds_format,
+    num_parts,
+    use_push_based_shuffle,
+    use_hash_aggregate,
 ):
     # Test built-in count aggregation
     seed = int(time.time())
@@ -312,10 +389,46 @@ def test_groupby_tabular_count(
     ]
 
 
+def test_groupby_mixed_numeric_types(ray_start_regular_shared, use_hash_aggregate):
+    # Only the pandas block of group 0 has floats, so the partial aggregates of the
+    # other groups are integers unless the types are unified across blocks.
+    dfs = [
+        pd.DataFrame({"A": list(range(10)), "B": list(range(10))}),
+        pd.DataFrame({"A": [0, 0], "B": [0.5, None]}),
+    ]
+    agg_ds = ray.data.from_pandas(dfs).groupby("A").sum("B")
+    assert agg_ds.schema().names == ["A", "sum(B)"]
+    assert list(agg_ds.sort("A").iter_rows()) == [
+        {"A": i, "sum(B)": i + 0.5 if i == 0 else i} for i in range(10)
+    ]
+
+
+def test_groupby_hash_aggregate_mixed_int_float_keys(ray_start_regular_shared):
+    ctx = ray.data.context.DataContext.get_current()
+    ctx.use_hash_aggregate = True
+    try:
+        # The keys of the second block are float64 because of the null, but equal
+        # keys of both blocks are hashed to the same partition.
+        dfs = [
+            pd.DataFrame({"A": list(range(10))}),
+            pd.DataFrame({"A": [float(i) for i in range(10)] + [None]}),
+        ]
+        agg_df = ray.data.from_pandas(dfs).groupby("A").count().to_pandas()
+        agg_df = agg_df.sort_values("A", na_position="last")
+        assert agg_df["A"].tolist()[:10] == list(range(10))
+        assert agg_df["count()"].tolist() == [2] * 10 + [1]
+    finally:
+        ctx.use_hash_aggregate = False
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
 def test_groupby_tabular_sum(
-    ray_start_regular_shared, ds_format, num_parts, use_push_based_shuffle
+    ray_start_regular_shared,
+    ds_format,
+    num_parts,
+    use_push_based_shuffle,
+    use_hash_aggregate,
 ):
     # Test built-in sum aggregation
     seed = int(time.time())
@@ -845,6 +958,58 @@ def test_groupby_arrow_multi_agg(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_hash_aggregate(
+    ray_start_regular_shared, ds_format, num_parts, use_push_based_shuffle
+):
+    ctx = ray.data.context.DataContext.get_current()
+    ctx.use_hash_aggregate = True
+    try:
+        xs = list(range(100))
+        random.shuffle(xs)
+        df = pd.DataFrame(
+            {
+                "A": [f"key{x % 7}" for x in xs] + [None, "key0"],
+                "B": [float(x) for x in xs] + [1.0, None],
+            }
+        )
+        ds = ray.data.from_pandas(df).repartition(num_parts)
+        batch_format = "pyarrow" if ds_format == "arrow" else "pandas"
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format=batch_format)
+
+        # Vectorized aggregations.
+        aggs = [Count(), Sum("B"), Min("B"), Max("B"), Mean("B"), Sum("B")]
+        agg_ds = ds.groupby("A").aggregate(*aggs)
+        assert agg_ds.count() == 8
+        agg_df = agg_ds.to_pandas().sort_values("A", na_position="last")
+        expected_grouped = df.groupby("A", dropna=False)["B"]
+        np.testing.assert_array_equal(
+            agg_df["count()"].to_numpy(), expected_grouped.size().to_numpy()
+        )
+        for agg in ["sum", "min", "max", "mean"]:
+            result = agg_df[f"{agg}(B)"].to_numpy()
+            expected = getattr(expected_grouped, agg)().to_numpy()
+            np.testing.assert_array_almost_equal(result, expected)
+        np.testing.assert_array_equal(agg_df["sum(B)_2"], agg_df["sum(B)"])
+        # Nulls aren't ignored.
+        agg_df = ds.groupby("A").mean("B", ignore_nulls=False).to_pandas()
+        assert agg_df[agg_df["A"] == "key0"]["mean(B)"].isnull().all()
+        assert agg_df[agg_df["A"] != "key0"]["mean(B)"].notnull().all()
+
+        # Non-vectorized aggregations.
+        agg_df = ds.groupby("A").aggregate(Count(), Std("B")).to_pandas()
+        agg_df = agg_df.sort_values("A", na_position="last")
+        np.testing.assert_array_equal(
+            agg_df["count()"].to_numpy(), expected_grouped.size().to_numpy()
+        )
+        np.testing.assert_array_almost_equal(
+            agg_df["std(B)"].to_numpy()[:-1], expected_grouped.std().to_numpy()[:-1]
+        )
+    finally:
+        ctx.use_hash_aggregate = False
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
     seed = int(time.time())
@@ -0,0 +1,153 @@
+import pytest
+from unittest.mock import MagicMock
+
+import ray
+from ray.data._internal.execution.backpressure_policy import (
+    ConcurrencyCapBackpressurePolicy,
+    MaxQueuedOutputsBackpressurePolicy,
+    ObjectStoreBudgetBackpressurePolicy,
+)
+from ray.data._internal.execution.interfaces import (
+    ExecutionOptions,
+    ExecutionResources,
+)
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.streaming_executor_state import (
+    AutoscalingState,
+    build_streaming_topology,
+    select_operator_to_run,
+)
+from ray.data._internal.execution.util import make_ref_bundles
+from ray.data.tests.util import extract_values
+from ray.data.tests.test_streaming_executor import NO_USAGE, make_transform
+from ray.data.tests.conftest import *  # noqa
+
+
+def _make_topology(options: ExecutionOptions):
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(
+        make_transform(lambda block: [b * -1 for b in block]), o1, name="Map1"
+    )
+    o3 = MapOperator.create(
+        make_transform(lambda block: [b * 2 for b in block]), o2, name="Map2"
+    )
+    topo, _ = build_streaming_topology(o3, options)
+    return topo, o1, o2, o3
+
+
+def _select(topo, options):
+    return select_operator_to_run(
+        topo,
+        NO_USAGE,
+        ExecutionResources(),
+        False,
+        "dummy",
+        AutoscalingState(),
+        options.backpressure_policies,
+    )
+
+
+def test_object_store_budget_policy(ray_start_10_cpus_shared):
+    policy = ObjectStoreBudgetBackpressurePolicy(budgets={"Map1": 100})
+    options = ExecutionOptions(backpressure_policies=[policy])
+    topo, o1, o2, o3 = _make_topology(options)
+    topo[o1].outqueue.append(make_ref_bundles([[0]])[0])
+    assert _select(topo, options) == o2
+
+    # Map1 is over its budget.
+    o2.current_resource_usage = MagicMock(
+        return_value=ExecutionResources(object_store_memory=100)
+    )
+    assert not policy.can_add_input(o2, topo[o2])
+    assert _select(topo, options) is None
+
+    # Map2 has no budget.
+    topo[o2].outqueue.append(make_ref_bundles([[0]])[0])
+    o3.current_resource_usage = MagicMock(
+        return_value=ExecutionResources(object_store_memory=10**9)
+    )
+    assert _select(topo, options) == o3
+
+    # The default budget applies to the operators not in `budgets`.
+    policy = ObjectStoreBudgetBackpressurePolicy(default_budget=10**9)
+    assert not policy.can_add_input(o3, topo[o3])
+    assert policy.can_add_input(o2, topo[o2])
+
+
+def test_max_queued_outputs_policy(ray_start_10_cpus_shared):
+    policy = MaxQueuedOutputsBackpressurePolicy(max_queued_outputs=2)
+    options = ExecutionOptions(backpressure_policies=[policy])
+    topo, o1, o2, o3 = _make_topology(options)
+    topo[o1].outqueue.append("dummy1")
+    assert _select(topo, options) == o2
+    topo[o2].outqueue.append("dummy2")
+    assert policy.can_add_input(o2, topo[o2])
+    topo[o2].outqueue.append("dummy3")
+    assert not policy.can_add_input(o2, topo[o2])
+    # Map1 has too many queued outputs, so only Map2 can run.
+    assert _select(topo, options) == o3
+
+
+def test_concurrency_cap_policy(ray_start_10_cpus_shared):
+    policy = ConcurrencyCapBackpressurePolicy(init_cap=2, cap_multiplier=2, max_cap=6)
+    topo, _, o2, _ = _make_topology(ExecutionOptions())
+    state = topo[o2]
+
+    o2.num_active_work_refs = MagicMock(return_value=1)
+    assert policy.can_add_input(o2, state)
+    o2.num_active_work_refs = MagicMock(return_value=2)
+    assert not policy.can_add_input(o2, state)
+
+    # Downstream keeps up with the outputs, so the cap is increased.
+    state.num_completed_tasks = 2
+    assert policy.can_add_input(o2, state)
+    o2.num_active_work_refs = MagicMock(return_value=4)
+    assert not policy.can_add_input(o2, state)
+
+    # The cap is bounded by max_cap.
+    state.num_completed_tasks = 6
+    o2.num_active_work_refs = MagicMock(return_value=5)
+    assert policy.can_add_input(o2, state)
+    o2.num_active_work_refs = MagicMock(return_value=6)
+    assert not policy.can_add_input(o2, state)
+
+    # Outputs are produced faster than they are consumed, so the cap is decreased.
+    state.outqueue.extend(["dummy"] * 6)
+    state.num_completed_tasks = 12
+    o2.num_active_work_refs = MagicMock(return_value=3)
+    assert not policy.can_add_input(o2, state)
+    o2.num_active_work_refs = MagicMock(return_value=2)
+    assert policy.can_add_input(o2, state)
+
+    # The policy can be serialized with the DataContext.
+    policy = ray.cloudpickle.loads(ray.cloudpickle.dumps(policy))
+    o2.num_active_work_refs = MagicMock(return_value=1)
+    assert policy.can_add_input(o2, state)
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        ObjectStoreBudgetBackpressurePolicy(default_budget=1),
+        MaxQueuedOutputsBackpressurePolicy(max_queued_outputs=1),
+        ConcurrencyCapBackpressurePolicy(init_cap=1),
+    ],
+)
+def test_backpressure_policies_e2e(
+    ray_start_10_cpus_shared, restore_data_context, policy
+):
+    ctx = ray.data.DataContext.get_current()
+    ctx.execution_options.backpressure_policies = [policy]
+    ds = ray.data.range(20, parallelism=20).map(lambda x: {"id": x["id"] * 2})
+    ds = ds.map(
+        lambda x: {"id": x["id"] + 1}, compute=ray.data.ActorPoolStrategy(size=1)
+    )
+    assert sorted(extract_values("id", ds.take_all())) == [x * 2 + 1 for x in range(20)]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
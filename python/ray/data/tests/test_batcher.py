@@ -1,9 +1,14 @@
 import time
 import pytest
 
+import pandas as pd
 import pyarrow as pa
 
-from ray.data._internal.batcher import ShufflingBatcher, Batcher
+from ray.data._internal.batcher import (
+    Batcher,
+    IndexShufflingBatcher,
+    ShufflingBatcher,
+)
 
 
 def gen_block(num_rows):
@@ -128,6 +133,79 @@ def test_shuffling_batcher():
     )
 
 
+@pytest.mark.parametrize("block_format", ["arrow", "pandas"])
+def test_index_shuffling_batcher(block_format):
+    batch_size = 5
+    buffer_size = 20
+
+    with pytest.raises(
+        ValueError, match="Must specify a batch_size if using a local shuffle."
+    ):
+        IndexShufflingBatcher(batch_size=None, shuffle_buffer_min_size=buffer_size)
+
+    def gen_range_block(start, num_rows):
+        data = {"foo": list(range(start, start + num_rows))}
+        if block_format == "arrow":
+            return pa.table(data)
+        return pd.DataFrame(data)
+
+    def get_values(batch):
+        if block_format == "arrow":
+            return batch["foo"].to_pylist()
+        return batch["foo"].tolist()
+
+    def run(shuffle_seed=None):
+        batcher = IndexShufflingBatcher(
+            batch_size=batch_size,
+            shuffle_buffer_min_size=buffer_size,
+            shuffle_seed=shuffle_seed,
+        )
+        batches = []
+        for start in range(0, 100, 10):
+            block = gen_range_block(start, 10)
+            assert batcher.can_add(block)
+            batcher.add(block)
+            while batcher.has_batch():
+                batches.append(get_values(batcher.next_batch()))
+            # Batches are only yielded while the buffer stays above its minimum.
+            assert batcher._buffer_size() >= buffer_size or start < buffer_size
+        batcher.done_adding()
+        while batcher.has_batch():
+            batches.append(get_values(batcher.next_batch()))
+        if batcher.has_any():
+            batches.append(get_values(batcher.next_batch()))
+        assert not batcher.has_any()
+        # Blocks are released once all of their rows have been yielded.
+        assert not batcher._blocks
+        return batches
+
+    batches = run()
+    assert all(len(batch) == batch_size for batch in batches)
+    rows = [row for batch in batches for row in batch]
+    assert sorted(rows) == list(range(100))
+    assert rows != list(range(100))
+
+    # The shuffle is deterministic given a seed.
+    assert run(shuffle_seed=42) == run(shuffle_seed=42)
+    assert run(shuffle_seed=42) != run(shuffle_seed=43)
+
+    # The buffered rows are bounded by the buffer capacity.
+    batcher = IndexShufflingBatcher(batch_size=batch_size, shuffle_buffer_min_size=20)
+    batcher.add(gen_range_block(0, 40))
+    assert batcher.can_add(gen_range_block(0, 1))
+    batcher.add(gen_range_block(0, 1))
+    assert not batcher.can_add(gen_range_block(0, 1))
+
+    # The rows gathered from each Arrow block are concatenated without copying.
+    batcher = IndexShufflingBatcher(batch_size=20, shuffle_buffer_min_size=20)
+    batcher.add(pa.table({"a": list(range(10))}))
+    batcher.add(pa.table({"a": list(range(10, 20))}))
+    batcher.done_adding()
+    batch = batcher.next_batch()
+    assert sorted(batch["a"].to_pylist()) == list(range(20))
+    assert batch["a"].num_chunks == 2
+
+
 def test_batching_pyarrow_table_with_many_chunks():
     """Make sure batching a pyarrow table with many chunks is fast.
 
@@ -165,6 +243,17 @@ def test_batching_pyarrow_table_with_many_chunks():
     duration = time.perf_counter() - start
     assert duration < 20
 
+    start = time.perf_counter()
+    index_shuffling_batcher = IndexShufflingBatcher(
+        batch_size=batch_size, shuffle_buffer_min_size=batch_size
+    )
+    index_shuffling_batcher.add(block)
+    index_shuffling_batcher.done_adding()
+    while index_shuffling_batcher.has_any():
+        index_shuffling_batcher.next_batch()
+    duration = time.perf_counter() - start
+    assert duration < 20
+
 
 if __name__ == "__main__":
     import sys
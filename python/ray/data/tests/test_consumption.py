@@ -1,3 +1,4 @@
+import gc
 import logging
 import math
 import sys
@@ -12,6 +13,7 @@ import pytest
 from unittest.mock import patch
 
 import ray
+from ray._private.test_utils import wait_for_condition
 from ray.data._internal.block_builder import BlockBuilder
 from ray.data._internal.datastream_logger import DatastreamLogger
 from ray.data._internal.lazy_block_list import LazyBlockList
@@ -220,6 +222,120 @@ def test_cache_dataset(ray_start_regular_shared):
     assert ray.get(c.inc.remote()) == 2
 
 
+def _cached_files(path):
+    return [
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk(path)
+        for filename in filenames
+    ]
+
+
+def test_cache_local_disk(ray_start_regular_shared, tmp_path):
+    ctx = DataContext.get_current()
+    old_cache_dir = ctx.local_disk_cache_dir
+    ctx.local_disk_cache_dir = str(tmp_path)
+
+    @ray.remote
+    class Counter:
+        def __init__(self):
+            self.i = 0
+
+        def inc(self):
+            self.i += 1
+            return self.i
+
+    c = Counter.remote()
+
+    def inc(batch):
+        ray.get(c.inc.remote())
+        return batch
+
+    try:
+        ds = ray.data.range(100, parallelism=5).map_batches(inc, batch_size=None)
+        cached = ds.cache()
+        assert len(_cached_files(tmp_path)) == 5
+        assert cached.count() == 100
+        assert cached.schema().names == ["id"]
+        for _ in range(3):
+            assert sorted(r["id"] for r in cached.take_all()) == list(range(100))
+        assert ray.get(c.inc.remote()) == 6
+        # The blocks are read on the node that cached them.
+        node_id = ray.get_runtime_context().get_node_id()
+        for read_task in cached._plan._in_blocks._tasks:
+            assert read_task._ray_remote_args["scheduling_strategy"].node_id == node_id
+
+        with pytest.raises(ValueError):
+            ds.cache(storage="memory")
+    finally:
+        ctx.local_disk_cache_dir = old_cache_dir
+
+
+def test_cache_local_disk_cleanup(ray_start_regular_shared, tmp_path):
+    ctx = DataContext.get_current()
+    old_cache_dir = ctx.local_disk_cache_dir
+    ctx.local_disk_cache_dir = str(tmp_path)
+    # The blocks cached by a job that exited.
+    session_name = ray._private.worker.global_worker.node.session_name
+    stale_dir = tmp_path / session_name / "ffffffff" / "stale"
+    stale_dir.mkdir(parents=True)
+    (stale_dir / "block.arrow").write_bytes(b"0" * 10000)
+    try:
+        first = ray.data.range(1000, parallelism=1).cache()
+        assert not stale_dir.exists()
+        [first_file] = _cached_files(tmp_path)
+        size = os.path.getsize(first_file)
+        second = ray.data.range(1000, parallelism=1).map(lambda r: r).cache()
+        # The blocks of datastreams that are still in use aren't evicted.
+        with pytest.raises(RuntimeError, match="max_bytes"):
+            ray.data.range(1000, parallelism=1).cache(max_bytes=2 * size)
+        assert len(_cached_files(tmp_path)) == 2
+        third = ray.data.range(1000, parallelism=1).cache(max_bytes=3 * size)
+        assert len(_cached_files(tmp_path)) == 3
+        for ds in [first, second, third]:
+            assert len(ds.take_all()) == 1000
+
+        # The blocks are removed when no datastream reads them anymore.
+        derived = second.map_batches(lambda batch: batch)
+        del second
+        gc.collect()
+        assert len(_cached_files(tmp_path)) == 3
+        assert len(derived.take_all()) == 1000
+        del derived
+        gc.collect()
+        wait_for_condition(lambda: len(_cached_files(tmp_path)) == 2)
+        assert len(first.take_all()) == 1000
+        assert len(third.take_all()) == 1000
+    finally:
+        ctx.local_disk_cache_dir = old_cache_dir
+
+
+def test_cache_local_disk_eviction(ray_start_regular_shared, tmp_path):
+    ctx = DataContext.get_current()
+    old_cache_dir = ctx.local_disk_cache_dir
+    ctx.local_disk_cache_dir = str(tmp_path)
+    # The blocks cached in a previous session, which no datastream can read.
+    old_dir = tmp_path / "session_old" / "01000000" / "old"
+    old_dir.mkdir(parents=True)
+    for i in range(2):
+        (old_dir / f"block{i}.arrow").write_bytes(b"0" * 10000)
+        os.utime(old_dir / f"block{i}.arrow", (i, i))
+    try:
+        cached = ray.data.range(1000, parallelism=1).cache()
+        size = os.path.getsize(
+            next(path for path in _cached_files(tmp_path) if "session_old" not in path)
+        )
+        # The least recently used unused blocks are evicted first.
+        cached2 = ray.data.range(1000, parallelism=1).cache(max_bytes=2 * size + 10000)
+        assert not (old_dir / "block0.arrow").exists()
+        assert (old_dir / "block1.arrow").exists()
+        cached3 = ray.data.range(1000, parallelism=1).cache(max_bytes=3 * size)
+        assert not (old_dir / "block1.arrow").exists()
+        for ds in [cached, cached2, cached3]:
+            assert len(ds.take_all()) == 1000
+    finally:
+        ctx.local_disk_cache_dir = old_cache_dir
+
+
 def test_schema(ray_start_regular_shared):
     ds2 = ray.data.range(10, parallelism=10)
     ds3 = ds2.repartition(5)
@@ -728,7 +844,17 @@ def test_iter_batches_empty_block(ray_start_regular_shared):
 
 @pytest.mark.parametrize("pipelined", [False, True])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
-def test_iter_batches_local_shuffle(shutdown_only, pipelined, ds_format):
+@pytest.mark.parametrize("use_index_based_local_shuffle", [False, True])
+def test_iter_batches_local_shuffle(
+    shutdown_only,
+    restore_data_context,
+    pipelined,
+    ds_format,
+    use_index_based_local_shuffle,
+):
+    ctx = ray.data.context.DataContext.get_current()
+    ctx.use_index_based_local_shuffle = use_index_based_local_shuffle
+
     # Input validation.
     # Batch size must be given for local shuffle.
     with pytest.raises(ValueError):
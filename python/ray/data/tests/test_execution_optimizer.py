@@ -7,8 +7,13 @@ import ray
 from ray.data._internal.execution.legacy_compat import _blocks_to_input_buffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.all_to_all_operator import AllToAllOperator
+from ray.data._internal.execution.operators.streaming_shuffle_operator import (
+    StreamingShuffleOperator,
+)
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
+from ray.data._internal.execution.operators.join_operator import JoinOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.logical.interfaces import LogicalPlan
 from ray.data._internal.logical.operators.from_arrow_operator import (
     FromArrowRefs,
@@ -27,13 +32,18 @@ from ray.data._internal.logical.operators.from_pandas_operator import (
     FromModin,
     FromPandasRefs,
 )
-from ray.data._internal.logical.optimizers import PhysicalOptimizer
+from ray.data._internal.logical.optimizers import (
+    LogicalOptimizer,
+    PhysicalOptimizer,
+    get_execution_plan,
+)
 from ray.data._internal.logical.operators.all_to_all_operator import (
     Aggregate,
     RandomShuffle,
     Repartition,
     Sort,
 )
+from ray.data._internal.logical.operators.limit_operator import Limit
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.operators.map_operator import (
@@ -41,8 +51,9 @@ from ray.data._internal.logical.operators.map_operator import (
     MapBatches,
     Filter,
     FlatMap,
+    Project,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.util import (
     _recorded_operators,
     _recorded_operators_lock,
@@ -205,13 +216,194 @@ def test_column_ops_e2e(ray_start_regular_shared, enable_optimizer):
 
     select_ds = ds.select_columns(cols=["new_col"])
     assert select_ds.take_all() == [{"new_col": 0}, {"new_col": 1}]
-    _check_usage_record(["ReadRange", "MapBatches"])
+    _check_usage_record(["ReadRange", "MapBatches", "Project"])
 
     ds = ds.drop_columns(cols=["new_col"])
     assert ds.take_all() == [{"id": 0}, {"id": 1}], ds
     _check_usage_record(["ReadRange", "MapBatches"])
 
 
+def test_filter_expr_e2e(ray_start_regular_shared, enable_optimizer):
+    import pyarrow.compute as pc
+
+    ds = ray.data.range(5)
+    ds = ds.filter(expr=pc.field("id") >= 3)
+    assert extract_values("id", ds.take_all()) == [3, 4], ds
+    _check_usage_record(["ReadRange", "Filter"])
+
+    with pytest.raises(ValueError):
+        ray.data.range(5).filter(lambda x: True, expr=pc.field("id") >= 3)
+
+
+def test_project_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op = Read(ParquetDatasource())
+    op = Project(read_op, cols=["a"])
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Project"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_predicate_and_projection_pushdown(ray_start_regular_shared, enable_optimizer):
+    import pyarrow.compute as pc
+
+    read_op = Read(ParquetDatasource(), read_args={"paths": "/tmp/dummy"})
+    op = Project(read_op, cols=["a", "b"])
+    op = Filter(op, filter_expr=pc.field("a") > 1)
+    op = Filter(op, filter_expr=pc.field("b") < 5)
+    op = Project(op, cols=["a"])
+    op = MapBatches(op, lambda x: x)
+    plan = LogicalOptimizer().optimize(LogicalPlan(op))
+
+    map_op = plan.dag
+    assert isinstance(map_op, MapBatches)
+    new_read_op = map_op.input_dependencies[0]
+    assert isinstance(new_read_op, Read)
+    assert new_read_op._read_args["paths"] == "/tmp/dummy"
+    assert new_read_op._read_args["columns"] == ["a"]
+    assert new_read_op._read_args["filter"].equals(
+        (pc.field("a") > 1) & (pc.field("b") < 5)
+    )
+    # The original read operator is left untouched.
+    assert "columns" not in read_op._read_args
+    assert "filter" not in read_op._read_args
+
+
+def test_predicate_pushdown_preserves_projected_away_columns(
+    ray_start_regular_shared, enable_optimizer
+):
+    import pyarrow.compute as pc
+
+    # Filtering on a column that was projected away raises an error, so the filter
+    # isn't pushed below the projection.
+    read_op = Read(ParquetDatasource())
+    op = Project(read_op, cols=["a"])
+    op = Filter(op, filter_expr=(pc.field("a") > 1) & (pc.field("b") > 1))
+    plan = LogicalOptimizer().optimize(LogicalPlan(op))
+    assert isinstance(plan.dag, Filter)
+    new_read_op = plan.dag.input_dependencies[0]
+    assert isinstance(new_read_op, Read)
+    assert new_read_op._read_args["columns"] == ["a"]
+    assert "filter" not in new_read_op._read_args
+
+    # The filter isn't pushed down when its columns can't be determined.
+    op = Project(read_op, cols=["a"])
+    op = Filter(op, filter_expr=pc.field("a").isin(["1"]))
+    plan = LogicalOptimizer().optimize(LogicalPlan(op))
+    assert isinstance(plan.dag, Filter)
+
+
+def test_pushdown_skips_udfs_and_unsupported_reads(
+    ray_start_regular_shared, enable_optimizer
+):
+    import pyarrow.compute as pc
+
+    # UDF-based filters can't be pushed down, and block projections behind them.
+    read_op = Read(ParquetDatasource())
+    op = Filter(read_op, lambda x: True)
+    op = Project(op, cols=["a"])
+    plan = LogicalOptimizer().optimize(LogicalPlan(op))
+    assert isinstance(plan.dag, Project)
+    assert isinstance(plan.dag.input_dependencies[0], Filter)
+    assert plan.dag.input_dependencies[0].input_dependencies[0] is read_op
+
+    # Datasources that don't support read pushdown keep their operators.
+    ds = ray.data.range(10).filter(expr=pc.field("id") < 5).select_columns(["id"])
+    plan = LogicalOptimizer().optimize(ds._logical_plan)
+    assert isinstance(plan.dag, Project)
+    assert isinstance(plan.dag.input_dependencies[0], Filter)
+    assert extract_values("id", ds.take_all()) == list(range(5))
+
+
+def test_pushdown_parquet_e2e(ray_start_regular_shared, enable_optimizer, tmp_path):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    for part in range(2):
+        path = tmp_path / f"part={part}"
+        path.mkdir()
+        table = pa.table(
+            {"a": list(range(part * 5, part * 5 + 5)), "b": [str(i) for i in range(5)]}
+        )
+        pq.write_table(table, str(path / "data.parquet"))
+
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.filter(expr=pc.field("a") >= 3).select_columns(["a"])
+    plan = LogicalOptimizer().optimize(ds._logical_plan)
+    assert isinstance(plan.dag, Read)
+    assert sorted(extract_values("a", ds.take_all())) == list(range(3, 10))
+    assert ds.schema().names == ["a"]
+
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.select_columns(["a"]).filter(expr=pc.field("b") == "1")
+    with pytest.raises(Exception, match="No match for FieldRef"):
+        ds.take_all()
+
+    # Filters on partition columns are pushed down as well.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(expr=pc.field("part") == 1)
+    assert sorted(extract_values("a", ds.take_all())) == list(range(5, 10))
+
+
+def test_limit_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op = Read(ParquetDatasource())
+    op = Limit(read_op, limit=10)
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Limit"
+    assert isinstance(physical_op, LimitOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_limit_pushdown(ray_start_regular_shared, enable_optimizer):
+    read_op = Read(ParquetDatasource())
+    op = MapRows(read_op, lambda x: x)
+    op = Limit(op, limit=20)
+    op = Limit(op, limit=10)
+    plan = LogicalOptimizer().optimize(LogicalPlan(op))
+
+    assert plan.dag is op
+    new_read_op = list(plan.dag.post_order_iter())[0]
+    assert isinstance(new_read_op, Read)
+    assert new_read_op._limit == 10
+    # The original read operator is left untouched.
+    assert read_op._limit is None
+
+    # Limits aren't pushed through operators that may change the number of rows.
+    read_op = Read(ParquetDatasource())
+    op = Filter(read_op, lambda x: True)
+    op = Limit(op, limit=10)
+    plan = LogicalOptimizer().optimize(LogicalPlan(op))
+    assert plan.dag.input_dependencies[0].input_dependencies[0] is read_op
+    assert read_op._limit is None
+
+
+def test_limit_e2e(ray_start_regular_shared, enable_optimizer):
+    ds = ray.data.range(100, parallelism=20)
+    assert extract_values("id", ds.limit(3).take_all()) == [0, 1, 2]
+    assert extract_values("id", ds.take(12)) == list(range(12))
+    assert extract_values("id", ds.map(lambda x: x).limit(7).take_all()) == list(
+        range(7)
+    )
+    assert ds.limit(0).count() == 0
+    _check_usage_record(["ReadRange", "Limit"])
+
+    # Only the read tasks needed for the limit are launched.
+    ds = ray.data.range(100, parallelism=20).limit(12)
+    dag = get_execution_plan(ds._logical_plan).dag
+    input_op = list(dag.post_order_iter())[0]
+    assert isinstance(input_op, InputDataBuffer)
+    input_op.start(ray.data.ExecutionOptions())
+    assert input_op.num_outputs_total() == 3
+
+
 def test_random_sample_e2e(ray_start_regular_shared, enable_optimizer):
     import math
 
@@ -261,6 +453,39 @@ def test_random_shuffle_e2e(
     _check_usage_record(["ReadRange", "RandomShuffle"])
 
 
+def test_streaming_shuffle_e2e(ray_start_regular_shared, enable_optimizer):
+    ctx = ray.data.context.DataContext.get_current()
+    original = ctx.use_streaming_shuffle
+    ctx.use_streaming_shuffle = True
+    try:
+        ds = ray.data.range(100, parallelism=10).map(lambda x: x)
+
+        shuffled_ds = ds.random_shuffle(seed=0)
+        dag = get_execution_plan(shuffled_ds._logical_plan).dag
+        assert isinstance(dag, StreamingShuffleOperator)
+        assert isinstance(dag.input_dependencies[0], MapOperator)
+        r1 = extract_values("id", shuffled_ds.take_all())
+        r2 = extract_values("id", ds.random_shuffle(seed=1024).take_all())
+        assert r1 != r2, (r1, r2)
+        assert sorted(r1) == list(range(100)), r1
+        assert sorted(r2) == list(range(100)), r2
+        stats = shuffled_ds._plan.stats()
+        assert "RandomShuffleMap" in stats.stages
+        assert "RandomShuffleReduce" in stats.stages
+
+        repartitioned_ds = ds.repartition(7, shuffle=True)
+        dag = get_execution_plan(repartitioned_ds._logical_plan).dag
+        assert isinstance(dag, StreamingShuffleOperator)
+        assert repartitioned_ds.num_blocks() == 7
+        assert repartitioned_ds.sum() == sum(range(100))
+
+        # Sorts still need to see all of their inputs before shuffling.
+        dag = get_execution_plan(ds.sort("id")._logical_plan).dag
+        assert isinstance(dag, AllToAllOperator)
+    finally:
+        ctx.use_streaming_shuffle = original
+
+
 @pytest.mark.parametrize(
     "shuffle",
     [True, False],
@@ -898,6 +1123,7 @@ def test_aggregate_e2e(
     ray_start_regular_shared,
     enable_optimizer,
     use_push_based_shuffle,
+    use_hash_aggregate,
 ):
     ds = ray.data.range(100, parallelism=4)
     ds = ds.groupby("id").count()
@@ -977,6 +1203,41 @@ def test_zip_e2e(ray_start_regular_shared, enable_optimizer, num_blocks1, num_bl
     _check_usage_record(["ReadRange", "Zip"])
 
 
+def test_join_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op1 = Read(ParquetDatasource())
+    read_op2 = Read(ParquetDatasource())
+    op = Join(read_op1, read_op2, on=["id"], how="inner", right_suffix="_1")
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Join"
+    assert isinstance(physical_op, JoinOperator)
+    assert len(physical_op.input_dependencies) == 2
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert isinstance(physical_op.input_dependencies[1], MapOperator)
+
+
+@pytest.mark.parametrize("broadcast_join_threshold", [0, 10**9])
+def test_join_e2e(
+    ray_start_regular_shared,
+    enable_optimizer,
+    restore_data_context,
+    broadcast_join_threshold,
+):
+    ctx = ray.data.DataContext.get_current()
+    ctx.broadcast_join_threshold = broadcast_join_threshold
+    ds1 = ray.data.range(20, parallelism=4)
+    ds2 = ray.data.range(10, parallelism=3).map(
+        lambda r: {"id": r["id"] * 2, "x": r["id"]}
+    )
+    ds = ds1.join(ds2, on="id", how="left")
+    assert sorted(ds.take_all(), key=lambda r: r["id"]) == named_values(
+        ["id", "x"], [(i, i // 2 if i % 2 == 0 else None) for i in range(20)]
+    )
+    _check_usage_record(["ReadRange", "Join"])
+
+
 def test_from_dask_operator(ray_start_regular_shared, enable_optimizer):
     import dask.dataframe as dd
 
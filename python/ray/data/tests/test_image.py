@@ -12,6 +12,7 @@ import ray
 from ray.data.datasource import Partitioning, PathPartitionFilter
 from ray.data.datasource.file_meta_provider import FastFileMetadataProvider
 from ray.data.datasource.image_datasource import (
+    _decode_image,
     _ImageDatasourceReader,
     _ImageFileMetadataProvider,
     ImageDatasource,
@@ -92,6 +93,18 @@ class TestReadImages:
             (64, 64, 3),
         ]
 
+    def test_same_height_different_widths(self, ray_start_regular_shared, tmp_path):
+        from PIL import Image
+
+        for width in [16, 24, 32]:
+            Image.new("RGB", (width, 16)).save(os.path.join(tmp_path, f"{width}.png"))
+        ds = ray.data.read_images(str(tmp_path), parallelism=1)
+        assert sorted(record["image"].shape for record in ds.take_all()) == [
+            (16, 16, 3),
+            (16, 24, 3),
+            (16, 32, 3),
+        ]
+
     @pytest.mark.parametrize("size", [(-32, 32), (32, -32), (-32, -32)])
     def test_invalid_size(self, ray_start_regular_shared, size):
         with pytest.raises(ValueError):
@@ -110,6 +123,54 @@ class TestReadImages:
         ds = ray.data.read_images("example://image-datasets/different-modes", mode=mode)
         assert all([record["image"].shape == expected_shape for record in ds.take()])
 
+    def test_size_different_modes(self, ray_start_regular_shared):
+        # Without `mode`, the resized images have different numbers of channels.
+        ds = ray.data.read_images(
+            "example://image-datasets/different-modes", size=(16, 16)
+        )
+        assert sorted(record["image"].shape for record in ds.take()) == [
+            (16, 16),
+            (16, 16, 3),
+            (16, 16, 4),
+        ]
+
+    def test_decode_threads(self, ray_start_regular_shared, restore_data_context):
+        ctx = ray.data.context.DataContext.get_current()
+        images = {}
+        for num_threads in [1, 4]:
+            ctx.image_decode_threads = num_threads
+            ds = ray.data.read_images(
+                "example://image-datasets/different-sizes",
+                size=(32, 32),
+                mode="RGB",
+                include_paths=True,
+                parallelism=1,
+            )
+            images[num_threads] = {
+                record["path"]: record["image"] for record in ds.take_all()
+            }
+        assert len(images[1]) == 3
+        assert images[1].keys() == images[4].keys()
+        for path, image in images[1].items():
+            np.testing.assert_array_equal(image, images[4][path])
+
+    def test_jpeg_draft(self, ray_start_regular_shared, tmp_path):
+        from PIL import Image
+
+        path = os.path.join(tmp_path, "large.jpg")
+        Image.new("RGB", (512, 512), color=(255, 0, 0)).save(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        # JPEGs are downscaled while decoding them, before being resized.
+        with patch.object(Image.Image, "resize", autospec=True) as resize:
+            _decode_image(data, (32, 32), None)
+        assert resize.call_args[0][0].size == (64, 64)
+
+        ds = ray.data.read_images(path, size=(32, 32))
+        image = ds.take(1)[0]["image"]
+        assert image.shape == (32, 32, 3)
+        assert (abs(image.astype(int) - [255, 0, 0]) <= 2).all()
+
     def test_partitioning(
         self, ray_start_regular_shared, enable_automatic_tensor_extension_cast
     ):
@@ -11,6 +11,8 @@ from pyarrow.fs import LocalFileSystem
 import pandas as pd
 import pyarrow.parquet as pq
 from pytest_lazyfixture import lazy_fixture
+
+import ray
 from ray.data.datasource.file_based_datasource import (
     FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD,
     _resolve_paths_and_filesystem,
@@ -24,6 +26,7 @@ from ray.data.datasource.file_meta_provider import (
 
 from ray.tests.conftest import *  # noqa
 from ray.data.datasource import (
+    CachingFileMetadataProvider,
     FileMetadataProvider,
     BaseFileMetadataProvider,
     ParquetMetadataProvider,
@@ -490,6 +493,95 @@ def test_fast_file_metadata_provider_ignore_missing():
             pass
 
 
+def test_caching_file_metadata_provider_parquet(ray_start_regular_shared, tmp_path):
+    data_path = os.path.join(tmp_path, "data")
+    os.mkdir(data_path)
+    paths = [os.path.join(data_path, f"test{i}.parquet") for i in range(3)]
+    for i, path in enumerate(paths):
+        pq.write_table(pa.table({"one": [i] * (i + 1)}), path)
+    fs = LocalFileSystem()
+
+    meta_provider = CachingFileMetadataProvider(os.path.join(tmp_path, "index.db"))
+    pq_ds = pq.ParquetDataset(paths, filesystem=fs, use_legacy_dataset=False)
+    with patch(
+        "ray.data.datasource.file_meta_provider."
+        "DefaultParquetMetadataProvider.prefetch_file_metadata",
+        wraps=DefaultParquetMetadataProvider().prefetch_file_metadata,
+    ) as mock_fetch:
+        file_metas = meta_provider.prefetch_file_metadata(pq_ds.pieces)
+        assert mock_fetch.call_count == 1
+        assert [m.num_rows for m in file_metas] == [1, 2, 3]
+
+        # Footers of unchanged files are read from the index.
+        file_metas = meta_provider.prefetch_file_metadata(pq_ds.pieces)
+        assert mock_fetch.call_count == 1
+        assert [m.num_rows for m in file_metas] == [1, 2, 3]
+
+        # Only the entries of modified files are invalidated.
+        pq.write_table(pa.table({"one": [1] * 5}), paths[1])
+        os.utime(paths[1], ns=(0, 0))
+        pq_ds = pq.ParquetDataset(paths, filesystem=fs, use_legacy_dataset=False)
+        file_metas = meta_provider.prefetch_file_metadata(pq_ds.pieces)
+        assert mock_fetch.call_count == 2
+        assert [p.path for p in mock_fetch.call_args[0][0]] == [paths[1]]
+        assert [m.num_rows for m in file_metas] == [1, 5, 3]
+
+    meta = meta_provider(
+        [p.path for p in pq_ds.pieces],
+        pq_ds.schema,
+        pieces=pq_ds.pieces,
+        prefetched_metadata=file_metas,
+    )
+    assert meta.num_rows == 9
+    assert meta.size_bytes == _get_parquet_file_meta_size_bytes(file_metas)
+
+    # The index is shared across provider instances.
+    ds = ray.data.read_parquet(
+        data_path,
+        meta_provider=CachingFileMetadataProvider(os.path.join(tmp_path, "index.db")),
+    )
+    assert ds.count() == 9
+    assert sorted(r["one"] for r in ds.take_all()) == [0, 1, 1, 1, 1, 1, 2, 2, 2]
+
+
+def test_caching_file_metadata_provider_listing(tmp_path):
+    data_path = os.path.join(tmp_path, "data")
+    os.mkdir(data_path)
+    df = pd.DataFrame({"one": [1, 2, 3]})
+    df_to_csv(df, os.path.join(data_path, "test1.csv"), index=False)
+    fs = LocalFileSystem()
+    index_path = os.path.join(tmp_path, "index.db")
+
+    # Without a listing TTL, directories are always re-listed.
+    meta_provider = CachingFileMetadataProvider(index_path)
+    assert len(list(meta_provider.expand_paths([data_path], fs))) == 1
+    df_to_csv(df, os.path.join(data_path, "test2.csv"), index=False)
+    file_paths, file_sizes = map(
+        list, zip(*meta_provider.expand_paths([data_path], fs))
+    )
+    assert file_paths == [
+        os.path.join(data_path, "test1.csv"),
+        os.path.join(data_path, "test2.csv"),
+    ]
+    assert file_sizes == _get_file_sizes_bytes(file_paths, fs)
+
+    # Listings are cached for the listing TTL.
+    meta_provider = CachingFileMetadataProvider(index_path, listing_ttl_s=3600)
+    assert list(meta_provider.expand_paths([data_path], fs)) == list(
+        zip(file_paths, file_sizes)
+    )
+    os.remove(os.path.join(data_path, "test2.csv"))
+    assert len(list(meta_provider.expand_paths([data_path], fs))) == 2
+    meta_provider = CachingFileMetadataProvider(index_path, listing_ttl_s=0)
+    assert len(list(meta_provider.expand_paths([data_path], fs))) == 1
+
+    meta = meta_provider(
+        file_paths[:1], None, rows_per_file=3, file_sizes=file_sizes[:1]
+    )
+    assert meta.num_rows == 3
+    assert meta.size_bytes == file_sizes[0]
+
+
 if __name__ == "__main__":
     import sys
 
@@ -8,10 +8,12 @@ import pytest
 from pytest_lazyfixture import lazy_fixture
 
 import ray
+from ray.data.block import BlockAccessor
 from ray.data.tests.util import Counter
 from ray.data.datasource import (
     BaseFileMetadataProvider,
     FastFileMetadataProvider,
+    NumpyDatasource,
     PartitionStyle,
     PathPartitionEncoder,
     PathPartitionFilter,
@@ -162,6 +164,34 @@ def test_numpy_read(ray_start_regular_shared, tmp_path):
     assert [v["data"].item() for v in ds.take(2)] == [0, 1]
 
 
+def test_numpy_read_mmap(ray_start_regular_shared, tmp_path):
+    path = os.path.join(tmp_path, "test_np_dir")
+    os.mkdir(path)
+    arr = np.arange(24, dtype=np.float32).reshape(6, 2, 2)
+    np.save(os.path.join(path, "test.npy"), arr)
+    np.save(os.path.join(path, "fortran.npy"), np.asfortranarray(arr[:, :, 0]))
+    ds = ray.data.read_numpy(os.path.join(path, "test.npy"), mmap_mode="r")
+    np.testing.assert_equal(np.stack(extract_values("data", ds.take_all())), arr)
+    ds = ray.data.read_numpy(os.path.join(path, "fortran.npy"), mmap_mode="r")
+    np.testing.assert_equal(
+        np.stack(extract_values("data", ds.take_all())), arr[:, :, 0]
+    )
+
+    # The block is backed by the memory map of the file.
+    source = NumpyDatasource()
+    file_path = os.path.join(path, "test.npy")
+    with source._open_input_source(pa.fs.LocalFileSystem(), file_path) as f:
+        mapping = f.read_buffer()
+        f.seek(0)
+        block = source._read_file(f, file_path, mmap_mode="r")
+    data = block["data"].chunk(0).storage.buffers()[-1]
+    assert mapping.address <= data.address < mapping.address + mapping.size
+    np.testing.assert_equal(BlockAccessor.for_block(block).to_numpy("data"), arr)
+
+    with pytest.raises(ValueError, match="mmap_mode"):
+        ray.data.read_numpy(file_path, mmap_mode="r+").materialize()
+
+
 @pytest.mark.parametrize("ignore_missing_paths", [True, False])
 def test_numpy_read_ignore_missing_paths(
     ray_start_regular_shared, tmp_path, ignore_missing_paths
@@ -22,6 +22,9 @@ from ray.data._internal.execution.operators.map_operator import (
     _BlockRefBundler,
 )
 from ray.data._internal.execution.operators.output_splitter import OutputSplitter
+from ray.data._internal.execution.operators.streaming_shuffle_operator import (
+    StreamingShuffleOperator,
+)
 from ray.data._internal.execution.operators.task_pool_map_operator import (
     TaskPoolMapOperator,
 )
@@ -30,6 +33,7 @@ from ray.data._internal.execution.operators.actor_pool_map_operator import (
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.util import make_ref_bundles
+from ray.data._internal.planner.exchange.shuffle_task_spec import ShuffleTaskSpec
 from ray.tests.conftest import *  # noqa
 from ray._private.test_utils import wait_for_condition
 
@@ -98,6 +102,55 @@ def test_all_to_all_operator():
     op.close_sub_progress_bars()
 
 
+def test_streaming_shuffle_operator(ray_start_regular_shared):
+    def run_tasks(op):
+        while op.get_work_refs():
+            ready, _ = ray.wait(op.get_work_refs(), num_returns=1, fetch_local=False)
+            op.notify_work_completed(ready[0])
+
+    input_op = InputDataBuffer(make_ref_bundles([[i, i + 10] for i in range(10)]))
+    op = StreamingShuffleOperator(
+        ShuffleTaskSpec(random_shuffle=True, random_seed=0),
+        input_op,
+        num_outputs=4,
+        merge_factor=2,
+    )
+    op.start(ExecutionOptions())
+    assert op.num_outputs_total() == 4
+
+    # Map tasks start before all inputs are added.
+    for _ in range(5):
+        op.add_input(input_op.get_next(), 0)
+    assert op.num_active_work_refs() == 5
+    run_tasks(op)
+    assert not op.has_next()
+    assert len(op.get_stats()["map"]) == 5
+    # The map outputs are merged every 2 map tasks, and the merged outputs every 2
+    # merge tasks.
+    assert len(op.get_stats()["merge"]) == 3 * 4
+    assert [len(outputs) for outputs in op._unmerged_outputs] == [1, 0, 1]
+
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    # The reduce tasks get at most one unmerged output of each merge level.
+    run_tasks(op)
+    assert all(len(outputs) < 2 for outputs in op._unmerged_outputs)
+    op.inputs_done()
+    run_tasks(op)
+    output = _take_outputs(op)
+    assert len(output) == 4
+    assert sorted(sum(output, [])) == list(range(20))
+    assert len(op.get_stats()["reduce"]) == 4
+    assert op.completed()
+
+
+def test_streaming_shuffle_operator_merge_factor(restore_data_context):
+    ray.data.context.DataContext.get_current().streaming_shuffle_merge_factor = 3
+    input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(10)]))
+    op = StreamingShuffleOperator(ShuffleTaskSpec(random_shuffle=False), input_op)
+    assert op._merge_factor == 3
+
+
 def test_num_outputs_total():
     input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(100)]))
     op1 = MapOperator.create(
@@ -324,6 +377,40 @@ def test_split_operator_locality_hints(ray_start_regular_shared):
     assert "all objects local" in op.progress_str()
 
 
+@pytest.mark.parametrize("equal", [False, True])
+def test_split_operator_clustered_locality_hints(ray_start_regular_shared, equal):
+    # The bundles of each node arrive one after the other, so the consumer with the
+    # least data often has no local bundle buffered.
+    input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(20)]))
+    op = OutputSplitter(input_op, 2, equal=equal, locality_hints=["node1", "node2"])
+
+    def get_fake_loc(item):
+        return "node1" if item < 10 else "node2"
+
+    op._get_location = lambda bundle: get_fake_loc(
+        list(ray.get(bundle.blocks[0][0])["id"])[0]
+    )
+
+    output_splits = collections.defaultdict(list)
+    op.start(ExecutionOptions())
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    op.inputs_done()
+    while op.has_next():
+        ref = op.get_next()
+        for block, _ in ref.blocks:
+            output_splits[ref.output_split_idx].extend(list(ray.get(block)["id"]))
+
+    assert sorted(output_splits[0] + output_splits[1]) == list(range(20))
+    if equal:
+        assert len(output_splits[0]) == len(output_splits[1]) == 10
+    # Only the bundles needed to balance the splits are sent to the other node.
+    misses = sum(get_fake_loc(i) != "node1" for i in output_splits[0]) + sum(
+        get_fake_loc(i) != "node2" for i in output_splits[1]
+    )
+    assert misses <= 2, output_splits
+
+
 def test_map_operator_actor_locality_stats(ray_start_regular_shared):
     # Create with inputs.
     input_op = InputDataBuffer(
@@ -403,6 +490,57 @@ def test_map_operator_min_rows_per_bundle(ray_start_regular_shared, use_actors):
     assert op.completed()
 
 
+@pytest.mark.parametrize("use_actors", [False, True])
+def test_map_operator_adaptive_block_sizing(ray_start_regular_shared, use_actors):
+    ctx = ray.data.context.DataContext.get_current()
+    old_adaptive = ctx.adaptive_block_sizing
+    old_min, old_max = ctx.target_min_block_size, ctx.target_max_block_size
+
+    # The UDF inflates each input block 1000x.
+    def _inflate(block_iter: Iterable[Block], ctx) -> Iterable[Block]:
+        for block in block_iter:
+            yield pd.DataFrame({"id": np.repeat(block["id"].to_numpy(), 1000)})
+
+    try:
+        ctx.adaptive_block_sizing = True
+        ctx.target_max_block_size = 1024
+        input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(10)]))
+        compute_strategy = (
+            ActorPoolStrategy(size=1) if use_actors else TaskPoolStrategy()
+        )
+        op = MapOperator.create(
+            _inflate,
+            input_op=input_op,
+            name="TestMapper",
+            compute_strategy=compute_strategy,
+        )
+        op.start(ExecutionOptions(preserve_order=True))
+        while input_op.has_next():
+            op.add_input(input_op.get_next(), 0)
+        op.inputs_done()
+        work_refs = op.get_work_refs()
+        while work_refs:
+            for work_ref in work_refs:
+                ray.get(work_ref)
+                op.notify_work_completed(work_ref)
+            work_refs = op.get_work_refs()
+        outputs = []
+        while op.has_next():
+            outputs.extend(op.get_next().blocks)
+    finally:
+        ctx.adaptive_block_sizing = old_adaptive
+        ctx.target_min_block_size, ctx.target_max_block_size = old_min, old_max
+
+    # The outputs of each task are split into blocks of about 1KiB.
+    assert len(outputs) > 10
+    for _, metadata in outputs:
+        assert metadata.size_bytes <= 2 * 1024, metadata
+    rows = [i for block, _ in outputs for i in ray.get(block)["id"]]
+    assert rows == [i for i in range(10) for _ in range(1000)]
+    # The observed output/input size ratio is used to bundle inputs.
+    assert op._block_ref_bundler._min_bytes_per_bundle is not None
+
+
 @pytest.mark.parametrize("use_actors", [False, True])
 @pytest.mark.parametrize("preserve_order", [False, True])
 def test_map_operator_output_unbundling(
@@ -512,6 +650,42 @@ def test_map_operator_shutdown(shutdown_only, use_actors):
     wait_for_condition(lambda: (ray.available_resources().get("GPU", 0) == 1.0))
 
 
+def test_map_operator_all_dependents_complete(shutdown_only):
+    ray.shutdown()
+    ray.init(num_cpus=0, num_gpus=1)
+
+    def _sleep(block_iter: Iterable[Block], ctx) -> Iterable[Block]:
+        time.sleep(999)
+
+    input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(10)]))
+    op = MapOperator.create(
+        _sleep,
+        input_op=input_op,
+        name="TestMapper",
+        ray_remote_args={"num_cpus": 0, "num_gpus": 1},
+    )
+
+    cancelled_refs = []
+    op._on_task_cancelled = cancelled_refs.append
+    op.start(ExecutionOptions())
+    bundle = input_op.get_next()
+    op.add_input(bundle, 0)
+    [ref] = op.get_work_refs()
+    assert op.need_more_inputs()
+
+    # Once downstream operators are done, in-flight tasks are cancelled and no more
+    # inputs are requested.
+    op.all_dependents_complete()
+    assert op.get_work_refs() == []
+    assert cancelled_refs == [ref]
+    # The inputs of the cancelled tasks are freed.
+    assert op.get_metrics()["obj_store_mem_freed"] == bundle.size_bytes()
+    assert op.current_resource_usage().object_store_memory == 0
+    assert not op.need_more_inputs()
+    assert op.completed()
+    wait_for_condition(lambda: (ray.available_resources().get("GPU", 0) == 1.0))
+
+
 def test_actor_pool_map_operator_init(ray_start_regular_shared):
     """Tests that ActorPoolMapOperator runs init_fn on start."""
 
@@ -732,6 +906,33 @@ def test_block_ref_bundler_uniform(
     assert flat_out == list(range(n))
 
 
+def test_block_ref_bundler_min_bytes():
+    # Test that the bundler bundles up to the target number of bytes.
+    bundler = _BlockRefBundler(None)
+    bundles = make_ref_bundles([[i] for i in range(10)])
+    bundle_size = bundles[0].size_bytes()
+    bundler.set_min_bytes_per_bundle(3 * bundle_size)
+    out_bundles = []
+    for bundle in bundles:
+        bundler.add_bundle(bundle)
+        while bundler.has_bundle():
+            out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+    bundler.done_adding_bundles()
+    if bundler.has_bundle():
+        out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+    assert out_bundles == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+    # Both the rows and bytes targets must be reached.
+    bundler = _BlockRefBundler(4)
+    bundler.set_min_bytes_per_bundle(2 * bundle_size)
+    out_bundles = []
+    for bundle in make_ref_bundles([[i] for i in range(8)]):
+        bundler.add_bundle(bundle)
+        while bundler.has_bundle():
+            out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+    assert out_bundles == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+
 if __name__ == "__main__":
     import sys
 
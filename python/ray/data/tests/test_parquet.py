@@ -13,6 +13,7 @@ from ray.data.block import BlockAccessor
 from ray.data.datasource import (
     DefaultFileMetadataProvider,
     DefaultParquetMetadataProvider,
+    PathPartitionParser,
 )
 from ray.data.datasource.parquet_base_datasource import ParquetBaseDatasource
 from ray.data.datasource.parquet_datasource import (
@@ -520,6 +521,64 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert ds.count() == 2
 
 
+def test_parquet_read_row_group_split(ray_start_regular_shared, tmp_path):
+    table = pa.table({"one": list(range(100))})
+    path = os.path.join(tmp_path, "test.parquet")
+    pq.write_table(table, path, row_group_size=10)
+
+    ctx = ray.data.context.DataContext.get_current()
+    old_target_max_block_size = ctx.target_max_block_size
+    ctx.target_max_block_size = 1
+    try:
+        # A large file is split into one read task per row group.
+        read_tasks = _ParquetDatasourceReader(path).get_read_tasks(100)
+        assert len(read_tasks) == 10
+        assert [t.get_metadata().num_rows for t in read_tasks] == [10] * 10
+        assert all(t.get_metadata().input_files == [path] for t in read_tasks)
+
+        ds = ray.data.read_parquet(path, parallelism=100)
+        assert ds.num_blocks() == 10
+        assert ds.count() == 100
+        assert [s["one"] for s in ds.take_all()] == list(range(100))
+    finally:
+        ctx.target_max_block_size = old_target_max_block_size
+
+    # Small files are read whole.
+    read_tasks = _ParquetDatasourceReader(path).get_read_tasks(100)
+    assert len(read_tasks) == 1
+    assert read_tasks[0].get_metadata().num_rows == 100
+
+
+@pytest.mark.parametrize("num_files", [1, PARALLELIZE_META_FETCH_THRESHOLD + 1])
+def test_parquet_read_row_group_pruning(ray_start_regular_shared, tmp_path, num_files):
+    for idx in range(num_files):
+        table = pa.table({"one": list(range(100 * idx, 100 * (idx + 1)))})
+        path = os.path.join(tmp_path, f"test_{idx}.parquet")
+        pq.write_table(table, path, row_group_size=10)
+
+    # Row groups are skipped based on their min/max statistics.
+    filter_expr = (pa.dataset.field("one") >= 35) & (pa.dataset.field("one") < 62)
+    reader = _ParquetDatasourceReader(str(tmp_path), filter=filter_expr)
+    pieces, _, row_group_ids = reader._split_pieces_by_row_groups()
+    assert len(pieces) == 1
+    assert row_group_ids == [[3, 4, 5, 6]]
+    read_tasks = reader.get_read_tasks(num_files)
+    assert len(read_tasks) == 1
+    assert read_tasks[0].get_metadata().num_rows is None
+
+    ds = ray.data.read_parquet(str(tmp_path), filter=filter_expr)
+    assert sorted(s["one"] for s in ds.take_all()) == list(range(35, 62))
+
+    # If all row groups are skipped, a single empty read task remains.
+    filter_expr = pa.dataset.field("one") < 0
+    read_tasks = _ParquetDatasourceReader(
+        str(tmp_path), filter=filter_expr
+    ).get_read_tasks(num_files)
+    assert len(read_tasks) == 1
+    ds = ray.data.read_parquet(str(tmp_path), filter=filter_expr)
+    assert ds.take_all() == []
+
+
 def test_parquet_read_partitioned_explicit(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame(
         {"one": [1, 1, 1, 3, 3, 3], "two": ["a", "b", "c", "e", "f", "g"]}
@@ -853,6 +912,77 @@ def test_parquet_write_with_udf(ray_start_regular_shared, tmp_path):
     assert expected_df.equals(dfds)
 
 
+def test_parquet_write_partitioned(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    df = pd.DataFrame(
+        {
+            "year": [2020 + i % 2 for i in range(30)],
+            "country": [["US", "CA", None][i % 3] for i in range(30)],
+            "id": list(range(30)),
+        }
+    )
+    ds = ray.data.from_pandas([df[:10], df[10:20], df[20:]])
+    ds._set_uuid("data")
+    ds.write_parquet(data_path, partition_cols=["year", "country"])
+
+    parser = PathPartitionParser.of(base_dir=data_path)
+    num_rows = 0
+    for dirpath, _, filenames in os.walk(data_path):
+        if not filenames:
+            continue
+        # The rows of each partition are shuffled to a single write task.
+        assert len(filenames) == 1, filenames
+        partition = parser(os.path.join(dirpath, filenames[0]))
+        table = pq.read_table(os.path.join(dirpath, filenames[0]), partitioning=None)
+        assert table.column_names == ["id"]
+        expected = df[df["year"] == int(partition["year"])]
+        if partition["country"] == "__HIVE_DEFAULT_PARTITION__":
+            expected = expected[expected["country"].isnull()]
+        else:
+            expected = expected[expected["country"] == partition["country"]]
+        assert sorted(table["id"].to_pylist()) == expected["id"].tolist()
+        num_rows += table.num_rows
+    assert num_rows == 30
+
+    ds = ray.data.read_parquet(data_path)
+    rows = sorted(ds.take_all(), key=lambda row: row["id"])
+    assert [(r["year"], r["country"], r["id"]) for r in rows] == list(
+        df.itertuples(index=False, name=None)
+    )
+
+
+def test_parquet_write_bucketed(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    ds = ray.data.range(100, parallelism=5)
+    ds._set_uuid("data")
+    ds.write_parquet(
+        data_path, num_buckets=3, bucket_cols=["id"], target_file_size_bytes=80
+    )
+
+    bucket_ids = {}
+    for filename in os.listdir(data_path):
+        _, _, bucket, _ = filename.split(".")[0].split("_")
+        ids = pq.read_table(os.path.join(data_path, filename))["id"].to_pylist()
+        # The files are rolled at the target size of 10 int64 rows.
+        assert 0 < len(ids) <= 10
+        for i in ids:
+            bucket_ids[i] = bucket
+    assert sorted(bucket_ids) == list(range(100))
+    assert len(set(bucket_ids.values())) == 3
+    # Equal keys are always in the same bucket.
+    ds = ray.data.range(100, parallelism=2)
+    ds._set_uuid("other")
+    ds.write_parquet(data_path, num_buckets=3, bucket_cols=["id"])
+    for filename in os.listdir(data_path):
+        if filename.startswith("other"):
+            bucket = filename.split(".")[0].split("_")[-1]
+            ids = pq.read_table(os.path.join(data_path, filename))["id"].to_pylist()
+            assert all(bucket_ids[i] == bucket for i in ids)
+
+    with pytest.raises(ValueError, match="must be specified together"):
+        ds.write_parquet(data_path, num_buckets=3)
+
+
 @pytest.mark.parametrize(
     "fs,data_path,endpoint_url",
     [
@@ -7,7 +7,8 @@ from ray.tests.conftest import *  # noqa
 
 
 @pytest.mark.parametrize("pandas", [False, True])
-def test_basic(ray_start_regular_shared, pandas):
+@pytest.mark.parametrize("index", ["sort", "hash"])
+def test_basic(ray_start_regular_shared, pandas, index):
     ds = ray.data.range(100, parallelism=10)
     ds = ds.add_column("embedding", lambda b: b["id"] ** 2)
     if not pandas:
@@ -15,7 +16,7 @@ def test_basic(ray_start_regular_shared, pandas):
             lambda df: pyarrow.Table.from_pandas(df), batch_format="pandas"
         )
 
-    rad = ds.to_random_access_dataset("id", num_workers=1)
+    rad = ds.to_random_access_dataset("id", num_workers=1, index=index)
 
     # Test get.
     assert ray.get(rad.get_async(-1)) is None
@@ -31,10 +32,45 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
 
-def test_empty_blocks(ray_start_regular_shared):
+@pytest.mark.parametrize("index", ["sort", "hash"])
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_multiget_batch(ray_start_regular_shared, index, num_workers):
+    ds = ray.data.range(100, parallelism=10)
+    ds = ds.add_column("embedding", lambda b: b["id"] ** 2)
+    rad = ds.to_random_access_dataset("id", num_workers=num_workers, index=index)
+
+    keys = [42, -1, 7, 99, 100, 0, 7]
+    table = rad.multiget_batch(keys)
+    assert isinstance(table, pyarrow.Table)
+    assert table.column_names == ["id", "embedding"]
+    assert table.to_pydict() == {
+        "id": [42, None, 7, 99, None, 0, 7],
+        "embedding": [42**2, None, 49, 99**2, None, 0, 49],
+    }
+
+    table = rad.multiget_batch([])
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "embedding"]
+
+
+def test_hash_index_string_keys(ray_start_regular_shared):
+    ds = ray.data.from_items([{"name": f"user_{i}", "value": i} for i in range(50)])
+    rad = ds.to_random_access_dataset("name", num_workers=2, index="hash")
+    assert ray.get(rad.get_async("user_3")) == {"name": "user_3", "value": 3}
+    assert ray.get(rad.get_async("missing")) is None
+    assert rad.multiget(["user_10", "missing"]) == [
+        {"name": "user_10", "value": 10},
+        None,
+    ]
+    table = rad.multiget_batch(["user_49", "missing", "user_0"])
+    assert table.column("value").to_pylist() == [49, None, 0]
+
+
+@pytest.mark.parametrize("index", ["sort", "hash"])
+def test_empty_blocks(ray_start_regular_shared, index):
     ds = ray.data.range(10).repartition(20)
     assert ds.num_blocks() == 20
-    rad = ds.to_random_access_dataset("id")
+    rad = ds.to_random_access_dataset("id", index=index)
     for i in range(10):
         assert ray.get(rad.get_async(i)) == {"id": i}
 
@@ -43,6 +79,10 @@ def test_errors(ray_start_regular_shared):
     ds = ray.data.range(10)
     with pytest.raises(ValueError):
         ds.to_random_access_dataset("invalid")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("invalid", index="hash")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("id", index="invalid")
 
 
 def test_stats(ray_start_regular_shared):
@@ -8,6 +8,7 @@ import pytest
 
 import ray
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
+from ray.data._internal.sort import external_merge_sorted_blocks
 from ray.data.block import BlockAccessor
 from ray.data.tests.conftest import *  # noqa
 from ray.tests.conftest import *  # noqa
@@ -151,6 +152,90 @@ def test_sort_arrow_with_empty_blocks(
         ctx.use_polars = original_use_polars
 
 
+@pytest.mark.parametrize("parallelism", [1, 4])
+def test_sort_arrow_external(ray_start_regular, parallelism, use_push_based_shuffle):
+    ctx = ray.data.context.DataContext.get_current()
+    original_use_external_sort = ctx.use_external_sort
+    original_buffer_size = ctx.external_sort_buffer_size
+    original_target_max_block_size = ctx.target_max_block_size
+    try:
+        ctx.use_external_sort = True
+        # Merge the sorted blocks in many small rounds, into many output blocks.
+        ctx.external_sort_buffer_size = 1024
+        ctx.target_max_block_size = 2048
+
+        xs = list(range(1000))
+        random.shuffle(xs)
+        ds = ray.data.from_items(
+            [{"a": x, "b": str(x)} for x in xs], parallelism=parallelism
+        )
+        ds = ds.map_batches(lambda t: t, batch_format="pyarrow", batch_size=None)
+        assert extract_values("a", ds.sort("a").take_all()) == list(range(1000))
+        assert extract_values("b", ds.sort("a").take_all()) == [
+            str(x) for x in range(1000)
+        ]
+        assert extract_values("a", ds.sort("a", descending=True).take_all()) == list(
+            reversed(range(1000))
+        )
+        if parallelism > 1:
+            # Each reducer outputs multiple blocks.
+            assert ds.sort("a").materialize().num_blocks() > parallelism
+    finally:
+        ctx.use_external_sort = original_use_external_sort
+        ctx.external_sort_buffer_size = original_buffer_size
+        ctx.target_max_block_size = original_target_max_block_size
+
+
+def test_external_merge_sorted_blocks(ray_start_regular):
+    ctx = ray.data.context.DataContext.get_current()
+    original_buffer_size = ctx.external_sort_buffer_size
+    original_target_max_block_size = ctx.target_max_block_size
+    try:
+        ctx.external_sort_buffer_size = 64
+        ctx.target_max_block_size = 256
+        for descending in [False, True]:
+            values = []
+            blocks = []
+            for _ in range(5):
+                block_values = [random.randint(0, 50) for _ in range(20)]
+                values.extend(block_values)
+                block_values = sorted(block_values, reverse=descending) + [None]
+                blocks.append(pa.table({"a": pa.array(block_values, pa.int64())}))
+            blocks.append(pa.table({"a": pa.array([], pa.int64())}))
+            order = "descending" if descending else "ascending"
+            *out_blocks, metadata = external_merge_sorted_blocks(
+                blocks, [("a", order)], descending
+            )
+            assert len(out_blocks) > 1
+            assert all(
+                block.nbytes < 2 * ctx.target_max_block_size for block in out_blocks
+            )
+            assert (
+                pa.concat_tables(out_blocks)["a"].to_pylist()
+                == sorted(values, reverse=descending) + [None] * 5
+            )
+            assert [meta.num_rows for meta in metadata] == [
+                block.num_rows for block in out_blocks
+            ]
+
+        # Sorts by multiple columns are merged in memory.
+        blocks = [
+            pa.table({"a": [0, 1, 1], "b": [5, 1, 3]}),
+            pa.table({"a": [0, 1, 2], "b": [2, 2, 0]}),
+        ]
+        *out_blocks, metadata = external_merge_sorted_blocks(
+            blocks, [("a", "ascending"), ("b", "ascending")], False
+        )
+        assert pa.concat_tables(out_blocks).to_pydict() == {
+            "a": [0, 0, 1, 1, 1, 2],
+            "b": [2, 5, 1, 2, 3, 0],
+        }
+        assert sum(meta.num_rows for meta in metadata) == 6
+    finally:
+        ctx.external_sort_buffer_size = original_buffer_size
+        ctx.target_max_block_size = original_target_max_block_size
+
+
 @pytest.mark.parametrize("num_items,parallelism", [(100, 1), (1000, 4)])
 def test_sort_pandas(ray_start_regular, num_items, parallelism, use_push_based_shuffle):
     a = list(reversed(range(num_items)))
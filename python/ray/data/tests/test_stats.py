@@ -1,11 +1,16 @@
 from collections import Counter
+import json
 import re
 import numpy as np
 
 import pytest
 
 import ray
-from ray.data._internal.stats import _StatsActor, DatastreamStats
+from ray.data._internal.stats import (
+    _StatsActor,
+    _assign_lanes,
+    DatastreamStats,
+)
 from ray.data._internal.datastream_logger import DatastreamLogger
 from ray.data.block import BlockMetadata
 from ray.data.context import DataContext
@@ -1106,6 +1111,40 @@ Datastream iterator time breakdown:
     )
 
 
+def test_export_chrome_trace(ray_start_regular_shared, restore_data_context, tmp_path):
+    DataContext.get_current().new_execution_backend = True
+    DataContext.get_current().use_streaming_executor = True
+    DataContext.get_current().enable_operator_timeline = True
+
+    # The different resources prevent the fusion of the operators.
+    ds = ray.data.range(100, parallelism=10).map_batches(lambda x: x)
+    ds = ds.map_batches(lambda x: x, num_cpus=0.5).materialize()
+    path = str(tmp_path / "trace.json")
+    ds.export_chrome_trace(path)
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+
+    process_names = [e["args"]["name"] for e in events if e["name"] == "process_name"]
+    assert process_names == [
+        "ReadRange->MapBatches(<lambda>)",
+        "MapBatches(<lambda>)",
+    ]
+    tasks = [e for e in events if e["ph"] == "X" and e["cat"] == "task"]
+    assert len([e for e in tasks if e["pid"] == 0]) == 10
+    assert len([e for e in tasks if e["pid"] == 1]) == 10
+    assert all(e["dur"] >= 0 for e in tasks)
+    # The outputs of the first operator wait in the queue of the second one.
+    assert any(e["ph"] == "X" and e["cat"] == "queue" for e in events)
+    bytes_samples = [e for e in events if e["ph"] == "C" and e["pid"] == 0]
+    assert bytes_samples[-1]["args"]["output"] > 0
+
+
+def test_assign_lanes():
+    assert _assign_lanes([]) == []
+    assert _assign_lanes([(0, 2), (1, 3), (2, 4), (5, 6)]) == [0, 1, 0, 0]
+    assert _assign_lanes([(3, 4), (0, 5), (1, 2)]) == [1, 0, 1]
+
+
 # NOTE: All tests above share a Ray cluster, while the tests below do not. These
 # tests should only be carefully reordered to retain this invariant!
 
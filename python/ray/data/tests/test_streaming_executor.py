@@ -23,9 +23,13 @@ from ray.data._internal.execution.streaming_executor_state import (
     select_operator_to_run,
     _execution_allowed,
 )
+from ray.data._internal.execution.legacy_compat import _blocks_to_input_buffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.util import make_ref_bundles
+from ray.data._internal.lazy_block_list import LazyBlockList
+from ray.data.block import BlockMetadata
+from ray.data.datasource import ReadTask
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from ray.data.tests.conftest import *  # noqa
 
@@ -539,6 +543,36 @@ def test_configure_output_locality():
     assert s2c.node_id == "node1"
 
 
+def test_read_task_remote_args():
+    ray.shutdown()
+    ray.init(num_cpus=2)
+    metadata = BlockMetadata(
+        num_rows=1, size_bytes=1, schema=None, input_files=None, exec_stats=None
+    )
+    node_strategy = NodeAffinitySchedulingStrategy("node1", soft=True)
+    read_tasks = [
+        ReadTask(lambda: [[0]], metadata),
+        ReadTask(
+            lambda: [[1]],
+            metadata,
+            ray_remote_args={"scheduling_strategy": node_strategy},
+        ),
+    ]
+    blocks = LazyBlockList(
+        read_tasks, ray_remote_args={"num_cpus": 2}, owned_by_consumer=False
+    )
+    op = _blocks_to_input_buffer(blocks, owns_blocks=False)
+    inputs = op.input_dependencies[0]
+    inputs.start(ExecutionOptions())
+    # The read tasks with remote args of their own override the read's.
+    args = op._get_runtime_ray_remote_args(inputs.get_next())
+    assert args["num_cpus"] == 2
+    assert "scheduling_strategy" not in args
+    args = op._get_runtime_ray_remote_args(inputs.get_next())
+    assert args["num_cpus"] == 2
+    assert args["scheduling_strategy"] is node_strategy
+
+
 def test_calculate_topology_usage():
     inputs = make_ref_bundles([[x] for x in range(20)])
     o1 = InputDataBuffer(inputs)
@@ -176,6 +176,25 @@ def test_streaming_split_e2e(ray_start_10_cpus_shared):
                 assert lengths == [300, 300, 400], lengths
 
 
+@pytest.mark.parametrize("max_blocks_per_fetch", [1, 4, 100])
+def test_streaming_split_bulk_fetch(
+    ray_start_10_cpus_shared, restore_data_context, max_blocks_per_fetch
+):
+    ctx = DataContext.get_current()
+    ctx.streaming_split_max_blocks_per_fetch = max_blocks_per_fetch
+    ds = ray.data.range(100, parallelism=20)
+    i1, i2 = ds.streaming_split(2, equal=True)
+
+    @ray.remote
+    def consume(it):
+        return [row["id"] for row in it.iter_rows()]
+
+    for _ in range(2):
+        out1, out2 = ray.get([consume.remote(i1), consume.remote(i2)])
+        assert len(out1) == len(out2) == 50
+        assert sorted(out1 + out2) == list(range(100))
+
+
 def test_streaming_split_barrier(ray_start_10_cpus_shared):
     ds = ray.data.range(20, parallelism=20)
     (
@@ -5,7 +5,7 @@ from typing import Any, List, Dict, Optional
 
 import ray
 from ray.actor import ActorHandle
-from ray.serve.config import DeploymentConfig, ReplicaConfig
+from ray.serve.config import DeploymentConfig, ReplicaConfig, ReplicaSchedulingPolicy
 from ray.serve.generated.serve_pb2 import (
     DeploymentInfo as DeploymentInfoProto,
     DeploymentStatusInfo as DeploymentStatusInfoProto,
@@ -325,6 +325,11 @@ class RunningReplicaInfo:
     actor_handle: ActorHandle
     max_concurrent_queries: int
     is_cross_language: bool = False
+    # The node the replica runs on, if known.
+    node_id: Optional[NodeId] = None
+    replica_scheduling_policy: ReplicaSchedulingPolicy = (
+        ReplicaSchedulingPolicy.RoundRobin
+    )
 
     def __post_init__(self):
         # Set hash value when object is constructed.
@@ -341,6 +346,7 @@ class RunningReplicaInfo:
                     str(self.actor_handle._actor_id),
                     str(self.max_concurrent_queries),
                     str(self.is_cross_language),
+                    str(self.replica_scheduling_policy),
                 ]
             )
         )
@@ -124,6 +124,13 @@ SYNC_HANDLE_IN_DAG_FEATURE_FLAG_ENV_KEY = "SERVE_DEPLOYMENT_HANDLE_IS_SYNC"
 # still replicas in the RECOVERING state.
 RECOVERING_LONG_POLL_BROADCAST_TIMEOUT_S = 10.0
 
+# Max number of body bytes of a streamed HTTP response that a replica buffers
+# while the previous chunks are being sent to the HTTP proxy. The response is
+# paused until they're sent when it's exceeded.
+RAY_SERVE_HTTP_RESPONSE_STREAM_MAX_BUFFERED_BYTES = int(
+    os.environ.get("RAY_SERVE_HTTP_RESPONSE_STREAM_MAX_BUFFERED_BYTES", 1024 * 1024)
+)
+
 
 class ServeHandleType(str, Enum):
     SYNC = "SYNC"
@@ -37,7 +37,7 @@ from ray.serve.schema import (
     ReplicaDetails,
     _deployment_info_to_schema,
 )
-from ray.serve.config import DeploymentConfig
+from ray.serve.config import DeploymentConfig, ReplicaSchedulingPolicy
 from ray.serve._private.constants import (
     MAX_DEPLOYMENT_CONSTRUCTOR_RETRY_COUNT,
     MAX_NUM_DELETED_DEPLOYMENTS,
@@ -275,6 +275,11 @@ class ActorReplicaWrapper:
         if self.deployment_config:
             return self.deployment_config.max_concurrent_queries
 
+    @property
+    def replica_scheduling_policy(self) -> Optional[ReplicaSchedulingPolicy]:
+        if self.deployment_config:
+            return self.deployment_config.replica_scheduling_policy
+
     @property
     def graceful_shutdown_timeout_s(self) -> Optional[float]:
         if self.deployment_config:
@@ -750,6 +755,8 @@ class DeploymentReplica(VersionedReplica):
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
             is_cross_language=self._actor.is_cross_language,
+            node_id=self._actor.node_id,
+            replica_scheduling_policy=self._actor.replica_scheduling_policy,
         )
 
     def get_replica_details(self, state: ReplicaState) -> ReplicaDetails:
@@ -2,15 +2,15 @@ import asyncio
 from asyncio.tasks import FIRST_COMPLETED
 import os
 import logging
-import pickle
 import socket
 import time
-from typing import Callable, List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from ray._private.utils import get_or_create_event_loop
 
 import uvicorn
 import starlette.responses
 import starlette.routing
+from starlette.types import Send
 
 import ray
 from ray.exceptions import RayActorError, RayTaskError
@@ -29,12 +29,13 @@ from ray.serve._private.common import EndpointInfo, EndpointTag, ApplicationName
 from ray.serve._private.constants import (
     SERVE_LOGGER_NAME,
     SERVE_NAMESPACE,
+    SERVE_PROXY_NAME,
     DEFAULT_LATENCY_BUCKET_MS,
 )
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 
-from ray.serve._private.utils import get_random_letters
+from ray.serve._private.utils import format_actor_name, get_random_letters
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
@@ -66,16 +67,48 @@ if os.environ.get("SERVE_REQUEST_PROCESSING_TIMEOUT_S") is not None:
     )
 
 
-async def _send_request_to_handle(handle, scope, receive, send) -> str:
-    http_body_bytes = await receive_http_body(scope, receive, send)
+class _ResponseStream:
+    """The response to a request that is streamed by a replica."""
+
+    def __init__(self, send: Send, client_disconnection_task: asyncio.Task):
+        self._send = send
+        self._client_disconnection_task = client_disconnection_task
+        # Set once the replica sent the start of the response.
+        self.status_code: Optional[str] = None
+
+    @property
+    def started(self) -> bool:
+        return self.status_code is not None
+
+    async def send(self, messages: List[Dict[str, Any]]) -> bool:
+        """Write the messages to the client.
 
-    # NOTE(edoakes): it's important that we defer building the starlette
-    # request until it reaches the replica to avoid unnecessary
-    # serialization cost, so we use a simple dataclass here.
-    request = HTTPRequestWrapper(scope, http_body_bytes)
-    # Perform a pickle here to improve latency. Stdlib pickle for simple
-    # dataclasses are 10-100x faster than cloudpickle.
-    request = pickle.dumps(request)
+        Returns False if the client disconnected.
+        """
+        if self._client_disconnection_task.done():
+            return False
+        for message in messages:
+            if message["type"] == "http.response.start":
+                self.status_code = str(message["status"])
+            await self._send(message)
+        return True
+
+
+async def _send_request_to_handle(
+    handle,
+    scope,
+    receive,
+    send,
+    response_streams: Optional[Dict[str, _ResponseStream]] = None,
+    proxy_actor_name: Optional[str] = None,
+) -> str:
+    """Send the request to the handle and its response to the client.
+
+    If `response_streams` and `proxy_actor_name` are passed, the replica can
+    stream the response by sending its messages to the proxy actor, which
+    looks the stream up by id in `response_streams`.
+    """
+    http_body_bytes = await receive_http_body(scope, receive, send)
 
     retries = 0
     backoff_time_s = 0.05
@@ -84,85 +117,133 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
     # We have received all the http request conent. The next `receive`
     # call might never arrive; if it does, it can only be `http.disconnect`.
     client_disconnection_task = loop.create_task(receive())
-    while retries < HTTP_REQUEST_MAX_RETRIES + 1:
-        assignment_task: asyncio.Task = handle.remote(request)
-        done, _ = await asyncio.wait(
-            [assignment_task, client_disconnection_task],
-            return_when=FIRST_COMPLETED,
-        )
-        if client_disconnection_task in done:
-            message = await client_disconnection_task
-            assert message["type"] == "http.disconnect", (
-                "Received additional request payload that's not disconnect. "
-                "This is an invalid HTTP state."
-            )
-            logger.warning(
-                f"Client from {scope['client']} disconnected, cancelling the "
-                "request.",
-                extra={"log_to_stderr": False},
+
+    response_stream = None
+    response_stream_id = None
+
+    # Once the replica started streaming the response, the request can't be
+    # retried and errors can't be sent to the client anymore.
+    def response_started():
+        return response_stream is not None and response_stream.started
+
+    try:
+        while retries < HTTP_REQUEST_MAX_RETRIES + 1:
+            if response_streams is not None and proxy_actor_name is not None:
+                # Each attempt gets its own stream, so that the replica of an
+                # attempt that timed out can't write to the response.
+                if response_stream_id is not None:
+                    del response_streams[response_stream_id]
+                response_stream = _ResponseStream(send, client_disconnection_task)
+                response_stream_id = get_random_letters(16)
+                response_streams[response_stream_id] = response_stream
+
+            # NOTE(edoakes): it's important that we defer building the starlette
+            # request until it reaches the replica to avoid unnecessary
+            # serialization cost, so we use a simple dataclass here. It's
+            # serialized with the body as a zero-copy buffer.
+            request = HTTPRequestWrapper(
+                scope,
+                http_body_bytes,
+                proxy_actor_name=proxy_actor_name if response_stream_id else None,
+                response_stream_id=response_stream_id,
             )
-            # This will make the .result() to raise cancelled error.
-            assignment_task.cancel()
-        try:
-            object_ref = await assignment_task
-
-            # NOTE (shrekris-anyscale): when the gcs, Serve controller, and
-            # some replicas crash simultaneously (e.g. if the head node crashes),
-            # requests to the dead replicas hang until the gcs recovers.
-            # This asyncio.wait can kill those hanging requests and retry them
-            # at another replica. Release tests should kill the head node and
-            # check if latency drops significantly. See
-            # https://github.com/ray-project/ray/pull/29534 for more info.
-
-            _, request_timed_out = await asyncio.wait(
-                [object_ref], timeout=RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S
+
+            assignment_task: asyncio.Task = handle.remote(request)
+            done, _ = await asyncio.wait(
+                [assignment_task, client_disconnection_task],
+                return_when=FIRST_COMPLETED,
             )
-            if request_timed_out:
+            if client_disconnection_task in done:
+                message = await client_disconnection_task
+                assert message["type"] == "http.disconnect", (
+                    "Received additional request payload that's not disconnect. "
+                    "This is an invalid HTTP state."
+                )
+                logger.warning(
+                    f"Client from {scope['client']} disconnected, cancelling the "
+                    "request.",
+                    extra={"log_to_stderr": False},
+                )
+                # This will make the .result() to raise cancelled error.
+                assignment_task.cancel()
+            try:
+                object_ref = await assignment_task
+
+                # NOTE (shrekris-anyscale): when the gcs, Serve controller, and
+                # some replicas crash simultaneously (e.g. if the head node crashes),
+                # requests to the dead replicas hang until the gcs recovers.
+                # This asyncio.wait can kill those hanging requests and retry them
+                # at another replica. Release tests should kill the head node and
+                # check if latency drops significantly. See
+                # https://github.com/ray-project/ray/pull/29534 for more info.
+
+                _, request_timed_out = await asyncio.wait(
+                    [object_ref], timeout=RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S
+                )
+                if request_timed_out and not response_started():
+                    logger.info(
+                        "Request didn't finish within "
+                        f"{RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S} seconds. Retrying "
+                        "with another replica. You can modify this timeout by "
+                        'setting the "RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S" env var.'
+                    )
+                    backoff = True
+                else:
+                    result = await object_ref
+                    client_disconnection_task.cancel()
+                    break
+            except asyncio.CancelledError:
+                # Here because the client disconnected, we will return a custom
+                # error code for metric tracking.
+                return DISCONNECT_ERROR_CODE
+            except RayTaskError as error:
+                if response_started():
+                    if client_disconnection_task.done():
+                        return DISCONNECT_ERROR_CODE
+                    logger.warning(f"Streamed response failed: {error}.")
+                    return "500"
+                error_message = "Task Error. Traceback: {}.".format(error)
+                await Response(error_message, status_code=500).send(
+                    scope, receive, send
+                )
+                return "500"
+            except RayActorError:
+                if response_started():
+                    logger.warning("Streamed response failed due to replica failure.")
+                    return "500"
                 logger.info(
-                    "Request didn't finish within "
-                    f"{RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S} seconds. Retrying "
-                    "with another replica. You can modify this timeout by "
-                    'setting the "RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S" env var.'
+                    "Request failed due to replica failure. There are "
+                    f"{HTTP_REQUEST_MAX_RETRIES - retries} retries "
+                    "remaining."
                 )
                 backoff = True
-            else:
-                result = await object_ref
-                client_disconnection_task.cancel()
-                break
-        except asyncio.CancelledError:
-            # Here because the client disconnected, we will return a custom
-            # error code for metric tracking.
-            return DISCONNECT_ERROR_CODE
-        except RayTaskError as error:
-            error_message = "Task Error. Traceback: {}.".format(error)
+            if backoff:
+                await asyncio.sleep(backoff_time_s)
+                # Be careful about the expotential backoff scaling here.
+                # Assuming 10 retries, 1.5x scaling means the last retry is 38x the
+                # initial backoff time, while 2x scaling means 512x the initial.
+                backoff_time_s *= 1.5
+                retries += 1
+                backoff = False
+        else:
+            error_message = f"Task failed with {HTTP_REQUEST_MAX_RETRIES} retries."
             await Response(error_message, status_code=500).send(scope, receive, send)
             return "500"
-        except RayActorError:
-            logger.info(
-                "Request failed due to replica failure. There are "
-                f"{HTTP_REQUEST_MAX_RETRIES - retries} retries "
-                "remaining."
-            )
-            backoff = True
-        if backoff:
-            await asyncio.sleep(backoff_time_s)
-            # Be careful about the expotential backoff scaling here.
-            # Assuming 10 retries, 1.5x scaling means the last retry is 38x the
-            # initial backoff time, while 2x scaling means 512x the initial.
-            backoff_time_s *= 1.5
-            retries += 1
-            backoff = False
-    else:
-        error_message = f"Task failed with {HTTP_REQUEST_MAX_RETRIES} retries."
-        await Response(error_message, status_code=500).send(scope, receive, send)
-        return "500"
-
-    if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
-        await result(scope, receive, send)
-        return str(result.status_code)
-    else:
-        await Response(result).send(scope, receive, send)
-        return "200"
+
+        if response_started():
+            # The rest of the messages, if any, are in the result.
+            if isinstance(result, RawASGIResponse):
+                await result(scope, receive, send)
+            return response_stream.status_code
+        elif isinstance(result, (starlette.responses.Response, RawASGIResponse)):
+            await result(scope, receive, send)
+            return str(result.status_code)
+        else:
+            await Response(result).send(scope, receive, send)
+            return "200"
+    finally:
+        if response_stream_id is not None:
+            del response_streams[response_stream_id]
 
 
 class LongestPrefixRouter:
@@ -255,7 +336,14 @@ class HTTPProxy:
     >>> uvicorn.run(HTTPProxy(controller_name)) # doctest: +SKIP
     """
 
-    def __init__(self, controller_name: str):
+    def __init__(self, controller_name: str, proxy_actor_name: Optional[str] = None):
+        """
+        Args:
+            controller_name: The name of the controller actor.
+            proxy_actor_name: The name of the actor running this proxy, which
+                replicas can stream responses to. Responses are returned all
+                at once if it's unset.
+        """
         # Set the controller name so that serve will connect to the
         # controller instance this proxy is running in.
         ray.serve.context._set_internal_replica_context(
@@ -265,6 +353,10 @@ class HTTPProxy:
         # Used only for displaying the route table.
         self.route_info: Dict[str, EndpointTag] = dict()
 
+        self._proxy_actor_name = proxy_actor_name
+        # The responses being streamed by replicas, by id.
+        self._response_streams: Dict[str, _ResponseStream] = dict()
+
         def get_handle(name):
             return serve.context.get_global_client().get_handle(
                 name,
@@ -343,6 +435,19 @@ class HTTPProxy:
                     return
             await asyncio.sleep(0.2)
 
+    async def send_response_messages(
+        self, stream_id: str, messages: List[Dict[str, Any]]
+    ) -> bool:
+        """Write messages of a response streamed by a replica to the client.
+
+        Returns False if the client disconnected or the request is over, in
+        which case the replica should stop generating the response.
+        """
+        response_stream = self._response_streams.get(stream_id)
+        if response_stream is None:
+            return False
+        return await response_stream.send(messages)
+
     async def _not_found(self, scope, receive, send):
         current_path = scope["path"]
         response = Response(
@@ -427,7 +532,14 @@ class HTTPProxy:
                 route_path, get_random_letters(10), app_name
             )
         )
-        status_code = await _send_request_to_handle(handle, scope, receive, send)
+        status_code = await _send_request_to_handle(
+            handle,
+            scope,
+            receive,
+            send,
+            response_streams=self._response_streams,
+            proxy_actor_name=self._proxy_actor_name,
+        )
         latency_ms = (time.time() - start_time) * 1000.0
         self.processing_latency_tracker.observe(
             latency_ms, tags={"route": route_path, "application": app_name}
@@ -483,7 +595,11 @@ class HTTPProxyActor:
 
         self.setup_complete = asyncio.Event()
 
-        self.app = HTTPProxy(controller_name)
+        # The proxy actor is named after its node, see HTTPState.
+        proxy_actor_name = format_actor_name(
+            SERVE_PROXY_NAME, controller_name, ray.get_runtime_context().get_node_id()
+        )
+        self.app = HTTPProxy(controller_name, proxy_actor_name=proxy_actor_name)
 
         self.wrapped_app = self.app
         for middleware in http_middlewares:
@@ -517,6 +633,12 @@ class HTTPProxyActor:
     ):
         await self.app.block_until_endpoint_exists(endpoint, timeout_s)
 
+    async def send_response_messages(
+        self, stream_id: str, messages: List[Dict[str, Any]]
+    ) -> bool:
+        """Called by replicas to stream the messages of a response."""
+        return await self.app.send_response_messages(stream_id, messages)
+
     async def run(self):
         sock = socket.socket()
         if SOCKET_REUSE_PORT_ENABLED:
@@ -1,18 +1,27 @@
 import asyncio
+from contextvars import ContextVar
 import socket
 from dataclasses import dataclass
 import inspect
 import json
 import logging
-from typing import Any, Dict, Type
+import pickle
+from typing import Any, Dict, List, Optional, Type, Union
 
 import starlette.responses
 import starlette.requests
 from starlette.types import Send, ASGIApp
 from fastapi.encoders import jsonable_encoder
 
+import ray
+from ray.actor import ActorHandle
+from ray.exceptions import RayActorError
 from ray.serve.exceptions import RayServeException
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    RAY_SERVE_HTTP_RESPONSE_STREAM_MAX_BUFFERED_BYTES,
+    SERVE_LOGGER_NAME,
+    SERVE_NAMESPACE,
+)
 
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -20,15 +29,43 @@ logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 @dataclass
 class HTTPRequestWrapper:
+    """An HTTP request sent by the proxy to a replica.
+
+    It's serialized as a compact envelope: the scope and the response stream
+    are packed with stdlib pickle, which is much faster than cloudpickle, and
+    the body is an out-of-band pickle buffer. Ray writes the body to the object
+    store without copying it into the pickled data, and the replica maps it
+    without copying until the body is read.
+    """
+
     scope: Dict[Any, Any]
-    body: bytes
+    # A read-only memoryview of the body in replicas.
+    body: Union[bytes, memoryview]
+    # The HTTP proxy the response can be streamed to, and the id of the
+    # response in it. Unset if the response must be returned all at once.
+    proxy_actor_name: Optional[str] = None
+    response_stream_id: Optional[str] = None
+
+    def __reduce__(self):
+        header = pickle.dumps(
+            (self.scope, self.proxy_actor_name, self.response_stream_id),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        return _unpack_http_request, (header, pickle.PickleBuffer(self.body))
+
 
+def _unpack_http_request(header: bytes, body) -> HTTPRequestWrapper:
+    scope, proxy_actor_name, response_stream_id = pickle.loads(header)
+    return HTTPRequestWrapper(
+        scope, memoryview(body), proxy_actor_name, response_stream_id
+    )
 
-def build_starlette_request(scope, serialized_body: bytes):
+
+def build_starlette_request(scope, serialized_body: Union[bytes, memoryview]):
     """Build and return a Starlette Request from ASGI payload.
 
     This function is intended to be used immediately before task invocation
-    happens.
+    happens. The body is only copied to bytes if the request reads it.
     """
 
     # Simulates receiving HTTP body from TCP socket.  In reality, the body has
@@ -46,7 +83,11 @@ def build_starlette_request(scope, serialized_body: bytes):
             await block_forever.wait()
 
         received = True
-        return {"body": serialized_body, "type": "http.request", "more_body": False}
+        return {
+            "body": bytes(serialized_body),
+            "type": "http.request",
+            "more_body": False,
+        }
 
     return starlette.requests.Request(scope, mock_receive)
 
@@ -124,6 +165,89 @@ async def receive_http_body(scope, receive, send):
     return b"".join(body_buffer)
 
 
+# The handles of the HTTP proxy actors, by name.
+_proxy_actors: Dict[str, ActorHandle] = {}
+
+
+def _get_proxy_actor(proxy_actor_name: str) -> ActorHandle:
+    proxy = _proxy_actors.get(proxy_actor_name)
+    if proxy is None:
+        proxy = ray.get_actor(proxy_actor_name, namespace=SERVE_NAMESPACE)
+        _proxy_actors[proxy_actor_name] = proxy
+    return proxy
+
+
+class ASGIResponseStream:
+    """Sends the ASGI messages of a response to the HTTP proxy while it's
+    being generated, instead of returning them all at once.
+
+    The messages are sent in batches, with one batch in flight at a time. The
+    proxy acknowledges a batch once it's written to the client, so a slow
+    client slows down the response: `send()` waits while more than
+    `max_buffered_bytes` of body are buffered.
+    """
+
+    def __init__(
+        self,
+        proxy_actor_name: str,
+        stream_id: str,
+        max_buffered_bytes: int = RAY_SERVE_HTTP_RESPONSE_STREAM_MAX_BUFFERED_BYTES,
+    ):
+        self._proxy_actor_name = proxy_actor_name
+        self._stream_id = stream_id
+        self._max_buffered_bytes = max_buffered_bytes
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffered_bytes = 0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def send(self, message: Dict[str, Any]):
+        if self._flush_task is not None and self._flush_task.done():
+            # Raise the error of the previous batch, if any.
+            self._flush_task.result()
+            self._flush_task = None
+
+        self._buffer.append(message)
+        self._buffered_bytes += len(message.get("body", b""))
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+        if self._buffered_bytes > self._max_buffered_bytes:
+            await self._flush_task
+
+    async def close(self):
+        """Wait until all the messages are written to the client."""
+        if self._flush_task is not None:
+            await self._flush_task
+
+    async def _flush(self):
+        while self._buffer:
+            messages = self._buffer
+            self._buffer = []
+            self._buffered_bytes = 0
+            if not await self._send_to_proxy(messages):
+                raise RayServeException(
+                    "The client disconnected before the response was complete."
+                )
+
+    async def _send_to_proxy(self, messages: List[Dict[str, Any]]) -> bool:
+        proxy = _get_proxy_actor(self._proxy_actor_name)
+        try:
+            return await proxy.send_response_messages.remote(self._stream_id, messages)
+        except RayActorError:
+            # The proxy was replaced by a new actor with the same name, e.g. after
+            # failing its health checks. Drop the handle of the dead actor and send
+            # the messages to the new one.
+            _proxy_actors.pop(self._proxy_actor_name, None)
+            proxy = _get_proxy_actor(self._proxy_actor_name)
+            return await proxy.send_response_messages.remote(self._stream_id, messages)
+
+
+# The stream of the response to the HTTP request being handled, if it can be
+# streamed.
+_current_response_stream: ContextVar[Optional[ASGIResponseStream]] = ContextVar(
+    "serve_current_response_stream", default=None
+)
+
+
 class RawASGIResponse(ASGIApp):
     """Implement a raw ASGI response interface.
 
@@ -146,14 +270,34 @@ class RawASGIResponse(ASGIApp):
 class ASGIHTTPSender(Send):
     """Implement the interface for ASGI sender to save data from varisous
     asgi response type (fastapi, starlette, etc.)
+
+    If the response of the current request can be streamed, the messages are
+    sent to the HTTP proxy as they come once a body chunk with `more_body` is
+    sent, and the built response only holds the messages before it.
     """
 
     def __init__(self) -> None:
         self.messages = []
+        self._response_stream = _current_response_stream.get()
+        self._streaming = False
 
     async def __call__(self, message):
         assert message["type"] in ("http.response.start", "http.response.body")
-        self.messages.append(message)
+        if (
+            not self._streaming
+            and self._response_stream is not None
+            and message["type"] == "http.response.body"
+            and message.get("more_body", False)
+        ):
+            self._streaming = True
+            for buffered_message in self.messages:
+                await self._response_stream.send(buffered_message)
+            self.messages = []
+
+        if self._streaming:
+            await self._response_stream.send(message)
+        else:
+            self.messages.append(message)
 
     def build_asgi_response(self) -> RawASGIResponse:
         return RawASGIResponse(self.messages)
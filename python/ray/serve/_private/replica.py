@@ -30,7 +30,7 @@ from ray.serve._private.constants import (
 )
 from ray.serve.deployment import Deployment
 from ray.serve.exceptions import RayServeException
-from ray.serve._private.http_util import ASGIHTTPSender
+from ray.serve._private.http_util import ASGIHTTPSender, _current_response_stream
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 from ray.serve._private.router import Query, RequestMetadata
 from ray.serve._private.utils import (
@@ -406,7 +406,15 @@ class RayServeReplica:
             return self.callable
         return getattr(self.callable, method_name)
 
-    async def ensure_serializable_response(self, response: Any) -> Any:
+    async def ensure_serializable_response(
+        self, response: Any, is_http_request: bool = False
+    ) -> Any:
+        if is_http_request and (
+            inspect.isgenerator(response) or inspect.isasyncgen(response)
+        ):
+            # Stream the chunks yielded by generators to HTTP clients.
+            response = starlette.responses.StreamingResponse(response)
+
         if isinstance(response, starlette.responses.StreamingResponse):
 
             async def mock_receive():
@@ -432,7 +440,9 @@ class RayServeReplica:
             extra={"log_to_stderr": False},
         )
 
-        args, kwargs = parse_request_item(request_item)
+        args, kwargs, response_stream = parse_request_item(request_item)
+        # Let the ASGI senders stream the response to the HTTP proxy.
+        response_stream_token = _current_response_stream.set(response_stream)
 
         method_to_call = None
         success = True
@@ -456,7 +466,13 @@ class RayServeReplica:
                     # call with non-empty args
                     result = await method_to_call(*args, **kwargs)
 
-            result = await self.ensure_serializable_response(result)
+            result = await self.ensure_serializable_response(
+                result, is_http_request=request_item.metadata.http_arg_is_pickled
+            )
+            if response_stream is not None:
+                # Only return once the streamed messages are written, so the
+                # HTTP proxy gets the result after them.
+                await response_stream.close()
             self.request_counter.inc(tags={"route": request_item.metadata.route})
         except Exception as e:
             logger.exception(f"Request failed due to {type(e).__name__}:")
@@ -471,6 +487,8 @@ class RayServeReplica:
                 function_name = method_to_call.__name__
             result = wrap_to_ray_error(function_name, e)
             self.error_counter.inc(tags={"route": request_item.metadata.route})
+        finally:
+            _current_response_stream.reset(response_stream_token)
 
         return result, success
 
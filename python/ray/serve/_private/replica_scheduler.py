@@ -0,0 +1,154 @@
+from abc import ABCMeta, abstractmethod
+import itertools
+import random
+from typing import Dict, List, Optional
+
+from ray.serve.config import ReplicaSchedulingPolicy
+from ray.serve._private.common import RunningReplicaInfo
+
+#: Weight of the latest latency of a replica in its exponentially weighted
+#: moving average.
+LATENCY_EWMA_ALPHA = 0.3
+
+
+class ReplicaScheduler:
+    """Defines the interface for choosing the replica to assign a query to.
+
+    A ReplicaSet owns one scheduler, and tells it about the current replicas
+    and the completed queries. To add a new scheduling policy, a class should
+    be defined that provides this interface and be registered in
+    `create_replica_scheduler()`.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        """Called when the replicas of the deployment are updated."""
+        pass
+
+    @abstractmethod
+    def choose_replica(
+        self, num_in_flight: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        """Choose the replica to assign a query to.
+
+        Arguments:
+            num_in_flight: The number of queries in flight to each replica.
+
+        Returns:
+            The chosen replica, or None if all replicas are at their
+            max_concurrent_queries.
+        """
+        pass
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float) -> None:
+        """Called when a query assigned to the replica is completed."""
+        pass
+
+
+class RoundRobinReplicaScheduler(ReplicaScheduler):
+    """Round-robins over the replicas, skipping overloaded ones.
+
+    The replicas are shuffled on each update to avoid multiple handles sending
+    requests in the same order.
+    """
+
+    def __init__(self):
+        self._replica_iterator = itertools.cycle([])
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        replicas = list(replicas)
+        random.shuffle(replicas)
+        self._replica_iterator = itertools.cycle(replicas)
+
+    def choose_replica(
+        self, num_in_flight: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        for _ in range(len(num_in_flight)):
+            replica = next(self._replica_iterator)
+            if num_in_flight[replica] < replica.max_concurrent_queries:
+                return replica
+        return None
+
+
+class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
+    """Samples two replicas that aren't overloaded and chooses the one with the
+    lower expected latency.
+
+    The expected latency of a replica is the number of queries in flight to it,
+    plus the new one, times the exponentially weighted moving average of its
+    latency. Replicas without a latency yet are assumed to have the average one.
+    If there are replicas on the node of the caller, one of the two samples is
+    one of them, and it's chosen on ties.
+    """
+
+    def __init__(self, node_id: Optional[str] = None):
+        self._node_id = node_id
+        self._latency_ewma_s: Dict[str, float] = {}
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        replica_tags = {replica.replica_tag for replica in replicas}
+        for replica_tag in list(self._latency_ewma_s):
+            if replica_tag not in replica_tags:
+                del self._latency_ewma_s[replica_tag]
+
+    def choose_replica(
+        self, num_in_flight: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        available = [
+            replica
+            for replica, num in num_in_flight.items()
+            if num < replica.max_concurrent_queries
+        ]
+        if len(available) <= 1:
+            return available[0] if available else None
+
+        local = [
+            replica
+            for replica in available
+            if self._node_id is not None and replica.node_id == self._node_id
+        ]
+        if local:
+            first = random.choice(local)
+            second = random.choice([r for r in available if r is not first])
+        else:
+            first, second = random.sample(available, 2)
+
+        default_latency_s = (
+            sum(self._latency_ewma_s.values()) / len(self._latency_ewma_s)
+            if self._latency_ewma_s
+            else 1.0
+        )
+
+        def expected_latency_s(replica: RunningReplicaInfo) -> float:
+            latency_s = self._latency_ewma_s.get(replica.replica_tag, default_latency_s)
+            return (num_in_flight[replica] + 1) * latency_s
+
+        if expected_latency_s(second) < expected_latency_s(first):
+            return second
+        return first
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float) -> None:
+        ewma_s = self._latency_ewma_s.get(replica.replica_tag)
+        if ewma_s is None:
+            self._latency_ewma_s[replica.replica_tag] = latency_s
+        else:
+            self._latency_ewma_s[replica.replica_tag] = (
+                LATENCY_EWMA_ALPHA * latency_s + (1 - LATENCY_EWMA_ALPHA) * ewma_s
+            )
+
+
+def create_replica_scheduler(
+    policy: ReplicaSchedulingPolicy, node_id: Optional[str] = None
+) -> ReplicaScheduler:
+    """Create the scheduler implementing the given policy.
+
+    Arguments:
+        policy: The replica scheduling policy of the deployment.
+        node_id: The node id of the caller, which replicas on the same node
+            are preferred for.
+    """
+    if policy == ReplicaSchedulingPolicy.PowerOfTwoChoices:
+        return PowerOfTwoChoicesReplicaScheduler(node_id)
+    return RoundRobinReplicaScheduler()
@@ -1,11 +1,11 @@
 import asyncio
+from collections import deque
 from dataclasses import dataclass
-import itertools
+from functools import partial
 import logging
 import pickle
-import random
-import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Deque, Dict, List, Optional
 
 import ray
 from ray.actor import ActorHandle
@@ -13,9 +13,12 @@ from ray.dag.py_obj_scanner import _PyObjScanner
 from ray.exceptions import RayActorError, RayTaskError
 from ray.util import metrics
 
+from ray.serve.config import ReplicaSchedulingPolicy
 from ray.serve._private.common import RunningReplicaInfo
 from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.http_util import HTTPRequestWrapper
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
+from ray.serve._private.replica_scheduler import create_replica_scheduler
 from ray.serve._private.utils import (
     compute_iterable_delta,
     JavaActorHandleProxy,
@@ -33,8 +36,9 @@ class RequestMetadata:
     endpoint: str
     call_method: str = "__call__"
 
-    # This flag will be set to true if the input argument is manually pickled
-    # and it needs to be deserialized by the replica.
+    # This flag will be set to true if the input argument is an
+    # HTTPRequestWrapper sent by the HTTP proxy, that the replica needs to
+    # build the starlette request from.
     http_arg_is_pickled: bool = False
 
     # HTTP route path of the request.
@@ -75,24 +79,18 @@ class ReplicaSet:
     ):
         self.deployment_name = deployment_name
         self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
-        # The iterator used for load balancing among replicas. Using itertools
-        # cycle, we implements a round-robin policy, skipping overloaded
-        # replicas.
-        # NOTE(simon): We can make this more pluggable and consider different
-        # policies like: min load, pick min of two replicas, pick replicas on
-        # the same node.
-        self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
-
-        # Used to unblock this replica set waiting for free replicas. A newly
-        # added replica or updated max_concurrent_queries value means the
-        # query that waits on a free replica might be unblocked on.
-
-        # Python 3.8 has deprecated the 'loop' parameter, and Python 3.10 has
-        # removed it alltogether. Call accordingly.
-        if sys.version_info.major >= 3 and sys.version_info.minor >= 10:
-            self.config_updated_event = asyncio.Event()
-        else:
-            self.config_updated_event = asyncio.Event(loop=event_loop)
+        # The scheduler used for load balancing among replicas. The policy is
+        # set by the deployment config of the replicas.
+        self._node_id = ray.get_runtime_context().get_node_id()
+        self._replica_scheduling_policy = ReplicaSchedulingPolicy.RoundRobin
+        self._replica_scheduler = create_replica_scheduler(
+            self._replica_scheduling_policy, self._node_id
+        )
+
+        # The queries waiting for a free replica, in FIFO order. A completed
+        # query frees a slot for the first one, while a newly added replica or
+        # updated max_concurrent_queries value might unblock all of them.
+        self._free_replica_waiters: Deque[asyncio.Future] = deque()
 
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
@@ -107,16 +105,17 @@ class ReplicaSet:
             {"deployment": self.deployment_name}
         )
 
-    def _reset_replica_iterator(self):
-        """Reset the iterator used to load balance replicas.
+    def _update_replica_scheduler(self):
+        """Update the scheduler used to load balance replicas.
 
         This call is expected to be called after the replica membership has
-        been updated. It will shuffle the replicas randomly to avoid multiple
-        handle sending requests in the same order.
+        been updated.
         """
-        replicas = list(self.in_flight_queries.keys())
-        random.shuffle(replicas)
-        self.replica_iterator = itertools.cycle(replicas)
+        self._replica_scheduler.update_replicas(list(self.in_flight_queries.keys()))
+
+    def _remove_replica(self, replica: RunningReplicaInfo):
+        # The completion callbacks of its queries in flight become no-ops.
+        self.in_flight_queries.pop(replica, None)
 
     def update_running_replicas(self, running_replicas: List[RunningReplicaInfo]):
         added, removed, _ = compute_iterable_delta(
@@ -130,99 +129,143 @@ class ReplicaSet:
             # Delete it directly because shutdown is processed by controller.
             # Replicas might already been deleted due to early detection of
             # actor error.
-            self.in_flight_queries.pop(removed_replica, None)
+            self._remove_replica(removed_replica)
+
+        if (
+            len(running_replicas) > 0
+            and running_replicas[0].replica_scheduling_policy
+            != self._replica_scheduling_policy
+        ):
+            self._replica_scheduling_policy = running_replicas[
+                0
+            ].replica_scheduling_policy
+            logger.debug(
+                f"ReplicaSet: using {self._replica_scheduling_policy} scheduling."
+            )
+            self._replica_scheduler = create_replica_scheduler(
+                self._replica_scheduling_policy, self._node_id
+            )
 
         if len(added) > 0 or len(removed) > 0:
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
-            self._reset_replica_iterator()
-            self.config_updated_event.set()
+            self._update_replica_scheduler()
+            self._notify_free_replica_waiters(wake_all=True)
 
     def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
         """
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
-            if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
-                # This replica is overloaded, try next one
-                continue
+        replica = self._replica_scheduler.choose_replica(
+            {
+                replica: len(in_flight_queries)
+                for replica, in_flight_queries in self.in_flight_queries.items()
+            }
+        )
+        if replica is None:
+            # All replicas are overloaded.
+            return None
 
+        logger.debug(
+            f"Assigned query {query.metadata.request_id} "
+            f"to replica {replica.replica_tag}."
+        )
+        if replica.is_cross_language:
+            # Handling requests for Java replica
+            arg = query.args[0]
+            if query.metadata.http_arg_is_pickled:
+                http_input: HTTPRequestWrapper = arg
+                query_string = http_input.scope.get("query_string")
+                if query_string:
+                    arg = query_string.decode().split("=", 1)[1]
+                elif http_input.body:
+                    arg = bytes(http_input.body).decode()
+            user_ref = JavaActorHandleProxy(replica.actor_handle).handle_request.remote(
+                RequestMetadataProto(
+                    request_id=query.metadata.request_id,
+                    endpoint=query.metadata.endpoint,
+                    call_method=query.metadata.call_method
+                    if query.metadata.call_method != "__call__"
+                    else "call",
+                ).SerializeToString(),
+                [arg],
+            )
+            tracker_ref = user_ref
+        else:
+            # Directly passing args because it might contain an ObjectRef.
+            tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
+                pickle.dumps(query.metadata), *query.args, **query.kwargs
+            )
+        self.in_flight_queries[replica].add(tracker_ref)
+        # Track the completion with a callback run by the event loop, instead of
+        # polling all the queries in flight on each assignment.
+        asyncio.wrap_future(tracker_ref.future()).add_done_callback(
+            partial(self._on_query_completed, replica, tracker_ref, time.time())
+        )
+        return user_ref
+
+    def _on_query_completed(
+        self,
+        replica: RunningReplicaInfo,
+        tracker_ref: ray.ObjectRef,
+        start_time: float,
+        future: asyncio.Future,
+    ):
+        replica_in_flight_queries = self.in_flight_queries.get(replica)
+        if (
+            replica_in_flight_queries is None
+            or tracker_ref not in replica_in_flight_queries
+        ):
+            # The replica was removed while the query was in flight.
+            return
+        replica_in_flight_queries.remove(tracker_ref)
+        self._replica_scheduler.on_query_completed(replica, time.time() - start_time)
+
+        exc = None if future.cancelled() else future.exception()
+        if isinstance(exc, RayActorError):
             logger.debug(
-                f"Assigned query {query.metadata.request_id} "
-                f"to replica {replica.replica_tag}."
+                f"Removing {replica.replica_tag} from replica set "
+                "because the actor exited."
             )
-            if replica.is_cross_language:
-                # Handling requests for Java replica
-                arg = query.args[0]
-                if query.metadata.http_arg_is_pickled:
-                    assert isinstance(arg, bytes)
-                    loaded_http_input = pickle.loads(arg)
-                    query_string = loaded_http_input.scope.get("query_string")
-                    if query_string:
-                        arg = query_string.decode().split("=", 1)[1]
-                    elif loaded_http_input.body:
-                        arg = loaded_http_input.body.decode()
-                user_ref = JavaActorHandleProxy(
-                    replica.actor_handle
-                ).handle_request.remote(
-                    RequestMetadataProto(
-                        request_id=query.metadata.request_id,
-                        endpoint=query.metadata.endpoint,
-                        call_method=query.metadata.call_method
-                        if query.metadata.call_method != "__call__"
-                        else "call",
-                    ).SerializeToString(),
-                    [arg],
-                )
-                self.in_flight_queries[replica].add(user_ref)
-            else:
-                # Directly passing args because it might contain an ObjectRef.
-                tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
-                    pickle.dumps(query.metadata), *query.args, **query.kwargs
-                )
-                self.in_flight_queries[replica].add(tracker_ref)
-            return user_ref
-        return None
-
-    @property
-    def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
-
-    def _drain_completed_object_refs(self) -> int:
-        refs = self._all_query_refs
-        # NOTE(simon): even though the timeout is 0, a large number of refs can still
-        # cause some blocking delay in the event loop. Consider moving this to async?
-        done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
-        replicas_to_remove = []
-        for replica_info, replica_in_flight_queries in self.in_flight_queries.items():
-            completed_queries = replica_in_flight_queries.intersection(done)
-            if len(completed_queries):
-                try:
-                    # NOTE(simon): this ray.get call should be cheap because all these
-                    # refs are ready as indicated by previous `ray.wait` call.
-                    ray.get(list(completed_queries))
-                except RayActorError:
-                    logger.debug(
-                        f"Removing {replica_info.replica_tag} from replica set "
-                        "because the actor exited."
-                    )
-                    replicas_to_remove.append(replica_info)
-                except RayTaskError:
-                    # Ignore application error.
-                    pass
-                except Exception:
-                    logger.exception(
-                        "Handle received unexpected error when processing request."
-                    )
-
-                replica_in_flight_queries.difference_update(completed_queries)
-
-        if len(replicas_to_remove) > 0:
-            for replica_info in replicas_to_remove:
-                self.in_flight_queries.pop(replica_info, None)
-            self._reset_replica_iterator()
-
-        return len(done)
+            self._remove_replica(replica)
+            self._update_replica_scheduler()
+            return
+        elif exc is not None and not isinstance(exc, RayTaskError):
+            # RayTaskError is an application error, which is ignored.
+            logger.error(
+                "Handle received unexpected error when processing request.",
+                exc_info=exc,
+            )
+        self._notify_free_replica_waiters()
+
+    def _notify_free_replica_waiters(self, wake_all: bool = False):
+        while self._free_replica_waiters:
+            waiter = self._free_replica_waiters.popleft()
+            if waiter.done():
+                # The waiting query was cancelled.
+                continue
+            waiter.set_result(None)
+            if not wake_all:
+                break
+
+    async def _wait_for_free_replica(self, retry: bool):
+        """Wait until a query completes or the replicas are updated.
+
+        Arguments:
+            retry: Whether the query was already woken up but failed to be
+                assigned, in which case it keeps its place in the queue.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        if retry:
+            self._free_replica_waiters.appendleft(waiter)
+        else:
+            self._free_replica_waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Hand the free slot this query was woken up for to the next one.
+                self._notify_free_replica_waiters()
+            raise
 
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
@@ -240,25 +283,16 @@ class ReplicaSet:
         )
         await query.resolve_async_tasks()
         assigned_ref = self._try_assign_replica(query)
+        retry = False
         while assigned_ref is None:  # Can't assign a replica right now.
+            # All replicas are busy, wait for a query to complete or the
+            # config to be updated.
             logger.debug(
-                "Failed to assign a replica for " f"query {query.metadata.request_id}"
+                "Failed to assign a replica for "
+                f"query {query.metadata.request_id}, waiting for a free replica."
             )
-            # Maybe there exists a free replica, we just need to refresh our
-            # query tracker.
-            num_finished = self._drain_completed_object_refs()
-            # All replicas are really busy, wait for a query to complete or the
-            # config to be updated.
-            if num_finished == 0:
-                logger.debug("All replicas are busy, waiting for a free replica.")
-                await asyncio.wait(
-                    self._all_query_refs + [self.config_updated_event.wait()],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if self.config_updated_event.is_set():
-                    self.config_updated_event.clear()
-            # We are pretty sure a free replica is ready now, let's recurse and
-            # assign this query a replica.
+            await self._wait_for_free_replica(retry)
+            retry = True
             assigned_ref = self._try_assign_replica(query)
         self.num_queued_queries -= 1
         self.num_queued_queries_gauge.set(
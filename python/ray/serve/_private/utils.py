@@ -2,14 +2,13 @@ import copy
 import importlib
 import inspect
 import os
-import pickle
 import random
 import string
 import time
 import traceback
 from enum import Enum
 from functools import wraps
-from typing import Dict, Iterable, List, Tuple, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import fastapi.encoders
 import numpy as np
@@ -22,7 +21,11 @@ import ray.util.serialization_addons
 from ray.actor import ActorHandle
 from ray.exceptions import RayTaskError
 from ray.serve._private.constants import HTTP_PROXY_TIMEOUT, RAY_GCS_RPC_TIMEOUT_S
-from ray.serve._private.http_util import HTTPRequestWrapper, build_starlette_request
+from ray.serve._private.http_util import (
+    ASGIResponseStream,
+    HTTPRequestWrapper,
+    build_starlette_request,
+)
 from ray.util.serialization import StandaloneSerializationContext
 from ray._raylet import MessagePackSerializer
 from ray._private.usage.usage_lib import TagKey, record_extra_usage_tag
@@ -62,15 +65,28 @@ T = TypeVar("T")
 Default = Union[DEFAULT, T]
 
 
-def parse_request_item(request_item):
+def parse_request_item(
+    request_item,
+) -> Tuple[Tuple[Any], Dict[str, Any], Optional[ASGIResponseStream]]:
+    """Returns the args and kwargs to call the replica with, and the stream to
+    send the response to if it's an HTTP request whose response can be streamed.
+    """
     if len(request_item.args) == 1:
         arg = request_item.args[0]
         if request_item.metadata.http_arg_is_pickled:
-            assert isinstance(arg, bytes)
-            arg: HTTPRequestWrapper = pickle.loads(arg)
-            return (build_starlette_request(arg.scope, arg.body),), {}
-
-    return request_item.args, request_item.kwargs
+            assert isinstance(arg, HTTPRequestWrapper)
+            response_stream = None
+            if arg.response_stream_id is not None:
+                response_stream = ASGIResponseStream(
+                    arg.proxy_actor_name, arg.response_stream_id
+                )
+            return (
+                (build_starlette_request(arg.scope, arg.body),),
+                {},
+                response_stream,
+            )
+
+    return request_item.args, request_item.kwargs, None
 
 
 class _ServeCustomEncoders:
@@ -280,6 +280,7 @@ def deployment(
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
     health_check_period_s: Default[float] = DEFAULT.VALUE,
     health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+    replica_scheduling_policy: Default[str] = DEFAULT.VALUE,
     is_driver_deployment: Optional[bool] = DEFAULT.VALUE,
 ) -> Callable[[Callable], Deployment]:
     """Decorator that converts a Python class to a `Deployment`.
@@ -327,6 +328,12 @@ def deployment(
             no more work to be done before shutting down.
         graceful_shutdown_timeout_s: Duration that a replica can be gracefully shutting
             down before being forcefully killed.
+        replica_scheduling_policy: How handles choose the replica to send each
+            request to. "RoundRobin" (the default) round-robins over the replicas
+            with fewer than `max_concurrent_queries` requests in flight.
+            "PowerOfTwoChoices" samples two of them and chooses the one with fewer
+            requests in flight weighted by its recent latency, preferring replicas
+            on the same node as the caller.
         is_driver_deployment: [EXPERIMENTAL] when set, exactly one replica of this
             deployment runs on every node (like a daemon set).
 
@@ -376,6 +383,7 @@ def deployment(
         graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
         health_check_period_s=health_check_period_s,
         health_check_timeout_s=health_check_timeout_s,
+        replica_scheduling_policy=replica_scheduling_policy,
     )
     config.user_configured_option_names = set(user_configured_option_names)
 
@@ -1,14 +1,27 @@
 import asyncio
 from functools import wraps
 from inspect import iscoroutinefunction
+import math
 import time
-from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TypeVar
-from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    overload,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from dataclasses import dataclass, field
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
 from ray._private.utils import get_or_create_event_loop
+from ray.serve import metrics
 from ray.serve.exceptions import RayServeException
+from ray.serve._private.constants import DEFAULT_LATENCY_BUCKET_MS
 from ray.util.annotations import PublicAPI
 
 
@@ -17,6 +30,7 @@ class _SingleRequest:
     self_arg: Optional[Any]
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueue_time: float = field(default_factory=time.time)
 
 
 def _batch_args_kwargs(
@@ -44,12 +58,145 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchingPolicy:
+    """Picks the batch size and wait timeout that maximize throughput while
+    keeping the p99 latency of requests under a target.
+
+    The execution time of a batch is modeled as `overhead + per_item * size`,
+    fitted online with exponentially weighted least squares, plus a margin of
+    P99_Z standard deviations of the residuals. The largest batch size whose
+    predicted p99 execution time fits in the latency budget is chosen, and the
+    rest of the budget is left to wait for the batch to fill, up to
+    `max_wait_timeout_s`. The budget is the target, scaled down while the
+    observed p99 latency of requests exceeds it (e.g. when requests queue up
+    for a free batch slot), and back up while it doesn't.
+    """
+
+    #: Weight of the previous observations when a new one is recorded.
+    DECAY = 0.98
+    #: Number of standard deviations of the p99 of a normal distribution.
+    P99_Z = 2.33
+    #: Effective number of batches to observe before adapting.
+    MIN_SAMPLES = 5
+    #: Number of request latencies the observed p99 latency is computed over.
+    LATENCY_WINDOW = 100
+    #: Multipliers of the budget when the observed p99 latency is over and
+    #: under the target.
+    BACKOFF = 0.8
+    RECOVERY = 1.05
+    MIN_BUDGET_SCALE = 0.1
+
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_wait_timeout_s: float,
+        target_p99_latency_s: float,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait_timeout_s = max_wait_timeout_s
+        self.target_p99_latency_s = target_p99_latency_s
+        self.budget_scale = 1.0
+
+        # Exponentially weighted sums of the batch sizes (x) and execution
+        # times (y), and of the squared residuals of the fit.
+        self._n = 0.0
+        self._sx = 0.0
+        self._sy = 0.0
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self._residual_sq = 0.0
+        self._latencies_s: List[float] = []
+
+        self.batch_size = max_batch_size
+        self.wait_timeout_s = min(max_wait_timeout_s, target_p99_latency_s / 2)
+
+    def _fit(self) -> Optional[Tuple[float, float]]:
+        """Returns the overhead and per item execution time, if there are
+        enough observations."""
+        if self._n < self.MIN_SAMPLES:
+            return None
+        denominator = self._n * self._sxx - self._sx * self._sx
+        if denominator > 1e-9 * self._n * self._sxx:
+            per_item = max(
+                0.0, (self._n * self._sxy - self._sx * self._sy) / denominator
+            )
+            overhead = max(0.0, (self._sy - per_item * self._sx) / self._n)
+        else:
+            # All the batches had the same size, assume there's no overhead.
+            per_item = self._sy / self._sx
+            overhead = 0.0
+        return overhead, per_item
+
+    def predict_execution_time_s(self, batch_size: int) -> Optional[float]:
+        """The predicted p99 execution time of a batch, if it can be predicted
+        yet."""
+        fit = self._fit()
+        if fit is None:
+            return None
+        overhead, per_item = fit
+        std = math.sqrt(self._residual_sq / self._n)
+        return overhead + per_item * batch_size + self.P99_Z * std
+
+    def record_batch(self, batch_size: int, execution_time_s: float):
+        fit = self._fit()
+        residual = 0.0
+        if fit is not None:
+            overhead, per_item = fit
+            residual = execution_time_s - (overhead + per_item * batch_size)
+
+        self._n = self.DECAY * self._n + 1
+        self._sx = self.DECAY * self._sx + batch_size
+        self._sy = self.DECAY * self._sy + execution_time_s
+        self._sxx = self.DECAY * self._sxx + batch_size * batch_size
+        self._sxy = self.DECAY * self._sxy + batch_size * execution_time_s
+        self._residual_sq = self.DECAY * self._residual_sq + residual * residual
+        self._update()
+
+    def record_request(self, latency_s: float):
+        self._latencies_s.append(latency_s)
+        if len(self._latencies_s) < self.LATENCY_WINDOW:
+            return
+
+        latencies_s = sorted(self._latencies_s)
+        self._latencies_s = []
+        p99_latency_s = latencies_s[int(0.99 * (len(latencies_s) - 1))]
+        if p99_latency_s > self.target_p99_latency_s:
+            self.budget_scale = max(
+                self.MIN_BUDGET_SCALE, self.budget_scale * self.BACKOFF
+            )
+        else:
+            self.budget_scale = min(1.0, self.budget_scale * self.RECOVERY)
+        self._update()
+
+    def _update(self):
+        budget_s = self.target_p99_latency_s * self.budget_scale
+        if self.predict_execution_time_s(1) is None:
+            self.wait_timeout_s = min(self.max_wait_timeout_s, budget_s / 2)
+            return
+
+        # The execution time increases with the batch size.
+        low, high = 1, self.max_batch_size
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.predict_execution_time_s(mid) <= budget_s:
+                low = mid
+            else:
+                high = mid - 1
+        self.batch_size = low
+        self.wait_timeout_s = min(
+            self.max_wait_timeout_s,
+            max(0.0, budget_s - self.predict_execution_time_s(low)),
+        )
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        max_concurrent_batches: int = 1,
+        target_p99_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -66,36 +213,108 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            max_concurrent_batches: max number of batches handle_batch_func
+                runs on at the same time.
+            target_p99_latency_s: if set, the batch size and timeout are
+                adapted to maximize throughput while keeping the p99 latency
+                of requests under it, up to max_batch_size and timeout_s.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
+        self.max_concurrent_batches = max_concurrent_batches
+        self.adaptive_policy: Optional[_AdaptiveBatchingPolicy] = None
+        if target_p99_latency_s is not None:
+            self.adaptive_policy = _AdaptiveBatchingPolicy(
+                max_batch_size, timeout_s, target_p99_latency_s
+            )
+        self._running_batches: Set[asyncio.Task] = set()
 
         self._handle_batch_task = None
         if handle_batch_func is not None:
+            self._init_metrics(handle_batch_func.__name__)
             self._handle_batch_task = get_or_create_event_loop().create_task(
                 self._handle_batches(handle_batch_func)
             )
 
+    def _init_metrics(self, function_name: str):
+        tags = {"function": function_name}
+        self._batch_size_gauge = metrics.Gauge(
+            "serve_batch_target_size",
+            description="The size of the batches the batch queue waits for.",
+            tag_keys=("function",),
+        )
+        self._batch_size_gauge.set_default_tags(tags)
+        self._wait_timeout_gauge = metrics.Gauge(
+            "serve_batch_wait_timeout_s",
+            description="The max time the batch queue waits for a full batch.",
+            tag_keys=("function",),
+        )
+        self._wait_timeout_gauge.set_default_tags(tags)
+        self._queue_length_gauge = metrics.Gauge(
+            "serve_batch_queue_length",
+            description="The number of requests waiting in the batch queue.",
+            tag_keys=("function",),
+        )
+        self._queue_length_gauge.set_default_tags(tags)
+        self._running_batches_gauge = metrics.Gauge(
+            "serve_batch_running_batches",
+            description="The number of batches being executed.",
+            tag_keys=("function",),
+        )
+        self._running_batches_gauge.set_default_tags(tags)
+        self._batch_execution_time_histogram = metrics.Histogram(
+            "serve_batch_execution_time_ms",
+            description="The time it takes to execute a batch.",
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("function",),
+        )
+        self._batch_execution_time_histogram.set_default_tags(tags)
+        self._request_latency_histogram = metrics.Histogram(
+            "serve_batch_request_latency_ms",
+            description=(
+                "The time from a request being queued to its batch being executed."
+            ),
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("function",),
+        )
+        self._request_latency_histogram.set_default_tags(tags)
+
+    @property
+    def batch_size(self) -> int:
+        """The size of the batches to wait for."""
+        if self.adaptive_policy is not None:
+            return self.adaptive_policy.batch_size
+        return self.max_batch_size
+
+    @property
+    def batch_wait_timeout_s(self) -> float:
+        """The max time to wait for a full batch."""
+        if self.adaptive_policy is not None:
+            return self.adaptive_policy.wait_timeout_s
+        return self.timeout_s
+
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
         self.queue.put_nowait(request)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self.batch_size:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
-        """Wait for batch respecting self.max_batch_size and self.timeout_s.
+        """Wait for batch respecting self.batch_size and
+        self.batch_wait_timeout_s.
 
-        Returns a batch of up to self.max_batch_size items, waiting for up
-        to self.timeout_s for a full batch. After the timeout, returns as many
-        items as are ready.
+        Returns a batch of up to self.batch_size items, waiting for up
+        to self.batch_wait_timeout_s for a full batch. After the timeout,
+        returns as many items as are ready.
 
         Always returns a batch with at least one item - will block
         indefinitely until an item comes in.
         """
-        curr_timeout = self.timeout_s
+        batch_size = self.batch_size
+        curr_timeout = self.batch_wait_timeout_s
         batch = []
         while len(batch) == 0:
             loop_start = time.time()
@@ -112,16 +331,13 @@ class _BatchQueue:
                 except asyncio.TimeoutError:
                     pass
 
-            # Pull up to the max_batch_size requests off the queue.
-            while len(batch) < self.max_batch_size and not self.queue.empty():
+            # Pull up to the batch_size requests off the queue.
+            while len(batch) < batch_size and not self.queue.empty():
                 batch.append(self.queue.get_nowait())
 
-            # Reset the event if there are fewer than max_batch_size requests
+            # Reset the event if there are fewer than batch_size requests
             # in the queue.
-            if (
-                self.queue.qsize() < self.max_batch_size
-                and self.full_batch_event.is_set()
-            ):
+            if self.queue.qsize() < batch_size and self.full_batch_event.is_set():
                 self.full_batch_event.clear()
 
             # Adjust the timeout based on the time spent in this iteration.
@@ -130,33 +346,66 @@ class _BatchQueue:
         return batch
 
     async def _handle_batches(self, func):
+        # Only wait for a batch once it can be executed, so that the requests
+        # queued meanwhile make up larger batches.
+        batch_slots = asyncio.Semaphore(self.max_concurrent_batches)
         while True:
+            await batch_slots.acquire()
+            self._batch_size_gauge.set(self.batch_size)
+            self._wait_timeout_gauge.set(self.batch_wait_timeout_s)
             batch: List[_SingleRequest] = await self.wait_for_batch()
             assert len(batch) > 0
-            self_arg = batch[0].self_arg
-            args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
-            futures = [item.future for item in batch]
-
-            try:
-                # Method call.
-                if self_arg is not None:
-                    results = await func(self_arg, *args, **kwargs)
-                # Normal function call.
-                else:
-                    results = await func(*args, **kwargs)
-
-                if len(results) != len(batch):
-                    raise RayServeException(
-                        "Batched function doesn't preserve batch size. "
-                        f"The input list has length {len(batch)} but the "
-                        f"returned list has length {len(results)}."
-                    )
-
-                for i, result in enumerate(results):
-                    futures[i].set_result(result)
-            except Exception as e:
-                for future in futures:
-                    future.set_exception(e)
+            self._queue_length_gauge.set(self.queue.qsize())
+
+            task = get_or_create_event_loop().create_task(
+                self._handle_batch(func, batch)
+            )
+            self._running_batches.add(task)
+            self._running_batches_gauge.set(len(self._running_batches))
+
+            def on_batch_done(task: asyncio.Task):
+                self._running_batches.discard(task)
+                self._running_batches_gauge.set(len(self._running_batches))
+                batch_slots.release()
+
+            task.add_done_callback(on_batch_done)
+
+    async def _handle_batch(self, func, batch: List[_SingleRequest]):
+        self_arg = batch[0].self_arg
+        args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
+        futures = [item.future for item in batch]
+
+        start_time = time.time()
+        try:
+            # Method call.
+            if self_arg is not None:
+                results = await func(self_arg, *args, **kwargs)
+            # Normal function call.
+            else:
+                results = await func(*args, **kwargs)
+
+            if len(results) != len(batch):
+                raise RayServeException(
+                    "Batched function doesn't preserve batch size. "
+                    f"The input list has length {len(batch)} but the "
+                    f"returned list has length {len(results)}."
+                )
+
+            for i, result in enumerate(results):
+                futures[i].set_result(result)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+
+        end_time = time.time()
+        self._batch_execution_time_histogram.observe((end_time - start_time) * 1000.0)
+        if self.adaptive_policy is not None:
+            self.adaptive_policy.record_batch(len(batch), end_time - start_time)
+        for item in batch:
+            latency_s = end_time - item.enqueue_time
+            self._request_latency_histogram.observe(latency_s * 1000.0)
+            if self.adaptive_policy is not None:
+                self.adaptive_policy.record_request(latency_s)
 
     def __del__(self):
         if (
@@ -169,6 +418,8 @@ class _BatchQueue:
         # causes some errors when the process exits due to the asyncio loop
         # already being destroyed.
         self._handle_batch_task.cancel()
+        for task in self._running_batches:
+            task.cancel()
 
 
 def _extract_self_if_method_call(args: List[Any], func: Callable) -> Optional[object]:
@@ -210,7 +461,10 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: int = 10, batch_wait_timeout_s: float = 0.0
+    max_batch_size: int = 10,
+    batch_wait_timeout_s: float = 0.0,
+    max_concurrent_batches: int = 1,
+    target_p99_latency_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
@@ -220,6 +474,8 @@ def batch(
     _func: Optional[Callable] = None,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    max_concurrent_batches: int = 1,
+    target_p99_latency_s: Optional[float] = None,
 ):
     """Converts a function to asynchronously handle batches.
 
@@ -231,6 +487,12 @@ def batch(
     and executed asynchronously once there is a batch of `max_batch_size`
     or `batch_wait_timeout_s` has elapsed, whichever occurs first.
 
+    If `target_p99_latency_s` is set, the batch size and wait timeout are
+    adapted online instead: the execution time of batches is learned as a
+    function of their size, and the largest batches whose p99 latency meets
+    the target are used, up to `max_batch_size` and `batch_wait_timeout_s`.
+    The chosen values and the queue stats are exported as metrics.
+
     Example:
 
     .. code-block:: python
@@ -259,6 +521,10 @@ def batch(
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the current batch.
+        max_concurrent_batches: the maximum number of batches executed at
+            the same time, e.g. by async model servers. Defaults to 1.
+        target_p99_latency_s: the p99 latency target of requests, from
+            being queued to being executed, that enables adaptive batching.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -286,6 +552,19 @@ def batch(
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if not isinstance(max_concurrent_batches, int):
+        raise TypeError("max_concurrent_batches must be integer >= 1")
+
+    if max_concurrent_batches < 1:
+        raise ValueError("max_concurrent_batches must be an integer >= 1")
+
+    if target_p99_latency_s is not None:
+        if not isinstance(target_p99_latency_s, (float, int)):
+            raise TypeError("target_p99_latency_s must be a float > 0")
+
+        if target_p99_latency_s <= 0:
+            raise ValueError("target_p99_latency_s must be a float > 0")
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -308,7 +587,13 @@ def batch(
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size,
+                    batch_wait_timeout_s,
+                    _func,
+                    max_concurrent_batches=max_concurrent_batches,
+                    target_p99_latency_s=target_p99_latency_s,
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
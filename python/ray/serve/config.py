@@ -114,6 +114,21 @@ def _needs_pickle(deployment_language: DeploymentLanguage, is_cross_language: bo
         return False
 
 
+@PublicAPI(stability="alpha")
+class ReplicaSchedulingPolicy(str, Enum):
+    """Policy for choosing the replica to send each request of a deployment to.
+
+    RoundRobin: round-robin over the replicas, skipping the ones at
+        max_concurrent_queries.
+    PowerOfTwoChoices: sample two replicas and choose the one with the fewest
+        queries in flight weighted by its recent latency, preferring replicas on
+        the same node as the caller.
+    """
+
+    RoundRobin = "RoundRobin"
+    PowerOfTwoChoices = "PowerOfTwoChoices"
+
+
 @PublicAPI(stability="stable")
 class DeploymentConfig(BaseModel):
     """Configuration options for a deployment, to be set by the user.
@@ -138,6 +153,9 @@ class DeploymentConfig(BaseModel):
         health_check_timeout_s (Optional[float]):
             Timeout that the controller will wait for a response from the
             replica's health check before marking it unhealthy.
+        replica_scheduling_policy (Optional[ReplicaSchedulingPolicy]):
+            Policy that handles use to choose the replica to send each
+            request to. Defaults to RoundRobin.
         user_configured_option_names (Set[str]):
             The names of options manually configured by the user.
     """
@@ -174,6 +192,11 @@ class DeploymentConfig(BaseModel):
         default=None, update_type=DeploymentOptionUpdateType.LightWeight
     )
 
+    replica_scheduling_policy: ReplicaSchedulingPolicy = Field(
+        default=ReplicaSchedulingPolicy.RoundRobin,
+        update_type=DeploymentOptionUpdateType.NeedsReconfigure,
+    )
+
     # This flag is used to let replica know they are deplyed from
     # a different language.
     is_cross_language: bool = False
@@ -268,6 +291,9 @@ class DeploymentConfig(BaseModel):
         if "version" in data:
             if data["version"] == "":
                 data["version"] = None
+        if data.get("replica_scheduling_policy") == "":
+            # Not set by a client that doesn't know about the field.
+            del data["replica_scheduling_policy"]
         if "user_configured_option_names" in data:
             data["user_configured_option_names"] = set(
                 data["user_configured_option_names"]
@@ -12,7 +12,7 @@ from ray.serve._private.common import (
     ReplicaState,
     ServeDeployMode,
 )
-from ray.serve.config import DeploymentMode
+from ray.serve.config import DeploymentMode, ReplicaSchedulingPolicy
 from ray.serve._private.utils import DEFAULT, dict_keys_snake_to_camel_case
 from ray.util.annotations import DeveloperAPI, PublicAPI
 from ray.serve._private.constants import SERVE_DEFAULT_APP_NAME
@@ -227,6 +227,13 @@ class DeploymentSchema(
         ),
         gt=0,
     )
+    replica_scheduling_policy: ReplicaSchedulingPolicy = Field(
+        default=DEFAULT.VALUE,
+        description=(
+            "How handles choose the replica to send each request to: "
+            '"RoundRobin" or "PowerOfTwoChoices". Uses a default if null.'
+        ),
+    )
     ray_actor_options: RayActorOptionsSchema = Field(
         default=DEFAULT.VALUE, description="Options set for each replica actor."
     )
@@ -282,6 +289,7 @@ def _deployment_info_to_schema(name: str, info: DeploymentInfo) -> DeploymentSch
         graceful_shutdown_timeout_s=info.deployment_config.graceful_shutdown_timeout_s,
         health_check_period_s=info.deployment_config.health_check_period_s,
         health_check_timeout_s=info.deployment_config.health_check_timeout_s,
+        replica_scheduling_policy=info.deployment_config.replica_scheduling_policy,
         ray_actor_options=info.replica_config.ray_actor_options,
         is_driver_deployment=info.is_driver_deployment,
     )
@@ -127,6 +127,51 @@ def test_starlette_response(serve_instance):
     assert resp.status_code == 418
 
 
+def test_streaming_response_is_not_buffered(serve_instance):
+    signal = SignalActor.remote()
+
+    @serve.deployment
+    def streaming(_):
+        async def chunks():
+            yield "first"
+            await signal.wait.remote()
+            yield "second"
+
+        return starlette.responses.StreamingResponse(chunks())
+
+    serve.run(streaming.bind())
+    with requests.get("http://127.0.0.1:8000/", stream=True) as resp:
+        assert resp.status_code == 200
+        chunks = resp.iter_content(chunk_size=None, decode_unicode=True)
+        # The first chunk is received before the response is complete.
+        assert next(chunks) == "first"
+        ray.get(signal.send.remote())
+        assert "".join(chunks) == "second"
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_generator_response(serve_instance, use_async):
+    if use_async:
+
+        @serve.deployment
+        async def numbers(_):
+            for number in range(3):
+                yield str(number)
+                await asyncio.sleep(0.01)
+
+    else:
+
+        @serve.deployment
+        def numbers(_):
+            for number in range(3):
+                yield str(number)
+
+    serve.run(numbers.bind())
+    resp = requests.get("http://127.0.0.1:8000/")
+    assert resp.status_code == 200
+    assert resp.text == "012"
+
+
 @pytest.mark.parametrize("use_async", [False, True])
 def test_deploy_function_no_params(serve_instance, use_async):
     serve.start()
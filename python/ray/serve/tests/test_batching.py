@@ -1,10 +1,12 @@
 import asyncio
+import time
 
 import pytest
 
 import ray
 from ray import serve
 from ray._private.utils import get_or_create_event_loop
+from ray.serve.batching import _AdaptiveBatchingPolicy
 
 
 def test_batching(serve_instance):
@@ -132,6 +134,32 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    with pytest.raises(ValueError):
+
+        class ZeroConcurrentBatches:
+            @serve.batch(max_concurrent_batches=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroLatencyTarget:
+            @serve.batch(target_p99_latency_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonLatencyTarget:
+            @serve.batch(target_p99_latency_s="a")
+            async def method(self, requests):
+                pass
+
+    class AdaptiveBatch:
+        @serve.batch(max_concurrent_batches=2, target_p99_latency_s=0.1)
+        async def method(self, requests):
+            pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -291,6 +319,72 @@ async def test_batch_args_kwargs(mode, use_class):
     assert result == [("hi1", "hi2"), ("hi3", "hi4")]
 
 
+@pytest.mark.asyncio
+async def test_max_concurrent_batches():
+    num_running = 0
+    max_num_running = 0
+
+    @serve.batch(max_batch_size=2, batch_wait_timeout_s=0, max_concurrent_batches=2)
+    async def func(requests):
+        nonlocal num_running, max_num_running
+        num_running += 1
+        max_num_running = max(max_num_running, num_running)
+        await asyncio.sleep(0.5)
+        num_running -= 1
+        return requests
+
+    assert await asyncio.gather(*[func(i) for i in range(6)]) == list(range(6))
+    assert max_num_running == 2
+
+
+def test_adaptive_batching_policy():
+    policy = _AdaptiveBatchingPolicy(
+        max_batch_size=16, max_wait_timeout_s=0.1, target_p99_latency_s=0.06
+    )
+    # Until the execution time is learned, batches use up to half the target
+    # waiting.
+    assert policy.batch_size == 16
+    assert policy.wait_timeout_s == pytest.approx(0.03)
+
+    for i in range(20):
+        batch_size = 1 + i % 8
+        policy.record_batch(batch_size, 0.01 + 0.002 * batch_size)
+    assert policy.predict_execution_time_s(10) == pytest.approx(0.03, abs=1e-6)
+    # The largest batches take 42ms, and the rest of the target is left to
+    # wait for them.
+    assert policy.batch_size == 16
+    assert policy.wait_timeout_s == pytest.approx(0.018, abs=1e-6)
+
+    # With a tighter target, the batches are smaller and not waited for.
+    policy.target_p99_latency_s = 0.031
+    policy.record_batch(4, 0.018)
+    assert policy.batch_size == 10
+    assert policy.wait_timeout_s == pytest.approx(0.001, abs=1e-5)
+
+    # The batches are smaller while the observed p99 latency exceeds the target.
+    for _ in range(policy.LATENCY_WINDOW):
+        policy.record_request(0.05)
+    assert policy.budget_scale == pytest.approx(0.8)
+    assert policy.batch_size == 7
+    for _ in range(policy.LATENCY_WINDOW):
+        policy.record_request(0.01)
+    assert policy.budget_scale == pytest.approx(0.84)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batching_caps_wait_timeout():
+    @serve.batch(max_batch_size=8, batch_wait_timeout_s=1000, target_p99_latency_s=0.5)
+    async def func(requests):
+        await asyncio.sleep(0.001 * len(requests))
+        return requests
+
+    # The request is only held for part of the latency target, not for the whole
+    # batch_wait_timeout_s.
+    start = time.time()
+    assert await asyncio.wait_for(func("hi"), timeout=10) == "hi"
+    assert time.time() - start < 0.5
+
+
 if __name__ == "__main__":
     import sys
 
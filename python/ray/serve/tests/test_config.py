@@ -8,6 +8,7 @@ from ray.serve.config import (
     DeploymentMode,
     HTTPOptions,
     ReplicaConfig,
+    ReplicaSchedulingPolicy,
 )
 from ray.serve.config import AutoscalingConfig
 from ray.serve._private.utils import DEFAULT
@@ -70,6 +71,20 @@ class TestDeploymentConfig:
         # Test dynamic default for max_concurrent_queries.
         assert DeploymentConfig().max_concurrent_queries == 100
 
+        # Test replica_scheduling_policy validation.
+        assert (
+            DeploymentConfig().replica_scheduling_policy
+            == ReplicaSchedulingPolicy.RoundRobin
+        )
+        assert (
+            DeploymentConfig(
+                replica_scheduling_policy="PowerOfTwoChoices"
+            ).replica_scheduling_policy
+            == ReplicaSchedulingPolicy.PowerOfTwoChoices
+        )
+        with pytest.raises(ValidationError):
+            DeploymentConfig(replica_scheduling_policy="Random")
+
     def test_deployment_config_update(self):
         b = DeploymentConfig(num_replicas=1, max_concurrent_queries=1)
 
@@ -33,6 +33,7 @@ from ray.serve._private.constants import (
     DEFAULT_HEALTH_CHECK_PERIOD_S,
     DEFAULT_HEALTH_CHECK_TIMEOUT_S,
 )
+from ray.serve.config import ReplicaSchedulingPolicy
 from ray.serve._private.storage.kv_store import RayInternalKVStore
 from ray.serve._private.utils import get_random_letters
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
@@ -99,6 +100,10 @@ class MockReplicaActorWrapper:
     def max_concurrent_queries(self) -> int:
         return 100
 
+    @property
+    def replica_scheduling_policy(self) -> ReplicaSchedulingPolicy:
+        return ReplicaSchedulingPolicy.RoundRobin
+
     @property
     def node_id(self) -> Optional[str]:
         if isinstance(self._scheduling_strategy, NodeAffinitySchedulingStrategy):
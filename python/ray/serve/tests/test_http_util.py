@@ -0,0 +1,192 @@
+import asyncio
+import pickle
+from typing import List
+
+import pytest
+
+import ray
+from ray.serve._private.constants import SERVE_NAMESPACE
+from ray.serve._private.http_util import (
+    ASGIHTTPSender,
+    ASGIResponseStream,
+    HTTPRequestWrapper,
+    build_starlette_request,
+    _current_response_stream,
+    _proxy_actors,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@ray.remote(num_cpus=0)
+class FakeHTTPProxy:
+    def __init__(self):
+        self.batches = []
+        self.connected = True
+
+    async def send_response_messages(self, stream_id: str, messages: List) -> bool:
+        if not self.connected:
+            return False
+        self.batches.append((stream_id, messages))
+        return True
+
+    def get_batches(self):
+        return self.batches
+
+    def disconnect(self):
+        self.connected = False
+
+
+@pytest.fixture
+def proxy_actor():
+    ray.init(num_cpus=1)
+    yield FakeHTTPProxy.options(name="proxy", namespace=SERVE_NAMESPACE).remote()
+    ray.shutdown()
+    _proxy_actors.clear()
+
+
+def start_message():
+    return {"type": "http.response.start", "status": 200, "headers": []}
+
+
+def body_message(body: bytes, more_body: bool):
+    return {"type": "http.response.body", "body": body, "more_body": more_body}
+
+
+async def test_sender_without_stream():
+    sender = ASGIHTTPSender()
+    await sender(start_message())
+    await sender(body_message(b"a", more_body=True))
+    await sender(body_message(b"", more_body=False))
+    response = sender.build_asgi_response()
+    assert len(response.messages) == 3
+    assert response.status_code == 200
+
+
+async def test_sender_buffers_single_body(proxy_actor):
+    token = _current_response_stream.set(ASGIResponseStream("proxy", "stream"))
+    try:
+        sender = ASGIHTTPSender()
+        await sender(start_message())
+        await sender(body_message(b"a", more_body=False))
+    finally:
+        _current_response_stream.reset(token)
+
+    # Responses with a single body aren't streamed.
+    assert len(sender.build_asgi_response().messages) == 2
+    assert await proxy_actor.get_batches.remote() == []
+
+
+async def test_sender_streams_body_chunks(proxy_actor):
+    stream = ASGIResponseStream("proxy", "stream", max_buffered_bytes=0)
+    token = _current_response_stream.set(stream)
+    try:
+        sender = ASGIHTTPSender()
+        await sender(start_message())
+        for chunk in [b"a", b"b", b"c"]:
+            await sender(body_message(chunk, more_body=True))
+        await sender(body_message(b"", more_body=False))
+        await stream.close()
+    finally:
+        _current_response_stream.reset(token)
+
+    assert sender.build_asgi_response().messages == []
+    batches = await proxy_actor.get_batches.remote()
+    assert {stream_id for stream_id, _ in batches} == {"stream"}
+    messages = [message for _, batch in batches for message in batch]
+    assert messages == [
+        start_message(),
+        body_message(b"a", more_body=True),
+        body_message(b"b", more_body=True),
+        body_message(b"c", more_body=True),
+        body_message(b"", more_body=False),
+    ]
+
+
+async def test_stream_batches_messages(proxy_actor):
+    stream = ASGIResponseStream("proxy", "stream")
+    await stream.send(body_message(b"a", more_body=True))
+    # Let the first message be sent.
+    await asyncio.sleep(0)
+    for chunk in [b"b", b"c"]:
+        await stream.send(body_message(chunk, more_body=True))
+    await stream.close()
+
+    # The messages sent while the first one was in flight make a single batch.
+    batches = await proxy_actor.get_batches.remote()
+    assert [len(batch) for _, batch in batches] == [1, 2]
+
+
+async def test_stream_client_disconnected(proxy_actor):
+    await proxy_actor.disconnect.remote()
+    stream = ASGIResponseStream("proxy", "stream", max_buffered_bytes=0)
+    with pytest.raises(ray.serve.exceptions.RayServeException):
+        for _ in range(2):
+            await stream.send(body_message(b"a", more_body=True))
+        await asyncio.wait_for(stream.close(), timeout=10)
+
+
+async def test_stream_after_proxy_restart(proxy_actor):
+    stream = ASGIResponseStream("proxy", "stream")
+    await stream.send(body_message(b"a", more_body=False))
+    await stream.close()
+
+    # Replace the proxy with a new actor with the same name, like the HTTP state
+    # does when a proxy fails its health checks.
+    ray.kill(proxy_actor, no_restart=True)
+    new_proxy_actor = FakeHTTPProxy.options(
+        name="proxy", namespace=SERVE_NAMESPACE
+    ).remote()
+    stream = ASGIResponseStream("proxy", "new_stream")
+    await stream.send(body_message(b"b", more_body=False))
+    await stream.close()
+
+    assert await new_proxy_actor.get_batches.remote() == [
+        ("new_stream", [body_message(b"b", more_body=False)])
+    ]
+
+
+def http_request(body: bytes) -> HTTPRequestWrapper:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/octet-stream")],
+    }
+    return HTTPRequestWrapper(scope, body, response_stream_id="stream")
+
+
+async def test_http_request_body_out_of_band():
+    body = b"x" * 1024
+    buffers = []
+    data = pickle.dumps(http_request(body), protocol=5, buffer_callback=buffers.append)
+    assert body not in data
+    assert len(buffers) == 1
+
+    request = pickle.loads(data, buffers=buffers)
+    assert isinstance(request.body, memoryview)
+    assert request.body == body
+    assert request.scope == http_request(body).scope
+    assert request.response_stream_id == "stream"
+
+    # The body is only copied to bytes when it's read.
+    starlette_request = build_starlette_request(request.scope, request.body)
+    assert await starlette_request.body() == body
+
+
+async def test_http_request_through_object_store(proxy_actor):
+    @ray.remote
+    def get_body(request: HTTPRequestWrapper):
+        assert isinstance(request.body, memoryview)
+        return bytes(request.body)
+
+    # Large enough to not be inlined in the task spec.
+    body = bytes(range(256)) * 4 * 1024
+    assert await get_body.remote(http_request(body)) == body
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
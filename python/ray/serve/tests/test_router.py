@@ -9,7 +9,12 @@ import pytest
 
 import ray
 from ray._private.utils import get_or_create_event_loop
+from ray.serve.config import ReplicaSchedulingPolicy
 from ray.serve._private.common import RunningReplicaInfo
+from ray.serve._private.replica_scheduler import (
+    PowerOfTwoChoicesReplicaScheduler,
+    RoundRobinReplicaScheduler,
+)
 from ray.serve._private.router import Query, ReplicaSet, RequestMetadata
 from ray._private.test_utils import SignalActor
 
@@ -156,6 +161,156 @@ async def test_replica_set(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+class FakeActorHandle:
+    def __init__(self, actor_id):
+        self._actor_id = actor_id
+
+
+def fake_replica(replica_tag, max_concurrent_queries=10, node_id=None):
+    return RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag=replica_tag,
+        actor_handle=FakeActorHandle(replica_tag),
+        max_concurrent_queries=max_concurrent_queries,
+        node_id=node_id,
+    )
+
+
+async def test_round_robin_scheduler():
+    replicas = [fake_replica(str(i), max_concurrent_queries=1) for i in range(3)]
+    scheduler = RoundRobinReplicaScheduler()
+    scheduler.update_replicas(replicas)
+
+    chosen = [scheduler.choose_replica(dict.fromkeys(replicas, 0)) for _ in range(6)]
+    assert chosen[:3] == chosen[3:]
+    assert set(chosen) == set(replicas)
+
+    # Overloaded replicas are skipped.
+    num_in_flight = {replicas[0]: 1, replicas[1]: 1, replicas[2]: 0}
+    assert scheduler.choose_replica(num_in_flight) == replicas[2]
+    assert scheduler.choose_replica(dict.fromkeys(replicas, 1)) is None
+
+
+async def test_power_of_two_choices_scheduler():
+    r1, r2 = fake_replica("1"), fake_replica("2")
+    scheduler = PowerOfTwoChoicesReplicaScheduler()
+    scheduler.update_replicas([r1, r2])
+
+    # Without latencies, the replica with fewer queries in flight is chosen.
+    for _ in range(10):
+        assert scheduler.choose_replica({r1: 5, r2: 1}) == r2
+
+    # The queries in flight are weighted by the latencies.
+    scheduler.on_query_completed(r1, 0.1)
+    scheduler.on_query_completed(r2, 1.0)
+    for _ in range(10):
+        assert scheduler.choose_replica({r1: 5, r2: 1}) == r1
+        assert scheduler.choose_replica({r1: 10, r2: 1}) == r2
+
+    # Overloaded replicas are never chosen.
+    assert scheduler.choose_replica({r1: 10, r2: 0}) == r2
+    assert scheduler.choose_replica({r1: 10, r2: 10}) is None
+
+    # The latencies are exponentially weighted moving averages.
+    scheduler.on_query_completed(r2, 2.0)
+    assert scheduler._latency_ewma_s["2"] == pytest.approx(0.3 * 2.0 + 0.7 * 1.0)
+
+    # The latencies of removed replicas are dropped.
+    scheduler.update_replicas([r2])
+    assert set(scheduler._latency_ewma_s) == {"2"}
+
+
+async def test_power_of_two_choices_scheduler_locality():
+    replicas = [fake_replica(str(i), node_id=f"node-{i}") for i in range(3)]
+    scheduler = PowerOfTwoChoicesReplicaScheduler(node_id="node-1")
+    scheduler.update_replicas(replicas)
+
+    # The replica on the same node as the caller wins ties.
+    for _ in range(20):
+        assert scheduler.choose_replica(dict.fromkeys(replicas, 0)) == replicas[1]
+
+    # But not if it has more queries in flight.
+    num_in_flight = {replicas[0]: 0, replicas[1]: 2, replicas[2]: 0}
+    for _ in range(20):
+        assert scheduler.choose_replica(num_in_flight) != replicas[1]
+
+
+async def test_replica_set_power_of_two_choices(ray_instance):
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            return b"", "DONE"
+
+    rs = ReplicaSet(
+        "my_deployment",
+        get_or_create_event_loop(),
+    )
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=MockWorker.remote(),
+            max_concurrent_queries=1,
+            replica_scheduling_policy=ReplicaSchedulingPolicy.PowerOfTwoChoices,
+        )
+        for i in range(2)
+    ]
+    rs.update_running_replicas(replicas)
+    assert isinstance(rs._replica_scheduler, PowerOfTwoChoicesReplicaScheduler)
+
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    for _ in range(10):
+        assert await (await rs.assign_replica(query)) == "DONE"
+
+    # The latencies of the completed queries are measured.
+    while any(rs.in_flight_queries.values()):
+        await asyncio.sleep(0.01)
+    assert set(rs._replica_scheduler._latency_ewma_s) == {"0", "1"}
+
+
+async def test_replica_set_cancelled_waiter(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            await signal.wait.remote()
+            return b"", "DONE"
+
+    rs = ReplicaSet(
+        "my_deployment",
+        get_or_create_event_loop(),
+    )
+    replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="0",
+        actor_handle=MockWorker.remote(),
+        max_concurrent_queries=1,
+    )
+    rs.update_running_replicas([replica])
+
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    first_ref = await rs.assign_replica(query)
+
+    # The next queries wait for the replica, in order.
+    loop = get_or_create_event_loop()
+    second_task = loop.create_task(rs.assign_replica(query))
+    third_task = loop.create_task(rs.assign_replica(query))
+    await asyncio.sleep(0.2)
+    assert not second_task.done() and not third_task.done()
+    assert len(rs._free_replica_waiters) == 2
+
+    # A cancelled query doesn't take the slot freed by the first one.
+    second_task.cancel()
+    await signal.send.remote()
+    assert await first_ref == "DONE"
+    assert await (await third_task) == "DONE"
+    assert second_task.cancelled()
+    assert not rs._free_replica_waiters
+
+
 if __name__ == "__main__":
     import sys
 